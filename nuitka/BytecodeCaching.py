@@ -0,0 +1,173 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Caching of bytecode compiled from source code.
+
+Modules included as bytecode, e.g. the standard library in standalone mode,
+are the same for every build. Their marshalled code objects are cached on
+disk, by a hash of the source code, its filename, the Python version, and the
+optimization level, so builds of all projects can use them.
+
+The cache is limited in size, files used least recently are removed, when
+it grows larger.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+
+from nuitka import Options
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import listDir, makePath
+
+# Size of the cache directory, before removing files from it.
+_max_cache_size = 256 * 1024 * 1024
+
+# Removing files makes room for this part of the maximum size.
+_pruned_cache_size = _max_cache_size * 3 // 4
+
+# The cache directory is only checked once per compilation.
+_cache_pruned = False
+
+
+def _getBytecodeCacheDir():
+    cache_dir = os.path.join(
+        getCacheDir(),
+        "bytecode"
+    )
+
+    makePath(cache_dir)
+
+    return cache_dir
+
+
+def _getBytecodeCacheFilename(source_code, filename):
+    key = hashlib.md5()
+
+    key_value = repr(
+        (
+            filename,
+            sys.version,
+            sys.flags.optimize
+        )
+    )
+
+    if str is not bytes:
+        key_value = key_value.encode("utf8")
+
+    # Plugins may give unicode source code with Python2 too.
+    if type(source_code) is not bytes:
+        if str is bytes:
+            source_code = source_code.encode("utf8")
+        else:
+            source_code = source_code.encode("utf8", "surrogatepass")
+
+    key.update(key_value)
+    key.update(source_code)
+
+    return os.path.join(
+        _getBytecodeCacheDir(),
+        key.hexdigest() + ".bin"
+    )
+
+
+def _pruneBytecodeCache():
+    """ Remove the least recently used files, if the cache is too large. """
+
+    cache_files = []
+    cache_size = 0
+
+    for cache_filename, _filename in listDir(_getBytecodeCacheDir()):
+        try:
+            stat = os.stat(cache_filename)
+        except OSError:
+            # Removed by another build running at the same time.
+            continue
+
+        cache_files.append((stat.st_mtime, stat.st_size, cache_filename))
+        cache_size += stat.st_size
+
+    if cache_size <= _max_cache_size:
+        return
+
+    for _mtime, size, cache_filename in sorted(cache_files):
+        try:
+            os.unlink(cache_filename)
+        except OSError:
+            # Removed by another build running at the same time.
+            pass
+
+        cache_size -= size
+
+        if cache_size <= _pruned_cache_size:
+            break
+
+
+def compileSourceToBytecode(source_code, filename):
+    """ Compile module source code to a code object, using the cache.
+
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global _cache_pruned
+
+    if Options.shallNotUseBytecodeCache():
+        return compile(source_code, filename, "exec", dont_inherit = True)
+
+    cache_filename = _getBytecodeCacheFilename(source_code, filename)
+
+    if os.path.exists(cache_filename):
+        with open(cache_filename, "rb") as cache_file:
+            try:
+                bytecode = marshal.loads(cache_file.read())
+            except (EOFError, ValueError, TypeError):
+                # Damaged cache file, compile again and replace it.
+                pass
+            else:
+                # Mark it as used, files used least recently are removed
+                # first.
+                try:
+                    os.utime(cache_filename, None)
+                except OSError:
+                    pass
+
+                return bytecode
+
+    bytecode = compile(source_code, filename, "exec", dont_inherit = True)
+
+    if not _cache_pruned:
+        _pruneBytecodeCache()
+
+        _cache_pruned = True
+
+    # Write to a temporary file first, so other builds running at the same
+    # time, never see partial results.
+    temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    with open(temp_filename, "wb") as cache_file:
+        cache_file.write(marshal.dumps(bytecode))
+
+    try:
+        os.rename(temp_filename, cache_filename)
+    except OSError:
+        # On Windows, renaming over an existing file fails, another build
+        # was faster to store the same result then.
+        os.unlink(temp_filename)
+
+    return bytecode
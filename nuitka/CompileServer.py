@@ -0,0 +1,477 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Compile server, that keeps Nuitka loaded between compilations.
+
+With "--compile-server", Nuitka connects to a server for the same Python,
+working directory, and command line through a Unix domain socket, and lets
+it do the compilation, passing on its output and exit code. If there is no
+server yet, one is started in the background, and this compilation is done
+as usual. With "--run", the compiled program needs the terminal and input of
+Nuitka, so no server is used then.
+
+The server has Nuitka imported, with the options parsed, and with the module
+tree cache read into memory. For every request, it forks a process to do the
+compilation, so that nothing a compilation does, can affect the server or
+later compilations. Everything in memory is checked before use, the cached
+trees by modification time of their files, and the server stops itself, if
+the Nuitka source code changed. It also stops, when it was not used for an
+hour, or when asked to with a stop request.
+"""
+
+import hashlib
+import os
+import pickle
+import select
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import traceback
+from logging import info
+
+from nuitka import Options
+from nuitka.importing.PreloadedPackages import (
+    getPreloadedPackagePaths,
+    getPthImportedPackages
+)
+from nuitka.tree import ModuleTreeCache
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import makePath
+from nuitka.Version import getNuitkaVersion
+
+# Seconds without requests, after which a server stops.
+_idle_timeout = 3600
+
+# The environment variable that tells the started Nuitka to be the server.
+_server_variable = "NUITKA_COMPILE_SERVER_SOCKET"
+
+# Kinds of the messages from the server.
+_message_stdout = b'1'
+_message_stderr = b'2'
+_message_exit = b'x'
+_message_restart = b'r'
+
+# Kinds of the messages to the server.
+_request_compile = b'q'
+_request_stop = b's'
+
+
+def _getNuitkaDir():
+    return os.path.dirname(os.path.abspath(Options.__file__))
+
+
+def _getSocketPath():
+    """ The socket of the server for this exact compilation. """
+
+    key = repr(
+        (
+            getNuitkaVersion(),
+            _getNuitkaDir(),
+            sys.executable,
+            sys.version,
+            sys.path,
+            os.getcwd(),
+            sys.argv[1:],
+            Options.getMainArgs()
+        )
+    )
+
+    server_dir = os.path.join(getCacheDir(), "compile_server")
+    makePath(server_dir)
+
+    # The socket gives access to compilations, so only for this user.
+    os.chmod(server_dir, 0o700)
+
+    return os.path.join(
+        server_dir,
+        hashlib.md5(key.encode("utf8")).hexdigest()[:16] + ".sock"
+    )
+
+
+def _sendMessage(connection, kind, data):
+    connection.sendall(kind + struct.pack("!I", len(data)) + data)
+
+
+def _receiveExactly(connection, size):
+    result = b""
+
+    while len(result) < size:
+        data = connection.recv(size - len(result))
+
+        if not data:
+            return None
+
+        result += data
+
+    return result
+
+
+def _receiveMessage(connection):
+    header = _receiveExactly(connection, 5)
+
+    if header is None:
+        return None, None
+
+    size, = struct.unpack("!I", header[1:])
+
+    return header[:1], _receiveExactly(connection, size)
+
+
+def _startServer(socket_path):
+    """ Start a server in the background, like Nuitka got started. """
+
+    env = dict(os.environ)
+    env[_server_variable] = socket_path
+
+    # These are what "nuitka.__main__" gets for re-execution.
+    env["NUITKA_PYTHONPATH"] = repr(sys.path)
+    env["NUITKA_NAMESPACES"] = repr(getPreloadedPackagePaths())
+    env["NUITKA_PTH_IMPORTED"] = repr(getPthImportedPackages())
+
+    args = [
+        sys.executable,
+        "-S",
+        os.path.join(_getNuitkaDir(), "__main__.py"),
+    ] + sys.argv[1:] + list(Options.getMainArgs())
+
+    with open(os.devnull, 'r') as devnull:
+        with open(socket_path + ".log", 'w') as log_file:
+            subprocess.Popen(
+                args,
+                stdin      = devnull,
+                stdout     = log_file,
+                stderr     = log_file,
+                env        = env,
+                close_fds  = True,
+                # Not to be stopped with the terminal session of the client.
+                preexec_fn = os.setsid
+            )
+
+    if Options.isShowProgress():
+        info("Started compile server for later compilations.")
+
+
+def runClient():
+    """ Let the server do the compilation, if there is one.
+
+        Returns only, if the compilation needs to be done here, otherwise
+        exits with the exit code of the compilation.
+    """
+
+    socket_path = _getSocketPath()
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        connection.connect(socket_path)
+    except socket.error:
+        _startServer(socket_path)
+        return
+
+    request = {
+        "environ" : dict(os.environ)
+    }
+
+    _sendMessage(connection, _request_compile, pickle.dumps(request, 2))
+
+    while True:
+        kind, data = _receiveMessage(connection)
+
+        if kind == _message_stdout:
+            os.write(1, data)
+        elif kind == _message_stderr:
+            os.write(2, data)
+        elif kind == _message_exit:
+            sys.exit(struct.unpack("!i", data)[0])
+        elif kind == _message_restart:
+            # The server is outdated, and stops.
+            _startServer(socket_path)
+            return
+        else:
+            sys.exit("Error, compile server failed without a result.")
+
+
+def stopServer(socket_path):
+    """ Ask the server at the socket to stop, if there is one.
+
+        Returns whether a server was asked.
+    """
+
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        connection.connect(socket_path)
+    except socket.error:
+        return False
+
+    try:
+        _sendMessage(connection, _request_stop, b"")
+    finally:
+        connection.close()
+
+    return True
+
+
+def _getExitCode(exit_value):
+    # Like Python does for "SystemExit".
+    if exit_value is None:
+        return 0
+    elif type(exit_value) is int:
+        return exit_value
+    else:
+        sys.stderr.write("%s\n" % exit_value)
+        return 1
+
+
+def _runCompilation(request, stdout_fd, stderr_fd):
+    # Compilations do not read input, programs run with "--run" would, which
+    # is why these are not done by the server.
+    os.dup2(os.open(os.devnull, os.O_RDONLY), 0)
+    os.dup2(stdout_fd, 1)
+    os.dup2(stderr_fd, 2)
+
+    os.environ.clear()
+    os.environ.update(request["environ"])
+
+    try:
+        from nuitka import MainControl # isort:skip
+        MainControl.main()
+
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = _getExitCode(e.code)
+    except BaseException: # Catch all the things, pylint: disable=broad-except
+        traceback.print_exc()
+
+        exit_code = 1
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    # Do not run any clean up of the server process, pylint: disable=protected-access
+    os._exit(exit_code)
+
+
+def _handleRequest(connection, request):
+    """ Do the compilation of a request, in a forked process. """
+
+    stdout_read, stdout_write = os.pipe()
+    stderr_read, stderr_write = os.pipe()
+
+    pid = os.fork()
+
+    if pid == 0:
+        connection.close()
+        os.close(stdout_read)
+        os.close(stderr_read)
+
+        _runCompilation(request, stdout_write, stderr_write)
+
+    os.close(stdout_write)
+    os.close(stderr_write)
+
+    kinds = {
+        stdout_read : _message_stdout,
+        stderr_read : _message_stderr
+    }
+
+    while kinds:
+        ready, _, _ = select.select(list(kinds), [], [])
+
+        for fd in ready:
+            data = os.read(fd, 65536)
+
+            if data:
+                _sendMessage(connection, kinds[fd], data)
+            else:
+                os.close(fd)
+                del kinds[fd]
+
+    _pid, status = os.waitpid(pid, 0)
+
+    if os.WIFSIGNALED(status):
+        exit_code = 128 + os.WTERMSIG(status)
+    else:
+        exit_code = os.WEXITSTATUS(status)
+
+    _sendMessage(connection, _message_exit, struct.pack("!i", exit_code))
+
+
+def _getNuitkaSourceTimes():
+    """ Modification times of the loaded Nuitka source files. """
+
+    nuitka_dir = _getNuitkaDir()
+    result = {}
+
+    for module in list(sys.modules.values()):
+        filename = getattr(module, "__file__", None)
+
+        if filename is None or not filename.startswith(nuitka_dir):
+            continue
+
+        if filename.endswith((".pyc", ".pyo")):
+            filename = filename[:-1]
+
+        try:
+            result[filename] = os.path.getmtime(filename)
+        except OSError:
+            result[filename] = None
+
+    return result
+
+
+def _isNuitkaChanged(source_times):
+    for filename, mtime in source_times.items():
+        try:
+            if os.path.getmtime(filename) != mtime:
+                return True
+        except OSError:
+            if mtime is not None:
+                return True
+
+    return False
+
+
+def _createServerSocket(socket_path):
+    server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    # A socket file may be left over from a server that was killed, but it
+    # might also belong to another server that just started.
+    if os.path.exists(socket_path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            probe.connect(socket_path)
+        except socket.error:
+            os.unlink(socket_path)
+        else:
+            sys.exit("Error, compile server is already running.")
+        finally:
+            probe.close()
+
+    server_socket.bind(socket_path)
+    server_socket.listen(5)
+
+    return server_socket
+
+
+def _removeServerFiles(socket_path):
+    # Sockets are not files to "deleteFile", so not using it here.
+    for filename in (socket_path, socket_path + ".log"):
+        try:
+            os.unlink(filename)
+        except OSError:
+            pass
+
+
+def runServer(socket_path):
+    """ Serve compilation requests, until idle for too long. """
+
+    # Load everything a compilation will need before waiting for requests.
+    from nuitka import MainControl # isort:skip pylint: disable=unused-import
+
+    source_times = _getNuitkaSourceTimes()
+
+    server_socket = _createServerSocket(socket_path)
+    server_socket.settimeout(_idle_timeout)
+
+    # Remove the socket, also when asked to stop.
+    signal.signal(signal.SIGTERM, lambda _signum, _frame: sys.exit(0))
+
+    if Options.shallUseModuleTreeCache():
+        ModuleTreeCache.loadModuleTreesIntoMemory()
+
+    try:
+        while True:
+            try:
+                connection, _address = server_socket.accept()
+            except socket.timeout:
+                break
+
+            connection.settimeout(None)
+
+            kind, data = _receiveMessage(connection)
+
+            if kind == _request_stop:
+                connection.close()
+                break
+
+            if kind != _request_compile:
+                connection.close()
+                continue
+
+            request = pickle.loads(data)
+
+            # Trees stored by earlier compilations, or changed otherwise.
+            if Options.shallUseModuleTreeCache():
+                ModuleTreeCache.loadModuleTreesIntoMemory()
+
+            # Collect the finished request handlers.
+            try:
+                while os.waitpid(-1, os.WNOHANG)[0] != 0:
+                    pass
+            except OSError:
+                pass
+
+            if _isNuitkaChanged(source_times):
+                # Make room for a new server, before the client starts it.
+                _removeServerFiles(socket_path)
+                socket_path = None
+
+                _sendMessage(connection, _message_restart, b"")
+                connection.close()
+
+                break
+
+            pid = os.fork()
+
+            if pid == 0:
+                server_socket.close()
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+                try:
+                    _handleRequest(connection, request)
+                finally:
+                    # Do not run any clean up of the server process,
+                    # pylint: disable=protected-access
+                    os._exit(0)
+
+            connection.close()
+    finally:
+        if socket_path is not None:
+            _removeServerFiles(socket_path)
+
+
+def main():
+    """ Compile through a compile server, or be the server.
+
+        Returns only, if the compilation needs to be done here.
+    """
+
+    if os.name == "nt":
+        sys.exit("Error, the compile server is not supported on Windows.")
+
+    if _server_variable in os.environ:
+        socket_path = os.environ[_server_variable]
+        del os.environ[_server_variable]
+
+        runServer(socket_path)
+        sys.exit(0)
+    else:
+        runClient()
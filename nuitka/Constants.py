@@ -21,6 +21,8 @@ This contains tools to compare, classify and test constants.
 """
 
 import math
+import pickle
+from io import BytesIO
 from types import BuiltinFunctionType
 
 from nuitka.Builtins import builtin_type_names
@@ -35,6 +37,7 @@ from .__past__ import (  # pylint: disable=I0021,redefined-builtin
 from .Builtins import (
     builtin_anon_names,
     builtin_anon_value_list,
+    builtin_anon_values,
     builtin_exception_values_list,
     builtin_named_values_list
 )
@@ -345,3 +348,42 @@ def isCompileTimeConstantValue(value):
         return True
     else:
         return False
+
+
+class _ConstantPickler(pickle.Pickler):
+    """ Pickler that refers to anonymous built-ins by their name. """
+
+    # Overloading the pickle protocol method, pylint: disable=method-hidden
+    @staticmethod
+    def persistent_id(obj):
+        try:
+            return builtin_anon_values.get(obj)
+        except TypeError:
+            # Not hashable, cannot be one.
+            return None
+
+
+class _ConstantUnpickler(pickle.Unpickler):
+    """ Unpickler for "_ConstantPickler" results. """
+
+    # Overloading the pickle protocol method, pylint: disable=method-hidden
+    @staticmethod
+    def persistent_load(pid):
+        return builtin_anon_names[pid]
+
+
+def pickleConstant(constant):
+    """ Pickle a constant value, such that "unpickleConstant" restores it.
+
+        Anonymous built-ins, e.g. the "code" type, cannot be pickled normally,
+        these are referenced by name.
+    """
+
+    pickle_file = BytesIO()
+    _ConstantPickler(pickle_file, 2).dump(constant)
+
+    return pickle_file.getvalue()
+
+
+def unpickleConstant(data):
+    return _ConstantUnpickler(BytesIO(data)).load()
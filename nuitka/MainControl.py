@@ -42,6 +42,7 @@ from nuitka.PythonVersions import (
     python_version_str
 )
 from nuitka.tree import SyntaxErrors
+from nuitka.tree.ModuleTreeCache import storeModuleTrees
 from nuitka.utils import Execution, InstanceCounters, MemoryUsage, Utils
 from nuitka.utils.AppDirs import getCacheDir
 from nuitka.utils.FileOperations import (
@@ -53,8 +54,14 @@ from nuitka.utils.FileOperations import (
 )
 
 from . import ModuleRegistry, Options, TreeXML
-from .build import SconsInterface
-from .codegen import CodeGeneration, ConstantCodes, Reports
+from .build import ProfileData, SconsInterface, SourceManifest
+from .codegen import (
+    CodeGeneration,
+    ConstantCodes,
+    ModuleCodes,
+    ParallelCodeGeneration,
+    Reports
+)
 from .finalizations import Finalization
 from .freezer.BytecodeModuleFreezer import generateBytecodeFrozenCode
 from .freezer.Standalone import copyUsedDLLs, detectEarlyImports
@@ -151,6 +158,9 @@ def createNodeTree(filename):
     # Then optimize the tree and potentially recursed modules.
     Optimization.optimize(main_module.getOutputFilename())
 
+    if Options.shallUseModuleTreeCache():
+        storeModuleTrees()
+
     if Options.isExperimental("check_xml_persistence"):
         for module in ModuleRegistry.getRootModules():
             if module.isMainModule():
@@ -228,6 +238,14 @@ def getResultFullpath(main_module):
 
 
 def cleanSourceDirectory(source_dir):
+    # Incremental builds keep the files of the last build, if it completed,
+    # and only write files that changed.
+    if SourceManifest.startManifest(
+        source_dir = source_dir,
+        keep       = Options.isIncrementalBuild()
+    ):
+        return
+
     if os.path.isdir(source_dir):
         for path, _filename in listDir(source_dir):
             if hasFilenameExtension(
@@ -237,6 +255,14 @@ def cleanSourceDirectory(source_dir):
                               ".manifest")
             ):
                 deleteFile(path, must_exist = True)
+
+        # The precompiled header is in a sub-directory, and would be used by
+        # the C compiler even if it no longer matches the generated headers.
+        for filename in ("prelude.h.gch", "prelude.h.pch"):
+            precompiled_header = os.path.join(source_dir, "nuitka", filename)
+
+            if os.path.exists(precompiled_header):
+                deleteFile(precompiled_header, must_exist = True)
     else:
         makePath(source_dir)
 
@@ -369,41 +395,27 @@ def makeSourceDirectory(main_module):
         modules    = ModuleRegistry.getDoneModules()
     )
 
-    # First pass, generate code and use constants doing so, but prepare the
-    # final code generation only, because constants code will be added at the
-    # end only.
-    prepared_modules = {}
-
-    for module in ModuleRegistry.getDoneModules():
-        if module.isCompiledPythonModule():
-            c_filename = module_filenames[module]
-
-            prepared_modules[c_filename] = CodeGeneration.prepareModuleCode(
-                global_context = global_context,
-                module         = module,
-                module_name    = module.getFullName(),
-            )
-
-            # Main code constants need to be allocated already too.
-            if module is main_module and not Options.shallMakeModule():
-                prepared_modules[c_filename][1].getConstantCode(0)
+    # Generate code for compiled modules, using constants doing so, which may
+    # happen in parallel.
+    module_codes = ParallelCodeGeneration.generateModulesCode(
+        global_context = global_context,
+        modules        = [
+            module
+            for module in
+            ModuleRegistry.getDoneModules()
+            if module.isCompiledPythonModule()
+        ],
+        main_module    = main_module
+    )
 
-    # Second pass, generate the actual module code into the files.
     for module in ModuleRegistry.getDoneModules():
         if module.isCompiledPythonModule():
-            c_filename = module_filenames[module]
-
-            template_values, module_context = prepared_modules[c_filename]
-
-            source_code = CodeGeneration.generateModuleCode(
-                module_context  = module_context,
-                template_values = template_values
-            )
-
-            writeSourceCode(
-                filename    = c_filename,
-                source_code = source_code
-            )
+            # For unity builds, the code is written in groups below.
+            if not Options.shallUseUnityBuild():
+                writeSourceCode(
+                    filename    = module_filenames[module],
+                    source_code = module_codes[module]
+                )
 
             if Options.isShowInclusion():
                 info("Included compiled module '%s'." % module.getFullName())
@@ -462,20 +474,101 @@ def makeSourceDirectory(main_module):
         source_code = helper_decl_code
     )
 
-    writeSourceCode(
-        filename    = os.path.join(
-            source_dir,
-            "__helpers.c"
-        ),
-        source_code = helper_impl_code
+    if Options.shallUseUnityBuild():
+        unity_groups = _getUnityModuleGroups(
+            main_module  = main_module,
+            module_codes = module_codes,
+            count        = Options.getUnityFileCount()
+        )
+
+        for count, unity_group in enumerate(unity_groups):
+            writeSourceCode(
+                filename    = os.path.join(
+                    source_dir,
+                    "__unity_%d.c" % (count + 1)
+                ),
+                source_code = ModuleCodes.getUnityCode(
+                    module_codes = [
+                        (module.getCodeName(), module_codes[module])
+                        for module in
+                        unity_group
+                    ],
+                    # The helpers code goes with the first group only.
+                    extra_code   = helper_impl_code if count == 0 else None
+                )
+            )
+    else:
+        writeSourceCode(
+            filename    = os.path.join(
+                source_dir,
+                "__helpers.c"
+            ),
+            source_code = helper_impl_code
+        )
+
+
+def _getUnityModuleGroups(main_module, module_codes, count):
+    """ Split the compiled modules into groups for unity files.
+
+        The modules are ordered by following their imports from the main
+        module, so modules that use each other tend to end up in the same
+        group, and then cut into groups of about the same code size.
+    """
+
+    modules_by_name = dict(
+        (module.getFullName(), module)
+        for module in
+        module_codes
+    )
+
+    ordered = []
+    seen = set()
+
+    # Modules not reached by imports, e.g. ones included by the user, come
+    # last, in a stable order.
+    pending = sorted(
+        module_codes,
+        key     = lambda module: module.getFullName(),
+        reverse = True
     )
+    pending.append(main_module)
+
+    while pending:
+        module = pending.pop()
+
+        if module in seen:
+            continue
+
+        seen.add(module)
+        ordered.append(module)
+
+        for used_module_name in reversed(tuple(module.trace_collection.getUsedModules())):
+            used_module = modules_by_name.get(used_module_name)
+
+            if used_module is not None and used_module not in seen:
+                pending.append(used_module)
+
+    total_size = sum(len(code) for code in module_codes.values())
+    group_size = total_size / float(min(count, len(ordered)))
+
+    result = [[]]
+    size = 0
+
+    for module in ordered:
+        if result[-1] and size >= group_size * len(result):
+            result.append([])
+
+        result[-1].append(module)
+        size += len(module_codes[module])
+
+    return result
 
 
 def _asBoolStr(value):
     return "true" if value else "false"
 
 
-def runScons(main_module, quiet):
+def runScons(main_module, quiet, pgo_mode = None):
     # Scons gets transported many details, that we express as variables, and
     # have checks for them, leading to many branches and statements,
     # pylint: disable=too-many-branches,too-many-statements
@@ -513,9 +606,18 @@ def runScons(main_module, quiet):
     if not Options.isRemoveBuildDir() and Utils.getOS() == "Windows":
         options["cache_mode"] = "true"
 
+    if Options.isIncrementalBuild():
+        options["incremental_mode"] = "true"
+
     if Options.isLto():
         options["lto_mode"] = "true"
 
+    if not Options.shallUsePrecompiledHeader():
+        options["precompiled_header"] = "false"
+
+    if pgo_mode is not None:
+        options["pgo_mode"] = pgo_mode
+
     if Options.shallDisableConsoleWindow():
         options["win_disable_console"] = "true"
 
@@ -588,9 +690,13 @@ def runScons(main_module, quiet):
 
 
 def writeSourceCode(filename, source_code):
-    # Prevent accidental overwriting. When this happens the collision detection
-    # or something else has failed.
-    assert not os.path.isfile(filename), filename
+    if Options.isIncrementalBuild():
+        if SourceManifest.isFileUnchanged(filename, source_code):
+            return
+    else:
+        # Prevent accidental overwriting. When this happens the collision
+        # detection or something else has failed.
+        assert not os.path.isfile(filename), filename
 
     if python_version >= 300:
         with open(filename, "wb") as output_file:
@@ -601,12 +707,16 @@ def writeSourceCode(filename, source_code):
 
 
 def writeBinaryData(filename, binary_data):
-    # Prevent accidental overwriting. When this happens the collision detection
-    # or something else has failed.
-    assert not os.path.isfile(filename), filename
-
     assert type(binary_data) is bytes
 
+    if Options.isIncrementalBuild():
+        if SourceManifest.isFileUnchanged(filename, binary_data):
+            return
+    else:
+        # Prevent accidental overwriting. When this happens the collision
+        # detection or something else has failed.
+        assert not os.path.isfile(filename), filename
+
     with open(filename, "wb") as output_file:
         output_file.write(binary_data)
 
@@ -695,6 +805,18 @@ def compileTree(main_module):
             ),
             binary_data = ConstantCodes.stream_data.getBytes()
         )
+
+        if Options.isIncrementalBuild():
+            SourceManifest.finishManifest()
+
+        if Options.isShowProgress():
+            info(
+                """\
+Constants blob has {size} bytes for {value_count} values, {shared_count} of \
+which share {shared_size} bytes.""".format(
+                    **ConstantCodes.stream_data.getStatistics()
+                )
+            )
     else:
         source_dir = getSourceDirectoryPath(main_module)
 
@@ -717,6 +839,12 @@ def compileTree(main_module):
     if Options.shallNotDoExecCCompilerCall():
         return True, {}
 
+    if Options.isPgoMode():
+        return runSconsWithPgo(
+            main_module = main_module,
+            quiet       = not Options.isShowScons()
+        )
+
     # Run the Scons to build things.
     result, options = runScons(
         main_module = main_module,
@@ -726,6 +854,71 @@ def compileTree(main_module):
     return result, options
 
 
+def runSconsWithPgo(main_module, quiet):
+    """ Build with profile guided optimization.
+
+        Unless there are cached profiles for the same C code, an instrumented
+        binary is built first, and the training command is run with it.
+    """
+
+    source_dir = getSourceDirectoryPath(main_module)
+    result_filename = getResultFullpath(main_module)
+
+    if ProfileData.restoreProfileData(source_dir, result_filename):
+        if Options.isShowProgress():
+            info("Using cached profile for unchanged C code.")
+    else:
+        ProfileData.deleteProfileData(source_dir)
+
+        result, options = runScons(
+            main_module = main_module,
+            quiet       = quiet,
+            pgo_mode    = "generate"
+        )
+
+        if not result:
+            return result, options
+
+        if Options.isShowProgress():
+            info("Running training of profile guided optimization.")
+
+        if Options.getPgoCommand() is None:
+            training_command = [os.path.abspath(result_filename)]
+        else:
+            training_command = Options.getPgoCommand()
+
+        # The output of the training run is not the output of Nuitka.
+        with open(os.devnull, 'w') as devnull:
+            if Options.isShowProgress():
+                output = None
+            else:
+                output = devnull
+
+            exit_code = subprocess.call(
+                training_command,
+                shell  = Options.getPgoCommand() is not None,
+                stdout = output,
+                stderr = output
+            )
+
+        if exit_code != 0:
+            warning(
+                "Training run of profile guided optimization exited with %d." % \
+                exit_code
+            )
+
+        if not ProfileData.storeProfileData(source_dir, result_filename):
+            warning(
+                "Training run of profile guided optimization wrote no profile."
+            )
+
+    return runScons(
+        main_module = main_module,
+        quiet       = quiet,
+        pgo_mode    = "use"
+    )
+
+
 def handleSyntaxError(e):
     # Syntax or indentation errors, output them to the user and abort. If
     # we are not in full compat, and user has not specified the Python
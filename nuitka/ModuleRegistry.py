@@ -43,6 +43,11 @@ done_modules = set()
 # Uncompiled modules
 uncompiled_modules = set()
 
+# Modules and functions used by modules when they were last optimized, and
+# the uses currently recorded, innermost last.
+module_uses = {}
+uses_stack = []
+
 
 def addRootModule(module):
     root_modules.add(module)
@@ -158,12 +163,94 @@ def startTraversal():
 
 
 def addUsedModule(module):
+    if uses_stack:
+        uses_stack[-1][0].add(module)
+
     if module not in done_modules and module not in active_modules:
         active_modules.add(module)
 
         module.startTraversal()
 
 
+def addUsedFunction(function_body):
+    """ Mark a function body as used, returns if it needs to be visited. """
+
+    owning_module = function_body.getParentModule()
+
+    # Make sure the owning module is added to the used set. This is most
+    # important for helper functions, or modules, which otherwise have
+    # become unused.
+    addUsedModule(owning_module)
+
+    if uses_stack:
+        uses_stack[-1][1].add(function_body)
+
+    return owning_module.addUsedFunction(function_body)
+
+
+def startUses():
+    """ Start recording the modules and functions used. """
+
+    uses_stack.append(
+        (OrderedSet(), OrderedSet())
+    )
+
+
+def finishUses():
+    """ Finish recording uses, returns the used modules and functions.
+
+        The uses are also recorded for the enclosing recording, if any.
+    """
+
+    used_modules, used_functions = uses_stack.pop()
+
+    if uses_stack:
+        enclosing_modules, enclosing_functions = uses_stack[-1]
+
+        for used_module in used_modules:
+            enclosing_modules.add(used_module)
+
+        for function_body in used_functions:
+            enclosing_functions.add(function_body)
+
+    return used_modules, used_functions
+
+
+def startModuleUses():
+    """ Start recording the modules and functions used by a module. """
+
+    startUses()
+
+
+def finishModuleUses(module):
+    module_uses[module] = finishUses()
+
+
+def getModuleUses(module):
+    """ Modules and functions used by module, when it was last optimized.
+
+        Returns "None" if the module was not optimized yet.
+    """
+
+    return module_uses.get(module)
+
+
+def replayModuleUses(module):
+    """ Use the modules and functions a module used when last optimized.
+
+        This is for a module not optimized again in a pass, so that what it
+        uses, does not become unused.
+    """
+
+    used_modules, used_functions = module_uses[module]
+
+    for used_module in used_modules:
+        addUsedModule(used_module)
+
+    for function_body in used_functions:
+        function_body.getParentModule().addUsedFunction(function_body)
+
+
 def nextModule():
     if active_modules:
         result = active_modules.pop()
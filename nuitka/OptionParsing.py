@@ -358,6 +358,52 @@ compatibility reasons, the "__file__" value will always have ".py" suffix
 independent of what it really is."""
 )
 
+codegen_group.add_option(
+    "--module-tree-cache",
+    action  = "store_true",
+    dest    = "module_tree_cache",
+    default = False,
+    help    = """\
+Keep the optimized trees of compiled modules in the cache directory, and reuse
+them for unchanged modules in later compilations. This avoids building and
+optimizing them from scratch. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--codegen-jobs",
+    action  = "store",
+    dest    = "codegen_jobs",
+    metavar = 'N',
+    default = 1,
+    help    = """\
+Specify the allowed number of parallel processes for generating the C code
+of modules. Defaults to 1, i.e. generate the code in the Nuitka process."""
+)
+
+codegen_group.add_option(
+    "--lazy-constants",
+    action  = "store_true",
+    dest    = "lazy_constants",
+    default = False,
+    help    = """\
+Create constants only used by one function, when that function is called
+first, instead of when its module is imported. This makes imports of large
+modules faster, where only some functions are used. Defaults to off."""
+)
+
+codegen_group.add_option(
+    "--compile-server",
+    action  = "store_true",
+    dest    = "compile_server",
+    default = False,
+    help    = """\
+Let a compile server do the compilation, that keeps Nuitka loaded, and with
+"--module-tree-cache", also the cached trees. There is one for every command
+line and directory, the first compilation starts it in the background, and it
+stops after an hour without use. Not used with "--run", and not supported on
+Windows. Defaults to off."""
+)
+
 parser.add_option_group(codegen_group)
 
 output_group = OptionGroup(
@@ -402,6 +448,17 @@ Removes the build directory after producing the module or exe file.
 Defaults to off."""
 )
 
+output_group.add_option(
+    "--incremental",
+    action  = "store_true",
+    dest    = "incremental",
+    default = False,
+    help    = """\
+Keep the files of the last build in the build directory, and only write the
+generated files whose content changed, so only these are compiled again.
+Defaults to off."""
+)
+
 output_group.add_option(
     "--no-pyi-file",
     action  = "store_false",
@@ -517,30 +574,42 @@ debug_group.add_option(
     help    = SUPPRESS_HELP
 )
 
-if os.name == "nt":
-    debug_group.add_option(
-        "--disable-dll-dependency-cache",
-        action  = "store_true",
-        dest    = "no_dependency_cache",
-        default = False,
-        help    = """\
-Disable the dependency walker cache. Will result in much longer times to create
-the distribution folder, but might be used in case the cache is suspect to cause
-errors.
+debug_group.add_option(
+    "--disable-dll-dependency-cache",
+    action  = "store_true",
+    dest    = "no_dependency_cache",
+    default = False,
+    help    = """\
+Disable the DLL dependency cache of the dependency walker on Windows, and of
+"ldd" on Linux, and the cache of early imports detection. Will result in much
+longer times to create the distribution folder, but might be used in case the
+cache is suspect to cause errors.
 """
-    )
+)
 
-    debug_group.add_option(
-        "--force-dll-dependency-cache-update",
-        action  = "store_true",
-        dest    = "update_dependency_cache",
-        default = False,
-        help    = """\
-For an update of the dependency walker cache. Will result in much longer times
+debug_group.add_option(
+    "--disable-bytecode-cache",
+    action  = "store_true",
+    dest    = "no_bytecode_cache",
+    default = False,
+    help    = """\
+Disable the cache of bytecode compiled for modules included as bytecode, e.g.
+the standard library in standalone mode. Will result in longer compilation
+times, but might be used in case the cache is suspect to cause errors.
+"""
+)
+
+debug_group.add_option(
+    "--force-dll-dependency-cache-update",
+    action  = "store_true",
+    dest    = "update_dependency_cache",
+    default = False,
+    help    = """\
+For an update of the DLL dependency cache. Will result in much longer times
 to create the distribution folder, but might be used in case the cache is suspect
 to cause errors or known to need an update.
 """
-    )
+)
 
 # This is for testing framework, "coverage.py" hates to loose the process. And
 # we can use it to make sure it's not done unknowingly.
@@ -604,6 +673,39 @@ Specify the allowed number of parallel C compiler jobs. Defaults to the
 system CPU count.""",
 )
 
+c_compiler_group.add_option(
+    "--unity-build",
+    action  = "store_true",
+    dest    = "unity_build",
+    default = False,
+    help    = """\
+Put the C code of several modules into one C file, to be compiled together.
+This avoids parsing the same headers for every module, and allows the C
+compiler to inline helper code into more modules. Defaults to off."""
+)
+
+c_compiler_group.add_option(
+    "--unity-files",
+    action  = "store",
+    dest    = "unity_files",
+    metavar = 'N',
+    default = None,
+    help    = """\
+Specify the number of C files for unity builds. Defaults to the number of
+parallel C compiler jobs."""
+)
+
+c_compiler_group.add_option(
+    "--disable-precompiled-header",
+    action  = "store_false",
+    dest    = "precompiled_header",
+    default = True,
+    help    = """\
+Do not precompile the "nuitka/prelude.h" header that all C files include
+first. This is only useful if the C compiler has issues with it. Defaults to
+off."""
+)
+
 c_compiler_group.add_option(
     "--lto",
     action  = "store_true",
@@ -614,6 +716,31 @@ Use link time optimizations if available and usable (gcc 4.6 and higher).
 Defaults to off."""
 )
 
+c_compiler_group.add_option(
+    "--pgo",
+    action  = "store_true",
+    dest    = "pgo",
+    default = False,
+    help    = """\
+Use profile guided optimization (gcc only). The program is compiled with
+instrumentation first, run for training, and then compiled again using the
+execution profile. The profile is cached and used again, while the generated
+C code is unchanged. Not supported in standalone mode. Defaults to off."""
+)
+
+c_compiler_group.add_option(
+    "--pgo-command",
+    action  = "store",
+    dest    = "pgo_command",
+    metavar = "COMMAND",
+    default = None,
+    help    = """\
+Shell command to run for the training of profile guided optimization. It should
+exercise the compiled program or extension module like real use does. Defaults
+to running the compiled program without arguments, for extension modules, it
+must be given."""
+)
+
 parser.add_option_group(c_compiler_group)
 
 tracing_group = OptionGroup(
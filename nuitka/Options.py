@@ -107,6 +107,31 @@ mode where filenames are mandatory, and not for standalone where there is a
 sane default used inside the dist folder."""
         )
 
+    if options.pgo and not options.executable and options.pgo_command is None:
+        sys.exit(
+            """Error, profile guided optimization of extension modules needs a training
+command given with '--pgo-command'."""
+        )
+
+    # Clang is forced on these platforms, and can be given with "CC" too,
+    # and without MinGW, Windows uses MSVC.
+    if options.pgo and \
+       (options.clang or
+        sys.platform == "darwin" or
+        "freebsd" in sys.platform or
+        "clang" in os.path.basename(os.environ.get("CC", "")) or
+        (os.name == "nt" and not options.mingw64)):
+        sys.exit(
+            """Error, profile guided optimization is only supported with gcc, not with
+clang or MSVC."""
+        )
+
+    if options.pgo and isStandaloneMode():
+        sys.exit(
+            """Error, profile guided optimization is not supported in standalone mode,
+the training run would happen before the dist folder is complete."""
+        )
+
 
 def isVerbose():
     return options.verbose
@@ -136,6 +161,22 @@ def shallNotDoExecCCompilerCall():
     return options.generate_c_only
 
 
+def shallUseModuleTreeCache():
+    return options.module_tree_cache
+
+
+def shallUseCompileServer():
+    return options.compile_server
+
+
+def getCodegenJobLimit():
+    return int(options.codegen_jobs)
+
+
+def shallUseLazyConstants():
+    return options.lazy_constants
+
+
 def getFileReferenceMode():
     if options.file_reference_mode is None:
         value = ("runtime"
@@ -288,10 +329,33 @@ def getJobLimit():
     return int(options.jobs)
 
 
+def shallUseUnityBuild():
+    return options.unity_build
+
+
+def getUnityFileCount():
+    if options.unity_files is not None:
+        return max(1, int(options.unity_files))
+
+    return getJobLimit()
+
+
+def shallUsePrecompiledHeader():
+    return options.precompiled_header
+
+
 def isLto():
     return options.lto
 
 
+def isPgoMode():
+    return options.pgo
+
+
+def getPgoCommand():
+    return options.pgo_command
+
+
 def isClang():
     return options.clang
 
@@ -328,6 +392,10 @@ def isRemoveBuildDir():
     return options.remove_build and not options.generate_c_only
 
 
+def isIncrementalBuild():
+    return options.incremental and not isRemoveBuildDir()
+
+
 def getIntendedPythonArch():
     return options.python_arch
 
@@ -390,14 +458,18 @@ def shallFreezeAllStdlib():
     return not shallFollowStandardLibrary()
 
 
-def shallNotUseDependsExeCachedResults():
+def shallNotUseDependencyCachedResults():
     return options.no_dependency_cache or options.update_dependency_cache
 
 
-def shallNotStoreDependsExeCachedResults():
+def shallNotStoreDependencyCachedResults():
     return options.no_dependency_cache
 
 
+def shallNotUseBytecodeCache():
+    return options.no_bytecode_cache
+
+
 def shallListPlugins():
     return options is not None and options.list_plugins
 
@@ -120,6 +120,15 @@ class Variable(object):
 
             self.shared_scopes = True
 
+    def getSharingForXML(self):
+        """ Sharing state for XML persistence, only tree building sets it. """
+
+        return self.shared_users, self.shared_scopes
+
+    def restoreSharingFromXML(self, shared_users, shared_scopes):
+        self.shared_users = shared_users
+        self.shared_scopes = shared_scopes
+
     def isSharedAmongScopes(self):
         # TODO: This is only used for Python2, and could be made
         # and optional slot.
@@ -173,9 +182,13 @@ class Variable(object):
             if trace.isAssignTrace():
                 writers.add(owner)
 
+        changed = writers != self.writers or users != self.users
+
         self.writers = writers
         self.users = users
 
+        return changed
+
     def hasWritesOutsideOf(self, user):
         if not complete:
             return None
@@ -207,6 +220,45 @@ class Variable(object):
 
         return None
 
+    def getAssignedFunctionBody(self):
+        """ The function body created by all assignments, if any.
+
+            This is only what the traces know, module variables can also be
+            changed from the outside, so this needs to be checked at run time.
+        """
+
+        result = None
+
+        for trace in self.traces:
+            if trace.isAssignTrace():
+                source = trace.getAssignNode().getAssignSource()
+
+                if not source.isExpressionFunctionCreation():
+                    return None
+
+                function_body = source.getFunctionRef().getFunctionBody()
+
+                if result is not None and function_body is not result:
+                    return None
+
+                result = function_body
+
+        return result
+
+    def getAssignedValues(self):
+        """ The values assigned to the variable.
+
+            Initial values of parameters, and changes from other scopes are
+            not included, callers need to check for these.
+        """
+
+        return [
+            trace.getAssignNode().getAssignSource()
+            for trace in
+            self.traces
+            if trace.isAssignTrace()
+        ]
+
     def getTypeShapes(self):
         result = set()
 
@@ -343,6 +395,9 @@ class LocalsDictVariable(Variable):
 
 
 def updateVariablesFromCollection(old_collection, new_collection):
+    """ Replace the traces of a collection, returns variables with changed usage.
+
+    """
     # After removing/adding traces, we need to pre-compute the users state
     # information.
     touched_variables = set()
@@ -362,5 +417,10 @@ def updateVariablesFromCollection(old_collection, new_collection):
         new_collection.variable_actives.clear()
         del new_collection.variable_actives
 
+    changed_variables = set()
+
     for variable in touched_variables:
-        variable.updateUsageState()
+        if variable.updateUsageState():
+            changed_variables.add(variable)
+
+    return changed_variables
@@ -169,6 +169,13 @@ def main():
         setPthImportedPackages(eval(os.environ["NUITKA_PTH_IMPORTED"]))
         del os.environ["NUITKA_PTH_IMPORTED"]
 
+    # The compile server may do the compilation for us, or we are it. The
+    # program execution needs our own input and terminal though.
+    if Options.shallUseCompileServer() and \
+       not Options.shallExecuteImmediately():
+        from nuitka import CompileServer  # isort:skip
+        CompileServer.main()
+
     # Now the real main program of Nuitka can take over.
     from nuitka import MainControl  # isort:skip
     MainControl.main()
@@ -0,0 +1,178 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Execution profiles for profile guided optimization.
+
+The instrumented binary writes a profile file for every object file, next to
+it in the build directory. These are kept in the cache directory, per compiled
+program and hashes of the generated C files and constants they were created
+from. Later builds use them again, as long as all of these are unchanged, so
+the training run is not needed then.
+"""
+
+import hashlib
+import os
+import shutil
+
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import (
+    deleteFile,
+    hasFilenameExtension,
+    listDir,
+    makePath,
+    removeDirectory
+)
+from nuitka.Version import getNuitkaVersion
+
+_manifest_filename = "profiles.txt"
+
+
+def _getProgramCacheDir(result_filename):
+    # The run time C files are part of Nuitka, so its version covers them.
+    key = "%s:%s" % (os.path.abspath(result_filename), getNuitkaVersion())
+
+    return os.path.join(
+        getCacheDir(),
+        "pgo",
+        hashlib.md5(key.encode("utf-8")).hexdigest()
+    )
+
+
+def _getProfileCacheDir(result_filename, source_hashes):
+    # The generated C code and constants are covered by their hashes, so an
+    # edited program does not use the profiles of an older one.
+    key = hashlib.md5()
+
+    for name, hash_value in sorted(source_hashes.items()):
+        key.update(("%s %s\n" % (hash_value, name)).encode("utf-8"))
+
+    return os.path.join(
+        _getProgramCacheDir(result_filename),
+        key.hexdigest()
+    )
+
+
+def _getSourceHashes(source_dir):
+    """ Hashes of the generated files in the build directory, by name. """
+
+    result = {}
+
+    for path, filename in listDir(source_dir):
+        if not hasFilenameExtension(path, (".c", ".cpp", ".h", ".bin")):
+            continue
+
+        # Only generated files, the run time files are provided by Scons,
+        # they are not there yet, when the profiles are restored.
+        if not filename.startswith(("module.", "__")):
+            continue
+
+        # Scons may make C++ files from C files, these are the same.
+        name, extension = os.path.splitext(filename)
+
+        if extension == ".cpp":
+            extension = ".c"
+
+        name += extension
+
+        if name in result:
+            continue
+
+        with open(path, "rb") as source_file:
+            result[name] = hashlib.md5(source_file.read()).hexdigest()
+
+    return result
+
+
+def deleteProfileData(source_dir):
+    """ Remove profiles in the build directory, e.g. of an older build. """
+
+    for path, _filename in listDir(source_dir):
+        if hasFilenameExtension(path, (".gcda",)):
+            deleteFile(path, must_exist = True)
+
+
+def restoreProfileData(source_dir, result_filename):
+    """ Put the cached profiles into the build directory.
+
+        Returns True, if there were profiles for exactly the current C files.
+    """
+
+    source_hashes = _getSourceHashes(source_dir)
+
+    cache_dir = _getProfileCacheDir(result_filename, source_hashes)
+    manifest_filename = os.path.join(cache_dir, _manifest_filename)
+
+    if not os.path.isfile(manifest_filename):
+        return False
+
+    cached_hashes = {}
+
+    with open(manifest_filename) as manifest_file:
+        for line in manifest_file:
+            hash_value, name = line.rstrip('\n').split(' ', 1)
+
+            cached_hashes[name] = hash_value
+
+    if cached_hashes != source_hashes:
+        return False
+
+    deleteProfileData(source_dir)
+
+    for path, filename in listDir(cache_dir):
+        if hasFilenameExtension(path, (".gcda",)):
+            shutil.copy(path, os.path.join(source_dir, filename))
+
+    return True
+
+
+def storeProfileData(source_dir, result_filename):
+    """ Put the profiles of a training run into the cache.
+
+        Returns True, if the training run did write any profiles.
+    """
+
+    profile_filenames = [
+        path
+        for path, _filename in
+        listDir(source_dir)
+        if hasFilenameExtension(path, (".gcda",))
+    ]
+
+    if not profile_filenames:
+        return False
+
+    source_hashes = _getSourceHashes(source_dir)
+
+    cache_dir = _getProfileCacheDir(result_filename, source_hashes)
+
+    # Only the profiles of the latest program version are kept.
+    program_cache_dir = _getProgramCacheDir(result_filename)
+
+    if os.path.isdir(program_cache_dir):
+        removeDirectory(program_cache_dir, ignore_errors = False)
+
+    makePath(cache_dir)
+
+    for profile_filename in profile_filenames:
+        shutil.copy(profile_filename, cache_dir)
+
+    # Written last, so an interrupted copy is not used.
+    with open(os.path.join(cache_dir, _manifest_filename), 'w') as manifest_file:
+        for name, hash_value in sorted(source_hashes.items()):
+            manifest_file.write("%s %s\n" % (hash_value, name))
+
+    return True
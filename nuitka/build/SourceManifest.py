@@ -0,0 +1,118 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Manifest of generated source files for incremental builds.
+
+The build directory keeps the hashes of the files generated for the last
+build. Files whose content did not change, are not written again, so their
+timestamps stay the same, and Scons does not compile them again. Files no
+longer generated are removed, Scons would compile them otherwise.
+
+The manifest is removed when a build starts, and only written when all files
+are generated, so an interrupted build cannot leave outdated files behind.
+"""
+
+import hashlib
+import os
+
+from nuitka.utils.FileOperations import deleteFile
+
+_manifest_filename = ".nuitka-sources"
+
+# The build directory, hashes of the files of the last build, and of the
+# current one, by their filenames.
+_source_dir = None
+_old_hashes = None
+_new_hashes = None
+
+
+def _getManifestFilename(source_dir):
+    return os.path.join(source_dir, _manifest_filename)
+
+
+def startManifest(source_dir, keep):
+    """ Start the manifest for a build in that directory.
+
+        Returns True, if the files of the last build are to be kept, which
+        is the case if asked for, and the last build was completed.
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global _source_dir, _old_hashes, _new_hashes
+
+    _source_dir = source_dir
+    _old_hashes = {}
+    _new_hashes = {}
+
+    manifest_filename = _getManifestFilename(source_dir)
+
+    if not os.path.isfile(manifest_filename):
+        return False
+
+    if keep:
+        with open(manifest_filename) as manifest_file:
+            for line in manifest_file:
+                hash_value, filename = line.rstrip('\n').split(' ', 1)
+
+                _old_hashes[filename] = hash_value
+
+    deleteFile(manifest_filename, must_exist = True)
+
+    return keep
+
+
+def isFileUnchanged(filename, data):
+    """ Check if the file is already present with that content.
+
+        The new content is recorded for the manifest in any case.
+    """
+
+    if type(data) is not bytes:
+        data = data.encode("latin1")
+
+    name = os.path.basename(filename)
+    hash_value = hashlib.md5(data).hexdigest()
+
+    _new_hashes[name] = hash_value
+
+    if _old_hashes.get(name) != hash_value:
+        # Scons renames C files, when using C++ instead, remove the old one,
+        # or it would not be replaced on some platforms.
+        deleteFile(filename + "pp", must_exist = False)
+
+        return False
+
+    # Scons may have renamed C files to C++ files.
+    return os.path.isfile(filename) or os.path.isfile(filename + "pp")
+
+
+def finishManifest():
+    """ Remove files of the last build not generated again, write manifest.
+
+    """
+
+    for name in _old_hashes:
+        if name not in _new_hashes:
+            filename = os.path.join(_source_dir, name)
+
+            deleteFile(filename, must_exist = False)
+            deleteFile(filename + "pp", must_exist = False)
+
+    with open(_getManifestFilename(_source_dir), 'w') as manifest_file:
+        for name, hash_value in sorted(_new_hashes.items()):
+            manifest_file.write("%s %s\n" % (hash_value, name))
@@ -43,6 +43,41 @@ NUITKA_MAY_BE_UNUSED static PyObject *LOOKUP_BUILTIN(PyObject *name) {
     return result;
 }
 
+#if PYTHON_VERSION >= 360
+// Cache for the value of a module variable, for one place that reads it. It
+// is valid as long as the module and the built-in dictionary are unchanged,
+// and then holds a value either one of them still references.
+typedef struct {
+    PyObject *value;
+    uint64_t module_dict_version;
+    uint64_t builtin_dict_version;
+} Nuitka_ModuleVariableCache;
+
+NUITKA_MAY_BE_UNUSED static PyObject *GET_MODULE_VARIABLE_VALUE_CACHED(PyDictObject *module_dict,
+                                                                        Nuitka_StringObject *var_name,
+                                                                        Nuitka_ModuleVariableCache *cache) {
+    if (likely(cache->value != NULL && cache->module_dict_version == module_dict->ma_version_tag &&
+               cache->builtin_dict_version == dict_builtin->ma_version_tag)) {
+        CHECK_OBJECT(cache->value);
+
+        return cache->value;
+    }
+
+    PyObject *result = GET_STRING_DICT_VALUE(module_dict, var_name);
+
+    if (unlikely(result == NULL)) {
+        result = GET_STRING_DICT_VALUE(dict_builtin, var_name);
+    }
+
+    // Not found values are not cached, these raise an exception anyway.
+    cache->value = result;
+    cache->module_dict_version = module_dict->ma_version_tag;
+    cache->builtin_dict_version = dict_builtin->ma_version_tag;
+
+    return result;
+}
+#endif
+
 extern void _initBuiltinModule();
 
 #define NUITKA_DECLARE_BUILTIN(name) extern PyObject *_python_original_builtin_value_##name;
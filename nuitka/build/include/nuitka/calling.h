@@ -78,6 +78,12 @@ NUITKA_MAY_BE_UNUSED static PyObject *CALL_FUNCTION_WITH_KEYARGS(PyObject *funct
     return CALL_FUNCTION(function_object, const_tuple_empty, named_args);
 }
 
+// Function call variant with keyword arguments, their values following the
+// positional ones in "args", and their names given as a tuple of strings. For
+// constant keyword arguments, "kw_dict" is their dictionary, otherwise NULL.
+extern PyObject *CALL_FUNCTION_WITH_ARGS_KWSPLIT(PyObject *called, PyObject **args, Py_ssize_t args_size,
+                                                 PyObject *kw_names, PyObject *kw_dict);
+
 // Method call variant with no arguments provided at all.
 extern PyObject *CALL_METHOD_NO_ARGS(PyObject *source, PyObject *attribute);
 
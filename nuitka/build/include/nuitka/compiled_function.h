@@ -110,6 +110,11 @@ extern bool parseArgumentsMethodPos(struct Nuitka_FunctionObject const *function
 extern PyObject *Nuitka_CallFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *function, PyObject **args,
                                                   Py_ssize_t args_size, PyObject *kw);
 
+// Keyword argument values follow the positional ones in "args", and their
+// names are given as a tuple of strings.
+extern PyObject *Nuitka_CallFunctionPosArgsKwSplit(struct Nuitka_FunctionObject const *function, PyObject **args,
+                                                   Py_ssize_t args_size, PyObject *kw_names);
+
 // These are fast calls of known compiled methods, without an actual object
 // of that kind. The object is that first argument, "self" or whatever, to
 // which the function would be bound.
@@ -120,5 +125,7 @@ extern PyObject *Nuitka_CallMethodFunctionPosArgs(struct Nuitka_FunctionObject c
 // This is also used by bound compiled methods
 extern PyObject *Nuitka_CallMethodFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *function, PyObject *object,
                                                         PyObject **args, Py_ssize_t args_size, PyObject *kw);
+extern PyObject *Nuitka_CallMethodFunctionPosArgsKwSplit(struct Nuitka_FunctionObject const *function, PyObject *object,
+                                                         PyObject **args, Py_ssize_t args_size, PyObject *kw_names);
 
 #endif
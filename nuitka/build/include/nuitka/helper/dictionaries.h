@@ -285,15 +285,34 @@ NUITKA_MAY_BE_UNUSED static PyObject *TO_DICT(PyObject *seq_obj, PyObject *dict_
     return result;
 }
 
-NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT0(PyDictObject *dict, Nuitka_StringObject *key, PyObject *value) {
-    Nuitka_DictEntryHandle entry = GET_STRING_DICT_ENTRY(dict, key);
+// Keyword arguments given as values and a tuple of their names, as a dictionary.
+NUITKA_MAY_BE_UNUSED static PyObject *MAKE_DICT_KWSPLIT(PyObject **kw_values, PyObject *kw_names) {
+    CHECK_OBJECT(kw_names);
+    assert(PyTuple_CheckExact(kw_names));
 
-#if PYTHON_VERSION >= 360
-    if (entry == NULL) {
-        DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
-        return;
+    Py_ssize_t kw_size = PyTuple_GET_SIZE(kw_names);
+
+    PyObject *result = _PyDict_NewPresized(kw_size);
+
+    for (Py_ssize_t i = 0; i < kw_size; i++) {
+        CHECK_OBJECT(kw_values[i]);
+
+        if (unlikely(!DICT_SET_ITEM(result, PyTuple_GET_ITEM(kw_names, i), kw_values[i]))) {
+            Py_DECREF(result);
+            return NULL;
+        }
     }
-#endif
+
+    return result;
+}
+
+NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT0(PyDictObject *dict, Nuitka_StringObject *key, PyObject *value) {
+#if PYTHON_VERSION >= 360
+    // Caches of module variable values rely on the version tag of the
+    // dictionary, which CPython updates for us when setting items.
+    DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
+#else
+    Nuitka_DictEntryHandle entry = GET_STRING_DICT_ENTRY(dict, key);
 
     PyObject *old = GET_DICT_ENTRY_VALUE(entry);
 
@@ -309,19 +328,18 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT0(PyDictObject *dict, Nuitka_
     } else {
         DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
     }
+#endif
 }
 
 NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT1(PyDictObject *dict, Nuitka_StringObject *key, PyObject *value) {
-    Nuitka_DictEntryHandle entry = GET_STRING_DICT_ENTRY(dict, key);
-
 #if PYTHON_VERSION >= 360
-    if (entry == NULL) {
-        DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
+    // Caches of module variable values rely on the version tag of the
+    // dictionary, which CPython updates for us when setting items.
+    DICT_SET_ITEM((PyObject *)dict, (PyObject *)key, value);
 
-        Py_DECREF(value);
-        return;
-    }
-#endif
+    Py_DECREF(value);
+#else
+    Nuitka_DictEntryHandle entry = GET_STRING_DICT_ENTRY(dict, key);
 
     PyObject *old = GET_DICT_ENTRY_VALUE(entry);
 
@@ -336,6 +354,7 @@ NUITKA_MAY_BE_UNUSED static void UPDATE_STRING_DICT1(PyDictObject *dict, Nuitka_
 
         Py_DECREF(value);
     }
+#endif
 }
 
 #endif
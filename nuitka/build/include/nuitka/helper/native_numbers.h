@@ -0,0 +1,227 @@
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_HELPER_NATIVE_NUMBERS_H__
+#define __NUITKA_HELPER_NATIVE_NUMBERS_H__
+
+// Local variables known to only hold "float" or "int" values, these are
+// kept as C values, and an object is only created when the value escapes,
+// e.g. for passing it to a call. Values that do not fit the C type, e.g.
+// "int" overflowing to "long", are kept as objects only.
+
+typedef enum {
+    NUITKA_NATIVE_UNASSIGNED = 0,
+    NUITKA_NATIVE_OBJECT_VALID = 1,
+    NUITKA_NATIVE_C_VALID = 2,
+    NUITKA_NATIVE_BOTH_VALID = 3
+} nuitka_native_validity;
+
+typedef struct {
+    nuitka_native_validity validity;
+    double c_value;
+    PyObject *object;
+} nuitka_double;
+
+typedef struct {
+    nuitka_native_validity validity;
+    long c_value;
+    PyObject *object;
+} nuitka_ilong;
+
+#define NUITKA_NATIVE_UNASSIGNED_VALUE                                                                                 \
+    { NUITKA_NATIVE_UNASSIGNED, 0, NULL }
+
+#define NUITKA_NATIVE_HAS_C_VALUE(value) (((value).validity & NUITKA_NATIVE_C_VALID) != 0)
+
+// Create the object if not yet present, false only if that fails.
+NUITKA_MAY_BE_UNUSED static bool NUITKA_DOUBLE_BOX(nuitka_double *value) {
+    if (value->validity == NUITKA_NATIVE_C_VALID) {
+        value->object = PyFloat_FromDouble(value->c_value);
+
+        if (unlikely(value->object == NULL)) {
+            return false;
+        }
+
+        value->validity = NUITKA_NATIVE_BOTH_VALID;
+    }
+
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static bool NUITKA_ILONG_BOX(nuitka_ilong *value) {
+    if (value->validity == NUITKA_NATIVE_C_VALID) {
+#if PYTHON_VERSION < 300
+        value->object = PyInt_FromLong(value->c_value);
+#else
+        value->object = PyLong_FromLong(value->c_value);
+#endif
+
+        if (unlikely(value->object == NULL)) {
+            return false;
+        }
+
+        value->validity = NUITKA_NATIVE_BOTH_VALID;
+    }
+
+    return true;
+}
+
+// Object for use in frame locals, borrowed reference, NULL if not assigned.
+NUITKA_MAY_BE_UNUSED static PyObject *NUITKA_DOUBLE_GET_OBJECT(nuitka_double *value) {
+    if (unlikely(!NUITKA_DOUBLE_BOX(value))) {
+        // Frame locals are attached for exceptions, do not mask those.
+        DROP_ERROR_OCCURRED();
+
+        return NULL;
+    }
+
+    return value->object;
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *NUITKA_ILONG_GET_OBJECT(nuitka_ilong *value) {
+    if (unlikely(!NUITKA_ILONG_BOX(value))) {
+        // Frame locals are attached for exceptions, do not mask those.
+        DROP_ERROR_OCCURRED();
+
+        return NULL;
+    }
+
+    return value->object;
+}
+
+// Assign a new reference to an object, takes the C value from it if possible.
+NUITKA_MAY_BE_UNUSED static void NUITKA_DOUBLE_SET_OBJECT(nuitka_double *value, PyObject *object) {
+    CHECK_OBJECT(object);
+
+    PyObject *old = value->object;
+    value->object = object;
+
+    if (likely(PyFloat_CheckExact(object))) {
+        value->c_value = PyFloat_AS_DOUBLE(object);
+        value->validity = NUITKA_NATIVE_BOTH_VALID;
+    } else {
+        value->validity = NUITKA_NATIVE_OBJECT_VALID;
+    }
+
+    Py_XDECREF(old);
+}
+
+NUITKA_MAY_BE_UNUSED static void NUITKA_ILONG_SET_OBJECT(nuitka_ilong *value, PyObject *object) {
+    CHECK_OBJECT(object);
+
+    PyObject *old = value->object;
+    value->object = object;
+    value->validity = NUITKA_NATIVE_OBJECT_VALID;
+
+#if PYTHON_VERSION < 300
+    // Only "int" values, "long" values must remain such when boxed again.
+    if (likely(PyInt_CheckExact(object))) {
+        value->c_value = PyInt_AS_LONG(object);
+        value->validity = NUITKA_NATIVE_BOTH_VALID;
+    }
+#else
+    if (likely(PyLong_CheckExact(object))) {
+        int overflow;
+        long c_value = PyLong_AsLongAndOverflow(object, &overflow);
+
+        if (overflow == 0) {
+            value->c_value = c_value;
+            value->validity = NUITKA_NATIVE_BOTH_VALID;
+        }
+    }
+#endif
+
+    Py_XDECREF(old);
+}
+
+NUITKA_MAY_BE_UNUSED static void NUITKA_DOUBLE_SET_C(nuitka_double *value, double c_value) {
+    PyObject *old = value->object;
+
+    value->c_value = c_value;
+    value->object = NULL;
+    value->validity = NUITKA_NATIVE_C_VALID;
+
+    Py_XDECREF(old);
+}
+
+NUITKA_MAY_BE_UNUSED static void NUITKA_ILONG_SET_C(nuitka_ilong *value, long c_value) {
+    PyObject *old = value->object;
+
+    value->c_value = c_value;
+    value->object = NULL;
+    value->validity = NUITKA_NATIVE_C_VALID;
+
+    Py_XDECREF(old);
+}
+
+// Release the value, for "del" statements and function exits.
+#define NUITKA_NATIVE_RELEASE(value)                                                                                   \
+    {                                                                                                                  \
+        PyObject *old = (value).object;                                                                                \
+        (value).object = NULL;                                                                                         \
+        (value).validity = NUITKA_NATIVE_UNASSIGNED;                                                                   \
+        Py_XDECREF(old);                                                                                               \
+    }
+
+// C level "int" arithmetic, false if the result overflows, then the
+// operation has to be done with objects.
+NUITKA_MAY_BE_UNUSED static inline bool NUITKA_ILONG_ADD(long *result, long a, long b) {
+    long x = (long)((unsigned long)a + b);
+
+    if (unlikely((x ^ a) < 0 && (x ^ b) < 0)) {
+        return false;
+    }
+
+    *result = x;
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static inline bool NUITKA_ILONG_SUB(long *result, long a, long b) {
+    long x = (long)((unsigned long)a - b);
+
+    if (unlikely((x ^ a) < 0 && (x ^ ~b) < 0)) {
+        return false;
+    }
+
+    *result = x;
+    return true;
+}
+
+NUITKA_MAY_BE_UNUSED static inline bool NUITKA_ILONG_MUL(long *result, long a, long b) {
+    // Same approach as CPython2 "int_mul", compare to the double result.
+    long longprod = (long)((unsigned long)a * b);
+    double doubleprod = (double)a * (double)b;
+    double doubled_longprod = (double)longprod;
+
+    if (likely(doubled_longprod == doubleprod)) {
+        *result = longprod;
+        return true;
+    }
+
+    double diff = doubled_longprod - doubleprod;
+    double absdiff = diff >= 0.0 ? diff : -diff;
+    double absprod = doubleprod >= 0.0 ? doubleprod : -doubleprod;
+
+    if (32.0 * absdiff <= absprod) {
+        *result = longprod;
+        return true;
+    }
+
+    return false;
+}
+
+#endif
@@ -1476,4 +1476,7 @@ NUITKA_MAY_BE_UNUSED static bool POWER_OPERATION_INPLACE(PyObject **operand1, Py
     return true;
 }
 
+// Helpers specialized to the types of the operands, generated code.
+#include "nuitka/helper/operations_binary.h"
+
 #endif
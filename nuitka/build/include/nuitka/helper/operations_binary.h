@@ -0,0 +1,8783 @@
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_OPERATIONS_BINARY_H__
+#define __NUITKA_OPERATIONS_BINARY_H__
+
+// This file is generated by "python -m nuitka.tools.specialize", do not edit
+// it, but change the generator instead.
+
+// Specialized helpers for binary operation ADD.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    long a = PyInt_AS_LONG(operand1);
+    long b = PyInt_AS_LONG(operand2);
+
+    long i = a + b;
+
+    // Detect overflow, in which case, a "long" object would have to be
+    // created, which the slot will do.
+    if (likely(!((i ^ a) < 0 && (i ^ b) < 0))) {
+        return PyInt_FromLong(i);
+    }
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    return PyFloat_FromDouble(a + b);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    return PyBytes_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ADD_INT_STR BINARY_OPERATION_ADD
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ADD_INT_UNICODE BINARY_OPERATION_ADD
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ADD_INT_LIST BINARY_OPERATION_ADD
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ADD_INT_TUPLE BINARY_OPERATION_ADD
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ADD_LONG_STR BINARY_OPERATION_ADD
+#endif
+
+#define BINARY_OPERATION_ADD_LONG_UNICODE BINARY_OPERATION_ADD
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ADD_LONG_BYTES BINARY_OPERATION_ADD
+#endif
+
+#define BINARY_OPERATION_ADD_LONG_LIST BINARY_OPERATION_ADD
+
+#define BINARY_OPERATION_ADD_LONG_TUPLE BINARY_OPERATION_ADD
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_add(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ADD_FLOAT_STR BINARY_OPERATION_ADD
+#endif
+
+#define BINARY_OPERATION_ADD_FLOAT_UNICODE BINARY_OPERATION_ADD
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ADD_FLOAT_BYTES BINARY_OPERATION_ADD
+#endif
+
+#define BINARY_OPERATION_ADD_FLOAT_LIST BINARY_OPERATION_ADD
+
+#define BINARY_OPERATION_ADD_FLOAT_TUPLE BINARY_OPERATION_ADD
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return PyString_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return PyUnicode_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return PyBytes_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    return PyBytes_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return PyBytes_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return PyBytes_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return PyBytes_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return PyList_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return PyTuple_Type.tp_as_sequence->sq_concat(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    if (PyString_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_STR_STR(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    if (PyUnicode_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_UNICODE_UNICODE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    if (PyBytes_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_BYTES_BYTES(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    if (PyList_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_LIST_LIST(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_OBJECT_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    if (PyTuple_CheckExact(operand1)) {
+        return BINARY_OPERATION_ADD_TUPLE_TUPLE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_STR_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyString_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_STR_STR(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyUnicode_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_UNICODE_UNICODE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyBytes_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_BYTES_BYTES(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_LIST_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyList_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_LIST_LIST(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ADD_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyTuple_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_TUPLE_TUPLE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_ADD(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_INT BINARY_OPERATION_ADD_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_LONG BINARY_OPERATION_ADD_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_FLOAT BINARY_OPERATION_ADD_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_STR PyNumber_InPlaceAdd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_UNICODE PyNumber_InPlaceAdd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_LIST PyNumber_InPlaceAdd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_INT_TUPLE PyNumber_InPlaceAdd
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_LONG_INT BINARY_OPERATION_ADD_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IADD_LONG_LONG BINARY_OPERATION_ADD_LONG_LONG
+
+#define BINARY_OPERATION_IADD_LONG_FLOAT BINARY_OPERATION_ADD_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_LONG_STR PyNumber_InPlaceAdd
+#endif
+
+#define BINARY_OPERATION_IADD_LONG_UNICODE PyNumber_InPlaceAdd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_LONG_BYTES PyNumber_InPlaceAdd
+#endif
+
+#define BINARY_OPERATION_IADD_LONG_LIST PyNumber_InPlaceAdd
+
+#define BINARY_OPERATION_IADD_LONG_TUPLE PyNumber_InPlaceAdd
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_FLOAT_INT BINARY_OPERATION_ADD_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_IADD_FLOAT_LONG BINARY_OPERATION_ADD_FLOAT_LONG
+
+#define BINARY_OPERATION_IADD_FLOAT_FLOAT BINARY_OPERATION_ADD_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_FLOAT_STR PyNumber_InPlaceAdd
+#endif
+
+#define BINARY_OPERATION_IADD_FLOAT_UNICODE PyNumber_InPlaceAdd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_FLOAT_BYTES PyNumber_InPlaceAdd
+#endif
+
+#define BINARY_OPERATION_IADD_FLOAT_LIST PyNumber_InPlaceAdd
+
+#define BINARY_OPERATION_IADD_FLOAT_TUPLE PyNumber_InPlaceAdd
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_INT BINARY_OPERATION_ADD_STR_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_LONG BINARY_OPERATION_ADD_STR_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_FLOAT BINARY_OPERATION_ADD_STR_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_STR BINARY_OPERATION_ADD_STR_STR
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_UNICODE BINARY_OPERATION_ADD_STR_UNICODE
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_LIST BINARY_OPERATION_ADD_STR_LIST
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_STR_TUPLE BINARY_OPERATION_ADD_STR_TUPLE
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_STR_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyString_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_STR_STR(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_UNICODE_INT BINARY_OPERATION_ADD_UNICODE_INT
+#endif
+
+#define BINARY_OPERATION_IADD_UNICODE_LONG BINARY_OPERATION_ADD_UNICODE_LONG
+
+#define BINARY_OPERATION_IADD_UNICODE_FLOAT BINARY_OPERATION_ADD_UNICODE_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_UNICODE_STR BINARY_OPERATION_ADD_UNICODE_STR
+#endif
+
+#define BINARY_OPERATION_IADD_UNICODE_UNICODE BINARY_OPERATION_ADD_UNICODE_UNICODE
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_UNICODE_BYTES BINARY_OPERATION_ADD_UNICODE_BYTES
+#endif
+
+#define BINARY_OPERATION_IADD_UNICODE_LIST BINARY_OPERATION_ADD_UNICODE_LIST
+
+#define BINARY_OPERATION_IADD_UNICODE_TUPLE BINARY_OPERATION_ADD_UNICODE_TUPLE
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyUnicode_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_UNICODE_UNICODE(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_BYTES_LONG BINARY_OPERATION_ADD_BYTES_LONG
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_BYTES_FLOAT BINARY_OPERATION_ADD_BYTES_FLOAT
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_BYTES_UNICODE BINARY_OPERATION_ADD_BYTES_UNICODE
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_BYTES_BYTES BINARY_OPERATION_ADD_BYTES_BYTES
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_BYTES_LIST BINARY_OPERATION_ADD_BYTES_LIST
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_BYTES_TUPLE BINARY_OPERATION_ADD_BYTES_TUPLE
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_BYTES_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyBytes_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_BYTES_BYTES(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_TUPLE_INT BINARY_OPERATION_ADD_TUPLE_INT
+#endif
+
+#define BINARY_OPERATION_IADD_TUPLE_LONG BINARY_OPERATION_ADD_TUPLE_LONG
+
+#define BINARY_OPERATION_IADD_TUPLE_FLOAT BINARY_OPERATION_ADD_TUPLE_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IADD_TUPLE_STR BINARY_OPERATION_ADD_TUPLE_STR
+#endif
+
+#define BINARY_OPERATION_IADD_TUPLE_UNICODE BINARY_OPERATION_ADD_TUPLE_UNICODE
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IADD_TUPLE_BYTES BINARY_OPERATION_ADD_TUPLE_BYTES
+#endif
+
+#define BINARY_OPERATION_IADD_TUPLE_LIST BINARY_OPERATION_ADD_TUPLE_LIST
+
+#define BINARY_OPERATION_IADD_TUPLE_TUPLE BINARY_OPERATION_ADD_TUPLE_TUPLE
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IADD_TUPLE_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyTuple_CheckExact(operand2)) {
+        return BINARY_OPERATION_ADD_TUPLE_TUPLE(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAdd(operand1, operand2);
+}
+
+// Specialized helpers for binary operation SUB.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    long a = PyInt_AS_LONG(operand1);
+    long b = PyInt_AS_LONG(operand2);
+
+    long i = a - b;
+
+    // Detect overflow, in which case, a "long" object would have to be
+    // created, which the slot will do.
+    if (likely(!((i ^ a) < 0 && (i ^ ~b) < 0))) {
+        return PyInt_FromLong(i);
+    }
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    return PyFloat_FromDouble(a - b);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_STR BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_UNICODE_UNICODE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LIST_LIST BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_TUPLE_TUPLE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_INT_STR BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_INT_UNICODE BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_INT_LIST BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_INT_TUPLE BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_LONG_STR BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LONG_UNICODE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_LONG_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LONG_LIST BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_LONG_TUPLE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_subtract(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_FLOAT_STR BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_FLOAT_UNICODE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_FLOAT_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_FLOAT_LIST BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_FLOAT_TUPLE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_INT BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_LONG BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_FLOAT BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_UNICODE BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_LIST BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_TUPLE BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_UNICODE_INT BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_UNICODE_LONG BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_UNICODE_FLOAT BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_UNICODE_STR BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_UNICODE_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_UNICODE_LIST BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_UNICODE_TUPLE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_LONG BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_FLOAT BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_UNICODE BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_LIST BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_TUPLE BINARY_OPERATION_SUB
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_LIST_INT BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LIST_LONG BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_LIST_FLOAT BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_LIST_STR BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LIST_UNICODE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_LIST_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LIST_TUPLE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_TUPLE_INT BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_TUPLE_LONG BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_TUPLE_FLOAT BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_TUPLE_STR BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_TUPLE_UNICODE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_TUPLE_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_TUPLE_LIST BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_SUB_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_SUB_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_SUB_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_OBJECT_STR BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_OBJECT_UNICODE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_OBJECT_BYTES BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_OBJECT_LIST BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_OBJECT_TUPLE BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_SUB_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_SUB_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_SUB_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_SUB_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_SUB(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_SUB_STR_OBJECT BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_UNICODE_OBJECT BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_SUB_BYTES_OBJECT BINARY_OPERATION_SUB
+#endif
+
+#define BINARY_OPERATION_SUB_LIST_OBJECT BINARY_OPERATION_SUB
+
+#define BINARY_OPERATION_SUB_TUPLE_OBJECT BINARY_OPERATION_SUB
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_INT BINARY_OPERATION_SUB_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_LONG BINARY_OPERATION_SUB_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_FLOAT BINARY_OPERATION_SUB_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_STR PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_UNICODE PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_LIST PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_INT_TUPLE PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ISUB_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_SUB_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceSubtract(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_LONG_INT BINARY_OPERATION_SUB_LONG_INT
+#endif
+
+#define BINARY_OPERATION_ISUB_LONG_LONG BINARY_OPERATION_SUB_LONG_LONG
+
+#define BINARY_OPERATION_ISUB_LONG_FLOAT BINARY_OPERATION_SUB_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_LONG_STR PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_LONG_UNICODE PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_LONG_BYTES PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_LONG_LIST PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_LONG_TUPLE PyNumber_InPlaceSubtract
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ISUB_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_SUB_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceSubtract(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_FLOAT_INT BINARY_OPERATION_SUB_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_ISUB_FLOAT_LONG BINARY_OPERATION_SUB_FLOAT_LONG
+
+#define BINARY_OPERATION_ISUB_FLOAT_FLOAT BINARY_OPERATION_SUB_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_FLOAT_STR PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_FLOAT_UNICODE PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_FLOAT_BYTES PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_FLOAT_LIST PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_FLOAT_TUPLE PyNumber_InPlaceSubtract
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ISUB_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_SUB_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceSubtract(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_INT PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_LONG PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_FLOAT PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_STR PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_UNICODE PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_LIST PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_TUPLE PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_STR_OBJECT PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_UNICODE_INT PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_UNICODE_LONG PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_UNICODE_FLOAT PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_UNICODE_STR PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_UNICODE_UNICODE PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_UNICODE_BYTES PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_UNICODE_LIST PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_UNICODE_TUPLE PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_UNICODE_OBJECT PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_LONG PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_FLOAT PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_UNICODE PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_BYTES PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_LIST PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_TUPLE PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_BYTES_OBJECT PyNumber_InPlaceSubtract
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_TUPLE_INT PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_TUPLE_LONG PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_TUPLE_FLOAT PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ISUB_TUPLE_STR PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_TUPLE_UNICODE PyNumber_InPlaceSubtract
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ISUB_TUPLE_BYTES PyNumber_InPlaceSubtract
+#endif
+
+#define BINARY_OPERATION_ISUB_TUPLE_LIST PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_TUPLE_TUPLE PyNumber_InPlaceSubtract
+
+#define BINARY_OPERATION_ISUB_TUPLE_OBJECT PyNumber_InPlaceSubtract
+
+// Specialized helpers for binary operation MUL.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    return PyFloat_FromDouble(a * b);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_STR_STR BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_UNICODE_UNICODE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_BYTES_BYTES BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_LIST_LIST BINARY_OPERATION_MUL
+
+#define BINARY_OPERATION_MUL_TUPLE_TUPLE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyString_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyUnicode_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyList_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyTuple_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyString_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyUnicode_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyBytes_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyList_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyTuple_Type.tp_as_sequence->sq_repeat, operand2, operand1);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_multiply(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_FLOAT_STR BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_FLOAT_UNICODE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_FLOAT_BYTES BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_FLOAT_LIST BINARY_OPERATION_MUL
+
+#define BINARY_OPERATION_MUL_FLOAT_TUPLE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_STR_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyString_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_STR_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyString_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_STR_FLOAT BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_STR_UNICODE BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_STR_LIST BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_STR_TUPLE BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_UNICODE_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyUnicode_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_UNICODE_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyUnicode_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+
+#define BINARY_OPERATION_MUL_UNICODE_FLOAT BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_UNICODE_STR BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_UNICODE_BYTES BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_UNICODE_LIST BINARY_OPERATION_MUL
+
+#define BINARY_OPERATION_MUL_UNICODE_TUPLE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_BYTES_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyBytes_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyBytes_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_BYTES_FLOAT BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_BYTES_UNICODE BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_BYTES_LIST BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_BYTES_TUPLE BINARY_OPERATION_MUL
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LIST_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyList_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LIST_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyList_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyList_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+
+#define BINARY_OPERATION_MUL_LIST_FLOAT BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_LIST_STR BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_LIST_UNICODE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_LIST_BYTES BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_LIST_TUPLE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_TUPLE_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyTuple_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_TUPLE_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyTuple_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    return SEQUENCE_REPEAT(PyTuple_Type.tp_as_sequence->sq_repeat, operand1, operand2);
+}
+
+#define BINARY_OPERATION_MUL_TUPLE_FLOAT BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_TUPLE_STR BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_TUPLE_UNICODE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_TUPLE_BYTES BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_TUPLE_LIST BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_MUL_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_MUL_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_MUL_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_OBJECT_STR BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_OBJECT_UNICODE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_OBJECT_BYTES BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_OBJECT_LIST BINARY_OPERATION_MUL
+
+#define BINARY_OPERATION_MUL_OBJECT_TUPLE BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_MUL_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_MUL_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_MUL_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_MUL_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_MUL(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_MUL_STR_OBJECT BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_UNICODE_OBJECT BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_MUL_BYTES_OBJECT BINARY_OPERATION_MUL
+#endif
+
+#define BINARY_OPERATION_MUL_LIST_OBJECT BINARY_OPERATION_MUL
+
+#define BINARY_OPERATION_MUL_TUPLE_OBJECT BINARY_OPERATION_MUL
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_INT BINARY_OPERATION_MUL_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_LONG BINARY_OPERATION_MUL_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_FLOAT BINARY_OPERATION_MUL_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_STR BINARY_OPERATION_MUL_INT_STR
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_UNICODE BINARY_OPERATION_MUL_INT_UNICODE
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_LIST BINARY_OPERATION_MUL_INT_LIST
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_INT_TUPLE BINARY_OPERATION_MUL_INT_TUPLE
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IMUL_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_MUL_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceMultiply(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_LONG_INT BINARY_OPERATION_MUL_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IMUL_LONG_LONG BINARY_OPERATION_MUL_LONG_LONG
+
+#define BINARY_OPERATION_IMUL_LONG_FLOAT BINARY_OPERATION_MUL_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_LONG_STR BINARY_OPERATION_MUL_LONG_STR
+#endif
+
+#define BINARY_OPERATION_IMUL_LONG_UNICODE BINARY_OPERATION_MUL_LONG_UNICODE
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_LONG_BYTES BINARY_OPERATION_MUL_LONG_BYTES
+#endif
+
+#define BINARY_OPERATION_IMUL_LONG_LIST BINARY_OPERATION_MUL_LONG_LIST
+
+#define BINARY_OPERATION_IMUL_LONG_TUPLE BINARY_OPERATION_MUL_LONG_TUPLE
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IMUL_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_MUL_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceMultiply(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_FLOAT_INT BINARY_OPERATION_MUL_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_IMUL_FLOAT_LONG BINARY_OPERATION_MUL_FLOAT_LONG
+
+#define BINARY_OPERATION_IMUL_FLOAT_FLOAT BINARY_OPERATION_MUL_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_FLOAT_STR PyNumber_InPlaceMultiply
+#endif
+
+#define BINARY_OPERATION_IMUL_FLOAT_UNICODE PyNumber_InPlaceMultiply
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_FLOAT_BYTES PyNumber_InPlaceMultiply
+#endif
+
+#define BINARY_OPERATION_IMUL_FLOAT_LIST PyNumber_InPlaceMultiply
+
+#define BINARY_OPERATION_IMUL_FLOAT_TUPLE PyNumber_InPlaceMultiply
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IMUL_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_MUL_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceMultiply(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_INT BINARY_OPERATION_MUL_STR_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_LONG BINARY_OPERATION_MUL_STR_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_FLOAT PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_STR PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_UNICODE PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_LIST PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_TUPLE PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_STR_OBJECT PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_UNICODE_INT BINARY_OPERATION_MUL_UNICODE_INT
+#endif
+
+#define BINARY_OPERATION_IMUL_UNICODE_LONG BINARY_OPERATION_MUL_UNICODE_LONG
+
+#define BINARY_OPERATION_IMUL_UNICODE_FLOAT PyNumber_InPlaceMultiply
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_UNICODE_STR PyNumber_InPlaceMultiply
+#endif
+
+#define BINARY_OPERATION_IMUL_UNICODE_UNICODE PyNumber_InPlaceMultiply
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_UNICODE_BYTES PyNumber_InPlaceMultiply
+#endif
+
+#define BINARY_OPERATION_IMUL_UNICODE_LIST PyNumber_InPlaceMultiply
+
+#define BINARY_OPERATION_IMUL_UNICODE_TUPLE PyNumber_InPlaceMultiply
+
+#define BINARY_OPERATION_IMUL_UNICODE_OBJECT PyNumber_InPlaceMultiply
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_LONG BINARY_OPERATION_MUL_BYTES_LONG
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_FLOAT PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_UNICODE PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_BYTES PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_LIST PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_TUPLE PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_BYTES_OBJECT PyNumber_InPlaceMultiply
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_TUPLE_INT BINARY_OPERATION_MUL_TUPLE_INT
+#endif
+
+#define BINARY_OPERATION_IMUL_TUPLE_LONG BINARY_OPERATION_MUL_TUPLE_LONG
+
+#define BINARY_OPERATION_IMUL_TUPLE_FLOAT PyNumber_InPlaceMultiply
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IMUL_TUPLE_STR PyNumber_InPlaceMultiply
+#endif
+
+#define BINARY_OPERATION_IMUL_TUPLE_UNICODE PyNumber_InPlaceMultiply
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IMUL_TUPLE_BYTES PyNumber_InPlaceMultiply
+#endif
+
+#define BINARY_OPERATION_IMUL_TUPLE_LIST PyNumber_InPlaceMultiply
+
+#define BINARY_OPERATION_IMUL_TUPLE_TUPLE PyNumber_InPlaceMultiply
+
+#define BINARY_OPERATION_IMUL_TUPLE_OBJECT PyNumber_InPlaceMultiply
+
+// Specialized helpers for binary operation DIV.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_INT_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_INT_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_INT_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_INT_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LONG_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LONG_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LONG_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LONG_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_FLOAT_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_FLOAT_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_FLOAT_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_FLOAT_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_INT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_LONG BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_FLOAT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_INT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_LONG BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_FLOAT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_INT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_LONG BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_FLOAT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_INT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_LONG BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_FLOAT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_DIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_DIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_OBJECT_STR BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_OBJECT_UNICODE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_OBJECT_LIST BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_OBJECT_TUPLE BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_DIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_DIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_STR_OBJECT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_UNICODE_OBJECT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_LIST_OBJECT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_DIV_TUPLE_OBJECT BINARY_OPERATION_DIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_INT BINARY_OPERATION_DIV_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_LONG BINARY_OPERATION_DIV_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_FLOAT BINARY_OPERATION_DIV_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_STR PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_UNICODE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_LIST PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_INT_TUPLE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceDivide(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_INT BINARY_OPERATION_DIV_LONG_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_LONG BINARY_OPERATION_DIV_LONG_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_FLOAT BINARY_OPERATION_DIV_LONG_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_STR PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_UNICODE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_LIST PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_LONG_TUPLE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceDivide(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_INT BINARY_OPERATION_DIV_FLOAT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_LONG BINARY_OPERATION_DIV_FLOAT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_FLOAT BINARY_OPERATION_DIV_FLOAT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_STR PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_UNICODE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_LIST PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_FLOAT_TUPLE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_DIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceDivide(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_INT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_LONG PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_FLOAT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_STR PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_UNICODE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_LIST PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_TUPLE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_STR_OBJECT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_INT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_LONG PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_FLOAT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_STR PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_UNICODE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_LIST PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_TUPLE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_UNICODE_OBJECT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_INT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_LONG PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_FLOAT PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_STR PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_UNICODE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_LIST PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_TUPLE PyNumber_InPlaceDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IDIV_TUPLE_OBJECT PyNumber_InPlaceDivide
+#endif
+
+// Specialized helpers for binary operation FLOORDIV.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_UNICODE_UNICODE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LIST_LIST BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_TUPLE_TUPLE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_INT_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_INT_UNICODE BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_INT_LIST BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_INT_TUPLE BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_LONG_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LONG_UNICODE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_LONG_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LONG_LIST BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_LONG_TUPLE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_floor_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_FLOAT_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_FLOAT_UNICODE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_FLOAT_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_FLOAT_LIST BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_FLOAT_TUPLE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_INT BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_LONG BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_FLOAT BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_UNICODE BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_LIST BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_TUPLE BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_UNICODE_INT BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_UNICODE_LONG BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_UNICODE_FLOAT BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_UNICODE_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_UNICODE_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_UNICODE_LIST BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_UNICODE_TUPLE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_LONG BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_FLOAT BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_UNICODE BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_LIST BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_TUPLE BINARY_OPERATION_FLOORDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_LIST_INT BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LIST_LONG BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_LIST_FLOAT BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_LIST_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LIST_UNICODE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_LIST_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LIST_TUPLE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_TUPLE_INT BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_TUPLE_LONG BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_TUPLE_FLOAT BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_TUPLE_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_TUPLE_UNICODE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_TUPLE_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_TUPLE_LIST BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_FLOORDIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_FLOORDIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_OBJECT_STR BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_OBJECT_UNICODE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_OBJECT_BYTES BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_OBJECT_LIST BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_OBJECT_TUPLE BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_FLOORDIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_FLOORDIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_FLOORDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_FLOORDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_FLOORDIV_STR_OBJECT BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_UNICODE_OBJECT BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_FLOORDIV_BYTES_OBJECT BINARY_OPERATION_FLOORDIV
+#endif
+
+#define BINARY_OPERATION_FLOORDIV_LIST_OBJECT BINARY_OPERATION_FLOORDIV
+
+#define BINARY_OPERATION_FLOORDIV_TUPLE_OBJECT BINARY_OPERATION_FLOORDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_INT BINARY_OPERATION_FLOORDIV_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_LONG BINARY_OPERATION_FLOORDIV_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_FLOAT BINARY_OPERATION_FLOORDIV_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_STR PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_UNICODE PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_LIST PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_INT_TUPLE PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IFLOORDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_FLOORDIV_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceFloorDivide(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_LONG_INT BINARY_OPERATION_FLOORDIV_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_LONG_LONG BINARY_OPERATION_FLOORDIV_LONG_LONG
+
+#define BINARY_OPERATION_IFLOORDIV_LONG_FLOAT BINARY_OPERATION_FLOORDIV_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_LONG_STR PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_LONG_UNICODE PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_LONG_BYTES PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_LONG_LIST PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_LONG_TUPLE PyNumber_InPlaceFloorDivide
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IFLOORDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_FLOORDIV_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceFloorDivide(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_INT BINARY_OPERATION_FLOORDIV_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_LONG BINARY_OPERATION_FLOORDIV_FLOAT_LONG
+
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_FLOAT BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_STR PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_UNICODE PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_BYTES PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_LIST PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_FLOAT_TUPLE PyNumber_InPlaceFloorDivide
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IFLOORDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_FLOORDIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceFloorDivide(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_INT PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_LONG PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_FLOAT PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_STR PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_UNICODE PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_LIST PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_TUPLE PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_STR_OBJECT PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_INT PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_LONG PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_FLOAT PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_STR PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_UNICODE PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_BYTES PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_LIST PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_TUPLE PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_UNICODE_OBJECT PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_LONG PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_FLOAT PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_UNICODE PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_BYTES PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_LIST PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_TUPLE PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_BYTES_OBJECT PyNumber_InPlaceFloorDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_INT PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_LONG PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_FLOAT PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_STR PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_UNICODE PyNumber_InPlaceFloorDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_BYTES PyNumber_InPlaceFloorDivide
+#endif
+
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_LIST PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_TUPLE PyNumber_InPlaceFloorDivide
+
+#define BINARY_OPERATION_IFLOORDIV_TUPLE_OBJECT PyNumber_InPlaceFloorDivide
+
+// Specialized helpers for binary operation TRUEDIV.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    // The slot raises the exception for this.
+    if (likely(b != 0.0)) {
+        return PyFloat_FromDouble(a / b);
+    }
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_UNICODE_UNICODE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LIST_LIST BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_TUPLE_TUPLE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_INT_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_INT_UNICODE BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_INT_LIST BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_INT_TUPLE BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_LONG_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LONG_UNICODE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_LONG_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LONG_LIST BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_LONG_TUPLE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_true_divide(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_FLOAT_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_FLOAT_UNICODE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_FLOAT_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_FLOAT_LIST BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_FLOAT_TUPLE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_INT BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_LONG BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_FLOAT BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_UNICODE BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_LIST BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_TUPLE BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_UNICODE_INT BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_UNICODE_LONG BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_UNICODE_FLOAT BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_UNICODE_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_UNICODE_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_UNICODE_LIST BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_UNICODE_TUPLE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_LONG BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_FLOAT BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_UNICODE BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_LIST BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_TUPLE BINARY_OPERATION_TRUEDIV
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_LIST_INT BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LIST_LONG BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_LIST_FLOAT BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_LIST_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LIST_UNICODE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_LIST_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LIST_TUPLE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_TUPLE_INT BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_TUPLE_LONG BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_TUPLE_FLOAT BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_TUPLE_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_TUPLE_UNICODE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_TUPLE_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_TUPLE_LIST BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_TRUEDIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_TRUEDIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_OBJECT_STR BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_OBJECT_UNICODE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_OBJECT_BYTES BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_OBJECT_LIST BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_OBJECT_TUPLE BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_TRUEDIV_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_TRUEDIV_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_TRUEDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_TRUEDIV(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_TRUEDIV_STR_OBJECT BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_UNICODE_OBJECT BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_TRUEDIV_BYTES_OBJECT BINARY_OPERATION_TRUEDIV
+#endif
+
+#define BINARY_OPERATION_TRUEDIV_LIST_OBJECT BINARY_OPERATION_TRUEDIV
+
+#define BINARY_OPERATION_TRUEDIV_TUPLE_OBJECT BINARY_OPERATION_TRUEDIV
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_INT BINARY_OPERATION_TRUEDIV_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_LONG BINARY_OPERATION_TRUEDIV_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_FLOAT BINARY_OPERATION_TRUEDIV_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_STR PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_UNICODE PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_LIST PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_INT_TUPLE PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ITRUEDIV_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_TRUEDIV_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceTrueDivide(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_LONG_INT BINARY_OPERATION_TRUEDIV_LONG_INT
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_LONG_LONG BINARY_OPERATION_TRUEDIV_LONG_LONG
+
+#define BINARY_OPERATION_ITRUEDIV_LONG_FLOAT BINARY_OPERATION_TRUEDIV_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_LONG_STR PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_LONG_UNICODE PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_LONG_BYTES PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_LONG_LIST PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_LONG_TUPLE PyNumber_InPlaceTrueDivide
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ITRUEDIV_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_TRUEDIV_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceTrueDivide(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_INT BINARY_OPERATION_TRUEDIV_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_LONG BINARY_OPERATION_TRUEDIV_FLOAT_LONG
+
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_FLOAT BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_STR PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_UNICODE PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_BYTES PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_LIST PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_FLOAT_TUPLE PyNumber_InPlaceTrueDivide
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ITRUEDIV_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_TRUEDIV_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceTrueDivide(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_INT PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_LONG PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_FLOAT PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_STR PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_UNICODE PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_LIST PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_TUPLE PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_STR_OBJECT PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_INT PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_LONG PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_FLOAT PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_STR PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_UNICODE PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_BYTES PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_LIST PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_TUPLE PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_UNICODE_OBJECT PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_LONG PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_FLOAT PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_UNICODE PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_BYTES PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_LIST PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_TUPLE PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_BYTES_OBJECT PyNumber_InPlaceTrueDivide
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_INT PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_LONG PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_FLOAT PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_STR PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_UNICODE PyNumber_InPlaceTrueDivide
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_BYTES PyNumber_InPlaceTrueDivide
+#endif
+
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_LIST PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_TUPLE PyNumber_InPlaceTrueDivide
+
+#define BINARY_OPERATION_ITRUEDIV_TUPLE_OBJECT PyNumber_InPlaceTrueDivide
+
+// Specialized helpers for binary operation REMAINDER.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_BYTES BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LIST_LIST BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_TUPLE_TUPLE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_INT_STR BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_INT_UNICODE BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_INT_LIST BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_INT_TUPLE BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_LONG_STR BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LONG_UNICODE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_LONG_BYTES BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LONG_LIST BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_LONG_TUPLE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_FLOAT_STR BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_FLOAT_UNICODE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_FLOAT_BYTES BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_FLOAT_LIST BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_FLOAT_TUPLE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    PyObject *result = PyString_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION >= 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_BYTES(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyBytes_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_LIST(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyList_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_TUPLE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyTuple_CheckExact(operand2));
+
+    PyObject *result = PyUnicode_Type.tp_as_number->nb_remainder(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_LONG BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_FLOAT BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_UNICODE BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_LIST BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_TUPLE BINARY_OPERATION_REMAINDER
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_LIST_INT BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LIST_LONG BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_LIST_FLOAT BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_LIST_STR BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LIST_UNICODE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_LIST_BYTES BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LIST_TUPLE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_TUPLE_INT BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_TUPLE_LONG BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_TUPLE_FLOAT BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_REMAINDER_TUPLE_STR BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_TUPLE_UNICODE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_TUPLE_BYTES BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_TUPLE_LIST BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_REMAINDER_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_REMAINDER_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_REMAINDER_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_OBJECT_STR(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyString_CheckExact(operand2));
+
+    if (PyString_CheckExact(operand1)) {
+        return BINARY_OPERATION_REMAINDER_STR_STR(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_OBJECT_UNICODE(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyUnicode_CheckExact(operand2));
+
+    if (PyUnicode_CheckExact(operand1)) {
+        return BINARY_OPERATION_REMAINDER_UNICODE_UNICODE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_OBJECT_BYTES BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_OBJECT_LIST BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_OBJECT_TUPLE BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_INT_INT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_LONG_LONG(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_STR_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyString_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_STR_STR(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_REMAINDER_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyUnicode_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_UNICODE_UNICODE(operand1, operand2);
+    }
+
+    return BINARY_OPERATION_REMAINDER(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_REMAINDER_BYTES_OBJECT BINARY_OPERATION_REMAINDER
+#endif
+
+#define BINARY_OPERATION_REMAINDER_LIST_OBJECT BINARY_OPERATION_REMAINDER
+
+#define BINARY_OPERATION_REMAINDER_TUPLE_OBJECT BINARY_OPERATION_REMAINDER
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_INT BINARY_OPERATION_REMAINDER_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_LONG BINARY_OPERATION_REMAINDER_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_FLOAT BINARY_OPERATION_REMAINDER_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_STR PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_UNICODE PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_LIST PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_INT_TUPLE PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IREMAINDER_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRemainder(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_LONG_INT BINARY_OPERATION_REMAINDER_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_LONG_LONG BINARY_OPERATION_REMAINDER_LONG_LONG
+
+#define BINARY_OPERATION_IREMAINDER_LONG_FLOAT BINARY_OPERATION_REMAINDER_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_LONG_STR PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_LONG_UNICODE PyNumber_InPlaceRemainder
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_LONG_BYTES PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_LONG_LIST PyNumber_InPlaceRemainder
+
+#define BINARY_OPERATION_IREMAINDER_LONG_TUPLE PyNumber_InPlaceRemainder
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IREMAINDER_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRemainder(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_FLOAT_INT BINARY_OPERATION_REMAINDER_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_FLOAT_LONG BINARY_OPERATION_REMAINDER_FLOAT_LONG
+
+#define BINARY_OPERATION_IREMAINDER_FLOAT_FLOAT BINARY_OPERATION_REMAINDER_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_FLOAT_STR PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_FLOAT_UNICODE PyNumber_InPlaceRemainder
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_FLOAT_BYTES PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_FLOAT_LIST PyNumber_InPlaceRemainder
+
+#define BINARY_OPERATION_IREMAINDER_FLOAT_TUPLE PyNumber_InPlaceRemainder
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IREMAINDER_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRemainder(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_INT BINARY_OPERATION_REMAINDER_STR_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_LONG BINARY_OPERATION_REMAINDER_STR_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_FLOAT BINARY_OPERATION_REMAINDER_STR_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_STR BINARY_OPERATION_REMAINDER_STR_STR
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_UNICODE BINARY_OPERATION_REMAINDER_STR_UNICODE
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_LIST BINARY_OPERATION_REMAINDER_STR_LIST
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_STR_TUPLE BINARY_OPERATION_REMAINDER_STR_TUPLE
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IREMAINDER_STR_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyString_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyString_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_STR_STR(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRemainder(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_UNICODE_INT BINARY_OPERATION_REMAINDER_UNICODE_INT
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_UNICODE_LONG BINARY_OPERATION_REMAINDER_UNICODE_LONG
+
+#define BINARY_OPERATION_IREMAINDER_UNICODE_FLOAT BINARY_OPERATION_REMAINDER_UNICODE_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_UNICODE_STR BINARY_OPERATION_REMAINDER_UNICODE_STR
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_UNICODE_UNICODE BINARY_OPERATION_REMAINDER_UNICODE_UNICODE
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_UNICODE_BYTES BINARY_OPERATION_REMAINDER_UNICODE_BYTES
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_UNICODE_LIST BINARY_OPERATION_REMAINDER_UNICODE_LIST
+
+#define BINARY_OPERATION_IREMAINDER_UNICODE_TUPLE BINARY_OPERATION_REMAINDER_UNICODE_TUPLE
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IREMAINDER_UNICODE_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyUnicode_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyUnicode_CheckExact(operand2)) {
+        return BINARY_OPERATION_REMAINDER_UNICODE_UNICODE(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRemainder(operand1, operand2);
+}
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_LONG PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_FLOAT PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_UNICODE PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_BYTES PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_LIST PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_TUPLE PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_BYTES_OBJECT PyNumber_InPlaceRemainder
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_TUPLE_INT PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_TUPLE_LONG PyNumber_InPlaceRemainder
+
+#define BINARY_OPERATION_IREMAINDER_TUPLE_FLOAT PyNumber_InPlaceRemainder
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IREMAINDER_TUPLE_STR PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_TUPLE_UNICODE PyNumber_InPlaceRemainder
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IREMAINDER_TUPLE_BYTES PyNumber_InPlaceRemainder
+#endif
+
+#define BINARY_OPERATION_IREMAINDER_TUPLE_LIST PyNumber_InPlaceRemainder
+
+#define BINARY_OPERATION_IREMAINDER_TUPLE_TUPLE PyNumber_InPlaceRemainder
+
+#define BINARY_OPERATION_IREMAINDER_TUPLE_OBJECT PyNumber_InPlaceRemainder
+
+// Specialized helpers for binary operation POW.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_FLOAT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_STR POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_UNICODE_UNICODE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LIST_LIST POWER_OPERATION
+
+#define BINARY_OPERATION_POW_TUPLE_TUPLE POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_INT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_INT_STR POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_INT_UNICODE POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_INT_LIST POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_INT_TUPLE POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_LONG_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_LONG_STR POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LONG_UNICODE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_LONG_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LONG_LIST POWER_OPERATION
+
+#define BINARY_OPERATION_POW_LONG_TUPLE POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_FLOAT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_FLOAT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyFloat_Type.tp_as_number->nb_power(operand1, operand2, Py_None);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_FLOAT_STR POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_FLOAT_UNICODE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_FLOAT_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_FLOAT_LIST POWER_OPERATION
+
+#define BINARY_OPERATION_POW_FLOAT_TUPLE POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_INT POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_LONG POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_FLOAT POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_UNICODE POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_LIST POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_TUPLE POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_UNICODE_INT POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_UNICODE_LONG POWER_OPERATION
+
+#define BINARY_OPERATION_POW_UNICODE_FLOAT POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_UNICODE_STR POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_UNICODE_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_UNICODE_LIST POWER_OPERATION
+
+#define BINARY_OPERATION_POW_UNICODE_TUPLE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_LONG POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_FLOAT POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_UNICODE POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_LIST POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_TUPLE POWER_OPERATION
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_LIST_INT POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LIST_LONG POWER_OPERATION
+
+#define BINARY_OPERATION_POW_LIST_FLOAT POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_LIST_STR POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LIST_UNICODE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_LIST_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LIST_TUPLE POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_TUPLE_INT POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_TUPLE_LONG POWER_OPERATION
+
+#define BINARY_OPERATION_POW_TUPLE_FLOAT POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_TUPLE_STR POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_TUPLE_UNICODE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_TUPLE_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_TUPLE_LIST POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_POW_INT_INT(operand1, operand2);
+    }
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_POW_LONG_LONG(operand1, operand2);
+    }
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_OBJECT_FLOAT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyFloat_CheckExact(operand2));
+
+    if (PyFloat_CheckExact(operand1)) {
+        return BINARY_OPERATION_POW_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_OBJECT_STR POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_OBJECT_UNICODE POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_OBJECT_BYTES POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_OBJECT_LIST POWER_OPERATION
+
+#define BINARY_OPERATION_POW_OBJECT_TUPLE POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_POW_INT_INT(operand1, operand2);
+    }
+
+    return POWER_OPERATION(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_POW_LONG_LONG(operand1, operand2);
+    }
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_POW_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_POW_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return POWER_OPERATION(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_POW_STR_OBJECT POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_UNICODE_OBJECT POWER_OPERATION
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_POW_BYTES_OBJECT POWER_OPERATION
+#endif
+
+#define BINARY_OPERATION_POW_LIST_OBJECT POWER_OPERATION
+
+#define BINARY_OPERATION_POW_TUPLE_OBJECT POWER_OPERATION
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_INT BINARY_OPERATION_POW_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_LONG BINARY_OPERATION_POW_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_FLOAT BINARY_OPERATION_POW_INT_FLOAT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_STR POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_UNICODE POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_LIST POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_INT_TUPLE POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IPOW_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_POW_INT_INT(operand1, operand2);
+    }
+
+    return POWER_OPERATION2(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_LONG_INT BINARY_OPERATION_POW_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IPOW_LONG_LONG BINARY_OPERATION_POW_LONG_LONG
+
+#define BINARY_OPERATION_IPOW_LONG_FLOAT BINARY_OPERATION_POW_LONG_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_LONG_STR POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_LONG_UNICODE POWER_OPERATION2
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_LONG_BYTES POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_LONG_LIST POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_LONG_TUPLE POWER_OPERATION2
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IPOW_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_POW_LONG_LONG(operand1, operand2);
+    }
+
+    return POWER_OPERATION2(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_FLOAT_INT BINARY_OPERATION_POW_FLOAT_INT
+#endif
+
+#define BINARY_OPERATION_IPOW_FLOAT_LONG BINARY_OPERATION_POW_FLOAT_LONG
+
+#define BINARY_OPERATION_IPOW_FLOAT_FLOAT BINARY_OPERATION_POW_FLOAT_FLOAT
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_FLOAT_STR POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_FLOAT_UNICODE POWER_OPERATION2
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_FLOAT_BYTES POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_FLOAT_LIST POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_FLOAT_TUPLE POWER_OPERATION2
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IPOW_FLOAT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyFloat_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyFloat_CheckExact(operand2)) {
+        return BINARY_OPERATION_POW_FLOAT_FLOAT(operand1, operand2);
+    }
+
+    return POWER_OPERATION2(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_INT POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_LONG POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_FLOAT POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_STR POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_UNICODE POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_LIST POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_TUPLE POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_STR_OBJECT POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_UNICODE_INT POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_UNICODE_LONG POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_UNICODE_FLOAT POWER_OPERATION2
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_UNICODE_STR POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_UNICODE_UNICODE POWER_OPERATION2
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_UNICODE_BYTES POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_UNICODE_LIST POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_UNICODE_TUPLE POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_UNICODE_OBJECT POWER_OPERATION2
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_LONG POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_FLOAT POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_UNICODE POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_BYTES POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_LIST POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_TUPLE POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_BYTES_OBJECT POWER_OPERATION2
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_TUPLE_INT POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_TUPLE_LONG POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_TUPLE_FLOAT POWER_OPERATION2
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IPOW_TUPLE_STR POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_TUPLE_UNICODE POWER_OPERATION2
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IPOW_TUPLE_BYTES POWER_OPERATION2
+#endif
+
+#define BINARY_OPERATION_IPOW_TUPLE_LIST POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_TUPLE_TUPLE POWER_OPERATION2
+
+#define BINARY_OPERATION_IPOW_TUPLE_OBJECT POWER_OPERATION2
+
+// Specialized helpers for binary operation LSHIFT.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_lshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_lshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+
+#define BINARY_OPERATION_LSHIFT_FLOAT_FLOAT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_STR PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_UNICODE_UNICODE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LIST_LIST PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_TUPLE_TUPLE PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_lshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_INT_FLOAT PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_INT_STR PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_INT_UNICODE PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_INT_LIST PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_INT_TUPLE PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_lshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LONG_FLOAT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_LONG_STR PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LONG_UNICODE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_LONG_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LONG_LIST PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_LONG_TUPLE PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_FLOAT_INT PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_FLOAT_LONG PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_FLOAT_STR PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_FLOAT_UNICODE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_FLOAT_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_FLOAT_LIST PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_FLOAT_TUPLE PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_INT PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_LONG PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_FLOAT PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_UNICODE PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_LIST PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_TUPLE PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_UNICODE_INT PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_UNICODE_LONG PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_UNICODE_FLOAT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_UNICODE_STR PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_UNICODE_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_UNICODE_LIST PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_UNICODE_TUPLE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_LONG PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_FLOAT PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_UNICODE PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_LIST PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_TUPLE PyNumber_Lshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_LIST_INT PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LIST_LONG PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_LIST_FLOAT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_LIST_STR PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LIST_UNICODE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_LIST_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LIST_TUPLE PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_TUPLE_INT PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_TUPLE_LONG PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_TUPLE_FLOAT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_TUPLE_STR PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_TUPLE_UNICODE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_TUPLE_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_TUPLE_LIST PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_LSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_LSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+
+#define BINARY_OPERATION_LSHIFT_OBJECT_FLOAT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_OBJECT_STR PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_OBJECT_UNICODE PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_OBJECT_BYTES PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_OBJECT_LIST PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_OBJECT_TUPLE PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_LSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_LSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_LSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Lshift(operand1, operand2);
+}
+
+#define BINARY_OPERATION_LSHIFT_FLOAT_OBJECT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_LSHIFT_STR_OBJECT PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_UNICODE_OBJECT PyNumber_Lshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_LSHIFT_BYTES_OBJECT PyNumber_Lshift
+#endif
+
+#define BINARY_OPERATION_LSHIFT_LIST_OBJECT PyNumber_Lshift
+
+#define BINARY_OPERATION_LSHIFT_TUPLE_OBJECT PyNumber_Lshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_INT BINARY_OPERATION_LSHIFT_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_LONG BINARY_OPERATION_LSHIFT_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_FLOAT PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_STR PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_UNICODE PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_LIST PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_INT_TUPLE PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ILSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_LSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceLshift(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_LONG_INT BINARY_OPERATION_LSHIFT_LONG_INT
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_LONG_LONG BINARY_OPERATION_LSHIFT_LONG_LONG
+
+#define BINARY_OPERATION_ILSHIFT_LONG_FLOAT PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_LONG_STR PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_LONG_UNICODE PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_LONG_BYTES PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_LONG_LIST PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_LONG_TUPLE PyNumber_InPlaceLshift
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_ILSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_LSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceLshift(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_FLOAT_INT PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_FLOAT_LONG PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_FLOAT_FLOAT PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_FLOAT_STR PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_FLOAT_UNICODE PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_FLOAT_BYTES PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_FLOAT_LIST PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_FLOAT_TUPLE PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_FLOAT_OBJECT PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_INT PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_LONG PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_FLOAT PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_STR PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_UNICODE PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_LIST PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_TUPLE PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_STR_OBJECT PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_UNICODE_INT PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_UNICODE_LONG PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_UNICODE_FLOAT PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_UNICODE_STR PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_UNICODE_UNICODE PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_UNICODE_BYTES PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_UNICODE_LIST PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_UNICODE_TUPLE PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_UNICODE_OBJECT PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_LONG PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_FLOAT PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_UNICODE PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_BYTES PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_LIST PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_TUPLE PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_BYTES_OBJECT PyNumber_InPlaceLshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_TUPLE_INT PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_TUPLE_LONG PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_TUPLE_FLOAT PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_ILSHIFT_TUPLE_STR PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_TUPLE_UNICODE PyNumber_InPlaceLshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_ILSHIFT_TUPLE_BYTES PyNumber_InPlaceLshift
+#endif
+
+#define BINARY_OPERATION_ILSHIFT_TUPLE_LIST PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_TUPLE_TUPLE PyNumber_InPlaceLshift
+
+#define BINARY_OPERATION_ILSHIFT_TUPLE_OBJECT PyNumber_InPlaceLshift
+
+// Specialized helpers for binary operation RSHIFT.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_rshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_rshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+
+#define BINARY_OPERATION_RSHIFT_FLOAT_FLOAT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_STR PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_UNICODE_UNICODE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LIST_LIST PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_TUPLE_TUPLE PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_rshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_INT_FLOAT PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_INT_STR PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_INT_UNICODE PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_INT_LIST PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_INT_TUPLE PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_rshift(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LONG_FLOAT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_LONG_STR PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LONG_UNICODE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_LONG_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LONG_LIST PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_LONG_TUPLE PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_FLOAT_INT PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_FLOAT_LONG PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_FLOAT_STR PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_FLOAT_UNICODE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_FLOAT_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_FLOAT_LIST PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_FLOAT_TUPLE PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_INT PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_LONG PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_FLOAT PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_UNICODE PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_LIST PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_TUPLE PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_UNICODE_INT PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_UNICODE_LONG PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_UNICODE_FLOAT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_UNICODE_STR PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_UNICODE_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_UNICODE_LIST PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_UNICODE_TUPLE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_LONG PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_FLOAT PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_UNICODE PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_LIST PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_TUPLE PyNumber_Rshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_LIST_INT PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LIST_LONG PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_LIST_FLOAT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_LIST_STR PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LIST_UNICODE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_LIST_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LIST_TUPLE PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_TUPLE_INT PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_TUPLE_LONG PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_TUPLE_FLOAT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_TUPLE_STR PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_TUPLE_UNICODE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_TUPLE_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_TUPLE_LIST PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_RSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_RSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+
+#define BINARY_OPERATION_RSHIFT_OBJECT_FLOAT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_OBJECT_STR PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_OBJECT_UNICODE PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_OBJECT_BYTES PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_OBJECT_LIST PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_OBJECT_TUPLE PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_RSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_RSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_RSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Rshift(operand1, operand2);
+}
+
+#define BINARY_OPERATION_RSHIFT_FLOAT_OBJECT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_RSHIFT_STR_OBJECT PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_UNICODE_OBJECT PyNumber_Rshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_RSHIFT_BYTES_OBJECT PyNumber_Rshift
+#endif
+
+#define BINARY_OPERATION_RSHIFT_LIST_OBJECT PyNumber_Rshift
+
+#define BINARY_OPERATION_RSHIFT_TUPLE_OBJECT PyNumber_Rshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_INT BINARY_OPERATION_RSHIFT_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_LONG BINARY_OPERATION_RSHIFT_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_FLOAT PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_STR PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_UNICODE PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_LIST PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_INT_TUPLE PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IRSHIFT_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_RSHIFT_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRshift(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_LONG_INT BINARY_OPERATION_RSHIFT_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_LONG_LONG BINARY_OPERATION_RSHIFT_LONG_LONG
+
+#define BINARY_OPERATION_IRSHIFT_LONG_FLOAT PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_LONG_STR PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_LONG_UNICODE PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_LONG_BYTES PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_LONG_LIST PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_LONG_TUPLE PyNumber_InPlaceRshift
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IRSHIFT_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_RSHIFT_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceRshift(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_FLOAT_INT PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_FLOAT_LONG PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_FLOAT_FLOAT PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_FLOAT_STR PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_FLOAT_UNICODE PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_FLOAT_BYTES PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_FLOAT_LIST PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_FLOAT_TUPLE PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_FLOAT_OBJECT PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_INT PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_LONG PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_FLOAT PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_STR PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_UNICODE PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_LIST PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_TUPLE PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_STR_OBJECT PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_UNICODE_INT PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_UNICODE_LONG PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_UNICODE_FLOAT PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_UNICODE_STR PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_UNICODE_UNICODE PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_UNICODE_BYTES PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_UNICODE_LIST PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_UNICODE_TUPLE PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_UNICODE_OBJECT PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_LONG PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_FLOAT PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_UNICODE PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_BYTES PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_LIST PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_TUPLE PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_BYTES_OBJECT PyNumber_InPlaceRshift
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_TUPLE_INT PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_TUPLE_LONG PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_TUPLE_FLOAT PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IRSHIFT_TUPLE_STR PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_TUPLE_UNICODE PyNumber_InPlaceRshift
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IRSHIFT_TUPLE_BYTES PyNumber_InPlaceRshift
+#endif
+
+#define BINARY_OPERATION_IRSHIFT_TUPLE_LIST PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_TUPLE_TUPLE PyNumber_InPlaceRshift
+
+#define BINARY_OPERATION_IRSHIFT_TUPLE_OBJECT PyNumber_InPlaceRshift
+
+// Specialized helpers for binary operation BITAND.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_and(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_And(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_and(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_And(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITAND_FLOAT_FLOAT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_STR PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_UNICODE_UNICODE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LIST_LIST PyNumber_And
+
+#define BINARY_OPERATION_BITAND_TUPLE_TUPLE PyNumber_And
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_and(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_And(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_INT_FLOAT PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_INT_STR PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_INT_UNICODE PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_INT_LIST PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_INT_TUPLE PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_and(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_And(operand1, operand2);
+}
+#endif
+
+#define BINARY_OPERATION_BITAND_LONG_FLOAT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_LONG_STR PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LONG_UNICODE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_LONG_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LONG_LIST PyNumber_And
+
+#define BINARY_OPERATION_BITAND_LONG_TUPLE PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_FLOAT_INT PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_FLOAT_LONG PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_FLOAT_STR PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_FLOAT_UNICODE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_FLOAT_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_FLOAT_LIST PyNumber_And
+
+#define BINARY_OPERATION_BITAND_FLOAT_TUPLE PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_INT PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_LONG PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_FLOAT PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_UNICODE PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_LIST PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_TUPLE PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_UNICODE_INT PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_UNICODE_LONG PyNumber_And
+
+#define BINARY_OPERATION_BITAND_UNICODE_FLOAT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_UNICODE_STR PyNumber_And
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_UNICODE_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_UNICODE_LIST PyNumber_And
+
+#define BINARY_OPERATION_BITAND_UNICODE_TUPLE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_LONG PyNumber_And
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_FLOAT PyNumber_And
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_UNICODE PyNumber_And
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_LIST PyNumber_And
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_TUPLE PyNumber_And
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_LIST_INT PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LIST_LONG PyNumber_And
+
+#define BINARY_OPERATION_BITAND_LIST_FLOAT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_LIST_STR PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LIST_UNICODE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_LIST_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LIST_TUPLE PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_TUPLE_INT PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_TUPLE_LONG PyNumber_And
+
+#define BINARY_OPERATION_BITAND_TUPLE_FLOAT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_TUPLE_STR PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_TUPLE_UNICODE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_TUPLE_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_TUPLE_LIST PyNumber_And
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_BITAND_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_And(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_BITAND_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_And(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITAND_OBJECT_FLOAT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_OBJECT_STR PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_OBJECT_UNICODE PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_OBJECT_BYTES PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_OBJECT_LIST PyNumber_And
+
+#define BINARY_OPERATION_BITAND_OBJECT_TUPLE PyNumber_And
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITAND_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_And(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITAND_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITAND_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_And(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITAND_FLOAT_OBJECT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITAND_STR_OBJECT PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_UNICODE_OBJECT PyNumber_And
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITAND_BYTES_OBJECT PyNumber_And
+#endif
+
+#define BINARY_OPERATION_BITAND_LIST_OBJECT PyNumber_And
+
+#define BINARY_OPERATION_BITAND_TUPLE_OBJECT PyNumber_And
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_INT BINARY_OPERATION_BITAND_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_LONG BINARY_OPERATION_BITAND_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_FLOAT PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_STR PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_UNICODE PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_LIST PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_INT_TUPLE PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IBITAND_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITAND_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAnd(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_LONG_INT BINARY_OPERATION_BITAND_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IBITAND_LONG_LONG BINARY_OPERATION_BITAND_LONG_LONG
+
+#define BINARY_OPERATION_IBITAND_LONG_FLOAT PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_LONG_STR PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_LONG_UNICODE PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_LONG_BYTES PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_LONG_LIST PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_LONG_TUPLE PyNumber_InPlaceAnd
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IBITAND_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITAND_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceAnd(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_FLOAT_INT PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_FLOAT_LONG PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_FLOAT_FLOAT PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_FLOAT_STR PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_FLOAT_UNICODE PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_FLOAT_BYTES PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_FLOAT_LIST PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_FLOAT_TUPLE PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_FLOAT_OBJECT PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_INT PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_LONG PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_FLOAT PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_STR PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_UNICODE PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_LIST PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_TUPLE PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_STR_OBJECT PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_UNICODE_INT PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_UNICODE_LONG PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_UNICODE_FLOAT PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_UNICODE_STR PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_UNICODE_UNICODE PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_UNICODE_BYTES PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_UNICODE_LIST PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_UNICODE_TUPLE PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_UNICODE_OBJECT PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_LONG PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_FLOAT PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_UNICODE PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_BYTES PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_LIST PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_TUPLE PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_BYTES_OBJECT PyNumber_InPlaceAnd
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_TUPLE_INT PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_TUPLE_LONG PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_TUPLE_FLOAT PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITAND_TUPLE_STR PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_TUPLE_UNICODE PyNumber_InPlaceAnd
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITAND_TUPLE_BYTES PyNumber_InPlaceAnd
+#endif
+
+#define BINARY_OPERATION_IBITAND_TUPLE_LIST PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_TUPLE_TUPLE PyNumber_InPlaceAnd
+
+#define BINARY_OPERATION_IBITAND_TUPLE_OBJECT PyNumber_InPlaceAnd
+
+// Specialized helpers for binary operation BITOR.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_or(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Or(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_or(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Or(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITOR_FLOAT_FLOAT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_STR PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_UNICODE_UNICODE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LIST_LIST PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_TUPLE_TUPLE PyNumber_Or
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_or(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Or(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_INT_FLOAT PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_INT_STR PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_INT_UNICODE PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_INT_LIST PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_INT_TUPLE PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_or(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Or(operand1, operand2);
+}
+#endif
+
+#define BINARY_OPERATION_BITOR_LONG_FLOAT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_LONG_STR PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LONG_UNICODE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_LONG_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LONG_LIST PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_LONG_TUPLE PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_FLOAT_INT PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_FLOAT_LONG PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_FLOAT_STR PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_FLOAT_UNICODE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_FLOAT_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_FLOAT_LIST PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_FLOAT_TUPLE PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_INT PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_LONG PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_FLOAT PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_UNICODE PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_LIST PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_TUPLE PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_UNICODE_INT PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_UNICODE_LONG PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_UNICODE_FLOAT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_UNICODE_STR PyNumber_Or
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_UNICODE_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_UNICODE_LIST PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_UNICODE_TUPLE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_LONG PyNumber_Or
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_FLOAT PyNumber_Or
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_UNICODE PyNumber_Or
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_LIST PyNumber_Or
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_TUPLE PyNumber_Or
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_LIST_INT PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LIST_LONG PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_LIST_FLOAT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_LIST_STR PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LIST_UNICODE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_LIST_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LIST_TUPLE PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_TUPLE_INT PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_TUPLE_LONG PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_TUPLE_FLOAT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_TUPLE_STR PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_TUPLE_UNICODE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_TUPLE_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_TUPLE_LIST PyNumber_Or
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_BITOR_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Or(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_BITOR_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Or(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITOR_OBJECT_FLOAT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_OBJECT_STR PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_OBJECT_UNICODE PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_OBJECT_BYTES PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_OBJECT_LIST PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_OBJECT_TUPLE PyNumber_Or
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITOR_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Or(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITOR_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Or(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITOR_FLOAT_OBJECT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITOR_STR_OBJECT PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_UNICODE_OBJECT PyNumber_Or
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITOR_BYTES_OBJECT PyNumber_Or
+#endif
+
+#define BINARY_OPERATION_BITOR_LIST_OBJECT PyNumber_Or
+
+#define BINARY_OPERATION_BITOR_TUPLE_OBJECT PyNumber_Or
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_INT BINARY_OPERATION_BITOR_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_LONG BINARY_OPERATION_BITOR_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_FLOAT PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_STR PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_UNICODE PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_LIST PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_INT_TUPLE PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IBITOR_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITOR_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceOr(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_LONG_INT BINARY_OPERATION_BITOR_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IBITOR_LONG_LONG BINARY_OPERATION_BITOR_LONG_LONG
+
+#define BINARY_OPERATION_IBITOR_LONG_FLOAT PyNumber_InPlaceOr
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_LONG_STR PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_LONG_UNICODE PyNumber_InPlaceOr
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_LONG_BYTES PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_LONG_LIST PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_LONG_TUPLE PyNumber_InPlaceOr
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IBITOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITOR_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceOr(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_FLOAT_INT PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_FLOAT_LONG PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_FLOAT_FLOAT PyNumber_InPlaceOr
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_FLOAT_STR PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_FLOAT_UNICODE PyNumber_InPlaceOr
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_FLOAT_BYTES PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_FLOAT_LIST PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_FLOAT_TUPLE PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_FLOAT_OBJECT PyNumber_InPlaceOr
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_INT PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_LONG PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_FLOAT PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_STR PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_UNICODE PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_LIST PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_TUPLE PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_STR_OBJECT PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_UNICODE_INT PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_UNICODE_LONG PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_UNICODE_FLOAT PyNumber_InPlaceOr
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_UNICODE_STR PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_UNICODE_UNICODE PyNumber_InPlaceOr
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_UNICODE_BYTES PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_UNICODE_LIST PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_UNICODE_TUPLE PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_UNICODE_OBJECT PyNumber_InPlaceOr
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_LONG PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_FLOAT PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_UNICODE PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_BYTES PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_LIST PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_TUPLE PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_BYTES_OBJECT PyNumber_InPlaceOr
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_TUPLE_INT PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_TUPLE_LONG PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_TUPLE_FLOAT PyNumber_InPlaceOr
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITOR_TUPLE_STR PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_TUPLE_UNICODE PyNumber_InPlaceOr
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITOR_TUPLE_BYTES PyNumber_InPlaceOr
+#endif
+
+#define BINARY_OPERATION_IBITOR_TUPLE_LIST PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_TUPLE_TUPLE PyNumber_InPlaceOr
+
+#define BINARY_OPERATION_IBITOR_TUPLE_OBJECT PyNumber_InPlaceOr
+
+// Specialized helpers for binary operation BITXOR.
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_INT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyInt_Type.tp_as_number->nb_xor(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Xor(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_LONG_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_xor(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Xor(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITXOR_FLOAT_FLOAT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_STR PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_UNICODE_UNICODE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LIST_LIST PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_TUPLE_TUPLE PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_INT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_xor(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Xor(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_INT_FLOAT PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_INT_STR PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_INT_UNICODE PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_INT_LIST PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_INT_TUPLE PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_LONG_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    PyObject *result = PyLong_Type.tp_as_number->nb_xor(operand1, operand2);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return PyNumber_Xor(operand1, operand2);
+}
+#endif
+
+#define BINARY_OPERATION_BITXOR_LONG_FLOAT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_LONG_STR PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LONG_UNICODE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_LONG_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LONG_LIST PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_LONG_TUPLE PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_FLOAT_INT PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_FLOAT_LONG PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_FLOAT_STR PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_FLOAT_UNICODE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_FLOAT_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_FLOAT_LIST PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_FLOAT_TUPLE PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_INT PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_LONG PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_FLOAT PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_UNICODE PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_LIST PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_TUPLE PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_UNICODE_INT PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_UNICODE_LONG PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_UNICODE_FLOAT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_UNICODE_STR PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_UNICODE_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_UNICODE_LIST PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_UNICODE_TUPLE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_LONG PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_FLOAT PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_UNICODE PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_LIST PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_TUPLE PyNumber_Xor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_LIST_INT PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LIST_LONG PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_LIST_FLOAT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_LIST_STR PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LIST_UNICODE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_LIST_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LIST_TUPLE PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_TUPLE_INT PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_TUPLE_LONG PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_TUPLE_FLOAT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_TUPLE_STR PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_TUPLE_UNICODE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_TUPLE_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_TUPLE_LIST PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_OBJECT_INT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyInt_CheckExact(operand2));
+
+    if (PyInt_CheckExact(operand1)) {
+        return BINARY_OPERATION_BITXOR_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Xor(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_OBJECT_LONG(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    CHECK_OBJECT(operand2);
+    assert(PyLong_CheckExact(operand2));
+
+    if (PyLong_CheckExact(operand1)) {
+        return BINARY_OPERATION_BITXOR_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Xor(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITXOR_OBJECT_FLOAT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_OBJECT_STR PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_OBJECT_UNICODE PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_OBJECT_BYTES PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_OBJECT_LIST PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_OBJECT_TUPLE PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITXOR_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_Xor(operand1, operand2);
+}
+#endif
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_BITXOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITXOR_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_Xor(operand1, operand2);
+}
+
+#define BINARY_OPERATION_BITXOR_FLOAT_OBJECT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_BITXOR_STR_OBJECT PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_UNICODE_OBJECT PyNumber_Xor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_BITXOR_BYTES_OBJECT PyNumber_Xor
+#endif
+
+#define BINARY_OPERATION_BITXOR_LIST_OBJECT PyNumber_Xor
+
+#define BINARY_OPERATION_BITXOR_TUPLE_OBJECT PyNumber_Xor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_INT BINARY_OPERATION_BITXOR_INT_INT
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_LONG BINARY_OPERATION_BITXOR_INT_LONG
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_FLOAT PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_STR PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_UNICODE PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_LIST PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_INT_TUPLE PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IBITXOR_INT_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyInt_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyInt_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITXOR_INT_INT(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceXor(operand1, operand2);
+}
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_LONG_INT BINARY_OPERATION_BITXOR_LONG_INT
+#endif
+
+#define BINARY_OPERATION_IBITXOR_LONG_LONG BINARY_OPERATION_BITXOR_LONG_LONG
+
+#define BINARY_OPERATION_IBITXOR_LONG_FLOAT PyNumber_InPlaceXor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_LONG_STR PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_LONG_UNICODE PyNumber_InPlaceXor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_LONG_BYTES PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_LONG_LIST PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_LONG_TUPLE PyNumber_InPlaceXor
+
+NUITKA_MAY_BE_UNUSED static PyObject *BINARY_OPERATION_IBITXOR_LONG_OBJECT(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+    assert(PyLong_CheckExact(operand1));
+    CHECK_OBJECT(operand2);
+
+    if (PyLong_CheckExact(operand2)) {
+        return BINARY_OPERATION_BITXOR_LONG_LONG(operand1, operand2);
+    }
+
+    return PyNumber_InPlaceXor(operand1, operand2);
+}
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_FLOAT_INT PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_FLOAT_LONG PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_FLOAT_FLOAT PyNumber_InPlaceXor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_FLOAT_STR PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_FLOAT_UNICODE PyNumber_InPlaceXor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_FLOAT_BYTES PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_FLOAT_LIST PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_FLOAT_TUPLE PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_FLOAT_OBJECT PyNumber_InPlaceXor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_INT PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_LONG PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_FLOAT PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_STR PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_UNICODE PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_LIST PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_TUPLE PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_STR_OBJECT PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_UNICODE_INT PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_UNICODE_LONG PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_UNICODE_FLOAT PyNumber_InPlaceXor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_UNICODE_STR PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_UNICODE_UNICODE PyNumber_InPlaceXor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_UNICODE_BYTES PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_UNICODE_LIST PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_UNICODE_TUPLE PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_UNICODE_OBJECT PyNumber_InPlaceXor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_LONG PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_FLOAT PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_UNICODE PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_BYTES PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_LIST PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_TUPLE PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_BYTES_OBJECT PyNumber_InPlaceXor
+#endif
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_TUPLE_INT PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_TUPLE_LONG PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_TUPLE_FLOAT PyNumber_InPlaceXor
+
+#if PYTHON_VERSION < 300
+#define BINARY_OPERATION_IBITXOR_TUPLE_STR PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_TUPLE_UNICODE PyNumber_InPlaceXor
+
+#if PYTHON_VERSION >= 300
+#define BINARY_OPERATION_IBITXOR_TUPLE_BYTES PyNumber_InPlaceXor
+#endif
+
+#define BINARY_OPERATION_IBITXOR_TUPLE_LIST PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_TUPLE_TUPLE PyNumber_InPlaceXor
+
+#define BINARY_OPERATION_IBITXOR_TUPLE_OBJECT PyNumber_InPlaceXor
+
+#endif
@@ -107,6 +107,7 @@ NUITKA_MAY_BE_UNUSED static PyObject *TO_FLOAT(PyObject *value) {
 #include "nuitka/helper/complex.h"
 
 #include "nuitka/helper/ints.h"
+#include "nuitka/helper/native_numbers.h"
 
 NUITKA_MAY_BE_UNUSED static PyObject *TO_UNICODE3(PyObject *value, PyObject *encoding, PyObject *errors) {
     CHECK_OBJECT(value);
@@ -314,6 +315,10 @@ extern PyObject *UNSTREAM_BYTES(unsigned char const *buffer, Py_ssize_t size);
 extern PyObject *UNSTREAM_FLOAT(unsigned char const *buffer);
 extern PyObject *UNSTREAM_BYTEARRAY(unsigned char const *buffer, Py_ssize_t size);
 
+// Create constants from a stream of records, see "ConstantsStream" in the
+// Nuitka code generation for the format.
+extern void UNSTREAM_CONSTANTS(PyObject **table[], unsigned char const *buffer, Py_ssize_t count);
+
 // Performance enhancements to Python types.
 extern void enhancePythonTypes(void);
 
@@ -47,9 +47,11 @@ struct Nuitka_MetaPathBasedLoaderEntry {
 };
 
 /* For embedded modules, register the meta path based loader. Used by main
- * program/package only.
+ * program/package only. The hash table has the indexes of the entries, in
+ * slots by the hash of their name, with -1 for empty slots.
  */
-extern void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *loader_entries);
+extern void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *loader_entries,
+                                           int const *loader_hash_slots, unsigned int loader_hash_mask);
 
 /* For use as the "__loader__" attribute of compiled modules in newer Python
  * versions.
@@ -947,6 +947,203 @@ PyObject *UNSTREAM_BYTEARRAY(unsigned char const *buffer, Py_ssize_t size) {
     return result;
 }
 
+static Py_ssize_t unstreamSize(unsigned char const **buffer) {
+    Py_ssize_t result = 0;
+    int shift = 0;
+
+    for (;;) {
+        unsigned char value = **buffer;
+        *buffer += 1;
+
+        result |= (Py_ssize_t)(value & 0x7f) << shift;
+
+        if ((value & 0x80) == 0) {
+            return result;
+        }
+
+        shift += 7;
+    }
+}
+
+static long unstreamLong(unsigned char const **buffer) {
+    unsigned long value = 0;
+    int shift = 0;
+
+    for (;;) {
+        unsigned char part = **buffer;
+        *buffer += 1;
+
+        value |= (unsigned long)(part & 0x7f) << shift;
+
+        if ((part & 0x80) == 0) {
+            break;
+        }
+
+        shift += 7;
+    }
+
+    // Sign is in the lowest bit, "zig-zag" encoding.
+    return (long)(value >> 1) ^ -(long)(value & 1);
+}
+
+static PyObject *unstreamElement(PyObject **table[], unsigned char const **buffer) {
+    unsigned char tag = **buffer;
+    *buffer += 1;
+
+    switch (tag) {
+    case 'r': {
+        PyObject *result = *table[unstreamSize(buffer)];
+        CHECK_OBJECT(result);
+
+        return result;
+    }
+    case 'N':
+        return Py_None;
+    case 'T':
+        return Py_True;
+    case 'F':
+        return Py_False;
+    case 'E':
+        return Py_Ellipsis;
+    case 'I':
+        return Py_NotImplemented;
+    default:
+        NUITKA_CANNOT_GET_HERE(unstreamElement);
+    }
+}
+
+void UNSTREAM_CONSTANTS(PyObject **table[], unsigned char const *buffer, Py_ssize_t count) {
+    for (Py_ssize_t i = 0; i < count; i++) {
+        unsigned char tag = *buffer++;
+        PyObject *result;
+
+        switch (tag) {
+        case 'i':
+            result = PyInt_FromLong(unstreamLong(&buffer));
+            break;
+#if PYTHON_VERSION < 300
+        case 'l':
+            result = PyLong_FromLong(unstreamLong(&buffer));
+            break;
+#endif
+        case 'f':
+            result = UNSTREAM_FLOAT(buffer);
+            buffer += 8;
+            break;
+        case 'a':
+        case 's': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = UNSTREAM_STRING(buffer, size, tag == 'a');
+            buffer += size;
+            break;
+        }
+#if PYTHON_VERSION < 300
+        case 'u': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = UNSTREAM_UNICODE(buffer, size);
+            buffer += size;
+            break;
+        }
+#else
+        case 'b': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = UNSTREAM_BYTES(buffer, size);
+            buffer += size;
+            break;
+        }
+#endif
+        case 'B': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = UNSTREAM_BYTEARRAY(buffer, size);
+            buffer += size;
+            break;
+        }
+        case 'm': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = PyMarshal_ReadObjectFromString((char *)buffer, size);
+            buffer += size;
+            break;
+        }
+        case 't': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = PyTuple_New(size);
+
+            for (Py_ssize_t j = 0; j < size; j++) {
+                PyObject *element = unstreamElement(table, &buffer);
+
+                // Do not take references, these won't be deleted ever.
+                PyTuple_SET_ITEM(result, j, element);
+                Py_INCREF(element);
+            }
+
+            break;
+        }
+        case 'L': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = PyList_New(size);
+
+            for (Py_ssize_t j = 0; j < size; j++) {
+                PyObject *element = unstreamElement(table, &buffer);
+
+                PyList_SET_ITEM(result, j, element);
+                Py_INCREF(element);
+            }
+
+            break;
+        }
+        case 'd': {
+            Py_ssize_t size = unstreamSize(&buffer);
+            result = _PyDict_NewPresized(size);
+
+            for (Py_ssize_t j = 0; j < size; j++) {
+                PyObject *key = unstreamElement(table, &buffer);
+                PyObject *value = unstreamElement(table, &buffer);
+
+                PyDict_SetItem(result, key, value);
+            }
+
+            assert(PyDict_Size(result) == size);
+            break;
+        }
+        case 'S':
+        case 'Z': {
+            Py_ssize_t size = unstreamSize(&buffer);
+
+            if (tag == 'S') {
+                result = PySet_New(NULL);
+            } else if (size == 0) {
+                // Empty frozensets are a singleton.
+                result = PyObject_CallFunction((PyObject *)&PyFrozenSet_Type, NULL);
+            } else {
+                result = PyFrozenSet_New(NULL);
+            }
+
+            for (Py_ssize_t j = 0; j < size; j++) {
+                PySet_Add(result, unstreamElement(table, &buffer));
+            }
+
+            assert(PySet_Size(result) == size);
+            break;
+        }
+        case ':': {
+            PyObject *start = unstreamElement(table, &buffer);
+            PyObject *stop = unstreamElement(table, &buffer);
+            PyObject *step = unstreamElement(table, &buffer);
+
+            result = PySlice_New(start, stop, step);
+            break;
+        }
+        default:
+            NUITKA_CANNOT_GET_HERE(UNSTREAM_CONSTANTS);
+        }
+
+        assert(!ERROR_OCCURRED());
+        CHECK_OBJECT(result);
+
+        *table[i] = result;
+    }
+}
+
 #if PYTHON_VERSION < 300
 
 static void set_slot(PyObject **slot, PyObject *value) {
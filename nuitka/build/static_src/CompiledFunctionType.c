@@ -1020,6 +1020,77 @@ static Py_ssize_t handleKeywordArgs(struct Nuitka_FunctionObject const *function
     return kw_found;
 }
 
+// Same as "handleKeywordArgs", but for keyword values given in an array, with
+// a tuple of their names, which are constants of the calling code.
+#if PYTHON_VERSION < 300
+static Py_ssize_t handleKeywordArgsKwSplit(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
+                                           Py_ssize_t args_size, PyObject **kw_values, PyObject *kw_names)
+#else
+static Py_ssize_t handleKeywordArgsKwSplit(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
+                                           Py_ssize_t *kw_only_found, Py_ssize_t args_size, PyObject **kw_values,
+                                           PyObject *kw_names)
+#endif
+{
+    Py_ssize_t keywords_count = function->m_args_keywords_count;
+
+#if PYTHON_VERSION >= 300
+    Py_ssize_t keyword_after_index = function->m_args_positional_count;
+#endif
+
+    assert(function->m_args_star_dict_index == -1);
+
+    PyObject **varnames = function->m_varnames;
+    Py_ssize_t kw_names_size = PyTuple_GET_SIZE(kw_names);
+
+    for (Py_ssize_t kw_index = 0; kw_index < kw_names_size; kw_index++) {
+        PyObject *key = PyTuple_GET_ITEM(kw_names, kw_index);
+        Py_ssize_t i;
+
+        // The names are interned, like the parameter names, so these are
+        // normally identical.
+        for (i = 0; i < keywords_count; i++) {
+            if (varnames[i] == key) {
+                break;
+            }
+        }
+
+        if (i == keywords_count) {
+            for (i = 0; i < keywords_count; i++) {
+                if (RICH_COMPARE_BOOL_EQ_NORECURSE(varnames[i], key)) {
+                    break;
+                }
+            }
+        }
+
+        if (unlikely(i == keywords_count)) {
+            PyErr_Format(PyExc_TypeError, "%s() got an unexpected keyword argument '%s'",
+                         Nuitka_String_AsString(function->m_name), Nuitka_String_AsString(key));
+
+            return -1;
+        }
+
+        // Positional arguments are assigned later, but CPython checks these
+        // first, and then the keyword arguments in their order.
+        if (unlikely(i < args_size && i < function->m_args_positional_count)) {
+            formatErrorMultipleValuesGiven(function, i);
+
+            return -1;
+        }
+
+        assert(python_pars[i] == NULL);
+        python_pars[i] = kw_values[kw_index];
+        Py_INCREF(python_pars[i]);
+
+#if PYTHON_VERSION >= 300
+        if (i >= keyword_after_index) {
+            *kw_only_found += 1;
+        }
+#endif
+    }
+
+    return kw_names_size;
+}
+
 static bool MAKE_STAR_DICT_DICTIONARY_COPY(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
                                            PyObject *kw) {
     Py_ssize_t star_dict_index = function->m_args_star_dict_index;
@@ -1702,6 +1773,19 @@ static bool parseArgumentsFull(struct Nuitka_FunctionObject const *function, PyO
         goto error_exit;
     }
 
+#if PYTHON_VERSION < 300
+    // For Python2, too many arguments are reported before keyword errors, and
+    // count all keyword arguments given, also the ones for star dict.
+    if (unlikely(function->m_args_star_list_index == -1 && args_size > function->m_args_positional_count)) {
+#if PYTHON_VERSION < 270
+        formatErrorTooManyArguments(function, args_size, kw_size);
+#else
+        formatErrorTooManyArguments(function, args_size + kw_size);
+#endif
+        goto error_exit;
+    }
+#endif
+
 #if PYTHON_VERSION >= 300
     kw_only_found = 0;
 #endif
@@ -1773,6 +1857,87 @@ error_exit:
     return false;
 }
 
+static bool parseArgumentsKwSplit(struct Nuitka_FunctionObject const *function, PyObject **python_pars,
+                                  PyObject **args, Py_ssize_t args_size, PyObject *kw_names) {
+    Py_ssize_t kw_found;
+    bool result;
+#if PYTHON_VERSION >= 300
+    Py_ssize_t kw_only_found;
+    bool kw_only_error;
+#endif
+
+    // Star dict parameters and functions without any, are left to the
+    // dictionary variant.
+    assert(function->m_args_star_dict_index == -1);
+    assert(function->m_args_keywords_count > 0);
+
+#if PYTHON_VERSION < 300
+    // For Python2, too many arguments are reported before keyword errors.
+    if (unlikely(function->m_args_star_list_index == -1 && args_size > function->m_args_positional_count)) {
+#if PYTHON_VERSION < 270
+        formatErrorTooManyArguments(function, args_size, PyTuple_GET_SIZE(kw_names));
+#else
+        formatErrorTooManyArguments(function, args_size + PyTuple_GET_SIZE(kw_names));
+#endif
+        goto error_exit;
+    }
+
+    kw_found = handleKeywordArgsKwSplit(function, python_pars, args_size, args + args_size, kw_names);
+#else
+    kw_only_found = 0;
+    kw_found = handleKeywordArgsKwSplit(function, python_pars, &kw_only_found, args_size, args + args_size, kw_names);
+#endif
+    if (kw_found == -1)
+        goto error_exit;
+
+#if PYTHON_VERSION < 270
+    result = handleArgumentsPlain(function, python_pars, NULL, args, args_size, kw_found, kw_found);
+#elif PYTHON_VERSION < 300
+    result = handleArgumentsPlain(function, python_pars, NULL, args, args_size, kw_found);
+#else
+    result = handleArgumentsPlain(function, python_pars, NULL, args, args_size, kw_found, kw_only_found);
+#endif
+
+    if (result == false)
+        goto error_exit;
+
+#if PYTHON_VERSION >= 300
+
+    // For Python3.3 the keyword only errors are all reported at once.
+    kw_only_error = false;
+
+    for (Py_ssize_t i = function->m_args_positional_count; i < function->m_args_keywords_count; i++) {
+        if (python_pars[i] == NULL) {
+            PyObject *arg_name = function->m_varnames[i];
+
+            if (function->m_kwdefaults != NULL) {
+                python_pars[i] = PyDict_GetItem(function->m_kwdefaults, arg_name);
+            }
+
+            if (python_pars[i] == NULL) {
+                kw_only_error = true;
+            } else {
+                Py_INCREF(python_pars[i]);
+            }
+        }
+    }
+
+    if (unlikely(kw_only_error)) {
+        formatErrorTooFewKwOnlyArguments(function, &python_pars[function->m_args_positional_count]);
+
+        goto error_exit;
+    }
+
+#endif
+
+    return true;
+
+error_exit:
+
+    releaseParameters(function, python_pars);
+    return false;
+}
+
 PyObject *Nuitka_CallFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *function, PyObject **args,
                                            Py_ssize_t args_size, PyObject *kw) {
 #ifdef _MSC_VER
@@ -1787,6 +1952,34 @@ PyObject *Nuitka_CallFunctionPosArgsKwArgs(struct Nuitka_FunctionObject const *f
     return function->m_c_code(function, python_pars);
 }
 
+PyObject *Nuitka_CallFunctionPosArgsKwSplit(struct Nuitka_FunctionObject const *function, PyObject **args,
+                                            Py_ssize_t args_size, PyObject *kw_names) {
+    if (unlikely(function->m_args_star_dict_index != -1 || function->m_args_keywords_count == 0)) {
+        PyObject *kw = MAKE_DICT_KWSPLIT(args + args_size, kw_names);
+
+        if (unlikely(kw == NULL)) {
+            return NULL;
+        }
+
+        PyObject *result = Nuitka_CallFunctionPosArgsKwArgs(function, args, args_size, kw);
+
+        Py_DECREF(kw);
+
+        return result;
+    }
+
+#ifdef _MSC_VER
+    PyObject **python_pars = (PyObject **)_alloca(sizeof(PyObject *) * function->m_args_overall_count);
+#else
+    PyObject *python_pars[function->m_args_overall_count];
+#endif
+    memset(python_pars, 0, function->m_args_overall_count * sizeof(PyObject *));
+
+    if (!parseArgumentsKwSplit(function, python_pars, args, args_size, kw_names))
+        return NULL;
+    return function->m_c_code(function, python_pars);
+}
+
 PyObject *Nuitka_CallMethodFunctionNoArgs(struct Nuitka_FunctionObject const *function, PyObject *object) {
 #ifdef _MSC_VER
     PyObject **python_pars = (PyObject **)_alloca(sizeof(PyObject *) * function->m_args_overall_count);
@@ -1915,3 +2108,18 @@ PyObject *Nuitka_CallMethodFunctionPosArgsKwArgs(struct Nuitka_FunctionObject co
     // TODO: Specialize implementation for massive gains.
     return Nuitka_CallFunctionPosArgsKwArgs(function, new_args, args_size + 1, kw);
 }
+
+PyObject *Nuitka_CallMethodFunctionPosArgsKwSplit(struct Nuitka_FunctionObject const *function, PyObject *object,
+                                                  PyObject **args, Py_ssize_t args_size, PyObject *kw_names) {
+    Py_ssize_t values_size = args_size + PyTuple_GET_SIZE(kw_names);
+
+#ifdef _MSC_VER
+    PyObject **new_args = (PyObject **)_alloca(sizeof(PyObject *) * (values_size + 1));
+#else
+    PyObject *new_args[values_size + 1];
+#endif
+    new_args[0] = object;
+    memcpy(new_args + 1, args, values_size * sizeof(PyObject *));
+
+    return Nuitka_CallFunctionPosArgsKwSplit(function, new_args, args_size + 1, kw_names);
+}
@@ -235,6 +235,80 @@ PyObject *CALL_FUNCTION_NO_ARGS(PyObject *called) {
     return CALL_FUNCTION(called, const_tuple_empty, NULL);
 }
 
+PyObject *CALL_FUNCTION_WITH_ARGS_KWSPLIT(PyObject *called, PyObject **args, Py_ssize_t args_size,
+                                          PyObject *kw_names, PyObject *kw_dict) {
+    CHECK_OBJECT(called);
+    CHECK_OBJECT(kw_names);
+    assert(PyTuple_CheckExact(kw_names));
+
+    if (Nuitka_Function_Check(called)) {
+        if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+            return NULL;
+        }
+
+        PyObject *result =
+            Nuitka_CallFunctionPosArgsKwSplit((struct Nuitka_FunctionObject *)called, args, args_size, kw_names);
+
+        Py_LeaveRecursiveCall();
+
+        return result;
+    } else if (Nuitka_Method_Check(called)) {
+        struct Nuitka_MethodObject *method = (struct Nuitka_MethodObject *)called;
+
+        // Unbound method, let the error path be slow.
+        if (method->m_object != NULL) {
+            if (unlikely(Py_EnterRecursiveCall((char *)" while calling a Python object"))) {
+                return NULL;
+            }
+
+            PyObject *result =
+                Nuitka_CallMethodFunctionPosArgsKwSplit(method->m_function, method->m_object, args, args_size, kw_names);
+
+            Py_LeaveRecursiveCall();
+
+            return result;
+        }
+    }
+#if PYTHON_VERSION >= 370
+    else if (PyFunction_Check(called) || PyCFunction_Check(called)) {
+        // These take the same form of arguments, and know how to be fast.
+        return _PyObject_FastCallKeywords(called, args, args_size, kw_names);
+    }
+#endif
+
+    if (kw_dict != NULL) {
+        // Constant keyword arguments, no need to make a dictionary of them.
+        CHECK_OBJECT(kw_dict);
+        assert(PyDict_CheckExact(kw_dict));
+
+        if (args_size == 0) {
+            return CALL_FUNCTION(called, const_tuple_empty, kw_dict);
+        }
+
+        PyObject *pos_args = MAKE_TUPLE(args, args_size);
+        PyObject *result = CALL_FUNCTION(called, pos_args, kw_dict);
+        Py_DECREF(pos_args);
+
+        return result;
+    }
+
+    PyObject *pos_args = MAKE_TUPLE(args, args_size);
+
+    PyObject *named_args = MAKE_DICT_KWSPLIT(args + args_size, kw_names);
+
+    if (unlikely(named_args == NULL)) {
+        Py_DECREF(pos_args);
+        return NULL;
+    }
+
+    PyObject *result = CALL_FUNCTION(called, pos_args, named_args);
+
+    Py_DECREF(pos_args);
+    Py_DECREF(named_args);
+
+    return result;
+}
+
 PyObject *CALL_METHOD_WITH_POSARGS(PyObject *source, PyObject *attribute, PyObject *positional_args) {
     CHECK_OBJECT(source);
     CHECK_OBJECT(attribute);
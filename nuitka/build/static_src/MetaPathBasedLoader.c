@@ -59,6 +59,11 @@ static inline bool isVerbose(void) { return false; }
 
 static struct Nuitka_MetaPathBasedLoaderEntry *loader_entries = NULL;
 
+// Hash table of indexes into the entries, -1 for empty slots, see "LoaderCodes"
+// of Nuitka for how it is created.
+static int const *loader_hash_slots = NULL;
+static unsigned int loader_hash_mask = 0;
+
 static bool hasFrozenModule(char const *name) {
     for (struct _frozen const *p = PyImport_FrozenModules;; p++) {
         if (p->name == NULL) {
@@ -212,19 +217,39 @@ static PyObject *loadModuleFromCodeObject(PyCodeObject *code_object, char const
     return module;
 }
 
+// The FNV-1a hash of the module name, must match the one used by Nuitka.
+static unsigned int hashModuleName(char const *name) {
+    unsigned int result = 2166136261U;
+
+    while (*name != 0) {
+        result ^= (unsigned char)*name++;
+        result = (result * 16777619U) & 0xffffffffU;
+    }
+
+    return result;
+}
+
 static struct Nuitka_MetaPathBasedLoaderEntry *findEntry(char const *name) {
-    struct Nuitka_MetaPathBasedLoaderEntry *current = loader_entries;
-    assert(current);
+    assert(loader_entries);
+    assert(loader_hash_slots);
 
-    while (current->name != NULL) {
-        if (strcmp(name, current->name) == 0) {
-            return current;
+    // The table is at most half full, so this terminates after few steps,
+    // also for names not found.
+    unsigned int slot = hashModuleName(name) & loader_hash_mask;
+
+    for (;;) {
+        int index = loader_hash_slots[slot];
+
+        if (index == -1) {
+            return NULL;
         }
 
-        current++;
-    }
+        if (strcmp(name, loader_entries[index].name) == 0) {
+            return &loader_entries[index];
+        }
 
-    return NULL;
+        slot = (slot + 1) & loader_hash_mask;
+    }
 }
 
 static char *_kwlist[] = {(char *)"fullname", (char *)"unused", NULL};
@@ -815,7 +840,8 @@ static PyMethodDef _method_def_loader_find_spec = {"module_repr", (PyCFunction)_
                                                    METH_VARARGS | METH_KEYWORDS, NULL};
 #endif
 
-void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loader_entries) {
+void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loader_entries,
+                                    int const *_loader_hash_slots, unsigned int _loader_hash_mask) {
     // Do it only once.
     if (loader_entries) {
         assert(_loader_entries == loader_entries);
@@ -824,6 +850,8 @@ void registerMetaPathBasedUnfreezer(struct Nuitka_MetaPathBasedLoaderEntry *_loa
     }
 
     loader_entries = _loader_entries;
+    loader_hash_slots = _loader_hash_slots;
+    loader_hash_mask = _loader_hash_mask;
 
     // Build the dictionary of the "loader" object, which needs to have two
     // methods "find_module" where we acknowledge that we are capable of loading
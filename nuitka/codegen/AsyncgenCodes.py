@@ -19,10 +19,9 @@
 
 """
 
-from .CodeHelpers import generateStatementSequenceCode
-from .Emission import SourceCodeCollector
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
+    generateFunctionStatementsCode,
     getClosureCopyCode,
     getFunctionQualnameObj,
     setupFunctionLocalVariables
@@ -60,17 +59,10 @@ def getAsyncgenObjectCode(context, function_identifier, closure_variables,
         temp_variables    = temp_variables
     )
 
-    function_codes = SourceCodeCollector()
+    function_codes = generateFunctionStatementsCode(context)
 
     asyncgen_object_body = context.getOwner()
 
-    generateStatementSequenceCode(
-        statement_sequence = asyncgen_object_body.getBody(),
-        allow_none         = True,
-        emit               = function_codes,
-        context            = context
-    )
-
     function_cleanup = finalizeFunctionLocalVariables(context)
 
     if needs_exception_exit:
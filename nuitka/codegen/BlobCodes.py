@@ -22,28 +22,289 @@ efficiently. The "StreamData" class is used in two places, for constants
 and for freezing of bytecode.
 """
 
+import re
+
+# Stand-in for stream data code, when the offsets are decided later. The
+# zero bytes cannot be part of any generated C code.
+_deferred_code_format = "\0stream_data:%d:%d\0"
+_deferred_code_pattern = re.compile("\0stream_data:([0-9]+):([01])\0")
+
+
+# Parts of the data of this size are indexed, at offsets that are a multiple
+# of the step, so one of the first parts of a value is indexed, if it is in
+# the data.
+_gram_size = 8
+_gram_step = 16
+
+# Offsets indexed per part, more would make frequent parts slow to check.
+_max_gram_offsets = 16
+
+# Smaller values are only shared with equal values.
+_min_found_size = _gram_size + _gram_step - 1
+
+
+class BlobBuilder(object):
+    """ Build a blob from values, sharing duplicate values.
+
+        Offsets of values added already are found in a hash index. Other
+        values are looked up in an index of parts of the data, so large
+        enough values are also shared with parts of values. Both indexes do
+        a bounded amount of work per value, and data is appended to a
+        "bytearray", so adding values is not quadratic in the blob size.
+    """
+
+    __slots__ = (
+        "data",
+        "offsets",
+        "gram_offsets",
+        "indexed_size",
+        "value_count",
+        "shared_count",
+        "shared_size"
+    )
+
+    def __init__(self):
+        self.data = bytearray()
+
+        # Offsets of values added to the data.
+        self.offsets = {}
+
+        # Offsets of parts of the data, and up to where it is indexed.
+        self.gram_offsets = {}
+        self.indexed_size = 0
+
+        # Statistics of values added, and shared ones.
+        self.value_count = 0
+        self.shared_count = 0
+        self.shared_size = 0
+
+    def _indexData(self):
+        start = self.indexed_size
+        end = len(self.data) - _gram_size + 1
+
+        if end <= start:
+            return
+
+        new_data = bytes(self.data[start:])
+        gram_offsets = self.gram_offsets
+
+        for offset in range(start, end, _gram_step):
+            gram = new_data[offset-start:offset-start+_gram_size]
+
+            offsets = gram_offsets.get(gram)
+
+            # Most parts are in the data only once, and stored without a list.
+            if offsets is None:
+                gram_offsets[gram] = offset
+            elif type(offsets) is int:
+                gram_offsets[gram] = [offsets, offset]
+            elif len(offsets) < _max_gram_offsets:
+                offsets.append(offset)
+
+        self.indexed_size = offset + _gram_step
+
+    def _findValue(self, value):
+        """ Find a value in the data, with the index of its parts. """
+
+        size = len(value)
+
+        if size < _min_found_size:
+            return -1
+
+        data = self.data
+        gram_offsets = self.gram_offsets
+
+        for count in range(_gram_step):
+            offsets = gram_offsets.get(value[count:count+_gram_size])
+
+            if offsets is None:
+                continue
+
+            if type(offsets) is int:
+                offsets = (offsets,)
+
+            for offset in offsets:
+                offset -= count
+
+                if offset >= 0 and data[offset:offset+size] == value:
+                    return offset
+
+        return -1
+
+    def getValueOffset(self, value):
+        self.value_count += 1
+
+        offset = self.offsets.get(value)
+
+        if offset is None:
+            offset = self._findValue(value)
+
+            if offset == -1:
+                offset = len(self.data)
+                self.data += value
+
+                self.offsets[value] = offset
+                self._indexData()
+
+                return offset
+
+            self.offsets[value] = offset
+
+        self.shared_count += 1
+        self.shared_size += len(value)
+
+        return offset
+
+    def addBlob(self, blob):
+        """ Append the data of another blob, returns its offset.
+
+            Its values are not shared, but counted in the statistics.
+        """
+
+        offset = len(self.data)
+        self.data += blob.data
+        self._indexData()
+
+        self.value_count += blob.value_count
+        self.shared_count += blob.shared_count
+        self.shared_size += blob.shared_size
+
+        return offset
+
+    def getBytes(self):
+        return bytes(self.data)
+
+
 class StreamData(object):
     def __init__(self):
-        self.stream_data = bytes()
+        self.blob = BlobBuilder()
+
+        # Values used while offsets are deferred, and their indexes.
+        self.deferred_values = None
+        self.deferred_indexes = None
+
+        # Blobs of sections, the current one, and the blob outside of it.
+        self.sections = {}
+        self.section_name = None
+        self.outer_blob = None
 
     def getStreamDataCode(self, value, fixed_size = False):
+        if self.deferred_values is not None:
+            return self._getDeferredStreamDataCode(value, fixed_size)
+
         offset = self.getStreamDataOffset(value)
 
+        if self.section_name is not None:
+            offset = "constant_bin_offset_%s + %d" % (
+                self.section_name,
+                offset
+            )
+        else:
+            offset = "%d" % offset
+
         if fixed_size:
-            return "&constant_bin[ %d ]" % offset
+            return "&constant_bin[ %s ]" % offset
         else:
-            return "&constant_bin[ %d ], %d" % (
+            return "&constant_bin[ %s ], %d" % (
                 offset,
                 len(value)
             )
 
     def getStreamDataOffset(self, value):
-        offset = self.stream_data.find(value)
-        if offset == -1:
-            offset = len(self.stream_data)
-            self.stream_data += value
-
-        return offset
+        return self.blob.getValueOffset(value)
 
     def getBytes(self):
-        return self.stream_data
+        assert not self.sections and self.section_name is None
+
+        return self.blob.getBytes()
+
+    def getStatistics(self):
+        """ Sizes and counts of values in the stream, shared ones too. """
+
+        return {
+            "size"         : len(self.blob.data),
+            "value_count"  : self.blob.value_count,
+            "shared_count" : self.blob.shared_count,
+            "shared_size"  : self.blob.shared_size
+        }
+
+    def startSection(self, section_name):
+        """ Add values to a section from now on.
+
+            Offsets in the section are relative to its start, which is only
+            decided by "placeSections", so they do not depend on the values
+            outside of it. Its start is in the C variable named after it.
+        """
+
+        assert self.section_name is None
+
+        if section_name not in self.sections:
+            self.sections[section_name] = BlobBuilder()
+
+        self.section_name = section_name
+        self.outer_blob = self.blob
+        self.blob = self.sections[section_name]
+
+    def finishSection(self):
+        self.blob = self.outer_blob
+
+        self.section_name = None
+        self.outer_blob = None
+
+    def placeSections(self):
+        """ Add the sections to the stream, returns their start offsets.
+
+        """
+
+        assert self.section_name is None
+
+        result = {}
+
+        for section_name, section_blob in sorted(self.sections.items()):
+            result[section_name] = self.blob.addBlob(section_blob)
+
+        self.sections = {}
+
+        return result
+
+    def deferStreamDataOffsets(self, values = ()):
+        """ Generate stand-ins for stream data code from now on.
+
+            This is for code generated in other processes, the values used
+            are then given to "resolveDeferredStreamDataCode". Continues
+            with indexes after the given values.
+        """
+
+        self.deferred_values = list(values)
+        self.deferred_indexes = dict(
+            (value, count)
+            for count, value in
+            enumerate(self.deferred_values)
+        )
+
+    def getDeferredValues(self):
+        return self.deferred_values
+
+    def _getDeferredStreamDataCode(self, value, fixed_size):
+        if value not in self.deferred_indexes:
+            self.deferred_indexes[value] = len(self.deferred_values)
+            self.deferred_values.append(value)
+
+        return _deferred_code_format % (
+            self.deferred_indexes[value],
+            1 if fixed_size else 0
+        )
+
+    def resolveDeferredStreamDataCode(self, code, values):
+        """ Replace stand-ins of deferred stream data code in code.
+
+            Values not yet in the stream are added as they are encountered.
+        """
+
+        return _deferred_code_pattern.sub(
+            lambda match: self.getStreamDataCode(
+                value      = values[int(match.group(1))],
+                fixed_size = match.group(2) == '1'
+            ),
+            code
+        )
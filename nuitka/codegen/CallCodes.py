@@ -19,10 +19,15 @@
 
 The different kinds of calls get dedicated code. Most notable, calls with
 only positional arguments, are attempted through helpers that might be
-able to execute them without creating the argument dictionary at all.
+able to execute them without creating the argument dictionary at all. And
+for keyword arguments with names known at compile time, their values are
+passed in an array with the positional ones, together with a constant tuple
+of the names, so compiled functions can take them without a dictionary.
 
 """
 
+from nuitka import Options
+
 from .CodeHelpers import (
     generateChildExpressionCode,
     generateExpressionCode,
@@ -30,16 +35,27 @@ from .CodeHelpers import (
 )
 from .ConstantCodes import getConstantAccess
 from .ErrorCodes import getErrorExitCode
+from .FunctionCodes import getFunctionEntryPointIdentifier
+from .Indentation import indented
 from .LineNumberCodes import emitLineNumberUpdateCode
 from .templates.CodeTemplatesCalls import (
+    template_call_function_direct_args,
+    template_call_function_direct_fallback_args,
+    template_call_function_direct_fallback_kw_split,
+    template_call_function_direct_fallback_no_args,
+    template_call_function_direct_guarded,
+    template_call_function_direct_no_args,
+    template_call_function_kw_split,
     template_call_function_with_args_decl,
     template_call_function_with_args_impl,
     template_call_method_with_args_decl,
-    template_call_method_with_args_impl
+    template_call_method_with_args_impl,
+    template_function_impl_declaration
 )
 from .templates.CodeTemplatesModules import (
     template_header_guard,
-    template_helper_impl_decl
+    template_helper_impl_decl,
+    template_module_prelude
 )
 
 
@@ -236,6 +252,238 @@ def _generateCallCodeKwOnly(to_name, expression, call_kw, called_name,
     )
 
 
+def _getKeywordSplitPairs(call_kw):
+    """ Keyword names and values of a call, if the names are all known.
+
+        Returns None, unless the names are strings at compile time, then the
+        values are expressions, or constants for a constant dictionary.
+    """
+
+    if call_kw.isExpressionMakeDict():
+        if not call_kw.isMappingWithConstantStringKeys():
+            return None
+
+        pairs = [
+            (pair.getKey().getConstant(), pair.getValue())
+            for pair in
+            call_kw.getPairs()
+        ]
+    elif call_kw.isExpressionConstantRef() and call_kw.isMapping():
+        pairs = list(call_kw.getConstant().items())
+    else:
+        return None
+
+    for key, _value in pairs:
+        if type(key) is not str:
+            return None
+
+    return pairs
+
+
+def _getKeywordSplitDictCode(call_kw, context):
+    """ C code of the keyword arguments dictionary for split calls.
+
+        For a constant dictionary, the called object can be given it as is,
+        where the split form is not supported, otherwise this is "NULL" and
+        a dictionary is made from the values at run time.
+    """
+
+    if call_kw is not None and call_kw.isExpressionConstantRef():
+        return context.getConstantCode(
+            constant = call_kw.getConstant()
+        )
+    else:
+        return "NULL"
+
+
+def _generateCallValuesCode(call_args, call_kw, kw_pairs, emit, context):
+    """ Values of positional and keyword arguments, each in a C variable.
+
+        The positional arguments must be a tuple creation or a constant, and
+        the keyword arguments given as split by "_getKeywordSplitPairs".
+    """
+
+    call_arg_names = []
+
+    if call_args is not None and call_args.isExpressionMakeTuple():
+        for call_arg_element in call_args.getElements():
+            call_arg_name = generateChildExpressionCode(
+                child_name = call_args.getChildName() + "_element",
+                expression = call_arg_element,
+                emit       = emit,
+                context    = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+    elif call_args is not None:
+        for call_arg_element in call_args.getConstant():
+            call_arg_name = context.allocateTempName("call_arg_element")
+
+            getConstantAccess(
+                to_name  = call_arg_name,
+                constant = call_arg_element,
+                emit     = emit,
+                context  = context,
+            )
+
+            call_arg_names.append(call_arg_name)
+
+    kw_value_names = []
+
+    for _key, value in kw_pairs:
+        if call_kw.isExpressionConstantRef():
+            kw_value_name = context.allocateTempName("kw_call_value")
+
+            getConstantAccess(
+                to_name  = kw_value_name,
+                constant = value,
+                emit     = emit,
+                context  = context,
+            )
+        else:
+            kw_value_name = generateChildExpressionCode(
+                child_name = "kw_call_value",
+                expression = value,
+                emit       = emit,
+                context    = context,
+            )
+
+        kw_value_names.append(kw_value_name)
+
+    return call_arg_names, kw_value_names
+
+
+def _generateCallCodeKwSplit(to_name, expression, call_args, call_kw, kw_pairs,
+                             called_name, emit, context):
+    call_arg_names, kw_value_names = _generateCallValuesCode(
+        call_args = call_args,
+        call_kw   = call_kw,
+        kw_pairs  = kw_pairs,
+        emit      = emit,
+        context   = context
+    )
+
+    context.setCurrentSourceCodeReference(
+        expression.getCompatibleSourceReference()
+    )
+
+    _getCallCodeKwSplit(
+        to_name      = to_name,
+        called_name  = called_name,
+        arg_names    = call_arg_names,
+        kw_names     = tuple(key for key, _value in kw_pairs),
+        kw_values    = kw_value_names,
+        kw_dict_name = _getKeywordSplitDictCode(call_kw, context),
+        needs_check  = expression.mayRaiseException(BaseException),
+        emit         = emit,
+        context      = context
+    )
+
+
+def _getDirectCallFunctionBody(expression, called):
+    """ The compiled function a call will likely be to, if one is known.
+
+        This is for variables only ever assigned a function creation, of this
+        module, so its C code can be called. The parameters must be simple,
+        i.e. no star arguments or keyword only ones.
+    """
+
+    if not called.isExpressionVariableRef():
+        return None
+
+    function_body = called.getVariable().getAssignedFunctionBody()
+
+    if function_body is None or \
+       not function_body.isExpressionFunctionBody() or \
+       not function_body.needsCreation():
+        return None
+
+    if function_body.getParentModule() is not expression.getParentModule():
+        return None
+
+    parameters = function_body.getParameters()
+
+    if parameters.getStarListArgumentName() is not None or \
+       parameters.getStarDictArgumentName() is not None or \
+       parameters.getKwOnlyParameterCount() > 0:
+        return None
+
+    return function_body
+
+
+def _getDirectCallParameterValues(function_body, arg_names, kw_names,
+                                  kw_values):
+    """ C values for all parameters of a function, in their order.
+
+        Returns None, if the arguments do not match the parameters, the call
+        then raises an error at run time, done by the normal call. Defaults
+        are taken from the function object, and their count is returned to
+        be checked.
+    """
+
+    parameters = function_body.getParameters()
+    parameter_names = parameters.getArgumentNames()
+
+    if len(arg_names) > len(parameter_names):
+        return None, None
+
+    values = list(arg_names) + [None] * (len(parameter_names) - len(arg_names))
+
+    for kw_name, kw_value in zip(kw_names, kw_values):
+        if kw_name not in parameter_names:
+            return None, None
+
+        index = parameter_names.index(kw_name)
+
+        if values[index] is not None:
+            return None, None
+
+        values[index] = kw_value
+
+    defaults_count = parameters.getDefaultCount()
+    defaults_used = False
+
+    for index, value in enumerate(values):
+        if value is None:
+            default_index = index - (len(parameter_names) - defaults_count)
+
+            if default_index < 0:
+                return None, None
+
+            values[index] = "PyTuple_GET_ITEM( direct_function->m_defaults, %d )" % default_index
+            defaults_used = True
+
+    return values, defaults_count if defaults_used else None
+
+
+def _generateCallCodeDirect(to_name, expression, call_args, call_kw, kw_pairs,
+                            called_name, function_body, emit, context):
+    call_arg_names, kw_value_names = _generateCallValuesCode(
+        call_args = call_args,
+        call_kw   = call_kw,
+        kw_pairs  = kw_pairs,
+        emit      = emit,
+        context   = context
+    )
+
+    context.setCurrentSourceCodeReference(
+        expression.getCompatibleSourceReference()
+    )
+
+    _getCallCodeDirect(
+        to_name       = to_name,
+        called_name   = called_name,
+        function_body = function_body,
+        arg_names     = call_arg_names,
+        kw_names      = tuple(key for key, _value in kw_pairs),
+        kw_values     = kw_value_names,
+        kw_dict_name  = _getKeywordSplitDictCode(call_kw, context),
+        needs_check   = expression.mayRaiseException(BaseException),
+        emit          = emit,
+        context       = context
+    )
+
+
 def generateCallCode(to_name, expression, emit, context):
     # There is a whole lot of different cases, for each of which, we create
     # optimized code, constant, with and without positional or keyword arguments
@@ -276,11 +524,37 @@ def generateCallCode(to_name, expression, emit, context):
             context    = context
         )
 
+    if called_attribute_name is None:
+        direct_function_body = _getDirectCallFunctionBody(expression, called)
+    else:
+        direct_function_body = None
+
+    if call_kw is None or \
+       (call_kw.isExpressionConstantRef() and call_kw.getConstant() == {}):
+        kw_pairs = ()
+    else:
+        kw_pairs = _getKeywordSplitPairs(call_kw)
+
     with withObjectCodeTemporaryAssignment(to_name, "call_result", expression, emit, context) \
       as result_name:
 
-        if call_kw is None or \
-           (call_kw.isExpressionConstantRef() and call_kw.getConstant() == {}):
+        if direct_function_body is not None and \
+           kw_pairs is not None and \
+           (call_args is None or \
+            call_args.isExpressionConstantRef() or \
+            call_args.isExpressionMakeTuple()):
+            _generateCallCodeDirect(
+                to_name       = result_name,
+                called_name   = called_name,
+                expression    = expression,
+                call_args     = call_args,
+                call_kw       = call_kw,
+                kw_pairs      = kw_pairs,
+                function_body = direct_function_body,
+                emit          = emit,
+                context       = context
+            )
+        elif kw_pairs == ():
             _generateCallCodePosOnly(
                 to_name               = result_name,
                 called_name           = called_name,
@@ -290,9 +564,21 @@ def generateCallCode(to_name, expression, emit, context):
                 context               = context
             )
         else:
-            call_args = expression.getCallArgs()
-
-            if call_args is None or \
+            if kw_pairs is not None and \
+               (call_args is None or \
+                call_args.isExpressionConstantRef() or \
+                call_args.isExpressionMakeTuple()):
+                _generateCallCodeKwSplit(
+                    to_name     = result_name,
+                    called_name = called_name,
+                    expression  = expression,
+                    call_args   = call_args,
+                    call_kw     = call_kw,
+                    kw_pairs    = kw_pairs,
+                    emit        = emit,
+                    context     = context
+                )
+            elif call_args is None or \
                (call_args.isExpressionConstantRef() and \
                 call_args.getConstant() == ()):
                 _generateCallCodeKwOnly(
@@ -598,6 +884,178 @@ def _getCallCodeKeywordArgs(to_name, called_name, call_kw_name, emit, context):
     context.addCleanupTempName(to_name)
 
 
+def _getCallCodeKwSplit(to_name, called_name, arg_names, kw_names, kw_values,
+                        kw_dict_name, needs_check, emit, context):
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        template_call_function_kw_split % {
+            "call_arg_names" : ", ".join(
+                str(arg_name)
+                for arg_name in
+                arg_names + kw_values
+            ),
+            "to_name"        : to_name,
+            "called_name"    : called_name,
+            "args_count"     : len(arg_names),
+            "kw_names"       : context.getConstantCode(
+                constant = kw_names
+            ),
+            "kw_dict_name"   : kw_dict_name
+        }
+    )
+
+    getErrorExitCode(
+        check_name    = to_name,
+        release_names = [called_name] + arg_names + kw_values,
+        needs_check   = needs_check,
+        emit          = emit,
+        context       = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
+def _getCallCodeDirect(to_name, called_name, function_body, arg_names,
+                       kw_names, kw_values, kw_dict_name, needs_check, emit,
+                       context):
+    # Many details to decide, pylint: disable=too-many-locals
+
+    values, defaults_count = _getDirectCallParameterValues(
+        function_body = function_body,
+        arg_names     = arg_names,
+        kw_names      = kw_names,
+        kw_values     = kw_values
+    )
+
+    if values is None:
+        if kw_names:
+            _getCallCodeKwSplit(
+                to_name      = to_name,
+                called_name  = called_name,
+                arg_names    = arg_names,
+                kw_names     = kw_names,
+                kw_values    = kw_values,
+                kw_dict_name = kw_dict_name,
+                needs_check  = needs_check,
+                emit         = emit,
+                context      = context
+            )
+        elif arg_names:
+            getCallCodePosArgsQuick(
+                to_name     = to_name,
+                called_name = called_name,
+                arg_names   = arg_names,
+                needs_check = needs_check,
+                emit        = emit,
+                context     = context
+            )
+        else:
+            getCallCodeNoArgs(
+                to_name     = to_name,
+                called_name = called_name,
+                needs_check = needs_check,
+                emit        = emit,
+                context     = context
+            )
+
+        return
+
+    function_impl_identifier = getFunctionEntryPointIdentifier(
+        function_identifier = function_body.getCodeName()
+    )
+
+    # The function body may come later in the C code.
+    if not context.hasDeclaration(function_impl_identifier):
+        context.addDeclaration(
+            function_impl_identifier,
+            template_function_impl_declaration % {
+                "function_impl_identifier" : function_impl_identifier
+            }
+        )
+
+    if values:
+        direct_call_code = template_call_function_direct_args % {
+            "call_arg_names"           : ", ".join(
+                str(value)
+                for value in
+                values
+            ),
+            "args_count"               : len(values),
+            "to_name"                  : to_name,
+            "function_impl_identifier" : function_impl_identifier
+        }
+    else:
+        direct_call_code = template_call_function_direct_no_args % {
+            "to_name"                  : to_name,
+            "function_impl_identifier" : function_impl_identifier
+        }
+
+    call_arg_names = list(arg_names) + list(kw_values)
+
+    if kw_names:
+        fallback_call_code = template_call_function_direct_fallback_kw_split % {
+            "call_arg_names" : ", ".join(
+                str(arg_name)
+                for arg_name in
+                call_arg_names
+            ),
+            "to_name"        : to_name,
+            "called_name"    : called_name,
+            "args_count"     : len(arg_names),
+            "kw_names"       : context.getConstantCode(
+                constant = kw_names
+            ),
+            "kw_dict_name"   : kw_dict_name
+        }
+    elif arg_names:
+        quick_calls_used.add(len(arg_names))
+
+        fallback_call_code = template_call_function_direct_fallback_args % {
+            "call_arg_names" : ", ".join(
+                str(arg_name)
+                for arg_name in
+                call_arg_names
+            ),
+            "to_name"        : to_name,
+            "args_count"     : len(arg_names),
+            "called_name"    : called_name
+        }
+    else:
+        fallback_call_code = template_call_function_direct_fallback_no_args % {
+            "to_name"     : to_name,
+            "called_name" : called_name
+        }
+
+    emitLineNumberUpdateCode(emit, context)
+
+    emit(
+        template_call_function_direct_guarded % {
+            "called_name"              : called_name,
+            "function_impl_identifier" : function_impl_identifier,
+            "defaults_check"           : " && ((struct Nuitka_FunctionObject *)%s)->m_defaults_given == %d" % (
+                                            called_name,
+                                            defaults_count
+                                         )
+                                           if defaults_count is not None else
+                                         "",
+            "to_name"                  : to_name,
+            "direct_call_code"         : indented(direct_call_code, 2),
+            "fallback_call_code"       : indented(fallback_call_code),
+        }
+    )
+
+    getErrorExitCode(
+        check_name    = to_name,
+        release_names = [called_name] + call_arg_names,
+        needs_check   = needs_check,
+        emit          = emit,
+        context       = context
+    )
+
+    context.addCleanupTempName(to_name)
+
+
 def _getCallCodePosKeywordArgs(to_name, called_name, call_args_name,
                                call_kw_name, emit, context):
     emitLineNumberUpdateCode(emit, context)
@@ -647,8 +1105,13 @@ def getCallsDecls():
 def getCallsCode():
     result = []
 
+    # Unity builds have the prelude included at the start of the file already.
     result.append(
-        template_helper_impl_decl % {}
+        template_helper_impl_decl % {
+            "module_prelude" : template_module_prelude
+                                 if not Options.shallUseUnityBuild() else
+                               ""
+        }
     )
 
     for quick_call_used in sorted(quick_calls_used.union(quick_instance_calls_used)):
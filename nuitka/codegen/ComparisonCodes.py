@@ -24,11 +24,107 @@ Rich comparisons, "in", and "not in", also "is", and "is not", and the
 from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeBool
 
 from . import OperatorCodes
+from .c_types.CTypeNuitkaNumbers import CTypeNuitkaDouble, CTypeNuitkaIlong
 from .CodeHelpers import generateExpressionCode
+from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitBoolCode, getErrorExitCode, getReleaseCodes
+from .Indentation import indented
+from .templates.CodeTemplatesVariables import template_native_value_guarded
+from .VariableCodes import getNativeOperandCodes
+
+_native_comparison_operators = {
+    "Lt"    : '<',
+    "LtE"   : "<=",
+    "Gt"    : '>',
+    "GtE"   : ">=",
+    "Eq"    : "==",
+    "NotEq" : "!=",
+}
+
+
+def _getNativeComparisonCode(to_name, expression, context):
+    """ Condition and code for a comparison done with C values, if possible. """
+
+    if to_name.c_type not in ("PyObject *", "nuitka_bool", "void"):
+        return None
+
+    comparator = expression.getComparator()
+
+    if comparator not in _native_comparison_operators:
+        return None
+
+    for c_type in (CTypeNuitkaDouble, CTypeNuitkaIlong):
+        operand_codes = getNativeOperandCodes(
+            c_type      = c_type,
+            expressions = (expression.getLeft(), expression.getRight()),
+            context     = context
+        )
+
+        # At least one variable is needed, constants are computed already.
+        if operand_codes is not None and operand_codes[1]:
+            break
+    else:
+        return None
+
+    (left_code, right_code), check_codes = operand_codes
+
+    native_code = SourceCodeCollector()
+
+    to_name.getCType().emitAssignmentCodeFromBoolCondition(
+        to_name   = to_name,
+        condition = "%s %s %s" % (
+            left_code,
+            _native_comparison_operators[comparator],
+            right_code
+        ),
+        emit      = native_code
+    )
+
+    # The object code gives a reference, so do the same.
+    if to_name.c_type == "PyObject *":
+        native_code(
+            "Py_INCREF( %s );" % to_name
+        )
+
+    return " && ".join(check_codes), native_code.codes
 
 
 def generateComparisonExpressionCode(to_name, expression, emit, context):
+    native_comparison = _getNativeComparisonCode(
+        to_name    = to_name,
+        expression = expression,
+        context    = context
+    )
+
+    if native_comparison is not None:
+        native_condition, native_code = native_comparison
+
+        object_code = SourceCodeCollector()
+
+        _generateComparisonExpressionObjectCode(
+            to_name    = to_name,
+            expression = expression,
+            emit       = object_code,
+            context    = context
+        )
+
+        emit(
+            template_native_value_guarded % {
+                "native_condition" : native_condition,
+                "native_code"      : indented(native_code),
+                "object_code"      : indented(object_code.codes)
+            }
+        )
+    else:
+        _generateComparisonExpressionObjectCode(
+            to_name    = to_name,
+            expression = expression,
+            emit       = emit,
+            context    = context
+        )
+
+
+def _generateComparisonExpressionObjectCode(to_name, expression, emit, context):
     # Currently high complexity, due to manual C typing and doing all
     # in one place, pylint: disable=too-many-branches,too-many-statements
 
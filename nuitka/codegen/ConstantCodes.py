@@ -48,11 +48,25 @@ from nuitka.Constants import (
     getConstantWeight,
     isMutable
 )
+from nuitka.containers.odict import OrderedDict
 
 from .BlobCodes import StreamData
 from .Emission import SourceCodeCollector
 from .Indentation import indented
 from .templates.CodeTemplatesConstants import template_constants_reading
+from .templates.CodeTemplatesModules import (
+    template_function_constants,
+    template_function_constants_check,
+    template_function_constants_create
+)
+
+# Stand-in for the creation of the lazy constants of a function body, only
+# known after the code of the module is complete. The zero bytes cannot be
+# part of any generated C code.
+_function_constants_format = "\0function_constants:%s\0"
+_function_constants_pattern = re.compile(
+    "([ \t]*)\0function_constants:([^\0]+)\0\n?"
+)
 
 
 def generateConstantReferenceCode(to_name, expression, emit, context):
@@ -132,11 +146,8 @@ def _isAttributeName(value):
 
 sizeof_long = ctypes.sizeof(ctypes.c_long)
 
-max_unsigned_long = 2**(sizeof_long*8)-1
-
-# The gcc gives a warning for -2**sizeof_long*8-1, which is still an "int", but
-# seems to not work (without warning) as literal, so avoid it.
-min_signed_long = -(2**(sizeof_long*8-1)-1)
+max_signed_long = 2**(sizeof_long*8-1)-1
+min_signed_long = -max_signed_long-1
 
 done = set()
 
@@ -261,23 +272,6 @@ def isMarshalConstant(constant_value):
     return r
 
 
-def getMarshalCode(constant_identifier, constant_value, emit):
-    """ Force the marshal of a value.
-
-    """
-    marshal_value = marshal.dumps(constant_value)
-    restored = marshal.loads(marshal_value)
-
-    assert compareConstants(constant_value, restored)
-
-    emit(
-        "%s = PyMarshal_ReadObjectFromString( (char *)%s );" % (
-            constant_identifier,
-            stream_data.getStreamDataCode(marshal_value)
-        )
-    )
-
-
 def attemptToMarshal(constant_identifier, constant_value, emit):
     """ Try and marshal a value, if so decided. Indicate with return value.
 
@@ -306,8 +300,271 @@ def attemptToMarshal(constant_identifier, constant_value, emit):
 
     return True
 
-def _addConstantInitCode(context, emit, check, constant_type, constant_value,
-                         constant_identifier, module_level):
+
+def _encodeSize(value):
+    """ Encode a non-negative value with 7 bits per byte, lowest first."""
+    result = bytearray()
+
+    while value >= 0x80:
+        result.append((value & 0x7f) | 0x80)
+        value >>= 7
+
+    result.append(value)
+
+    return result
+
+
+def _encodeLong(value):
+    """ Encode a value with its sign in the lowest bit, see "_encodeSize". """
+    if value >= 0:
+        return _encodeSize(value << 1)
+    else:
+        return _encodeSize(((-value-1) << 1) | 1)
+
+
+class ConstantsStream(object):
+    """ Records to create constants of an init scope in one pass.
+
+        Instead of C code for every constant, a record of it is added to the
+        stream data, and "UNSTREAM_CONSTANTS" creates them from it, in the
+        order added, which is the order of their table indexes. Elements of
+        containers refer to table indexes. Constants of other scopes, which
+        are created already, get entries at the end of the table.
+    """
+
+    __slots__ = ("records", "indexes")
+
+    def __init__(self):
+        # Constant identifiers and their parts, with element references
+        # as tuples of the constant identifier.
+        self.records = []
+        self.indexes = {}
+
+    def addRecord(self, constant_identifier, tag, *parts):
+        assert constant_identifier not in self.indexes, constant_identifier
+
+        self.indexes[constant_identifier] = len(self.records)
+        self.records.append(
+            (constant_identifier, (tag.encode("ascii"),) + parts)
+        )
+
+    def getCodes(self):
+        if not self.records:
+            return []
+
+        table = [
+            constant_identifier
+            for constant_identifier, _parts in
+            self.records
+        ]
+        indexes = dict(self.indexes)
+
+        data = bytearray()
+
+        for _constant_identifier, parts in self.records:
+            for part in parts:
+                if type(part) is tuple:
+                    element_identifier, = part
+
+                    if element_identifier not in indexes:
+                        indexes[element_identifier] = len(table)
+                        table.append(element_identifier)
+
+                    data += b'r'
+                    data += _encodeSize(indexes[element_identifier])
+                else:
+                    data += part
+
+        result = ["static PyObject **constants_table[] = {"]
+        result += [
+            "    &%s," % constant_identifier
+            for constant_identifier in
+            table
+        ]
+        result.append("};")
+
+        result.append(
+            "UNSTREAM_CONSTANTS( constants_table, %s, %d );" % (
+                stream_data.getStreamDataCode(bytes(data), fixed_size = True),
+                len(self.records)
+            )
+        )
+
+        return result
+
+
+_stream_singletons = {
+    None           : b'N',
+    True           : b'T',
+    False          : b'F',
+    Ellipsis       : b'E',
+    NotImplemented : b'I',
+}
+
+_stream_simple_types = (int, long, float, complex, str, unicode, bytes, bytearray)
+
+def _isStreamableConstant(constant_value):
+    """ Decide if a constant can be created by "UNSTREAM_CONSTANTS".
+
+        Types, built-ins, and "xrange" values, and containers of them, need
+        C code to be created.
+    """
+    constant_type = type(constant_value)
+
+    if constant_type in _stream_simple_types:
+        return True
+    elif constant_type in (tuple, list, set, frozenset):
+        for element_value in constant_value:
+            if not _isStreamableConstant(element_value):
+                return False
+
+        return True
+    elif constant_type is dict:
+        for key, value in iterItems(constant_value):
+            if not _isStreamableConstant(key) or \
+               not _isStreamableConstant(value):
+                return False
+
+        return True
+    elif constant_type is slice:
+        return _isStreamableConstant(constant_value.start) and \
+               _isStreamableConstant(constant_value.stop) and \
+               _isStreamableConstant(constant_value.step)
+    else:
+        return any(
+            constant_value is singleton
+            for singleton in
+            _stream_singletons
+        )
+
+
+def _getConstantStreamElement(context, emit, check, stream, constant_value,
+                              module_level):
+    """ Add the constant for an element to the stream, return its reference."""
+
+    for singleton, tag in iterItems(_stream_singletons):
+        if constant_value is singleton:
+            return tag
+
+    constant_identifier = context.getConstantCode(constant_value)
+
+    _addConstantInitCode(
+        emit                = emit,
+        check               = check,
+        stream              = stream,
+        constant_type       = type(constant_value),
+        constant_value      = constant_value,
+        constant_identifier = constant_identifier,
+        module_level        = module_level,
+        context             = context
+    )
+
+    return (constant_identifier,)
+
+
+def _addConstantStreamRecord(context, emit, check, stream, constant_type,
+                             constant_value, constant_identifier, module_level):
+    # Many types to deal with, pylint: disable=too-many-branches
+
+    def addRecord(tag, *parts):
+        stream.addRecord(constant_identifier, tag, *parts)
+
+    def addMarshalRecord():
+        marshal_value = marshal.dumps(constant_value)
+        assert compareConstants(constant_value, marshal.loads(marshal_value))
+
+        addRecord('m', _encodeSize(len(marshal_value)), marshal_value)
+
+    def addElement(element_value):
+        return _getConstantStreamElement(
+            context        = context,
+            emit           = emit,
+            check          = check,
+            stream         = stream,
+            constant_value = element_value,
+            module_level   = module_level
+        )
+
+    if constant_type in (int, long):
+        if min_signed_long <= constant_value <= max_signed_long:
+            # For Python2, "long" values have their own tag.
+            addRecord(
+                'i' if constant_type is int else 'l',
+                _encodeLong(constant_value)
+            )
+        else:
+            addMarshalRecord()
+    elif constant_type is float:
+        addRecord('f', struct.pack("<d", constant_value))
+    elif constant_type is unicode or constant_type is str:
+        # Python3: Strings that can be encoded as UTF-8 are done more or less
+        # directly. When they cannot be expressed as UTF-8, that is rare not we
+        # can indeed use marshal.
+        if constant_type is unicode:
+            try:
+                encoded = constant_value.encode("utf-8")
+            except UnicodeEncodeError:
+                addMarshalRecord()
+                return
+        else:
+            encoded = constant_value
+
+        if str is bytes and constant_type is unicode:
+            tag = 'u'
+        elif _isAttributeName(constant_value):
+            tag = 'a'
+        else:
+            tag = 's'
+
+        addRecord(tag, _encodeSize(len(encoded)), encoded)
+    elif constant_type is bytes:
+        # Python3 only, for Python2, bytes are "str".
+        addRecord('b', _encodeSize(len(constant_value)), constant_value)
+    elif constant_type is bytearray:
+        addRecord(
+            'B',
+            _encodeSize(len(constant_value)),
+            bytes(constant_value)
+        )
+    elif constant_type is complex:
+        addMarshalRecord()
+    elif constant_type is slice:
+        addRecord(
+            ':',
+            addElement(constant_value.start),
+            addElement(constant_value.stop),
+            addElement(constant_value.step)
+        )
+    elif isMarshalConstant(constant_value):
+        # See "isMarshalConstant" for why it's only used for large values.
+        addMarshalRecord()
+    elif constant_type is dict:
+        parts = []
+
+        for key, value in iterItems(constant_value):
+            parts.append(addElement(key))
+            parts.append(addElement(value))
+
+        addRecord('d', _encodeSize(len(constant_value)), *parts)
+    else:
+        tag = {
+            tuple     : 't',
+            list      : 'L',
+            set       : 'S',
+            frozenset : 'Z'
+        }[constant_type]
+
+        parts = [
+            addElement(element_value)
+            for element_value in
+            constant_value
+        ]
+
+        addRecord(tag, _encodeSize(len(constant_value)), *parts)
+
+
+def _addConstantInitCode(context, emit, check, stream, constant_type,
+                         constant_value, constant_identifier, module_level):
     """ Emit code for a specific constant to be prepared during init.
 
         This may be module or global init. Code makes sure that nested
@@ -335,8 +592,8 @@ def _addConstantInitCode(context, emit, check, constant_type, constant_value,
         emit("""NUITKA_PRINT_TRACE("Creating constant: %s");""" % constant_identifier)
 
     # Then it's a real named constant not yet created.
-    __addConstantInitCode(context, emit, check, constant_type, constant_value,
-                          constant_identifier, module_level)
+    __addConstantInitCode(context, emit, check, stream, constant_type,
+                          constant_value, constant_identifier, module_level)
 
     # In debug mode, lets check if the constants somehow change behind our
     # back, add those values too.
@@ -357,8 +614,8 @@ assert( hash_%(constant_identifier)s == DEEP_HASH( %(constant_identifier)s ) );"
         )
 
 
-def __addConstantInitCode(context, emit, check, constant_type, constant_value,
-                          constant_identifier, module_level):
+def __addConstantInitCode(context, emit, check, stream, constant_type,
+                          constant_value, constant_identifier, module_level):
     """ Emit code for a specific constant to be prepared during init.
 
         This may be module or global init. Code makes sure that nested
@@ -380,156 +637,16 @@ def __addConstantInitCode(context, emit, check, constant_type, constant_value,
     # to be done now.
     done.add(constant_identifier)
 
-    # Use shortest code for ints and longs.
-    if constant_type is long:
-        # See above, same for long values. Note: These are of course not
-        # existent with Python3 which would have covered it before.
-        if 0 <= constant_value <= max_unsigned_long:
-            emit (
-                "%s = PyLong_FromUnsignedLong( %sul );" % (
-                    constant_identifier,
-                    constant_value
-                )
-            )
-
-            return
-        elif 0 > constant_value >= min_signed_long:
-            emit (
-                "%s = PyLong_FromLong( %sl );" % (
-                    constant_identifier,
-                    constant_value
-                )
-            )
-
-            return
-        elif constant_value == min_signed_long-1:
-            # There are compilers out there, that give warnings for the literal
-            # MININT when used. We work around that warning here.
-            emit(
-                """\
-%s = PyLong_FromLong( %sl ); // To be corrected with -1 in-place next lines.
-CHECK_OBJECT( const_int_pos_1 );
-%s = PyNumber_InPlaceSubtract( %s, PyLong_FromLong( 1 ) );""" % (
-                    constant_identifier,
-                    min_signed_long,
-                    constant_identifier,
-                    constant_identifier
-                )
-            )
-
-            return
-        else:
-            getMarshalCode(
-                constant_identifier = constant_identifier,
-                constant_value      = constant_value,
-                emit                = emit
-            )
-
-            return
-    elif constant_type is int:
-        if constant_value >= min_signed_long:
-            emit(
-                "%s = PyInt_FromLong( %sl );" % (
-                    constant_identifier,
-                    constant_value
-                )
-            )
-
-            return
-        else:
-            # There are compilers out there, that give warnings for the literal
-            # MININT when used. We work around that warning here.
-            assert constant_value == min_signed_long-1
-
-            emit(
-                """\
-%s = PyInt_FromLong( %sl );  // To be corrected in next line.
-%s = PyNumber_InPlaceSubtract( %s, PyInt_FromLong( 1 ) );""" % (
-                    constant_identifier,
-                    min_signed_long,
-                    constant_identifier,
-                    constant_identifier
-                )
-            )
-
-            return
-
-    if constant_type is unicode:
-        try:
-            encoded = constant_value.encode("utf-8")
-
-            if str is bytes:
-                emit(
-                    "%s = UNSTREAM_UNICODE( %s );" % (
-                        constant_identifier,
-                        stream_data.getStreamDataCode(encoded)
-                    )
-                )
-            else:
-                emit(
-                    "%s = UNSTREAM_STRING( %s, %d );" % (
-                        constant_identifier,
-                        stream_data.getStreamDataCode(encoded),
-                        1 if _isAttributeName(constant_value) else 0
-                    )
-                )
-
-            return
-        except UnicodeEncodeError:
-            getMarshalCode(
-                constant_identifier = constant_identifier,
-                constant_value      = constant_value,
-                emit                = emit
-            )
-
-            return
-
-    elif constant_type is str:
-        # Python3: Strings that can be encoded as UTF-8 are done more or less
-        # directly. When they cannot be expressed as UTF-8, that is rare not we
-        # can indeed use pickling.
-        assert str is bytes
-
-        if len(constant_value) == 1:
-            emit(
-                "%s = UNSTREAM_CHAR( %d, %d );" % (
-                    constant_identifier,
-                    ord(constant_value[0]),
-                    1 if _isAttributeName(constant_value) else 0
-                )
-            )
-        else:
-            emit(
-                "%s = UNSTREAM_STRING( %s, %d );" % (
-                    constant_identifier,
-                    stream_data.getStreamDataCode(constant_value),
-                    1 if _isAttributeName(constant_value) else 0
-                )
-            )
-
-        return
-    elif constant_type is bytes:
-        # Python3 only, for Python2, bytes do not happen.
-        assert str is not bytes
-
-        emit(
-            "%s = UNSTREAM_BYTES( %s );" % (
-                constant_identifier,
-                stream_data.getStreamDataCode(constant_value)
-            )
-        )
-
-        return
-
-    if constant_type is float:
-        emit(
-            "%s = UNSTREAM_FLOAT( %s );" % (
-                constant_identifier,
-                stream_data.getStreamDataCode(
-                    value      = struct.pack("<d", constant_value),
-                    fixed_size = True
-                )
-            )
+    if _isStreamableConstant(constant_value):
+        _addConstantStreamRecord(
+            context             = context,
+            emit                = emit,
+            check               = check,
+            stream              = stream,
+            constant_type       = constant_type,
+            constant_value      = constant_value,
+            constant_identifier = constant_identifier,
+            module_level        = module_level
         )
 
         return
@@ -553,6 +670,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(key),
                 constant_value      = key,
                 constant_identifier = key_name,
@@ -564,6 +682,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(value),
                 constant_value      = value,
                 constant_identifier = value_name,
@@ -611,6 +730,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(element_value),
                 constant_value      = element_value,
                 constant_identifier = context.getConstantCode(
@@ -654,6 +774,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(element_value),
                 constant_value      = element_value,
                 constant_identifier = element_name,
@@ -704,6 +825,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(element_value),
                 constant_value      = element_value,
                 constant_identifier = element_name,
@@ -732,6 +854,7 @@ CHECK_OBJECT( const_int_pos_1 );
         _addConstantInitCode(
             emit                = emit,
             check               = check,
+            stream              = stream,
             constant_type       = type(constant_value.start),
             constant_value      = constant_value.start,
             constant_identifier = slice1_name,
@@ -742,6 +865,7 @@ CHECK_OBJECT( const_int_pos_1 );
         _addConstantInitCode(
             emit                = emit,
             check               = check,
+            stream              = stream,
             constant_type       = type(constant_value.stop),
             constant_value      = constant_value.stop,
             constant_identifier = slice2_name,
@@ -752,6 +876,7 @@ CHECK_OBJECT( const_int_pos_1 );
         _addConstantInitCode(
             emit                = emit,
             check               = check,
+            stream              = stream,
             constant_type       = type(constant_value.step),
             constant_value      = constant_value.step,
             constant_identifier = slice3_name,
@@ -807,6 +932,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(range_args[0]),
                 constant_value      = range_args[0],
                 constant_identifier = range1_name,
@@ -817,6 +943,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(range_args[1]),
                 constant_value      = range_args[1],
                 constant_identifier = range2_name,
@@ -827,6 +954,7 @@ CHECK_OBJECT( const_int_pos_1 );
             _addConstantInitCode(
                 emit                = emit,
                 check               = check,
+                stream              = stream,
                 constant_type       = type(range_args[2]),
                 constant_value      = range_args[2],
                 constant_identifier = range3_name,
@@ -845,25 +973,6 @@ CHECK_OBJECT( const_int_pos_1 );
 
         return
 
-    if constant_type is bytearray:
-        emit(
-            "%s = UNSTREAM_BYTEARRAY( %s );" % (
-                constant_identifier,
-                stream_data.getStreamDataCode(bytes(constant_value))
-            )
-        )
-
-        return
-
-    if constant_type is complex:
-        getMarshalCode(
-            constant_identifier = constant_identifier,
-            constant_value      = constant_value,
-            emit                = emit
-        )
-
-        return
-
     if constant_value in builtin_named_values_list:
         builtin_name = builtin_named_values[constant_value]
         builtin_identifier = context.getConstantCode(builtin_name)
@@ -871,6 +980,7 @@ CHECK_OBJECT( const_int_pos_1 );
         _addConstantInitCode(
             emit                = emit,
             check               = check,
+            stream              = stream,
             constant_type       = type(builtin_name),
             constant_value      = builtin_name,
             constant_identifier = builtin_identifier,
@@ -897,6 +1007,8 @@ def getConstantsInitCode(context):
 
     check = SourceCodeCollector()
 
+    stream = ConstantsStream()
+
     # Sort items by length and name, so we are deterministic and pretty.
     sorted_constants = sorted(
         iterItems(context.getConstants()),
@@ -907,6 +1019,7 @@ def getConstantsInitCode(context):
         _addConstantInitCode(
             emit                = emit,
             check               = check,
+            stream              = stream,
             constant_type       = type(constant_value),
             constant_value      = constant_value,
             constant_identifier = constant_identifier,
@@ -914,7 +1027,9 @@ def getConstantsInitCode(context):
             context             = context
         )
 
-    return emit.codes, check.codes
+    # The streamed constants are created first, the code for the others may
+    # use them.
+    return stream.getCodes() + emit.codes, check.codes
 
 
 def getConstantsDeclCode(context):
@@ -1053,10 +1168,34 @@ def getModuleConstantCode(constant):
 constant_counts = {}
 
 def getConstantInitCodes(module_context):
+    """ Code for the constants used by a module.
+
+        Returns declarations, init and check codes for the constants only used
+        by the module. With lazy constants, also the functions to create the
+        ones used only by one function, when that function is called first, by
+        function identifier.
+    """
+
+    # Many details to deal with, pylint: disable=too-many-locals
+
     decls = []
     inits = SourceCodeCollector()
     checks = SourceCodeCollector()
 
+    stream = ConstantsStream()
+
+    # Constants only used by one function, init and check codes, and stream,
+    # by their function.
+    lazy_constants = {}
+
+    for function_identifier in module_context.getLazyConstantsFunctions():
+        lazy_constants[function_identifier] = (
+            [],
+            SourceCodeCollector(),
+            SourceCodeCollector(),
+            ConstantsStream()
+        )
+
     sorted_constants = sorted(
         module_context.getConstants(),
         key = lambda k: (len(k[0]), k[0])
@@ -1071,17 +1210,29 @@ def getConstantInitCodes(module_context):
         if global_context.getConstantUseCount(constant_identifier) == 1:
             qualifier = "static"
 
-            constant_value = global_context.constants[constant_identifier]
-
-            _addConstantInitCode(
-                emit                = inits,
-                check               = checks,
-                constant_type       = type(constant_value),
-                constant_value      = constant_value,
-                constant_identifier = constant_identifier,
-                module_level        = True,
-                context             = module_context
+            function_identifier = module_context.getConstantUser(
+                constant_identifier
             )
+
+            # Created later, after all the other ones, as their elements
+            # are created with the module.
+            if function_identifier is not None:
+                lazy_constants[function_identifier][0].append(
+                    constant_identifier
+                )
+            else:
+                constant_value = global_context.constants[constant_identifier]
+
+                _addConstantInitCode(
+                    emit                = inits,
+                    check               = checks,
+                    stream              = stream,
+                    constant_type       = type(constant_value),
+                    constant_value      = constant_value,
+                    constant_identifier = constant_identifier,
+                    module_level        = True,
+                    context             = module_context
+                )
         else:
             qualifier = "extern"
 
@@ -1100,14 +1251,91 @@ def getConstantInitCodes(module_context):
                 )
             )
 
-    return decls, inits.codes, checks.codes
+    if Options.isIncrementalBuild():
+        decls.append(
+            "extern int const constant_bin_offset_%s;" % (
+                module_context.getModuleCodeName()
+            )
+        )
+
+    function_inits = OrderedDict()
+
+    for function_identifier in module_context.getLazyConstantsFunctions():
+        function_constants, function_emit, function_check, function_stream = \
+          lazy_constants[function_identifier]
+
+        # Without constants of its own, nothing is created for it.
+        if not function_constants:
+            continue
+
+        for constant_identifier in function_constants:
+            constant_value = global_context.constants[constant_identifier]
+
+            _addConstantInitCode(
+                emit                = function_emit,
+                check               = function_check,
+                stream              = function_stream,
+                constant_type       = type(constant_value),
+                constant_value      = constant_value,
+                constant_identifier = constant_identifier,
+                module_level        = True,
+                context             = module_context
+            )
+
+        function_inits[function_identifier] = template_function_constants % {
+            "function_identifier" : function_identifier,
+            "constant_init_codes" : indented(
+                function_stream.getCodes() + function_emit.codes
+            )
+        }
+
+        if function_check.codes:
+            checks(
+                template_function_constants_check % {
+                    "function_identifier"  : function_identifier,
+                    "constant_check_codes" : indented(function_check.codes)
+                }
+            )
+
+    return decls, stream.getCodes() + inits.codes, checks.codes, function_inits
+
+
+def getFunctionConstantsCreationCode(function_identifier):
+    """ Code to create the lazy constants of a function body when called first.
+
+        This is a stand-in, see "resolveFunctionConstantsCreationCode".
+    """
+
+    return _function_constants_format % function_identifier
+
+
+def resolveFunctionConstantsCreationCode(code, function_inits):
+    """ Replace stand-ins of lazy constants creation code in module code.
+
+        Only function bodies with constants of their own, i.e. the ones in
+        "function_inits" of "getConstantInitCodes", get the code.
+    """
+
+    def replaceStandIn(match):
+        function_identifier = match.group(2)
+
+        if function_identifier not in function_inits:
+            return ""
+
+        return match.group(1) + template_function_constants_create % {
+            "function_identifier" : function_identifier
+        } + '\n'
+
+    return _function_constants_pattern.sub(replaceStandIn, code)
 
 
 def allocateNestedConstants(module_context):
     # Lots of types to deal with.
 
-    def considerForDeferral(constant_value):
-        module_context.getConstantCode(constant_value)
+    def considerForDeferral(constant_value, nested = True):
+        # Not for the constants used directly, their user is to be kept.
+        if nested:
+            module_context.getConstantCode(constant_value)
 
         if isMarshalConstant(constant_value):
             return
@@ -1142,7 +1370,7 @@ def allocateNestedConstants(module_context):
         constant_type = type(constant_value)
 
         if constant_type in (tuple, dict, list, set, frozenset, slice, xrange):
-            considerForDeferral(constant_value)
+            considerForDeferral(constant_value, nested = False)
         elif constant_type in (str, NoneType, int, long):
             pass
         elif constant_value in builtin_named_values_list:
@@ -1164,6 +1392,16 @@ def getConstantsDefinitionCode(context):
         context = context
     )
 
+    # The module stream data sections are placed after the global constants
+    # stream data, their offsets are decided here.
+    for section_name, offset in sorted(stream_data.placeSections().items()):
+        constant_declarations.append(
+            "extern int const constant_bin_offset_%s;" % section_name
+        )
+        constant_declarations.append(
+            "int const constant_bin_offset_%s = %d;" % (section_name, offset)
+        )
+
     if Options.shallMakeModule():
         sys_executable = None
     else:
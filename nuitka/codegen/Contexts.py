@@ -404,6 +404,10 @@ class PythonContextBase(ContextMetaClassBase):
     def addDeclaration(self, key, code):
         pass
 
+    @abstractmethod
+    def hasDeclaration(self, key):
+        pass
+
     @abstractmethod
     def pushFrameVariables(self, frame_variables):
         pass
@@ -560,6 +564,9 @@ class PythonChildContextBase(PythonContextBase):
     def addDeclaration(self, key, code):
         self.parent.addDeclaration(key, code)
 
+    def hasDeclaration(self, key):
+        return self.parent.hasDeclaration(key)
+
     def pushFrameVariables(self, frame_variables):
         return self.parent.pushFrameVariables(frame_variables)
 
@@ -578,6 +585,9 @@ class PythonChildContextBase(PythonContextBase):
     def getFrameVariableCodeNames(self):
         return self.parent.getFrameVariableCodeNames()
 
+    def getNativeCTypes(self):
+        return self.parent.getNativeCTypes()
+
 
 def _getConstantDefaultPopulation():
     # Lots of cases, pylint: disable=too-many-branches
@@ -926,10 +936,11 @@ class FrameDeclarationsMixin(object):
     def setVariableType(self, variable, variable_declaration):
         assert variable.isLocalVariable(), variable
 
-        # TODO: Change value of that dict to take advantage of declaration.
+        variable_c_type = variable_declaration.getCType()
+
         self.frame_variable_types[variable] = (
-            str(variable_declaration),
-            variable_declaration.getCType().getTypeIndicator()
+            variable_c_type.getFrameValueCode(variable_declaration),
+            variable_c_type.getTypeIndicator()
         )
 
     def getFrameVariableTypeDescriptions(self):
@@ -953,17 +964,11 @@ class FrameDeclarationsMixin(object):
         return result
 
     def getFrameVariableCodeNames(self):
-        result = []
-
-        for variable in self.frame_variables_stack[-1]:
-            variable_code_name, variable_code_type = self.frame_variable_types.get(variable, ("NULL", 'N'))
-
-            if variable_code_type in ('b',):
-                result.append("(int)" + variable_code_name)
-            else:
-                result.append(variable_code_name)
-
-        return result
+        return [
+            self.frame_variable_types.get(variable, ("NULL", 'N'))[0]
+            for variable in
+            self.frame_variables_stack[-1]
+        ]
 
     def getLocalsDictNames(self):
         return self.locals_dict_names
@@ -1050,6 +1055,11 @@ class PythonModuleContext(TempMixin, CodeObjectsMixin,
 
         self.constants = set()
 
+        # The function using a constant, if it's the only one, for creating
+        # it lazily, and these functions.
+        self.constant_users = {}
+        self.lazy_constant_functions = []
+
         self.frame_handle = None
 
         self.needs_module_filename_object = False
@@ -1058,6 +1068,9 @@ class PythonModuleContext(TempMixin, CodeObjectsMixin,
             heap_name = None
         )
 
+        # Decisions for C value types of local variables of this module.
+        self.native_c_types = {}
+
     def __repr__(self):
         return "<PythonModuleContext instance for module %s>" % self.filename
 
@@ -1067,6 +1080,9 @@ class PythonModuleContext(TempMixin, CodeObjectsMixin,
     def getEntryPoint(self):
         return self.module
 
+    def getNativeCTypes(self):
+        return self.native_c_types
+
     def isCompiledPythonModule(self):
         return True
 
@@ -1105,6 +1121,9 @@ class PythonModuleContext(TempMixin, CodeObjectsMixin,
 
         self.declaration_codes[ key ] = code
 
+    def hasDeclaration(self, key):
+        return key in self.declaration_codes
+
     def getDeclarations(self):
         return self.declaration_codes
 
@@ -1112,17 +1131,33 @@ class PythonModuleContext(TempMixin, CodeObjectsMixin,
         return False
 
     def getConstantCode(self, constant):
+        return self.getConstantCodeForUser(constant, None)
+
+    def getConstantCodeForUser(self, constant, user):
         result = self.global_context.getConstantCode(constant)
 
         if result not in self.constants:
             self.constants.add(result)
             self.global_context.countConstantUse(result)
 
+            self.constant_users[result] = user
+        elif self.constant_users[result] != user:
+            self.constant_users[result] = None
+
         return result
 
     def getConstants(self):
         return self.constants
 
+    def getConstantUser(self, constant):
+        return self.constant_users[constant]
+
+    def addLazyConstantsFunction(self, function_identifier):
+        self.lazy_constant_functions.append(function_identifier)
+
+    def getLazyConstantsFunctions(self):
+        return self.lazy_constant_functions
+
     def markAsNeedsModuleFilenameObject(self):
         self.needs_module_filename_object = True
 
@@ -1153,6 +1188,9 @@ class PythonFunctionContext(FrameDeclarationsMixin,
 
         self.variable_storage = self._makeVariableStorage()
 
+        # Function identifier to attribute constant uses to, if any.
+        self.constants_user = None
+
     def _makeVariableStorage(self):
         return VariableStorage(
             heap_name = None
@@ -1181,6 +1219,12 @@ class PythonFunctionContext(FrameDeclarationsMixin,
     def getCodeObjectHandle(self, code_object):
         return self.parent.getCodeObjectHandle(code_object)
 
+    def getConstantCode(self, constant):
+        return self.parent.getConstantCodeForUser(constant, self.constants_user)
+
+    def setConstantsUser(self, function_identifier):
+        self.constants_user = function_identifier
+
 
 class PythonFunctionDirectContext(PythonFunctionContext):
     def isForDirectCall(self):
@@ -21,13 +21,12 @@
 
 from .CodeHelpers import (
     generateChildExpressionsCode,
-    generateStatementSequenceCode,
     withObjectCodeTemporaryAssignment
 )
-from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitCode
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
+    generateFunctionStatementsCode,
     getClosureCopyCode,
     getFunctionQualnameObj,
     setupFunctionLocalVariables
@@ -67,17 +66,10 @@ def getCoroutineObjectCode(context, function_identifier, closure_variables,
         temp_variables    = temp_variables
     )
 
-    function_codes = SourceCodeCollector()
+    function_codes = generateFunctionStatementsCode(context)
 
     coroutine_object_body = context.getOwner()
 
-    generateStatementSequenceCode(
-        statement_sequence = coroutine_object_body.getBody(),
-        allow_none         = True,
-        emit               = function_codes,
-        context            = context
-    )
-
     function_cleanup = finalizeFunctionLocalVariables(context)
 
     if needs_exception_exit:
@@ -30,6 +30,12 @@ from .VariableCodes import getVariableAssignmentCode
 
 
 def _getStoreLocalsCode(locals_name, variable_traces, is_dict, emit, context):
+    # Sorted, so the generated code does not differ between runs.
+    variable_traces = sorted(
+        variable_traces,
+        key = lambda item: item[0].getName()
+    )
+
     for variable, variable_trace in variable_traces:
         if not variable.isModuleVariable():
             key_name = context.getConstantCode(
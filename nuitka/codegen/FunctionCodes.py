@@ -19,6 +19,7 @@
 
 """
 
+from nuitka import Options
 from nuitka.PythonVersions import python_version
 
 from .c_types.CTypePyObjectPtrs import CTypeCellObject, CTypePyObjectPtrPtr
@@ -27,6 +28,7 @@ from .CodeHelpers import (
     generateStatementSequenceCode,
     withObjectCodeTemporaryAssignment
 )
+from .ConstantCodes import getFunctionConstantsCreationCode
 from .Contexts import PythonFunctionOutlineContext
 from .Emission import SourceCodeCollector
 from .ErrorCodes import getErrorExitCode, getMustNotGetHereCode, getReleaseCode
@@ -84,7 +86,7 @@ def getFunctionMakerDecl(function_identifier, defaults_name, kw_defaults_name,
     }
 
 
-def _getFunctionEntryPointIdentifier(function_identifier):
+def getFunctionEntryPointIdentifier(function_identifier):
     return "impl_" + function_identifier
 
 
@@ -140,7 +142,7 @@ def getFunctionMakerCode(function_body, function_identifier, closure_variables,
         ),
         "function_qualname_obj"      : getFunctionQualnameObj(function_body, context),
         "function_identifier"        : function_identifier,
-        "function_impl_identifier"   : _getFunctionEntryPointIdentifier(
+        "function_impl_identifier"   : getFunctionEntryPointIdentifier(
             function_identifier = function_identifier,
         ),
         "function_creation_args"     : ", ".join(
@@ -352,7 +354,7 @@ def getFunctionCreationCode(to_name, function_identifier, defaults_name,
 
 def getDirectFunctionCallCode(to_name, function_identifier, arg_names,
                               closure_variables, needs_check, emit, context):
-    function_identifier = _getFunctionEntryPointIdentifier(
+    function_identifier = getFunctionEntryPointIdentifier(
         function_identifier = function_identifier
     )
 
@@ -525,8 +527,12 @@ def setupFunctionLocalVariables(context, parameters, closure_variables,
 def finalizeFunctionLocalVariables(context):
     function_cleanup = []
 
-    # TODO: Many times this will not be necessary.
-    for locals_declaration in context.getLocalsDictNames():
+    # TODO: Many times this will not be necessary. Sorted, so the generated
+    # code does not differ between runs.
+    for locals_declaration in sorted(
+            context.getLocalsDictNames(),
+            key = lambda locals_declaration: locals_declaration.code_name
+        ):
         function_cleanup.append(
             "Py_XDECREF( %(locals_dict)s );\n" % {
                 "locals_dict" : locals_declaration
@@ -536,6 +542,37 @@ def finalizeFunctionLocalVariables(context):
     return function_cleanup
 
 
+def generateFunctionStatementsCode(context):
+    """ Generate the code of the statements of a function body.
+
+        With lazy constants, the constants used only by them, are created
+        when the function body is executed first, see "ConstantCodes".
+    """
+
+    function_codes = SourceCodeCollector()
+
+    if Options.shallUseLazyConstants():
+        function_identifier = context.getOwner().getCodeName()
+
+        context.parent.addLazyConstantsFunction(function_identifier)
+        context.setConstantsUser(function_identifier)
+
+        function_codes(
+            getFunctionConstantsCreationCode(function_identifier)
+        )
+
+    generateStatementSequenceCode(
+        statement_sequence = context.getOwner().getBody(),
+        allow_none         = True,
+        emit               = function_codes,
+        context            = context
+    )
+
+    context.setConstantsUser(None)
+
+    return function_codes
+
+
 def getFunctionCode(context, function_identifier, parameters, closure_variables,
                     user_variables, outline_variables,
                     temp_variables, function_doc, file_scope, needs_exception_exit):
@@ -551,14 +588,7 @@ def getFunctionCode(context, function_identifier, parameters, closure_variables,
         temp_variables    = temp_variables
     )
 
-    function_codes = SourceCodeCollector()
-
-    generateStatementSequenceCode(
-        statement_sequence = context.getOwner().getBody(),
-        allow_none         = True,
-        emit               = function_codes,
-        context            = context
-    )
+    function_codes = generateFunctionStatementsCode(context)
 
     function_cleanup = finalizeFunctionLocalVariables(context = context)
 
@@ -21,10 +21,9 @@
 
 from nuitka.PythonVersions import python_version
 
-from .CodeHelpers import generateStatementSequenceCode
-from .Emission import SourceCodeCollector
 from .FunctionCodes import (
     finalizeFunctionLocalVariables,
+    generateFunctionStatementsCode,
     getClosureCopyCode,
     getFunctionQualnameObj,
     setupFunctionLocalVariables
@@ -62,14 +61,7 @@ def getGeneratorObjectCode(context, function_identifier, closure_variables,
         temp_variables    = temp_variables
     )
 
-    function_codes = SourceCodeCollector()
-
-    generateStatementSequenceCode(
-        statement_sequence = context.getOwner().getBody(),
-        allow_none         = True,
-        emit               = function_codes,
-        context            = context
-    )
+    function_codes = generateFunctionStatementsCode(context)
 
     function_cleanup = finalizeFunctionLocalVariables(context)
 
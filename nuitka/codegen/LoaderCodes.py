@@ -56,13 +56,53 @@ def getModuleMetapathLoaderEntryCode(module_name, module_identifier,
         }
 
 
+def _getModuleNameHash(module_name):
+    """ The FNV-1a hash of a module name, as computed by the loader. """
+
+    result = 2166136261
+
+    for value in bytearray(module_name.encode("utf-8")):
+        result = ((result ^ value) * 16777619) & 0xffffffff
+
+    return result
+
+
+def _getModuleNameHashTable(module_names):
+    """ Hash table of the indexes of the module names, -1 for empty slots.
+
+        The table is at most half full, so lookups of names not present end
+        at an empty slot after few steps. Collisions use the next free slot.
+    """
+
+    size = 8
+    while size < 2 * len(module_names):
+        size *= 2
+
+    slots = [-1] * size
+
+    for index, module_name in enumerate(module_names):
+        slot = _getModuleNameHash(module_name) & (size - 1)
+
+        while slots[slot] != -1:
+            slot = (slot + 1) & (size - 1)
+
+        slots[slot] = index
+
+    return slots
+
+
 stream_data = ConstantCodes.stream_data
 
 def getMetapathLoaderBodyCode(other_modules):
     metapath_loader_inittab = []
     metapath_module_decls = []
 
+    # Names in the order of the entries, for the hash table.
+    module_names = []
+
     for other_module in other_modules:
+        module_names.append(other_module.getFullName())
+
         if other_module.isUncompiledPythonModule():
             code_data = other_module.getByteCode()
             is_package = other_module.isUncompiledPythonPackage()
@@ -95,6 +135,8 @@ def getMetapathLoaderBodyCode(other_modules):
             )
 
     for uncompiled_module in getUncompiledNonTechnicalModules():
+        module_names.append(uncompiled_module.getFullName())
+
         code_data = uncompiled_module.getByteCode()
         is_package = uncompiled_module.isUncompiledPythonPackage()
 
@@ -111,8 +153,21 @@ def getMetapathLoaderBodyCode(other_modules):
             }
         )
 
+    hash_slots = _getModuleNameHashTable(module_names)
 
     return template_metapath_loader_body % {
-        "metapath_module_decls"   : indented(metapath_module_decls, 0),
-        "metapath_loader_inittab" : indented(metapath_loader_inittab)
+        "metapath_module_decls"      : indented(metapath_module_decls, 0),
+        "metapath_loader_inittab"    : indented(metapath_loader_inittab),
+        "metapath_loader_hash_slots" : indented(
+            [
+                ", ".join(
+                    "%d" % slot
+                    for slot in
+                    hash_slots[count:count+16]
+                ) + ','
+                for count in
+                range(0, len(hash_slots), 16)
+            ]
+        ),
+        "metapath_loader_hash_mask"  : len(hash_slots) - 1
     }
@@ -19,6 +19,7 @@
 
 """
 
+from nuitka import Options
 from nuitka.__past__ import iterItems
 from nuitka.codegen import Emission
 from nuitka.Version import getNuitkaVersion, getNuitkaVersionYear
@@ -29,13 +30,20 @@ from .CodeHelpers import (
     withObjectCodeTemporaryAssignment
 )
 from .CodeObjectCodes import getCodeObjectsDeclCode, getCodeObjectsInitCode
-from .ConstantCodes import allocateNestedConstants, getConstantInitCodes
+from .ConstantCodes import (
+    allocateNestedConstants,
+    getConstantInitCodes,
+    resolveFunctionConstantsCreationCode
+)
 from .Indentation import indented
 from .templates.CodeTemplatesModules import (
     template_global_copyright,
     template_module_body_template,
     template_module_exception_exit,
-    template_module_noexception_exit
+    template_module_noexception_exit,
+    template_module_prelude,
+    template_unity_body,
+    template_unity_module
 )
 from .VariableCodes import getVariableReferenceCode
 
@@ -129,13 +137,18 @@ def getModuleValues(context, module_name, module_identifier, function_decl_codes
 
 
 def getModuleCode(module_context, template_values):
-    header = template_global_copyright % {
-        "name"    : module_context.getName(),
-        "version" : getNuitkaVersion(),
-        "year"    : getNuitkaVersionYear()
-    }
+    # Unity files include the prelude only once at their start, where a
+    # precompiled header can be used for it.
+    if Options.shallUseUnityBuild():
+        header = ""
+    else:
+        header = template_global_copyright % {
+            "name"    : module_context.getName(),
+            "version" : getNuitkaVersion(),
+            "year"    : getNuitkaVersionYear()
+        } + template_module_prelude
 
-    decls, inits, checks = getConstantInitCodes(module_context)
+    decls, inits, checks, function_inits = getConstantInitCodes(module_context)
 
     if module_context.needsModuleFilenameObject():
         decls.append("static PyObject *module_filename_obj;")
@@ -155,7 +168,40 @@ def getModuleCode(module_context, template_values):
         1
     )
 
-    return header + template_module_body_template % template_values
+    template_values["function_constants_codes"] = ''.join(
+        '\n' + function_init
+        for function_init in
+        function_inits.values()
+    )
+
+    return header + resolveFunctionConstantsCreationCode(
+        code           = template_module_body_template % template_values,
+        function_inits = function_inits
+    )
+
+
+def getUnityCode(module_codes, extra_code):
+    """ Combine the code of several modules into one C file.
+
+        The module codes are pairs of module identifier and code. The extra
+        code is added at the end, this is used for the helper code.
+    """
+
+    unity_codes = [
+        template_unity_module % {
+            "module_identifier" : module_identifier,
+            "module_code"       : module_code
+        }
+        for module_identifier, module_code in
+        module_codes
+    ]
+
+    if extra_code:
+        unity_codes.append(extra_code)
+
+    return template_unity_body % {
+        "unity_codes" : '\n'.join(unity_codes)
+    }
 
 
 def generateModuleAttributeFileCode(to_name, expression, emit, context):
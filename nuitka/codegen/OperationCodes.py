@@ -117,20 +117,19 @@ def generateOperationUnaryCode(to_name, expression, emit, context):
         context     = context
     )
 
-# TODO: Have these for even more types, esp. long values, construct from the
-# list of keys the helper name automatically.
 _shape_to_helper_code = {
     ShapeTypeList    : "LIST",
     ShapeTypeFloat   : "FLOAT",
     ShapeTypeTuple   : "TUPLE",
     ShapeTypeUnicode : "UNICODE",
+    ShapeTypeLong    : "LONG",
 }
 
 if python_version < 300:
     _shape_to_helper_code[ShapeTypeInt] = "INT"
     _shape_to_helper_code[ShapeTypeStr] = "STR"
 else:
-    _shape_to_helper_code[ShapeTypeLong] = "LONG"
+    _shape_to_helper_code[ShapeTypeInt] = "LONG"
     _shape_to_helper_code[ShapeTypeBytes] = "BYTES"
 
 _iadd_helpers_set = set(
@@ -147,18 +146,85 @@ _iadd_helpers_set = set(
         "BINARY_OPERATION_ADD_OBJECT_BYTES_INPLACE",
 
         "BINARY_OPERATION_ADD_LIST_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_FLOAT_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_TUPLE_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_UNICODE_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_INT_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_STR_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_LONG_OBJECT_INPLACE",
-        "BINARY_OPERATION_ADD_BYTES_OBJECT_INPLACE",
 
         "BINARY_OPERATION_ADD_LIST_LIST_INPLACE",
     ]
 )
 
+# Operators with helpers specialized to the shapes of both operands, these are
+# generated by "nuitka.tools.specialize" for all pairs of the above shapes,
+# except both being "OBJECT".
+_binary_helper_codes = {
+    "Add"      : "ADD",
+    "Sub"      : "SUB",
+    "Mult"     : "MUL",
+    "FloorDiv" : "FLOORDIV",
+    "TrueDiv"  : "TRUEDIV",
+    "Mod"      : "REMAINDER",
+    "Pow"      : "POW",
+    "LShift"   : "LSHIFT",
+    "RShift"   : "RSHIFT",
+    "BitAnd"   : "BITAND",
+    "BitOr"    : "BITOR",
+    "BitXor"   : "BITXOR",
+}
+
+if python_version < 300:
+    _binary_helper_codes["Div"] = "DIV"
+
+# For these, in-place operations are the same as the normal ones, as they
+# cannot be modified.
+_immutable_helper_codes = (
+    "INT",
+    "LONG",
+    "FLOAT",
+    "STR",
+    "UNICODE",
+    "BYTES",
+    "TUPLE",
+)
+
+
+def _getBinaryOperationSpecializedHelper(expression, operator):
+    """ Helper specialized to the shapes of the operands, if any.
+
+        In-place operators are only specialized for left operand shapes that
+        cannot be modified in-place, and use variants that raise the errors
+        of the in-place operator.
+    """
+
+    left_part = _shape_to_helper_code.get(
+        expression.getLeft().getTypeShape(),
+        "OBJECT"
+    )
+    right_part = _shape_to_helper_code.get(
+        expression.getRight().getTypeShape(),
+        "OBJECT"
+    )
+
+    if operator.startswith('I') and operator[1:] in _binary_helper_codes:
+        if left_part not in _immutable_helper_codes:
+            return None
+
+        prefix = 'I'
+        operator = operator[1:]
+    else:
+        prefix = ""
+
+    if operator not in _binary_helper_codes:
+        return None
+
+    if left_part == "OBJECT" and right_part == "OBJECT":
+        return None
+
+    return "BINARY_OPERATION_%s%s_%s_%s" % (
+        prefix,
+        _binary_helper_codes[operator],
+        left_part,
+        right_part
+    )
+
+
 def _getOperationCode(to_name, expression, operator, arg_names, in_place,
                       needs_check, emit, context):
     # This needs to have one case per operation of Python, and there are many
@@ -167,7 +233,22 @@ def _getOperationCode(to_name, expression, operator, arg_names, in_place,
     prefix_args = ()
     ref_count = 1
 
-    if operator == "Pow":
+    if len(arg_names) == 2 and not (operator == "IAdd" and in_place):
+        specialized_helper = _getBinaryOperationSpecializedHelper(
+            expression = expression,
+            operator   = operator
+        )
+    else:
+        specialized_helper = None
+
+    if specialized_helper is not None and in_place:
+        helper = "BINARY_OPERATION"
+        prefix_args = (
+            specialized_helper,
+        )
+    elif specialized_helper is not None:
+        helper = specialized_helper
+    elif operator == "Pow":
         helper = "POWER_OPERATION"
     elif operator == "IPow" and in_place:
         helper = "POWER_OPERATION_INPLACE"
@@ -187,12 +268,23 @@ def _getOperationCode(to_name, expression, operator, arg_names, in_place,
             right_part
         )
 
-        if ideal_helper not in _iadd_helpers_set:
+        if ideal_helper in _iadd_helpers_set:
+            helper = ideal_helper
+        elif left_part in ("INT", "LONG", "FLOAT", "TUPLE") and \
+             right_part != "OBJECT":
+            # Values that cannot be modified in-place, so the specialized
+            # variant of the normal operation will do.
+            helper = "BINARY_OPERATION"
+            prefix_args = (
+                _getBinaryOperationSpecializedHelper(
+                    expression = expression,
+                    operator   = "IAdd"
+                ),
+            )
+        else:
             onMissingHelper(ideal_helper)
 
             helper = "BINARY_OPERATION_ADD_OBJECT_OBJECT_INPLACE"
-        else:
-            helper = ideal_helper
     elif operator == "IMult" and in_place:
         helper = "BINARY_OPERATION_MUL_INPLACE"
     elif operator == "Sub":
@@ -235,7 +327,7 @@ def _getOperationCode(to_name, expression, operator, arg_names, in_place,
             emit(
                 "%s = BINARY_OPERATION_INPLACE( %s, &%s, %s );" % (
                     res_name,
-                    OperatorCodes.binary_operator_codes[ operator ],
+                    prefix_args[0],
                     arg_names[0],
                     arg_names[1],
                 )
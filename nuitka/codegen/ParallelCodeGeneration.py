@@ -0,0 +1,353 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Parallel code generation of modules.
+
+Generating the code of a module is independent of other modules, except for
+the constants and helpers used, which are collected globally. Worker processes
+are forked, so they have the node tree already, generate the code for their
+share of the modules, and report their use of constants and helpers back.
+
+Offsets into the constants stream are decided by the main process, visiting
+the modules in the same order as serial code generation does, so the result
+is the same C code.
+"""
+
+import multiprocessing
+import os
+import sys
+import traceback
+
+from nuitka import Options
+from nuitka.Constants import pickleConstant, unpickleConstant
+from nuitka.PythonVersions import python_version
+
+from . import CallCodes, Reports
+from .CodeGeneration import generateModuleCode, prepareModuleCode
+from .ConstantCodes import stream_data
+
+
+def canGenerateInParallel():
+    # The node tree is not transferable to other processes, forking is the
+    # only way to share it.
+    return hasattr(os, "fork")
+
+
+def _getModuleWeight(module):
+    # Roughly the amount of code to generate.
+    return len(module.getUsedFunctions()) + 1
+
+
+def _distributeModules(modules, job_count):
+    """ Distribute modules to jobs, largest first, to balance their work. """
+
+    jobs = [
+        []
+        for _i in range(job_count)
+    ]
+    job_weights = [0] * job_count
+
+    for module in sorted(modules, key = _getModuleWeight, reverse = True):
+        job_index = job_weights.index(min(job_weights))
+
+        jobs[job_index].append(module)
+        job_weights[job_index] += _getModuleWeight(module)
+
+    return [
+        job
+        for job in
+        jobs
+        if job
+    ]
+
+
+def _startStreamSection(module):
+    # For incremental builds, the stream data of each module is a section of
+    # its own, so its code does not change, when other modules change.
+    if Options.isIncrementalBuild():
+        stream_data.startSection(module.getCodeName())
+
+
+def _finishStreamSection():
+    if Options.isIncrementalBuild():
+        stream_data.finishSection()
+
+
+def _prepareModule(global_context, module, main_module):
+    template_values, module_context = prepareModuleCode(
+        global_context = global_context,
+        module         = module,
+        module_name    = module.getFullName(),
+    )
+
+    # Main code constants need to be allocated already too.
+    if module is main_module and not Options.shallMakeModule():
+        module_context.getConstantCode(0)
+
+    return template_values, module_context
+
+
+def _generateModulesWorker(connection, global_context, modules, main_module):
+    # Using the stream data and constants from the fork time, changes are
+    # reported back.
+    constants_before = set(global_context.constants)
+    use_counts_before = dict(global_context.constant_use_count)
+
+    stream_values = {}
+    prepared_modules = {}
+
+    for module in modules:
+        stream_data.deferStreamDataOffsets()
+
+        prepared_modules[module] = _prepareModule(
+            global_context = global_context,
+            module         = module,
+            main_module    = main_module
+        )
+
+        stream_values[module.getFullName()] = stream_data.getDeferredValues()
+
+    new_constants = dict(
+        (constant_identifier, pickleConstant(constant_value))
+        for constant_identifier, constant_value in
+        global_context.constants.items()
+        if constant_identifier not in constants_before
+    )
+
+    use_counts = {}
+
+    for constant_identifier, use_count in global_context.constant_use_count.items():
+        use_count -= use_counts_before.get(constant_identifier, 0)
+
+        if use_count:
+            use_counts[constant_identifier] = use_count
+
+    connection.send(
+        (new_constants, use_counts, stream_values)
+    )
+
+    # Only with the use counts of all modules, it is known which constants
+    # are module level.
+    global_context.constant_use_count = connection.recv()
+
+    module_codes = {}
+
+    for module in modules:
+        stream_data.deferStreamDataOffsets(
+            stream_values[module.getFullName()]
+        )
+
+        template_values, module_context = prepared_modules[module]
+
+        module_codes[module.getFullName()] = (
+            generateModuleCode(
+                module_context  = module_context,
+                template_values = template_values
+            ),
+            stream_data.getDeferredValues()[len(stream_values[module.getFullName()]):]
+        )
+
+    connection.send(
+        (
+            module_codes,
+            sorted(CallCodes.quick_calls_used),
+            sorted(CallCodes.quick_instance_calls_used),
+            Reports.getMissingHelpers()
+        )
+    )
+
+
+def _runWorker(connection, global_context, modules, main_module):
+    try:
+        _generateModulesWorker(
+            connection     = connection,
+            global_context = global_context,
+            modules        = modules,
+            main_module    = main_module
+        )
+    except BaseException: # Catch all the things, pylint: disable=broad-except
+        connection.send(traceback.format_exc())
+
+    connection.close()
+
+
+def _receiveFromWorker(connection, workers):
+    try:
+        result = connection.recv()
+    except EOFError:
+        result = "Worker process died unexpectedly."
+
+    if type(result) is str:
+        for worker in workers:
+            worker.terminate()
+
+        sys.exit(
+            "Error, code generation failed in worker process:\n" + result
+        )
+
+    return result
+
+
+def _generateModulesCodeParallel(global_context, modules, main_module, jobs):
+    if python_version >= 340:
+        multiprocessing_context = multiprocessing.get_context("fork")
+    else:
+        multiprocessing_context = multiprocessing
+
+    connections = []
+    workers = []
+
+    for job_modules in _distributeModules(modules, jobs):
+        connection, worker_connection = multiprocessing_context.Pipe()
+
+        worker = multiprocessing_context.Process(
+            target = _runWorker,
+            args   = (worker_connection, global_context, job_modules, main_module)
+        )
+        worker.start()
+        worker_connection.close()
+
+        connections.append(connection)
+        workers.append(worker)
+
+    stream_values = {}
+
+    for connection in connections:
+        constants, use_counts, worker_stream_values = _receiveFromWorker(
+            connection = connection,
+            workers    = workers
+        )
+
+        for constant_identifier, constant_data in constants.items():
+            if constant_identifier not in global_context.constants:
+                global_context.constants[constant_identifier] = \
+                  unpickleConstant(constant_data)
+
+        for constant_identifier, use_count in use_counts.items():
+            global_context.constant_use_count[constant_identifier] = \
+              global_context.constant_use_count.get(constant_identifier, 0) + \
+              use_count
+
+        stream_values.update(worker_stream_values)
+
+    for connection in connections:
+        connection.send(global_context.constant_use_count)
+
+    module_codes = {}
+
+    for connection in connections:
+        worker_module_codes, quick_calls_used, quick_instance_calls_used, \
+          missing_helpers = _receiveFromWorker(
+            connection = connection,
+            workers    = workers
+        )
+
+        module_codes.update(worker_module_codes)
+
+        CallCodes.quick_calls_used.update(quick_calls_used)
+        CallCodes.quick_instance_calls_used.update(quick_instance_calls_used)
+
+        for helper_name in missing_helpers:
+            Reports.onMissingHelper(helper_name)
+
+    for worker in workers:
+        worker.join()
+
+    # Decide stream offsets in the order of serial code generation, first for
+    # preparing all modules, then for their module level constants.
+    for module in modules:
+        _startStreamSection(module)
+
+        for value in stream_values[module.getFullName()]:
+            stream_data.getStreamDataOffset(value)
+
+        _finishStreamSection()
+
+    for module in modules:
+        _startStreamSection(module)
+
+        for value in module_codes[module.getFullName()][1]:
+            stream_data.getStreamDataOffset(value)
+
+        _finishStreamSection()
+
+    result = {}
+
+    for module in modules:
+        source_code, module_stream_values = module_codes[module.getFullName()]
+
+        _startStreamSection(module)
+
+        result[module] = stream_data.resolveDeferredStreamDataCode(
+            code   = source_code,
+            values = stream_values[module.getFullName()] + module_stream_values
+        )
+
+        _finishStreamSection()
+
+    return result
+
+
+def generateModulesCode(global_context, modules, main_module):
+    """ Generate the C code of compiled modules.
+
+        Returns a dictionary of the modules to their C code. With more than
+        one job allowed, this happens in parallel.
+    """
+
+    jobs = min(Options.getCodegenJobLimit(), len(modules))
+
+    if jobs > 1 and canGenerateInParallel():
+        return _generateModulesCodeParallel(
+            global_context = global_context,
+            modules        = modules,
+            main_module    = main_module,
+            jobs           = jobs
+        )
+
+    # First pass, generate code and use constants doing so, but prepare the
+    # final code generation only, because constants code will be added at the
+    # end only.
+    prepared_modules = {}
+
+    for module in modules:
+        _startStreamSection(module)
+
+        prepared_modules[module] = _prepareModule(
+            global_context = global_context,
+            module         = module,
+            main_module    = main_module
+        )
+
+        _finishStreamSection()
+
+    # Second pass, generate the actual module code.
+    result = {}
+
+    for module in modules:
+        template_values, module_context = prepared_modules[module]
+
+        _startStreamSection(module)
+
+        result[module] = generateModuleCode(
+            module_context  = module_context,
+            template_values = template_values
+        )
+
+        _finishStreamSection()
+
+    return result
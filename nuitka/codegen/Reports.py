@@ -39,3 +39,7 @@ def doMissingOptimizationReport():
 
 def onMissingHelper(helper_name):
     _missing_helpers.add(helper_name)
+
+
+def getMissingHelpers():
+    return list(_missing_helpers)
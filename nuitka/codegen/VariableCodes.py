@@ -19,23 +19,77 @@
 
 """
 
-from nuitka.nodes.shapes.BuiltinTypeShapes import ShapeTypeBool
+from nuitka.__past__ import long  # pylint: disable=I0021,redefined-builtin
+from nuitka.nodes.shapes.BuiltinTypeShapes import (
+    ShapeTypeBool,
+    ShapeTypeFloat,
+    ShapeTypeInt,
+    ShapeTypeLong
+)
 
+from .c_types.CTypeNuitkaNumbers import CTypeNuitkaDouble, CTypeNuitkaIlong
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
     CTypePyObjectPtrPtr
 )
 from .CodeHelpers import decideConversionCheckNeeded, generateExpressionCode
+from .Emission import SourceCodeCollector
 from .ErrorCodes import (
     getAssertionCode,
     getLocalVariableReferenceErrorCode,
     getNameReferenceErrorCode
 )
+from .Indentation import indented
+from .templates.CodeTemplatesVariables import template_native_value_guarded
 from .VariableDeclarations import VariableDeclaration
 
 
 def generateAssignmentVariableCode(statement, emit, context):
+    variable = statement.getVariable()
+
+    if not variable.isModuleVariable():
+        variable_declaration = getLocalVariableDeclaration(
+            context,
+            variable,
+            statement.getVariableTrace()
+        )
+
+        native_operation = getNativeOperationCode(
+            to_name    = variable_declaration,
+            expression = statement.getAssignSource(),
+            context    = context
+        )
+
+        if native_operation is not None:
+            native_condition, native_code = native_operation
+
+            object_code = SourceCodeCollector()
+
+            _generateAssignmentVariableObjectCode(
+                statement = statement,
+                emit      = object_code,
+                context   = context
+            )
+
+            emit(
+                template_native_value_guarded % {
+                    "native_condition" : native_condition,
+                    "native_code"      : indented(native_code),
+                    "object_code"      : indented(object_code.codes)
+                }
+            )
+
+            return
+
+    _generateAssignmentVariableObjectCode(
+        statement = statement,
+        emit      = emit,
+        context   = context
+    )
+
+
+def _generateAssignmentVariableObjectCode(statement, emit, context):
     assign_source = statement.getAssignSource()
 
     variable = statement.getVariable()
@@ -165,6 +219,183 @@ def generateVariableReferenceCode(to_name, expression, emit, context):
     )
 
 
+def _getNativeOperandCode(c_type, expression, exact, context):
+    """ C value of an operand for C level operations of a C type.
+
+        Returns None, if the operand cannot be used as a C value, otherwise
+        the value code, the conditions for it, and the C type of its value.
+        With "exact", "int" values of variables are not converted to "float"
+        values, as done for arithmetic with them.
+    """
+
+    if expression.isExpressionConstantRef():
+        constant = expression.getCompileTimeConstant()
+
+        constant_code = c_type.getNativeConstantCode(constant)
+
+        if constant_code is None:
+            return None
+
+        # Exact types only, pylint: disable=unidiomatic-typecheck
+        if type(constant) is float:
+            value_c_type = CTypeNuitkaDouble
+        else:
+            value_c_type = CTypeNuitkaIlong
+
+        return constant_code, [], value_c_type
+    elif expression.isExpressionVariableRef():
+        variable = expression.getVariable()
+
+        if variable.isModuleVariable():
+            return None
+
+        variable_declaration = getLocalVariableDeclaration(
+            context,
+            variable,
+            expression.getVariableTrace()
+        )
+
+        value_c_type = variable_declaration.getCType()
+
+        if value_c_type is not c_type and \
+           (exact or
+            c_type is not CTypeNuitkaDouble or
+            value_c_type is not CTypeNuitkaIlong):
+            return None
+
+        value_code = value_c_type.getNativeValueCode(variable_declaration)
+
+        if value_c_type is not c_type:
+            value_code = "((double)%s)" % value_code
+
+        # Unassigned values fail the check, and the object code will raise.
+        return (
+            value_code,
+            [value_c_type.getNativeValueCheckCode(variable_declaration)],
+            value_c_type
+        )
+    elif expression.isExpressionOperationBinary():
+        return _getNativeBinaryOperationCode(c_type, expression, context)
+    else:
+        return None
+
+
+def _getNativeBinaryOperationCode(c_type, expression, context):
+    left_code = _getNativeOperandCode(
+        c_type     = c_type,
+        expression = expression.getLeft(),
+        exact      = False,
+        context    = context
+    )
+
+    if left_code is None:
+        return None
+
+    right_code = _getNativeOperandCode(
+        c_type     = c_type,
+        expression = expression.getRight(),
+        exact      = False,
+        context    = context
+    )
+
+    if right_code is None:
+        return None
+
+    # Operations on "int" values only, give "int" values.
+    if c_type is CTypeNuitkaDouble and \
+       CTypeNuitkaDouble not in (left_code[2], right_code[2]):
+        return None
+
+    operator = expression.getOperator()
+
+    # In-place does not matter for these values, they cannot be modified.
+    if expression.isExpressionOperationBinaryInplace():
+        operator = operator[1:]
+
+    operation_code = c_type.getNativeOperationCode(
+        operator   = operator,
+        left_code  = left_code[0],
+        right_code = right_code[0],
+        context    = context
+    )
+
+    if operation_code is None:
+        return None
+
+    condition, value_code = operation_code
+
+    check_codes = list(left_code[1])
+
+    for check_code in right_code[1]:
+        if check_code not in check_codes:
+            check_codes.append(check_code)
+
+    if condition is not None:
+        check_codes.append(condition)
+
+    return value_code, check_codes, c_type
+
+
+def getNativeOperandCodes(c_type, expressions, context):
+    """ C values of operands for C level comparisons.
+
+        Returns None, if not all operands can be used as C values, otherwise
+        the value codes and the conditions for them.
+    """
+
+    value_codes = []
+    check_codes = []
+
+    for expression in expressions:
+        operand_code = _getNativeOperandCode(
+            c_type     = c_type,
+            expression = expression,
+            exact      = True,
+            context    = context
+        )
+
+        if operand_code is None:
+            return None
+
+        value_codes.append(operand_code[0])
+
+        for check_code in operand_code[1]:
+            if check_code not in check_codes:
+                check_codes.append(check_code)
+
+    return value_codes, check_codes
+
+
+def getNativeOperationCode(to_name, expression, context):
+    """ Condition and code for a binary operation done with C values.
+
+        Returns None, if not possible, otherwise the condition under which
+        the code can be used instead of the object operation.
+    """
+
+    if to_name.c_type not in ("nuitka_double", "nuitka_ilong") or \
+       not expression.isExpressionOperationBinary():
+        return None
+
+    c_type = to_name.getCType()
+
+    operation_code = _getNativeBinaryOperationCode(
+        c_type     = c_type,
+        expression = expression,
+        context    = context
+    )
+
+    if operation_code is None:
+        return None
+
+    value_code, check_codes, _value_c_type = operation_code
+
+    return (
+        " && ".join(check_codes) or '1',
+        c_type.getNativeAssignCode(to_name, value_code)
+    )
+
+
 def _getVariableCodeName(in_context, variable):
     if in_context:
         # Closure case:
@@ -177,6 +408,181 @@ def _getVariableCodeName(in_context, variable):
         return "var_" + variable.getCodeName()
 
 
+# Operations that give "int" or "float" results for these operands, the
+# value may still not fit the C type, but then the object is used.
+_native_int_operators = frozenset(
+    (
+        "Add", "Sub", "Mult", "Div", "FloorDiv", "Mod",
+        "LShift", "RShift", "BitAnd", "BitOr", "BitXor"
+    )
+)
+_native_float_operators = frozenset(
+    (
+        "Add", "Sub", "Mult", "Div", "TrueDiv", "FloorDiv", "Mod"
+    )
+)
+
+_native_shape_c_types = {
+    ShapeTypeFloat : CTypeNuitkaDouble,
+    ShapeTypeInt   : CTypeNuitkaIlong,
+    ShapeTypeLong  : CTypeNuitkaIlong,
+}
+
+
+def _joinNativeCTypes(c_type1, c_type2):
+    if c_type1 is None:
+        return c_type2
+    elif c_type2 is None or c_type1 is c_type2:
+        return c_type1
+    else:
+        return CTypePyObjectPtr
+
+
+def _getNativeExpressionCType(expression, variable_c_types):
+    """ C type for the value of an expression, given C types of variables.
+
+        None means not yet known, and "CTypePyObjectPtr" is for all values
+        that cannot be C values.
+    """
+
+    if expression.isExpressionConstantRef():
+        constant_type = type(expression.getCompileTimeConstant())
+
+        if constant_type is float:
+            return CTypeNuitkaDouble
+        elif constant_type in (int, long):
+            return CTypeNuitkaIlong
+        else:
+            return CTypePyObjectPtr
+    elif expression.isExpressionVariableRef() and \
+         expression.getVariable() in variable_c_types:
+        return variable_c_types[expression.getVariable()]
+    elif expression.isExpressionOperationBinary():
+        operator = expression.getOperator()
+
+        if expression.isExpressionOperationBinaryInplace():
+            operator = operator[1:]
+
+        left_c_type = _getNativeExpressionCType(
+            expression.getLeft(),
+            variable_c_types
+        )
+        right_c_type = _getNativeExpressionCType(
+            expression.getRight(),
+            variable_c_types
+        )
+
+        if CTypePyObjectPtr in (left_c_type, right_c_type):
+            return CTypePyObjectPtr
+        elif left_c_type is None or right_c_type is None:
+            return None
+        elif left_c_type is CTypeNuitkaIlong and \
+             right_c_type is CTypeNuitkaIlong and \
+             operator in _native_int_operators:
+            return CTypeNuitkaIlong
+        elif operator in _native_float_operators:
+            return CTypeNuitkaDouble
+        else:
+            return CTypePyObjectPtr
+    else:
+        return _native_shape_c_types.get(
+            expression.getTypeShape(),
+            CTypePyObjectPtr
+        )
+
+
+def _getNativeExpressionVariables(expression):
+    if expression.isExpressionVariableRef():
+        return (expression.getVariable(),)
+    elif expression.isExpressionOperationBinary():
+        return _getNativeExpressionVariables(expression.getLeft()) + \
+               _getNativeExpressionVariables(expression.getRight())
+    else:
+        return ()
+
+
+def _getNativeVariableValues(variable):
+    """ Assigned values of a variable, if it could use a C value at all. """
+
+    if not variable.isLocalVariable() or variable.isParameterVariable():
+        return None
+
+    # Only for plain function bodies, not for generators and the like, which
+    # need to keep their variables on the heap.
+    owner = variable.getOwner()
+
+    if owner is not variable.getEntryPoint() or \
+       not owner.isExpressionFunctionBody() or \
+       owner.isUnoptimized():
+        return None
+
+    if variable.isSharedTechnically() is not False or \
+       variable.hasAccessesOutsideOf(owner) is not False:
+        return None
+
+    return variable.getAssignedValues()
+
+
+def _getNativeCType(variable, context):
+    """ C value type to use for a local variable, None if not possible.
+
+        The variables assigned from each other are decided together, as
+        e.g. loops assign variables from themselves. The decisions are kept
+        with the module context.
+    """
+
+    native_c_types = context.getNativeCTypes()
+
+    if variable in native_c_types:
+        return native_c_types[variable]
+
+    variable_values = {}
+
+    pending = [variable]
+    while pending:
+        current = pending.pop()
+
+        if current in variable_values:
+            continue
+
+        values = _getNativeVariableValues(current)
+
+        if values is None:
+            continue
+
+        variable_values[current] = values
+
+        for value in values:
+            pending.extend(_getNativeExpressionVariables(value))
+
+    variable_c_types = dict.fromkeys(variable_values)
+
+    changed = True
+    while changed:
+        changed = False
+
+        for current, values in variable_values.items():
+            c_type = None
+
+            for value in values:
+                c_type = _joinNativeCTypes(
+                    c_type,
+                    _getNativeExpressionCType(value, variable_c_types)
+                )
+
+            if c_type is not variable_c_types[current]:
+                variable_c_types[current] = c_type
+                changed = True
+
+    for current, c_type in variable_c_types.items():
+        if c_type not in (CTypeNuitkaDouble, CTypeNuitkaIlong):
+            c_type = None
+
+        native_c_types[current] = c_type
+
+    return native_c_types.get(variable)
+
+
 def getPickedCType(variable, variable_trace, context):
     """ Return type to use for specific context. """
 
@@ -187,6 +593,11 @@ def getPickedCType(variable, variable_trace, context):
         if variable.isSharedTechnically():
             result = CTypeCellObject
         else:
+            native_c_type = _getNativeCType(variable, context)
+
+            if native_c_type is not None:
+                return native_c_type
+
             shapes = variable.getTypeShapes()
 
             if len(shapes) > 1:
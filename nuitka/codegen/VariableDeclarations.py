@@ -23,6 +23,7 @@ from contextlib import contextmanager
 
 from .c_types.CTypeModuleDictVariables import CTypeModuleDictVariable
 from .c_types.CTypeNuitkaBools import CTypeNuitkaBoolEnum
+from .c_types.CTypeNuitkaNumbers import CTypeNuitkaDouble, CTypeNuitkaIlong
 from .c_types.CTypePyObjectPtrs import (
     CTypeCellObject,
     CTypePyObjectPtr,
@@ -94,6 +95,10 @@ class VariableDeclaration(object):
             return CTypePyObjectPtrPtr
         elif c_type == "nuitka_bool":
             return CTypeNuitkaBoolEnum
+        elif c_type == "nuitka_double":
+            return CTypeNuitkaDouble
+        elif c_type == "nuitka_ilong":
+            return CTypeNuitkaIlong
         elif c_type == "module_var":
             return CTypeModuleDictVariable
         elif c_type == "void":
@@ -25,7 +25,11 @@ type_indicators = {
     "PyObject *" : 'o',
     "PyObject **" : 'O',
     "struct Nuitka_CellObject *" : 'c',
-    "nuitka_bool" : 'b'
+    "nuitka_bool" : 'b',
+
+    # These give objects to the frame.
+    "nuitka_double" : 'o',
+    "nuitka_ilong" : 'o',
 }
 
 class CTypeBase(object):
@@ -36,6 +40,11 @@ class CTypeBase(object):
     def getTypeIndicator(cls):
         return type_indicators[cls.c_type]
 
+    @classmethod
+    def getFrameValueCode(cls, variable_code_name):
+        """ Get code to pass the variable value to frame locals. """
+
+        return str(variable_code_name)
 
     @classmethod
     def getInitValue(cls, init_from):
@@ -52,6 +52,11 @@ class CTypeNuitkaBoolEnum(CTypeBase):
                 emit      = emit
             )
 
+    @classmethod
+    def getFrameValueCode(cls, variable_code_name):
+        # Enum values are passed as "int" through variable arguments.
+        return "(int)%s" % variable_code_name
+
     @classmethod
     def getLocalVariableInitTestCode(cls, value_name, inverted):
         return "%s %s NUITKA_BOOL_UNASSIGNED" % (
@@ -0,0 +1,244 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" CType classes for nuitka_double and nuitka_ilong, C values with objects.
+
+These hold a C "double" or "long" value, and an object for it, that is only
+created when the value escapes. Values that do not fit the C type are held
+as objects only.
+"""
+
+import math
+
+from nuitka.codegen.ErrorCodes import getErrorExitBoolCode
+
+from .CTypeBases import CTypeBase
+
+
+class CTypeNuitkaNumberBase(CTypeBase):
+    # For overload.
+    helper_prefix = None
+    native_operations = {}
+
+    @classmethod
+    def getInitValue(cls, init_from):
+        assert init_from is None, init_from
+
+        return "NUITKA_NATIVE_UNASSIGNED_VALUE"
+
+    @classmethod
+    def getLocalVariableInitTestCode(cls, value_name, inverted):
+        return "%s.validity %s NUITKA_NATIVE_UNASSIGNED" % (
+            value_name,
+            "==" if inverted else "!="
+        )
+
+    @classmethod
+    def emitVariableAssignCode(cls, value_name, needs_release, tmp_name,
+                               ref_count, in_place, emit, context):
+        # The value is released or not depending on the validity, the release
+        # indicator is not needed, pylint: disable=unused-argument
+
+        if in_place:
+            # The in-place operation has consumed the reference of the object,
+            # and gave the new one to the temporary.
+            emit(
+                "%s.object = NULL;" % value_name
+            )
+        elif not ref_count:
+            emit(
+                "Py_INCREF( %s );" % tmp_name
+            )
+
+        emit(
+            "%s_SET_OBJECT( &%s, %s );" % (
+                cls.helper_prefix,
+                value_name,
+                tmp_name
+            )
+        )
+
+    @classmethod
+    def emitValueAccessCode(cls, value_name, emit, context):
+        from ..VariableDeclarations import VariableDeclaration
+
+        getErrorExitBoolCode(
+            condition = "!%s_BOX( &%s )" % (
+                cls.helper_prefix,
+                value_name
+            ),
+            emit      = emit,
+            context   = context
+        )
+
+        # Use the object created for it, NULL if unassigned.
+        return VariableDeclaration(
+            "PyObject *",
+            "%s.object" % value_name,
+            None,
+            None
+        )
+
+    @classmethod
+    def getFrameValueCode(cls, variable_code_name):
+        return "%s_GET_OBJECT( &%s )" % (
+            cls.helper_prefix,
+            variable_code_name
+        )
+
+    @classmethod
+    def getReleaseCode(cls, variable_code_name, needs_check, emit):
+        # No checks needed, pylint: disable=unused-argument
+        emit(
+            "NUITKA_NATIVE_RELEASE( %s );" % variable_code_name
+        )
+
+    @classmethod
+    def getDeleteObjectCode(cls, to_name, value_name, needs_check, tolerant,
+                            emit, context):
+        if needs_check and not tolerant:
+            emit(
+                "%s = %s;" % (
+                    to_name,
+                    cls.getLocalVariableInitTestCode(value_name, False)
+                )
+            )
+
+        emit(
+            "NUITKA_NATIVE_RELEASE( %s );" % value_name
+        )
+
+    @classmethod
+    def getNativeValueCode(cls, value_name):
+        return "%s.c_value" % value_name
+
+    @classmethod
+    def getNativeValueCheckCode(cls, value_name):
+        return "NUITKA_NATIVE_HAS_C_VALUE( %s )" % value_name
+
+    @classmethod
+    def getNativeConstantCode(cls, constant):
+        """ C value for a constant operand, None if not suitable. """
+
+        # Need to overload this for each type it is used for, pylint: disable=unused-argument
+        assert False, cls.c_type
+
+    @classmethod
+    def getNativeOperationCode(cls, operator, left_code, right_code, context):
+        """ Condition and value code for C level binary operation.
+
+            Returns None if not possible, the condition may be None, if the
+            operation cannot fail.
+        """
+
+        # Need to overload this for each type it is used for, pylint: disable=unused-argument
+        assert False, cls.c_type
+
+    @classmethod
+    def getNativeAssignCode(cls, to_name, value_code):
+        return "%s_SET_C( &%s, %s );" % (
+            cls.helper_prefix,
+            to_name,
+            value_code
+        )
+
+
+class CTypeNuitkaDouble(CTypeNuitkaNumberBase):
+    c_type = "nuitka_double"
+
+    helper_prefix = "NUITKA_DOUBLE"
+
+    native_operations = {
+        "Add"     : '+',
+        "Sub"     : '-',
+        "Mult"    : '*',
+        "Div"     : '/',
+        "TrueDiv" : '/',
+    }
+
+    @classmethod
+    def getNativeConstantCode(cls, constant):
+        # Exact types only, pylint: disable=unidiomatic-typecheck
+        if type(constant) is float:
+            if math.isinf(constant) or math.isnan(constant):
+                return None
+
+            return "(%r)" % constant
+        elif type(constant) is int and abs(constant) < 2**53:
+            # Converts to the same double value as CPython does.
+            return "(%d.0)" % constant
+        else:
+            return None
+
+    @classmethod
+    def getNativeOperationCode(cls, operator, left_code, right_code, context):
+        if operator not in cls.native_operations:
+            return None
+
+        if operator in ("Div", "TrueDiv"):
+            # Division by zero is raised by the object operation.
+            condition = "%s != 0.0" % right_code
+        else:
+            condition = None
+
+        return (
+            condition,
+            "(%s %s %s)" % (
+                left_code,
+                cls.native_operations[operator],
+                right_code
+            )
+        )
+
+
+class CTypeNuitkaIlong(CTypeNuitkaNumberBase):
+    c_type = "nuitka_ilong"
+
+    helper_prefix = "NUITKA_ILONG"
+
+    native_operations = {
+        "Add"  : "NUITKA_ILONG_ADD",
+        "Sub"  : "NUITKA_ILONG_SUB",
+        "Mult" : "NUITKA_ILONG_MUL",
+    }
+
+    @classmethod
+    def getNativeConstantCode(cls, constant):
+        # Exact types only, pylint: disable=unidiomatic-typecheck
+        # Limited to values a C "long" has on all platforms.
+        if type(constant) is int and abs(constant) < 2**31:
+            return "(%dL)" % constant
+        else:
+            return None
+
+    @classmethod
+    def getNativeOperationCode(cls, operator, left_code, right_code, context):
+        if operator not in cls.native_operations:
+            return None
+
+        result_name = context.allocateTempName("native_result", "long")
+
+        # Overflows are handled by the object operation.
+        return (
+            "%s( &%s, %s, %s )" % (
+                cls.native_operations[operator],
+                result_name,
+                left_code,
+                right_code
+            ),
+            str(result_name)
+        )
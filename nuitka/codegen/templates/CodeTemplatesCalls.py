@@ -711,5 +711,67 @@ PyObject *CALL_METHOD_WITH_ARGS%(args_count)d( PyObject *source, PyObject *attr_
 }
 """
 
+# Call with keyword arguments given as names and values, and with the constant
+# dictionary of them, if they are all constant, "NULL" otherwise.
+template_call_function_kw_split = """\
+{
+    PyObject *call_args[] = { %(call_arg_names)s };
+    %(to_name)s = CALL_FUNCTION_WITH_ARGS_KWSPLIT( %(called_name)s, call_args, %(args_count)d, %(kw_names)s, %(kw_dict_name)s );
+}
+"""
+
+# Call of a compiled function known at compile time, directly to its C code,
+# with the parameter values arranged already. Checked at run time, because the
+# variable may have changed, then it is a normal call.
+template_call_function_direct_guarded = """\
+if ( Nuitka_Function_Check( %(called_name)s ) && ((struct Nuitka_FunctionObject *)%(called_name)s)->m_c_code == %(function_impl_identifier)s%(defaults_check)s )
+{
+    struct Nuitka_FunctionObject const *direct_function = (struct Nuitka_FunctionObject const *)%(called_name)s;
+
+    if (unlikely( Py_EnterRecursiveCall( (char *)" while calling a Python object" ) ))
+    {
+        %(to_name)s = NULL;
+    }
+    else
+    {
+%(direct_call_code)s
+
+        Py_LeaveRecursiveCall();
+    }
+}
+else
+{
+%(fallback_call_code)s
+}
+"""
+
+template_call_function_direct_args = """\
+PyObject *dir_call_args[] = { %(call_arg_names)s };
+
+for( size_t i = 0; i < %(args_count)d; i++ )
+{
+    Py_INCREF( dir_call_args[ i ] );
+}
+
+%(to_name)s = %(function_impl_identifier)s( direct_function, dir_call_args );"""
+
+template_call_function_direct_no_args = """\
+%(to_name)s = %(function_impl_identifier)s( direct_function, NULL );"""
+
+template_call_function_direct_fallback_kw_split = """\
+PyObject *call_args[] = { %(call_arg_names)s };
+%(to_name)s = CALL_FUNCTION_WITH_ARGS_KWSPLIT( %(called_name)s, call_args, %(args_count)d, %(kw_names)s, %(kw_dict_name)s );"""
+
+template_call_function_direct_fallback_args = """\
+PyObject *call_args[] = { %(call_arg_names)s };
+%(to_name)s = CALL_FUNCTION_WITH_ARGS%(args_count)d( %(called_name)s, call_args );"""
+
+template_call_function_direct_fallback_no_args = """\
+%(to_name)s = CALL_FUNCTION_NO_ARGS( %(called_name)s );"""
+
+template_function_impl_declaration = """\
+static PyObject *%(function_impl_identifier)s( struct Nuitka_FunctionObject const *self, PyObject **python_pars );
+"""
+
 from . import TemplateDebugWrapper # isort:skip
 TemplateDebugWrapper.checkDebug(globals())
@@ -49,13 +49,23 @@ static struct Nuitka_MetaPathBasedLoaderEntry meta_path_loader_entries[] =
     { NULL, NULL, 0, 0, 0 }
 };
 
+/* Hash table of the indexes of the entries, by their module name hash. */
+static int const meta_path_loader_hash_slots[] =
+{
+%(metapath_loader_hash_slots)s
+};
+
 void setupMetaPathBasedLoader( void )
 {
     static bool init_done = false;
 
     if ( init_done == false )
     {
-        registerMetaPathBasedUnfreezer( meta_path_loader_entries );
+        registerMetaPathBasedUnfreezer(
+            meta_path_loader_entries,
+            meta_path_loader_hash_slots,
+            %(metapath_loader_hash_mask)d
+        );
         init_done = true;
     }
 }
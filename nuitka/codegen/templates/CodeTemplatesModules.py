@@ -42,9 +42,11 @@ template_global_copyright = """\
  */
 """
 
-template_module_body_template = """
+template_module_prelude = """
 #include "nuitka/prelude.h"
+"""
 
+template_module_body_template = """
 #include "__helpers.h"
 
 /* The _module_%(module_identifier)s is a Python object pointer of module type. */
@@ -68,7 +70,7 @@ static void createModuleConstants( void )
 
     constants_created = true;
 }
-
+%(function_constants_codes)s
 #ifndef __NUITKA_NO_ASSERT__
 void checkModuleConstants_%(module_identifier)s( void )
 {
@@ -351,6 +353,26 @@ MOD_INIT_DECL( %(module_identifier)s )
 %(module_exit)s
 """
 
+template_function_constants = """\
+static bool constants_created_%(function_identifier)s = false;
+
+static void createFunctionConstants_%(function_identifier)s( void )
+{
+%(constant_init_codes)s
+
+    constants_created_%(function_identifier)s = true;
+}
+"""
+
+template_function_constants_create = """\
+if (unlikely( constants_created_%(function_identifier)s == false )) createFunctionConstants_%(function_identifier)s();"""
+
+template_function_constants_check = """\
+if ( constants_created_%(function_identifier)s )
+{
+%(constant_check_codes)s
+}"""
+
 template_module_exception_exit = """\
     module_exception_exit:
     RESTORE_ERROR_OCCURRED( exception_type, exception_value, exception_tb );
@@ -363,11 +385,33 @@ template_module_noexception_exit = """\
 template_helper_impl_decl = """\
 // This file contains helper functions that are automatically created from
 // templates.
+%(module_prelude)s
+extern PyObject *callPythonFunction( PyObject *func, PyObject **args, int count );
+
+"""
+
+template_unity_body = """\
+/* Unity build of compiled modules, compiled as one C file. */
 
 #include "nuitka/prelude.h"
 
-extern PyObject *callPythonFunction( PyObject *func, PyObject **args, int count );
+%(unity_codes)s
+"""
+
+# The names of module private declarations are the same for all modules, so
+# in unity files, they get renamed per module.
+template_unity_module = """\
+#define module_filename_obj module_filename_obj_%(module_identifier)s
+#define constants_created constants_created_%(module_identifier)s
+#define createModuleConstants createModuleConstants_%(module_identifier)s
+#define createModuleCodeObjects createModuleCodeObjects_%(module_identifier)s
+
+%(module_code)s
 
+#undef module_filename_obj
+#undef constants_created
+#undef createModuleConstants
+#undef createModuleCodeObjects
 """
 
 template_header_guard = """\
@@ -185,6 +185,17 @@ if (unlikely( %(tmp_name)s == NULL ))
 }
 """
 
+# Same, but with a cache for every place the variable is read, that is used
+# while the dictionary versions are unchanged, so it's only for Python3.6 or
+# higher.
+template_read_mvar_unclear_cached = """\
+{
+    static Nuitka_ModuleVariableCache cache;
+
+    %(tmp_name)s = GET_MODULE_VARIABLE_VALUE_CACHED( moduledict_%(module_identifier)s, (Nuitka_StringObject *)%(var_name)s, &cache );
+}
+"""
+
 template_read_locals_dict_with_fallback = """\
 %(to_name)s = PyDict_GetItem( %(locals_dict)s, %(var_name)s );
 
@@ -321,6 +332,17 @@ else
 }
 """
 
+template_native_value_guarded = """\
+if ( %(native_condition)s )
+{
+%(native_code)s
+}
+else
+{
+%(object_code)s
+}
+"""
+
 
 # TODO: Unused now.
 template_assign_from_frame_locals = """\
@@ -35,6 +35,7 @@ from logging import debug, info, warning
 
 from nuitka import Options, SourceCodeReferences, Tracing
 from nuitka.__past__ import iterItems
+from nuitka.BytecodeCaching import compileSourceToBytecode
 from nuitka.containers.odict import OrderedDict
 from nuitka.importing import ImportCache
 from nuitka.importing.StandardLibrary import (
@@ -50,6 +51,13 @@ from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceCodeFromFilename
 from nuitka.utils import Utils
 from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.ElfFiles import (
+    ElfError,
+    getElfDynamicInfo,
+    getInheritedRpath,
+    removeElfRPATH,
+    resolveElfNeeded
+)
 from nuitka.utils.Execution import withEnvironmentPathAdded
 from nuitka.utils.FileOperations import (
     areSamePaths,
@@ -161,7 +169,7 @@ __file__ = (__nuitka_binary_dir + '%s%s') if '__nuitka_binary_dir' in dict(__bui
         source_code = source_code
     )
 
-    bytecode = compile(source_code, filename, "exec", dont_inherit = True)
+    bytecode = compileSourceToBytecode(source_code, filename)
 
     bytecode = Plugins.onFrozenModuleBytecode(
         module_name = module_name,
@@ -219,17 +227,8 @@ def _detectedShlibFile(filename, module_name):
     module_names.add(module_name)
 
 
-def _detectImports(command, user_provided, technical):
-    # This is pretty complicated stuff, with variants to deal with.
-    # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-
-    # Print statements for stuff to show, the modules loaded.
-    if python_version >= 300:
-        command += '\nprint("\\n".join(sorted("import " + module.__name__ + " # sourcefile " + ' \
-                   'module.__file__ for module in sys.modules.values() if hasattr(module, "__file__") and ' \
-                   'module.__file__ not in (None, "<frozen>"))), file = sys.stderr)'  # do not read it
-
-    reduced_path = [
+def _getReducedPath():
+    return [
         path_element
         for path_element in
         sys.path
@@ -243,6 +242,24 @@ def _detectImports(command, user_provided, technical):
         )
     ]
 
+
+def _runImportsDetection(command):
+    """ Run CPython with a command and find out the modules it imported.
+
+        Returns a list of module name, priority, kind of import, and filename.
+    """
+
+    # This is pretty complicated stuff, with variants to deal with.
+    # pylint: disable=too-many-branches
+
+    # Print statements for stuff to show, the modules loaded.
+    if python_version >= 300:
+        command += '\nprint("\\n".join(sorted("import " + module.__name__ + " # sourcefile " + ' \
+                   'module.__file__ for module in sys.modules.values() if hasattr(module, "__file__") and ' \
+                   'module.__file__ not in (None, "<frozen>"))), file = sys.stderr)'  # do not read it
+
+    reduced_path = _getReducedPath()
+
     # Make sure the right import path (the one Nuitka binary is running with)
     # is used.
     command = ("import sys; sys.path = %s; sys.real_prefix = sys.prefix;" % repr(reduced_path)) + command
@@ -273,8 +290,6 @@ def _detectImports(command, user_provided, technical):
             Tracing.printError(line)
         sys.exit("Error, please report the issue with above output.")
 
-    result = []
-
     debug("Detecting imports:")
 
     detections = []
@@ -344,6 +359,115 @@ def _detectImports(command, user_provided, technical):
                     (module_name, 1, "shlib", filename)
                 )
 
+    return detections
+
+
+def _getImportsCacheFilename(cache_name):
+    """ Cache filename for the imports detected for a purpose.
+
+        The interpreter, its version, the import path, and the modification
+        times of the standard library directories and their sub-directories
+        are considered, so changes to the installation are noticed.
+    """
+    stdlib_mtimes = []
+
+    for stdlib_dir in sorted(getStandardLibraryPaths()):
+        stdlib_mtimes.append(
+            (stdlib_dir, os.stat(stdlib_dir).st_mtime)
+        )
+
+        for sub_dir, _dirname in listDir(stdlib_dir):
+            if os.path.isdir(sub_dir):
+                stdlib_mtimes.append(
+                    (sub_dir, os.stat(sub_dir).st_mtime)
+                )
+
+    hashed_value = repr(
+        (
+            cache_name,
+            sys.executable,
+            sys.version,
+            _getReducedPath(),
+            stdlib_mtimes
+        )
+    )
+
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(
+        getCacheDir(),
+        "early_imports",
+    )
+
+    makePath(cache_dir)
+
+    return os.path.join(
+        cache_dir,
+        cache_name + '-' + hashlib.md5(hashed_value).hexdigest()
+    )
+
+
+def _getImportsDetections(cache_name, getCommand):
+    """ Detect the imports of a command, with caching on disk.
+
+        The command is only created, if the cache cannot be used.
+    """
+    cache_filename = _getImportsCacheFilename(cache_name)
+
+    if os.path.exists(cache_filename) and \
+       not Options.shallNotUseDependencyCachedResults():
+        detections = []
+
+        with open(cache_filename, "rb") as cache_file:
+            for line in cache_file:
+                if str is not bytes:
+                    line = line.decode("utf8")
+
+                module_name, prio, kind, filename = \
+                  line.rstrip('\n').split(' ', 3)
+
+                detections.append(
+                    (module_name, int(prio), kind, filename)
+                )
+
+        # Files removed since, make the cache outdated.
+        if all(
+                os.path.exists(filename)
+                for _module_name, _prio, _kind, filename in
+                detections
+            ):
+            return detections
+
+    detections = _runImportsDetection(getCommand())
+
+    if not Options.shallNotStoreDependencyCachedResults():
+        # Write to a temporary file first, so other builds running at the
+        # same time, never see partial results.
+        temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+        with open(temp_filename, "wb") as cache_file:
+            for detection in detections:
+                line = "%s %d %s %s\n" % detection
+
+                if str is not bytes:
+                    line = line.encode("utf8")
+
+                cache_file.write(line)
+
+        os.rename(temp_filename, cache_filename)
+
+    return detections
+
+
+def _detectImports(cache_name, getCommand, user_provided, technical):
+    detections = _getImportsDetections(
+        cache_name = cache_name,
+        getCommand = getCommand
+    )
+
+    result = []
+
     for module_name, _prio, kind, filename in sorted(detections):
         if kind == "precompiled":
             _detectedPrecompiledFile(
@@ -455,7 +579,7 @@ def scanStandardLibraryPath(stdlib_dir):
                 yield import_path + '.' + dirname
 
 
-def detectEarlyImports():
+def _getEarlyImportsCode():
     encoding_names = [
         filename[:-3]
         for _path, filename in
@@ -481,37 +605,34 @@ def detectEarlyImports():
     if python_version >= 300:
         import_code += "import inspect;"
 
-    result = _detectImports(
-        command       = import_code,
-        user_provided = False,
-        technical     = True
-    )
+    return import_code
 
-    if Options.shallFreezeAllStdlib():
-        stdlib_modules = set()
 
-        # Scan the standard library paths (multiple in case of virtualenv.
-        for stdlib_dir in getStandardLibraryPaths():
-            for module_name in scanStandardLibraryPath(stdlib_dir):
-                stdlib_modules.add(module_name)
+def _getStandardLibraryImportsCode():
+    stdlib_modules = set()
 
-        # Put here ones that should be imported first.
-        first_ones = (
-            "Tkinter",
-        )
+    # Scan the standard library paths (multiple in case of virtualenv.
+    for stdlib_dir in getStandardLibraryPaths():
+        for module_name in scanStandardLibraryPath(stdlib_dir):
+            stdlib_modules.add(module_name)
+
+    # Put here ones that should be imported first.
+    first_ones = (
+        "Tkinter",
+    )
 
-        # We have to fight zombie modules in this, some things, e.g. Tkinter
-        # on newer Python 2.7, comes back after failure without a second error
-        # being raised, leading to other issues. So we fight it after each
-        # module that was tried, and prevent re-try by adding a meta path
-        # based loader that will never load it again, and remove it from the
-        # "sys.modules" over and over, once it sneaks back. The root cause is
-        # that extension modules sometimes only raise an error when first
-        # imported, not the second time around.
-        # Otherwise this just makes imports of everything so we can see where
-        # it comes from and what it requires.
-
-        import_code = """
+    # We have to fight zombie modules in this, some things, e.g. Tkinter
+    # on newer Python 2.7, comes back after failure without a second error
+    # being raised, leading to other issues. So we fight it after each
+    # module that was tried, and prevent re-try by adding a meta path
+    # based loader that will never load it again, and remove it from the
+    # "sys.modules" over and over, once it sneaks back. The root cause is
+    # that extension modules sometimes only raise an error when first
+    # imported, not the second time around.
+    # Otherwise this just makes imports of everything so we can see where
+    # it comes from and what it requires.
+
+    return """
 imports = %r
 
 failed = set()
@@ -542,6 +663,16 @@ for imp in imports:
     key = lambda name: (name not in first_ones, name)
 )
 
+
+def detectEarlyImports():
+    result = _detectImports(
+        cache_name    = "early",
+        getCommand    = _getEarlyImportsCode,
+        user_provided = False,
+        technical     = True
+    )
+
+    if Options.shallFreezeAllStdlib():
         early_names = [
             module.getFullName()
             for module in result
@@ -550,7 +681,8 @@ for imp in imports:
         result += [
             module
             for module in _detectImports(
-                command       = import_code,
+                cache_name    = "stdlib",
+                getCommand    = _getStandardLibraryImportsCode,
                 user_provided = False,
                 technical     = False
             )
@@ -564,18 +696,48 @@ for imp in imports:
 _detected_python_rpath = None
 
 ldd_result_cache = {}
+ldd_result_cache_lock = Lock()
 
-def _detectBinaryPathDLLsLinuxBSD(dll_filename):
-    # This is complex, as it also includes the caching mechanism
-    # pylint: disable=too-many-branches
+def _getLddCacheFilename(dll_filename):
+    """ Cache filename for the "ldd" result of a DLL.
 
-    if ldd_result_cache.get(dll_filename):
-        return ldd_result_cache[dll_filename]
+        The file is identified by its path, size, modification time, and
+        inode, and the environment used to run "ldd" is considered too.
+    """
+    stat_result = os.stat(dll_filename)
 
-    # Ask "ldd" about the libraries being used by the created binary, these
-    # are the ones that interest us.
-    result = set()
+    hashed_value = repr(
+        (
+            dll_filename,
+            stat_result.st_size,
+            stat_result.st_mtime,
+            stat_result.st_ino,
+            _getPythonRPATH(),
+            os.environ.get("LD_LIBRARY_PATH", ""),
+            sys.version + sys.executable
+        )
+    )
+
+    if str is not bytes:
+        hashed_value = hashed_value.encode("utf8")
+
+    cache_dir = os.path.join(
+        getCacheDir(),
+        "library_deps",
+    )
+
+    makePath(cache_dir)
+
+    return os.path.join(
+        cache_dir,
+        "ldd-" + hashlib.md5(hashed_value).hexdigest()
+    )
 
+
+def _getPythonRPATH():
+    """ The "RPATH" of the Python binary, with "$ORIGIN" resolved.
+
+    """
     # This is the rpath of the Python binary, which will be effective when
     # loading the other DLLs too. This happens at least for Python installs
     # on Travis. pylint: disable=global-statement
@@ -589,7 +751,41 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
                 os.path.dirname(sys.executable).encode("utf-8")
             )
 
-    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _detected_python_rpath):
+    return _detected_python_rpath
+
+
+def _isKernelDLL(filename):
+    # Do not include kernel specific libraries, and the loader itself.
+    return os.path.basename(filename).startswith(
+        (
+            "libc.so.",
+            "libpthread.so.",
+            "libm.so.",
+            "libdl.so.",
+            "ld-linux",
+            "ld64.so."
+        )
+    )
+
+
+def _getLddDLLs(dll_filename):
+    """ Ask "ldd" about the libraries used by a DLL, with caching on disk.
+
+    """
+    cache_filename = _getLddCacheFilename(dll_filename)
+
+    if os.path.exists(cache_filename) and \
+       not Options.shallNotUseDependencyCachedResults():
+        with open(cache_filename) as cache_file:
+            return set(
+                line.rstrip('\n')
+                for line in
+                cache_file
+            )
+
+    result = set()
+
+    with withEnvironmentPathAdded("LD_LIBRARY_PATH", _getPythonRPATH()):
         process = subprocess.Popen(
             args   = [
                 "ldd",
@@ -625,34 +821,113 @@ def _detectBinaryPathDLLsLinuxBSD(dll_filename):
             if filename == "not found":
                 continue
 
-            # Do not include kernel specific libraries.
-            if os.path.basename(filename).startswith(
-                    (
-                        "libc.so.",
-                        "libpthread.so.",
-                        "libm.so.",
-                        "libdl.so."
-                    )
-                ):
+            if _isKernelDLL(filename):
                 continue
 
             result.add(filename)
 
-    # Allow plugins to prevent inclusion.
-    blocked = Plugins.removeDllDependencies(
-        dll_filename  = dll_filename,
-        dll_filenames = result
+    if not Options.shallNotStoreDependencyCachedResults():
+        # Write to a temporary file first, so other builds running at the
+        # same time, never see partial results.
+        temp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+        with open(temp_filename, 'w') as cache_file:
+            for filename in sorted(result):
+                print(filename, file = cache_file)
+
+        os.rename(temp_filename, cache_filename)
+
+    return result
+
+
+def _getElfDLLs(dll_filename, inherited_rpath):
+    """ Find the libraries used by a DLL from its dynamic section.
+
+        This avoids running "ldd", which is only used if a library cannot be
+        found here, and then for the used libraries of those too. Returns the
+        filenames, and the "DT_RPATH" inherited by them.
+    """
+    try:
+        dynamic_info = getElfDynamicInfo(dll_filename)
+    except (ElfError, EnvironmentError, ValueError):
+        return _getLddDLLs(dll_filename), inherited_rpath
+
+    library_path = os.environ.get("LD_LIBRARY_PATH", "")
+
+    if str is not bytes:
+        library_path = library_path.encode("utf-8")
+
+    if _getPythonRPATH():
+        library_path += b":" + _getPythonRPATH()
+
+    sub_inherited_rpath = getInheritedRpath(
+        filename        = dll_filename,
+        dynamic_info    = dynamic_info,
+        inherited_rpath = inherited_rpath
     )
 
-    for to_remove in blocked:
-        result.discard(to_remove)
+    needed = resolveElfNeeded(
+        filename        = dll_filename,
+        dynamic_info    = dynamic_info,
+        library_path    = library_path,
+        inherited_rpath = inherited_rpath
+    )
+
+    if needed is None:
+        return _getLddDLLs(dll_filename), sub_inherited_rpath
+
+    result = set()
 
-    ldd_result_cache[dll_filename] = result
+    for _needed_name, filename in needed:
+        if python_version >= 300:
+            filename = filename.decode("utf-8")
 
-    sub_result = set(result)
+        if _isKernelDLL(filename):
+            continue
 
-    for sub_dll_filename in result:
-        sub_result = sub_result.union(_detectBinaryPathDLLsLinuxBSD(sub_dll_filename))
+        result.add(filename)
+
+    return result, sub_inherited_rpath
+
+
+def _detectBinaryPathDLLsLinuxBSD(dll_filename):
+    # Used DLLs of the used DLLs are considered too, visiting each DLL only
+    # once for the "DT_RPATH" inherited from the DLLs loading it, which
+    # decides where its used DLLs are found.
+    sub_result = set()
+    pending = [(dll_filename, ())]
+    visited = set(pending)
+
+    while pending:
+        filename, inherited_rpath = pending.pop()
+
+        with ldd_result_cache_lock:
+            cached = ldd_result_cache.get((filename, inherited_rpath))
+
+        if cached is None:
+            result, sub_inherited_rpath = _getElfDLLs(filename, inherited_rpath)
+
+            # Allow plugins to prevent inclusion.
+            blocked = Plugins.removeDllDependencies(
+                dll_filename  = filename,
+                dll_filenames = result
+            )
+
+            for to_remove in blocked:
+                result.discard(to_remove)
+
+            with ldd_result_cache_lock:
+                ldd_result_cache[(filename, inherited_rpath)] = \
+                  result, sub_inherited_rpath
+        else:
+            result, sub_inherited_rpath = cached
+
+        for sub_dll_filename in result:
+            sub_result.add(sub_dll_filename)
+
+            if (sub_dll_filename, sub_inherited_rpath) not in visited:
+                visited.add((sub_dll_filename, sub_inherited_rpath))
+                pending.append((sub_dll_filename, sub_inherited_rpath))
 
     return sub_result
 
@@ -859,7 +1134,7 @@ def _detectBinaryPathDLLsWindows(is_main_executable, source_dir, original_dir, b
 
     cache_filename = _getCacheFilename(is_main_executable, source_dir, original_dir, binary_filename)
 
-    if os.path.exists(cache_filename) and not Options.shallNotUseDependsExeCachedResults():
+    if os.path.exists(cache_filename) and not Options.shallNotUseDependencyCachedResults():
         for line in open(cache_filename):
             line = line.strip()
 
@@ -935,7 +1210,7 @@ SxS
     deleteFile(binary_filename + ".depends", must_exist = True)
     deleteFile(binary_filename + ".dwp", must_exist = True)
 
-    if not Options.shallNotStoreDependsExeCachedResults():
+    if not Options.shallNotStoreDependencyCachedResults():
         with open(cache_filename, 'w') as cache_file:
             for dll_filename in result:
                 print(dll_filename, file = cache_file)
@@ -1046,29 +1321,20 @@ def fixupBinaryDLLPaths(binary_filename, is_exe, dll_map):
 
 
 def getSharedLibraryRPATH(filename):
-    process = subprocess.Popen(
-        ["readelf", "-d", filename],
-        stdout = subprocess.PIPE,
-        stderr = subprocess.PIPE,
-        shell  = False
-    )
-
-    stdout, stderr = process.communicate()
-    retcode = process.poll()
-
-    if retcode != 0:
+    try:
+        dynamic_info = getElfDynamicInfo(filename)
+    except (ElfError, EnvironmentError, ValueError) as e:
         sys.exit(
-            "Error reading shared library path for %s, tool said %r" % (
+            "Error reading shared library path for %s, reading it gave %r" % (
                 filename,
-                stderr
+                e
             )
         )
 
-    for line in stdout.split(b"\n"):
-        if b"RPATH" in line or b"RUNPATH" in line:
-            return line[line.find(b'[')+1:line.rfind(b']')]
+    if dynamic_info.rpath is not None:
+        return dynamic_info.rpath
 
-    return None
+    return dynamic_info.runpath
 
 
 def removeSharedLibraryRPATH(filename):
@@ -1078,26 +1344,10 @@ def removeSharedLibraryRPATH(filename):
         if Options.isShowInclusion():
             info("Removing 'RPATH' setting from '%s'.", filename)
 
-        if not Utils.isExecutableCommand("chrpath"):
-            sys.exit(
-                """\
-Error, needs 'chrpath' on your system, due to 'RPATH' settings in used shared
-libraries that need to be removed."""
-            )
-
         os.chmod(filename, int("644", 8))
-        process = subprocess.Popen(
-            ["chrpath", "-d", filename],
-            stdout = subprocess.PIPE,
-            stderr = subprocess.PIPE,
-            shell  = False
-        )
-        process.communicate()
-        retcode = process.poll()
+        removeElfRPATH(filename)
         os.chmod(filename, int("444", 8))
 
-        assert retcode == 0, filename
-
 
 def copyUsedDLLs(source_dir, dist_dir, standalone_entry_points):
     # This is terribly complex, because we check the list of used DLLs
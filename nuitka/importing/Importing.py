@@ -50,7 +50,6 @@ from nuitka.importing import StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
 from nuitka.utils.AppDirs import getCacheDir
-from nuitka.utils.FileOperations import listDir
 
 from .PreloadedPackages import getPreloadedPackagePath, isPreloadedPackagePath
 from .Whitelisting import isWhiteListedNotExistingModule
@@ -81,11 +80,18 @@ def isPackageDir(dirname):
         extra packages provided via "*.pth" file tricks by "site.py" loading.
     """
 
-    return '.' not in os.path.basename(dirname) and \
-           os.path.isdir(dirname) and \
+    if '.' in os.path.basename(dirname):
+        return False
+
+    names = _getDirectoryNames(dirname)
+
+    return names is not None and \
            (
                python_version >= 300 or
-               os.path.isfile(os.path.join(dirname, "__init__.py")) or
+               (
+                   "__init__.py" in names and
+                   os.path.isfile(os.path.join(dirname, "__init__.py"))
+               ) or
                isPreloadedPackagePath(dirname)
            )
 
@@ -310,8 +316,38 @@ def findModule(importing, module_name, parent_package, level, warn):
     return None, None, "not-found"
 
 
-# Some platforms are case insensitive.
-case_sensitive = not sys.platform.startswith(("win", "cygwin", "darwin"))
+# Names in the directories searched for modules, by directory, together with
+# the modification time of the directory, that tells if they are still valid.
+_directory_names = {}
+
+def _getDirectoryNames(dirname):
+    """ The names of files and directories in a directory, or None.
+
+        Searching a module looks for many names in the same directories, so
+        these are read once and used for all of them. Names are exact, so
+        they also decide about case on case insensitive systems.
+    """
+
+    try:
+        mtime = os.stat(dirname).st_mtime
+    except OSError:
+        return None
+
+    cached = _directory_names.get(dirname)
+
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    try:
+        names = frozenset(os.listdir(dirname))
+    except OSError:
+        # Not a directory, or not allowed to read it.
+        names = None
+
+    _directory_names[dirname] = mtime, names
+
+    return names
+
 
 def _findModuleInPath2(module_name, search_path):
     """ This is out own module finding low level implementation.
@@ -336,17 +372,30 @@ def _findModuleInPath2(module_name, search_path):
             continue
         considered.add(os.path.normcase(entry))
 
+        entry_names = _getDirectoryNames(entry)
+
+        if entry_names is None:
+            continue
+
         package_directory = os.path.join(entry, module_name)
 
         # First, check for a package with an init file, that would be the
         # first choice.
-        if os.path.isdir(package_directory):
+        package_names = None
+
+        if module_name in entry_names:
+            package_names = _getDirectoryNames(package_directory)
+
+        if package_names is not None:
             for suffix, _mode, mtype in imp.get_suffixes():
                 if mtype == imp.C_EXTENSION:
                     continue
 
                 package_file_name = "__init__" + suffix
 
+                if package_file_name not in package_names:
+                    continue
+
                 file_path = os.path.join(package_directory, package_file_name)
 
                 if os.path.isfile(file_path):
@@ -362,6 +411,9 @@ def _findModuleInPath2(module_name, search_path):
 
         # Then, check out suffixes of all kinds.
         for suffix, _mode, _type in imp.get_suffixes():
+            if module_name + suffix not in entry_names:
+                continue
+
             file_path = os.path.join(entry, module_name + suffix)
             if os.path.isfile(file_path):
                 candidates.add(
@@ -383,17 +435,9 @@ def _findModuleInPath2(module_name, search_path):
             if candidate[1] == min_prio
         ]
 
-        # On case sensitive systems, no resolution needed.
-        if case_sensitive:
-            return candidates[0][2]
-        else:
-            for candidate in candidates:
-                for fullname, _filename in listDir(candidate[0]):
-                    if fullname == candidate[2]:
-                        return candidate[2]
-
-            # Only exact case matches matter, all candidates were ignored,
-            # lets just fall through to raising the import error.
+        # Only exact case matches are candidates, as the names come from the
+        # directory listings, so no resolution is needed.
+        return candidates[0][2]
 
     # Nothing found.
     raise ImportError
@@ -27,6 +27,7 @@ import sys
 from logging import debug, info, warning
 
 from nuitka import ModuleRegistry, Options
+from nuitka.BytecodeCaching import compileSourceToBytecode
 from nuitka.importing import ImportCache, Importing, StandardLibrary
 from nuitka.plugins.Plugins import Plugins
 from nuitka.PythonVersions import python_version
@@ -120,11 +121,9 @@ Cannot recurse to import module '%s' (%s) because code is too complex.""",
                             module_name   = module.getFullName(),
                             filename      = module_filename,
                             bytecode      = marshal.dumps(
-                                compile(
-                                    source_code,
-                                    module_filename,
-                                    "exec",
-                                    dont_inherit = True
+                                compileSourceToBytecode(
+                                    source_code = source_code,
+                                    filename    = module_filename
                                 )
                             ),
                             is_package    = module.isCompiledPythonPackage(),
@@ -30,9 +30,13 @@ the traces.
 
 """
 
-from nuitka.ModuleRegistry import getOwnerFromCodeName
 
-from .NodeBases import StatementBase, StatementChildHavingBase
+from .NodeBases import (
+    StatementBase,
+    StatementChildHavingBase,
+    extractVariableOwnerFromXML,
+    getVariableOwnerDetailsForXML
+)
 from .NodeMakingHelpers import (
     makeStatementExpressionOnlyReplacementNode,
     makeStatementsSequenceReplacementNode
@@ -181,17 +185,20 @@ class StatementAssignmentVariable(StatementChildHavingBase):
         }
 
     def getDetailsForDisplay(self):
-        return {
+        result = {
             "variable_name" : self.getVariableName(),
-            "is_temp"       : self.variable.isTempVariable(),
-            "owner"         : self.variable.getOwner().getCodeName(),
+            "is_temp"       : self.variable.isTempVariable()
         }
 
+        result.update(getVariableOwnerDetailsForXML(self.variable))
+
+        return result
+
     @classmethod
     def fromXML(cls, provider, source_ref, **args):
         assert cls is StatementAssignmentVariable, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = extractVariableOwnerFromXML(provider, args)
 
         if args["is_temp"] == "True":
             variable = owner.createTempVariable(args["variable_name"])
@@ -199,7 +206,7 @@ class StatementAssignmentVariable(StatementChildHavingBase):
             variable = owner.getProvidedVariable(args["variable_name"])
 
         del args["is_temp"]
-        del args["owner"]
+        del args["variable_name"]
 
         version = variable.allocateTargetNumber()
 
@@ -498,18 +505,21 @@ class StatementDelVariable(StatementBase):
         }
 
     def getDetailsForDisplay(self):
-        return {
+        result = {
             "variable_name" : self.getVariableName(),
             "is_temp"       : self.variable.isTempVariable(),
-            "owner"         : self.variable.getOwner().getCodeName(),
             "tolerant"      : self.tolerant
         }
 
+        result.update(getVariableOwnerDetailsForXML(self.variable))
+
+        return result
+
     @classmethod
     def fromXML(cls, provider, source_ref, **args):
         assert cls is StatementDelVariable, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = extractVariableOwnerFromXML(provider, args)
 
         if args["is_temp"] == "True":
             variable = owner.createTempVariable(args["variable_name"])
@@ -517,7 +527,7 @@ class StatementDelVariable(StatementBase):
             variable = owner.getProvidedVariable(args["variable_name"])
 
         del args["is_temp"]
-        del args["owner"]
+        del args["variable_name"]
 
         version = variable.allocateTargetNumber()
         variable.version_number = max(variable.version_number, version)
@@ -658,19 +668,25 @@ class StatementReleaseVariable(StatementBase):
         }
 
     def getDetailsForDisplay(self):
-        return {
+        result = {
             "variable_name" : self.variable.getName(),
-            "owner"    : self.variable.getOwner().getCodeName()
+            "is_temp"       : self.variable.isTempVariable()
         }
 
+        result.update(getVariableOwnerDetailsForXML(self.variable))
+
+        return result
+
     @classmethod
     def fromXML(cls, provider, source_ref, **args):
         assert cls is StatementReleaseVariable, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
-        assert owner is not None, args["owner"]
+        owner = extractVariableOwnerFromXML(provider, args)
 
-        variable = owner.getProvidedVariable(args["variable_name"])
+        if args["is_temp"] == "True":
+            variable = owner.createTempVariable(args["variable_name"])
+        else:
+            variable = owner.getProvidedVariable(args["variable_name"])
 
         return cls(
             variable   = variable,
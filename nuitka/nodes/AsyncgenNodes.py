@@ -53,6 +53,16 @@ class ExpressionMakeAsyncgenObject(ExpressionChildrenHavingBase):
             "asyncgen" : self.getAsyncgenRef().getFunctionBody().getCodeName()
         }
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # The code name is only informative, the reference child has it.
+        del args["asyncgen"]
+
+        return cls(
+            source_ref = source_ref,
+            **args
+        )
+
     def computeExpression(self, trace_collection):
         self.variable_closure_traces = []
 
@@ -342,6 +342,15 @@ class ExpressionBuiltinSetattr(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            object_arg = args["source"],
+            name       = args["attribute"],
+            value      = args["value"],
+            source_ref = source_ref
+        )
+
     getLookupSource = ExpressionChildrenHavingBase.childGetter("source")
     getAttribute = ExpressionChildrenHavingBase.childGetter("attribute")
     getValue = ExpressionChildrenHavingBase.childGetter("value")
@@ -369,6 +378,14 @@ class ExpressionBuiltinHasattr(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            object_arg = args["source"],
+            name       = args["attribute"],
+            source_ref = source_ref
+        )
+
     getLookupSource = ExpressionChildrenHavingBase.childGetter("source")
     getAttribute = ExpressionChildrenHavingBase.childGetter("attribute")
 
@@ -428,6 +445,19 @@ class ExpressionAttributeCheck(ExpressionChildHavingBase):
 
         self.attribute_name = attribute_name
 
+    def getDetails(self):
+        return {
+            "attribute_name" : self.attribute_name
+        }
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            object_arg     = args["source"],
+            attribute_name = args["attribute_name"],
+            source_ref     = source_ref
+        )
+
     getLookupSource = ExpressionChildHavingBase.childGetter("source")
 
     def computeExpression(self, trace_collection):
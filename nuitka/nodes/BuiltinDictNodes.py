@@ -57,6 +57,20 @@ class ExpressionBuiltinDict(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # The pairs are stored as nodes, but created from plain keys.
+        args["pairs"] = tuple(
+            (pair.getKey().getConstant(), pair.getValue())
+            for pair in
+            args["pairs"]
+        )
+
+        return cls(
+            source_ref = source_ref,
+            **args
+        )
+
     getPositionalArgument = ExpressionChildrenHavingBase.childGetter("pos_arg")
     getNamedArgumentPairs = ExpressionChildrenHavingBase.childGetter("pairs")
 
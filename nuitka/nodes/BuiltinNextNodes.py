@@ -67,6 +67,15 @@ class ExpressionSpecialUnpack(ExpressionBuiltinNext1):
         result["starred"] = self.getStarred()
         return result
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        args["starred"] = args["starred"] == "True"
+
+        return cls(
+            source_ref = source_ref,
+            **args
+        )
+
     def getCount(self):
         return self.count
 
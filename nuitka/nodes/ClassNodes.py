@@ -25,7 +25,12 @@ from nuitka.PythonVersions import python_version
 
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .IndicatorMixins import MarkNeedsAnnotationsMixin
-from .LocalsScopes import getLocalsDictHandle, setLocalsDictType
+from .LocalsScopes import (
+    finalizeLocalsDictHandle,
+    getLocalsDictHandle,
+    hasLocalsDictHandle,
+    setLocalsDictType
+)
 from .OutlineNodes import ExpressionOutlineFunction
 
 
@@ -82,16 +87,54 @@ class ExpressionClassBody(MarkNeedsAnnotationsMixin,
         if self.doc is not None:
             result["doc"] = self.doc
 
+        if python_version >= 340:
+            result["qualname"] = self.getFunctionQualname()
+
+        if self.temp_scope is not None:
+            result["temp_scope"] = self.temp_scope
+
+        result.update(self.getProviderDepthDetailsForXML())
+        result.update(self.getClosureDetailsForXML())
+        result.update(self.getProviderDetailsForXML())
+
+        # Python2 class dictionaries can be propagated completely.
+        if hasLocalsDictHandle(self.locals_dict_name):
+            result.update(
+                getLocalsDictHandle(self.locals_dict_name).getPropagationDetailsForXML()
+            )
+        else:
+            result["locals_finalized"] = True
+
         return result
 
     @classmethod
     def fromXML(cls, provider, source_ref, **args):
-        return cls(
-            provider   = provider,
-            source_ref = source_ref,
-            **args
+        result = cls(
+            provider   = cls.extractProviderFromXML(provider, args),
+            name       = args.pop("name"),
+            doc        = args.pop("doc", None),
+            source_ref = source_ref
         )
 
+        flags = args.pop("flags")
+
+        if flags:
+            result.flags = set(flags.split(','))
+
+        result.restoreQualnameFromXML(args)
+
+        if args.pop("locals_finalized", None) == "True":
+            finalizeLocalsDictHandle(result.locals_dict_name)
+        else:
+            getLocalsDictHandle(result.locals_dict_name).restorePropagationDetailsFromXML(
+                provider = result.getEntryPoint(),
+                args     = args
+            )
+
+        result.restoreFromXML(args)
+
+        return result
+
     def getDoc(self):
         return self.doc
 
@@ -181,6 +224,15 @@ class ExpressionBuiltinType3(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            type_name  = args["type_name"],
+            bases      = args["bases"],
+            type_dict  = args["dict"],
+            source_ref = source_ref
+        )
+
     getTypeName = ExpressionChildrenHavingBase.childGetter("type_name")
     getBases = ExpressionChildrenHavingBase.childGetter("bases")
     getDict = ExpressionChildrenHavingBase.childGetter("dict")
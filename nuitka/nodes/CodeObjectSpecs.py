@@ -25,6 +25,10 @@ objects, as well as tracebacks. They might be shared.
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
 
+def _fromXMLFlag(value):
+    return None if value == "None" else value == "True"
+
+
 class CodeObjectSpec(object):
     # One attribute for each code object aspect, and even flags,
     # pylint: disable=too-many-arguments,too-many-instance-attributes
@@ -71,12 +75,12 @@ class CodeObjectSpec(object):
         self.filename = co_filename
         self.line_number = int(co_lineno)
 
-        if type(co_has_starlist) is not bool:
-            co_new_locals = co_new_locals != "False"
-        if type(co_has_starlist) is not bool:
-            co_has_closure = co_has_closure != "False"
-        if type(co_has_starlist) is not bool:
-            co_is_optimized = co_is_optimized != "False"
+        if type(co_new_locals) is str:
+            co_new_locals = _fromXMLFlag(co_new_locals)
+        if type(co_has_closure) is str:
+            co_has_closure = _fromXMLFlag(co_has_closure)
+        if type(co_is_optimized) is str:
+            co_is_optimized = _fromXMLFlag(co_is_optimized)
 
         self.new_locals = co_new_locals
         self.has_closure = co_has_closure
@@ -22,6 +22,7 @@
 from logging import warning
 
 from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
+    builtins,
     iterItems,
     long,
     unicode,
@@ -45,6 +46,7 @@ from nuitka.Constants import (
 from nuitka.Options import isDebug
 
 from .ExpressionBases import CompileTimeConstantExpressionBase
+from .NodeBases import getConstantTextForXML
 from .NodeMakingHelpers import (
     getComputationResult,
     makeRaiseExceptionReplacementExpression,
@@ -129,10 +131,20 @@ class ExpressionConstantRefBase(CompileTimeConstantExpressionBase):
         result = self.getDetails()
 
         if "constant" in result:
-            result["constant"] = repr(result["constant"])
+            result["constant"] = getConstantTextForXML(result["constant"])
 
         return result
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        if "user_provided" in args:
+            args["user_provided"] = args["user_provided"] == "True"
+
+        return cls(
+            source_ref = source_ref,
+            **args
+        )
+
     def getDetail(self):
         return repr(self.constant)
 
@@ -868,6 +880,21 @@ class ExpressionConstantTypeRef(ExpressionConstantRefBase):
             source_ref    = source_ref
         )
 
+    def getDetailsForDisplay(self):
+        # The "repr" of types cannot be evaluated, use the built-in name.
+        return {
+            "type_name"     : self.constant.__name__,
+            "user_provided" : self.user_provided
+        }
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            constant      = getattr(builtins, args["type_name"]),
+            user_provided = args["user_provided"] == "True",
+            source_ref    = source_ref
+        )
+
     @staticmethod
     def isExpressionConstantTypeRef():
         return True
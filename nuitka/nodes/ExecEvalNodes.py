@@ -53,6 +53,15 @@ class ExpressionBuiltinEval(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            source_code = args["source"],
+            globals_arg = args["globals"],
+            locals_arg  = args["locals"],
+            source_ref  = source_ref
+        )
+
     getSourceCode = ExpressionChildrenHavingBase.childGetter("source")
     getGlobals = ExpressionChildrenHavingBase.childGetter("globals")
     getLocals = ExpressionChildrenHavingBase.childGetter("locals")
@@ -160,6 +169,15 @@ class StatementExec(StatementChildrenHavingBase):
 
         return StatementChildrenHavingBase.setChild(self, name, value)
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            source_code = args["source"],
+            globals_arg = args["globals"],
+            locals_arg  = args["locals"],
+            source_ref  = source_ref
+        )
+
     getSourceCode = StatementChildrenHavingBase.childGetter("source")
     getGlobals = StatementChildrenHavingBase.childGetter("globals")
     getLocals = StatementChildrenHavingBase.childGetter("locals")
@@ -337,6 +355,15 @@ class ExpressionBuiltinCompile(ExpressionChildrenHavingBase):
             source_ref = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        args["source_code"] = args.pop("source")
+
+        return cls(
+            source_ref = source_ref,
+            **args
+        )
+
     getSourceCode = ExpressionChildrenHavingBase.childGetter("source")
     getFilename = ExpressionChildrenHavingBase.childGetter("filename")
     getMode = ExpressionChildrenHavingBase.childGetter("mode")
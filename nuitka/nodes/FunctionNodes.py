@@ -341,6 +341,26 @@ class ExpressionFunctionBodyBase(ClosureTakerMixin, ClosureGiverNodeMixin,
         else:
             return provider.getFunctionQualname() + ".<locals>." + function_name
 
+    def restoreQualnameFromXML(self, args):
+        """ Restore the "__qualname__" provider, consuming the detail.
+
+            Tree building may decide to use an outer provider, e.g. for
+            generator bodies, or the module instead of the provider to
+            compute it, so search outwards for the one that matches.
+        """
+
+        qualname = args.pop("qualname", None)
+
+        if qualname is not None:
+            provider = self.qualname_provider
+
+            while self.getFunctionQualname() != qualname and \
+                  not provider.isCompiledPythonModule():
+                provider = provider.getParentVariableProvider()
+                self.qualname_provider = provider
+
+            assert self.getFunctionQualname() == qualname, (self, qualname)
+
     def computeExpression(self, trace_collection):
         assert False
 
@@ -392,6 +412,83 @@ class ExpressionFunctionEntryPointBase(EntryPointMixin, ExpressionFunctionBodyBa
             # TODO: There should be a locals scope for non-dict/mapping too.
             self.locals_dict_name = None
 
+    def getDetailsForDisplay(self):
+        result = {
+            "name"      : self.getFunctionName(),
+            "provider"  : self.provider.getCodeName(),
+            "code_name" : self.getCodeName(),
+            "flags"     : ""
+                            if self.flags is None else
+                          ','.join(sorted(self.flags))
+        }
+
+        if self.code_object:
+            result.update(self.code_object.getDetails())
+
+        if python_version >= 340:
+            result["qualname"] = self.getFunctionQualname()
+
+        result.update(self.getClosureDetailsForXML())
+        result.update(self.getProviderDetailsForXML())
+
+        if self.locals_dict_name is not None:
+            result.update(
+                self.getFunctionLocalsScope().getPropagationDetailsForXML()
+            )
+
+        return result
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        result = cls(
+            provider    = provider,
+            name        = args.pop("name"),
+            code_object = cls._extractCodeObjectFromXML(args),
+            flags       = cls._extractFlagsFromXML(args),
+            source_ref  = source_ref
+        )
+
+        result.restoreDetailsFromXML(args)
+
+        return result
+
+    @staticmethod
+    def _extractCodeObjectFromXML(args):
+        code_object_args = dict(
+            (key, args.pop(key))
+            for key in
+            tuple(args)
+            if key.startswith("co_")
+        )
+
+        if not code_object_args:
+            return None
+
+        code_object_args["future_spec"] = fromFlags(args.pop("code_flags"))
+
+        return CodeObjectSpec(**code_object_args)
+
+    @staticmethod
+    def _extractFlagsFromXML(args):
+        flags = args.pop("flags")
+
+        return set(flags.split(',')) if flags else set()
+
+    def restoreDetailsFromXML(self, args):
+        """ Restore closure and provided variables, consuming the details. """
+
+        self.restoreQualnameFromXML(args)
+        self.restoreClosureDetailsFromXML(args)
+        self.restoreProviderDetailsFromXML(args)
+
+        if self.locals_dict_name is not None:
+            self.getFunctionLocalsScope().restorePropagationDetailsFromXML(
+                provider = self,
+                args     = args
+            )
+
+        assert not args, args
+
     def getFunctionLocalsScope(self):
         if self.locals_dict_name is None:
             return None
@@ -402,6 +499,18 @@ class ExpressionFunctionEntryPointBase(EntryPointMixin, ExpressionFunctionBodyBa
         return self.code_object
 
     def computeFunctionRaw(self, trace_collection):
+        from nuitka.optimizations import FunctionTracking
+
+        # Unless something it depends on changed, the result would be the
+        # same again.
+        if not FunctionTracking.isFunctionComputationNeeded(self):
+            FunctionTracking.replayFunctionUses(
+                function_body    = self,
+                trace_collection = trace_collection
+            )
+
+            return
+
         from nuitka.optimizations.TraceCollections import \
             TraceCollectionFunction
 
@@ -411,10 +520,14 @@ class ExpressionFunctionEntryPointBase(EntryPointMixin, ExpressionFunctionBodyBa
         )
         old_collection = self.setTraceCollection(trace_collection)
 
+        FunctionTracking.startFunctionComputation(self)
+
         self.computeFunction(trace_collection)
 
         trace_collection.updateVariablesFromCollection(old_collection)
 
+        FunctionTracking.finishFunctionComputation(self)
+
     def computeFunction(self, trace_collection):
         statements_sequence = self.getBody()
 
@@ -494,17 +607,10 @@ class ExpressionFunctionBody(MarkUnoptimizedFunctionIndicatorMixin,
         }
 
     def getDetailsForDisplay(self):
-        result = {
-            "name"       : self.getFunctionName(),
-            "provider"   : self.provider.getCodeName(),
-            "flags"      : self.flags
-        }
+        result = ExpressionFunctionEntryPointBase.getDetailsForDisplay(self)
 
         result.update(self.parameters.getDetails())
 
-        if self.code_object:
-            result.update(self.code_object.getDetails())
-
         if self.doc is not None:
             result["doc"] = self.doc
 
@@ -514,36 +620,29 @@ class ExpressionFunctionBody(MarkUnoptimizedFunctionIndicatorMixin,
     def fromXML(cls, provider, source_ref, **args):
         assert provider is not None
 
-        parameter_spec_args = {}
-        code_object_args = {}
-        other_args = {}
-
-        for key, value in args.items():
-            if key.startswith("ps_"):
-                parameter_spec_args[key] = value
-            elif key.startswith("co_"):
-                code_object_args[key] = value
-            elif key == "code_flags":
-                code_object_args["future_spec"] = fromFlags(args["code_flags"])
-            else:
-                other_args[key] = value
-
-        parameters = ParameterSpec(**parameter_spec_args)
-        code_object = CodeObjectSpec(**code_object_args)
-
-        # The empty doc string and no doc string are distinguished by presence. The
-        # most common case is going to be not present.
-        if "doc" not in other_args:
-            other_args["doc"] = None
+        parameter_spec_args = dict(
+            (key, args.pop(key))
+            for key in
+            tuple(args)
+            if key.startswith("ps_")
+        )
 
-        return cls(
+        result = cls(
             provider    = provider,
-            parameters  = parameters,
-            code_object = code_object,
-            source_ref  = source_ref,
-            **other_args
+            name        = args.pop("name"),
+            code_object = cls._extractCodeObjectFromXML(args),
+            # The empty doc string and no doc string are distinguished by
+            # presence. The most common case is going to be not present.
+            doc         = args.pop("doc", None),
+            parameters  = ParameterSpec(**parameter_spec_args),
+            flags       = cls._extractFlagsFromXML(args),
+            source_ref  = source_ref
         )
 
+        result.restoreDetailsFromXML(args)
+
+        return result
+
     def getDetail(self):
         return "named %s with %s" % (self.getFunctionName(), self.parameters)
 
@@ -847,9 +946,34 @@ class ExpressionFunctionRef(ExpressionBase):
         }
 
     def getDetailsForDisplay(self):
-        return {
-            "code_name" : self.getFunctionBody().getCodeName()
-        }
+        function_body = self.getFunctionBody()
+
+        # Internal helpers are created on demand, so their code names are not
+        # stable, but their names are unique.
+        if function_body.getParentModule().isInternalModule():
+            return {
+                "helper_name" : function_body.getFunctionName()
+            }
+        else:
+            return {
+                "code_name" : function_body.getCodeName()
+            }
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        if "helper_name" in args:
+            from nuitka.tree.InternalModule import getInternalHelperFunction
+            function_body = getInternalHelperFunction(args["helper_name"])
+        else:
+            function_body = provider.getParentModule().getFunctionFromXML(
+                code_name = args["code_name"],
+                provider  = provider
+            )
+
+        return cls(
+            function_body = function_body,
+            source_ref    = source_ref
+        )
 
     def getFunctionBody(self):
         if self.function_body is None:
@@ -865,15 +989,8 @@ class ExpressionFunctionRef(ExpressionBase):
     def computeExpressionRaw(self, trace_collection):
         function_body = self.getFunctionBody()
 
-        owning_module = function_body.getParentModule()
-
-        # Make sure the owning module is added to the used set. This is most
-        # important for helper functions, or modules, which otherwise have
-        # become unused.
-        from nuitka.ModuleRegistry import addUsedModule
-        addUsedModule(owning_module)
-
-        needs_visit = owning_module.addUsedFunction(function_body)
+        from nuitka.ModuleRegistry import addUsedFunction
+        needs_visit = addUsedFunction(function_body)
 
         if needs_visit:
             function_body.computeFunctionRaw(trace_collection)
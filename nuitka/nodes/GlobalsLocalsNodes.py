@@ -70,6 +70,27 @@ class ExpressionBuiltinLocalsBase(ExpressionBase):
         del self.locals_scope
         del self.variable_traces
 
+    def getDetails(self):
+        return {
+            "locals_scope" : self.locals_scope
+        }
+
+    def getDetailsForDisplay(self):
+        if self.locals_scope is None:
+            return {}
+        else:
+            return {
+                "locals_scope" : self.locals_scope.getCodeName()
+            }
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # Python2 functions without exec have no locals scope.
+        return cls(
+            locals_scope = args.get("locals_scope"),
+            source_ref   = source_ref
+        )
+
     def mayHaveSideEffects(self):
         return False
 
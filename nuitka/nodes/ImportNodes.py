@@ -469,6 +469,24 @@ class StatementImportStar(StatementChildHavingBase):
 
     getSourceModule = StatementChildHavingBase.childGetter("module")
 
+    def getDetails(self):
+        return {
+            "target_scope" : self.target_scope
+        }
+
+    def getDetailsForDisplay(self):
+        return {
+            "target_scope" : self.target_scope.getCodeName()
+        }
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            target_scope  = args["target_scope"],
+            module_import = args["module"],
+            source_ref    = source_ref
+        )
+
     def getTargetDictScope(self):
         return self.target_scope
 
@@ -515,6 +533,18 @@ class ExpressionImportName(ExpressionChildHavingBase):
 
         assert module is not None
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        if args["level"] != "None":
+            args["level"] = int(args["level"])
+        else:
+            args["level"] = None
+
+        return cls(
+            source_ref = source_ref,
+            **args
+        )
+
     def getImportName(self):
         return self.import_name
 
@@ -66,6 +66,12 @@ class ExpressionLocalsVariableRefORFallback(ExpressionChildrenHavingBase):
             "variable_name" : self.getVariableName(),
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope"  : self.locals_scope.getCodeName(),
+            "variable_name" : self.getVariableName(),
+        }
+
     def getVariableName(self):
         return self.variable.getName()
 
@@ -221,6 +227,7 @@ class ExpressionLocalsVariableRef(ExpressionBase):
     def getDetailsForDisplay(self):
         return {
             "variable_name" : self.getVariableName(),
+            "locals_scope"  : self.locals_scope.getCodeName()
         }
 
     def getVariableName(self):
@@ -316,6 +323,12 @@ class ExpressionLocalsVariableCheck(ExpressionBase):
             "variable_name" : self.variable_name,
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope"  : self.locals_scope.getCodeName(),
+            "variable_name" : self.variable_name,
+        }
+
     def getVariableName(self):
         return self.variable_name
 
@@ -369,6 +382,12 @@ class StatementLocalsDictOperationSet(StatementChildHavingBase):
             "variable_name" : self.getVariableName()
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope"  : self.locals_scope.getCodeName(),
+            "variable_name" : self.getVariableName()
+        }
+
     def getVariableName(self):
         return self.variable.getName()
 
@@ -464,6 +483,12 @@ class StatementLocalsDictOperationDel(StatementBase):
             "locals_scope"  : self.locals_scope
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "variable_name" : self.getVariableName(),
+            "locals_scope"  : self.locals_scope.getCodeName()
+        }
+
     def getVariableName(self):
         return self.variable.getName()
 
@@ -604,6 +629,14 @@ class StatementSetLocalsDictionary(StatementSetLocals):
             source_ref   = source_ref
         )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        # The new locals are always an empty dictionary.
+        return cls(
+            locals_scope = args["locals_scope"],
+            source_ref   = source_ref
+        )
+
     def mayRaiseException(self, exception_type):
         return False
 
@@ -656,6 +689,11 @@ class StatementReleaseLocals(StatementBase):
             "locals_scope": self.locals_scope
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "locals_scope": self.locals_scope.getCodeName()
+        }
+
     def getLocalsScope(self):
         return self.locals_scope
 
@@ -52,6 +52,36 @@ def getLocalsDictHandles():
     return locals_dict_handles
 
 
+def hasLocalsDictHandle(locals_dict_name):
+    return locals_dict_name in locals_dict_handles
+
+
+def finalizeLocalsDictHandle(locals_dict_name):
+    """ Forget a locals dict handle, after its propagation is done. """
+    locals_dict_handles.pop(locals_dict_name).finalize()
+
+
+def releaseModuleLocalsDictHandles(module_code_name):
+    """ Forget the locals dict handles created for a module.
+
+        This is needed when the module tree is thrown away and re-created,
+        otherwise creating the handles would fail.
+    """
+    module_dict_name = "globals_%s" % module_code_name
+    locals_prefix = "locals_%s" % module_code_name
+
+    for locals_dict_name in tuple(locals_dict_handles):
+        if locals_dict_name == module_dict_name:
+            del locals_dict_handles[locals_dict_name]
+        elif locals_dict_name.startswith(locals_prefix):
+            rest = locals_dict_name[len(locals_prefix):]
+
+            # Functions are below the module code name, module level classes
+            # use it directly with their line number.
+            if rest.startswith("$$$") or rest[1:].isdigit():
+                del locals_dict_handles[locals_dict_name]
+
+
 class LocalsDictHandle(object):
     __slots__ = (
         "locals_name",
@@ -128,6 +158,39 @@ class LocalsDictHandle(object):
 
         return self.propagation
 
+    def getPropagationDetailsForXML(self):
+        """ Propagation state for XML persistence of the owning node. """
+
+        if self.mark_for_propagation:
+            return {
+                "locals_propagation" : ','.join(self.getPropagationVariables())
+            }
+        else:
+            return {}
+
+    def restorePropagationDetailsFromXML(self, provider, args):
+        """ Restore from getPropagationDetailsForXML, consuming the details.
+
+            The replacement temporary variables are owned by the provider and
+            must already exist.
+        """
+
+        variable_names = args.pop("locals_propagation", None)
+
+        if variable_names is None:
+            return
+
+        self.mark_for_propagation = True
+
+        if variable_names:
+            self.propagation = OrderedDict()
+
+            for variable_name in variable_names.split(','):
+                self.propagation[variable_name] = provider.getTempVariable(
+                    temp_scope = None,
+                    name       = self.getCodeName() + "_key_" + variable_name
+                )
+
     def finalize(self):
         del self.propagation
         del self.mark_for_propagation
@@ -174,6 +237,9 @@ class GlobalsDictHandle(object):
 
         self.escaped = False
 
+    def getCodeName(self):
+        return self.locals_name
+
     def markAsEscaped(self):
         self.escaped = True
 
@@ -24,6 +24,7 @@ together and cross-module optimizations are the most difficult to tackle.
 import os
 
 from nuitka import Options, Variables
+from nuitka.containers.odict import OrderedDict
 from nuitka.containers.oset import OrderedSet
 from nuitka.importing.Importing import (
     findModule,
@@ -40,13 +41,18 @@ from nuitka.utils.FileOperations import relpath
 from .Checkers import checkStatementsSequenceOrNone
 from .FutureSpecs import FutureSpec, fromFlags
 from .IndicatorMixins import EntryPointMixin, MarkNeedsAnnotationsMixin
-from .LocalsScopes import getLocalsDictHandle, setLocalsDictType
+from .LocalsScopes import (
+    getLocalsDictHandle,
+    releaseModuleLocalsDictHandles,
+    setLocalsDictType
+)
 from .NodeBases import (
     ChildrenHavingMixin,
     ClosureGiverNodeMixin,
     NodeBase,
     extractKindAndArgsFromXML,
-    fromXML
+    makeChild,
+    makeCodeNodeFromXML
 )
 
 
@@ -260,6 +266,8 @@ class CompiledPythonModule(ChildrenHavingMixin, ClosureGiverNodeMixin,
         if self.future_spec is not None:
             result["code_flags"] = ','.join(self.future_spec.asFlags())
 
+        result.update(self.getProviderDetailsForXML())
+
         return result
 
     @classmethod
@@ -267,6 +275,183 @@ class CompiledPythonModule(ChildrenHavingMixin, ClosureGiverNodeMixin,
         # Modules are not having any provider, must not be used,
         assert False
 
+    def restoreFromXML(self, xml):
+        """ Restore the module tree from XML into this empty module.
+
+            The XML must have been created with "asXml" of a module of the
+            same name and kind.
+        """
+
+        _kind, node_class, args, _source_ref = extractKindAndArgsFromXML(
+            xml,
+            self.source_ref
+        )
+
+        assert node_class is self.__class__, (node_class, self)
+        assert args["filename"] == self.getFilename(), args["filename"]
+
+        if "code_flags" in args:
+            self.future_spec = fromFlags(args["code_flags"])
+
+        roles = dict(
+            (role.attrib["name"], role)
+            for role in
+            xml
+        )
+
+        self.restoreChildrenFromXML(
+            body_xml      = roles["body"],
+            functions_xml = roles["functions"],
+            args          = args
+        )
+
+    def restoreChildrenFromXML(self, body_xml, functions_xml, args):
+        """ Restore provided variables, functions and body from XML.
+
+            Functions are restored when their first reference is restored,
+            because that decides their provider, see "getFunctionFromXML".
+        """
+
+        self.variables_removed = []
+        self.restoreProviderDetailsFromXML(args)
+
+        function_order = []
+        self.functions_xml = OrderedDict()
+
+        for xml in functions_xml:
+            code_name = xml.attrib["code_name"]
+
+            function_order.append(code_name)
+            self.functions_xml[code_name] = xml
+
+        self.setChild(
+            "body",
+            makeChild(
+                provider   = self,
+                child      = body_xml,
+                source_ref = self.source_ref
+            )
+        )
+
+        # Functions not referenced in the module body, these need to have
+        # providers that are not outlines.
+        while self.functions_xml:
+            code_name = next(iter(self.functions_xml))
+            xml = self.functions_xml.pop(code_name)
+
+            self._restoreFunctionFromXML(
+                xml      = xml,
+                provider = getOwnerFromCodeName(xml.attrib["provider"])
+            )
+
+        del self.functions_xml
+
+        for provider, variable_name in self.variables_removed:
+            del provider.providing[variable_name]
+
+        del self.variables_removed
+
+        functions = dict(
+            (function.getCodeName(), function)
+            for function in
+            self.getFunctions()
+        )
+
+        self.setFunctions(
+            tuple(
+                functions[code_name]
+                for code_name in
+                function_order
+            )
+        )
+
+    def discardTree(self):
+        """ Forget the tree, e.g. one partially restored from XML.
+
+            Afterwards the tree can be built from source, as if nothing
+            happened to the module before.
+        """
+
+        if self.getBody() is not None:
+            self.setBody(None)
+
+        if self.getFunctions():
+            self.setFunctions(())
+
+        ClosureGiverNodeMixin.__init__(
+            self,
+            name        = self.name,
+            code_prefix = "module"
+        )
+        MarkNeedsAnnotationsMixin.__init__(self)
+
+        self.variables = {}
+
+        self.active_functions = OrderedSet()
+        self.cross_used_functions = OrderedSet()
+
+        for attribute_name in ("functions_xml", "variables_removed"):
+            if hasattr(self, attribute_name):
+                delattr(self, attribute_name)
+
+        releaseModuleLocalsDictHandles(self.getCodeName())
+        setLocalsDictType(self.module_dict_name, "module_dict")
+
+    def addRemovedVariableFromXML(self, provider, variable_name):
+        self.variables_removed.append((provider, variable_name))
+
+    def getFunctionFromXML(self, code_name, provider):
+        """ Get a function for a reference restored from XML.
+
+            The provider of the reference is used for the function, which
+            for outlines, is the only way to get at it.
+        """
+
+        xml = self.functions_xml.pop(code_name, None)
+
+        if xml is None:
+            function = self.getFunctionFromCodeName(code_name)
+
+            assert function is not None, code_name
+
+            return function
+        else:
+            return self._restoreFunctionFromXML(
+                xml      = xml,
+                provider = provider
+            )
+
+    def _restoreFunctionFromXML(self, xml, provider):
+        _kind, node_class, args, source_ref = extractKindAndArgsFromXML(
+            xml,
+            self.source_ref
+        )
+
+        provider_code_name = args.pop("provider")
+        assert provider_code_name == provider.getCodeName(), provider_code_name
+
+        function = makeCodeNodeFromXML(
+            node_class = node_class,
+            provider   = provider,
+            code_name  = args.pop("code_name"),
+            source_ref = source_ref,
+            args       = args
+        )
+
+        for role in xml:
+            assert role.attrib["name"] == "body", role
+
+            function.setChild(
+                "body",
+                makeChild(
+                    provider   = function,
+                    child      = role,
+                    source_ref = source_ref
+                )
+            )
+
+        return function
+
     def getFutureSpec(self):
         return self.future_spec
 
@@ -686,49 +871,10 @@ class PythonMainModule(CompiledPythonModule):
         from nuitka.ModuleRegistry import addRootModule
         addRootModule(result)
 
-        function_work = []
-
-        for xml in args["functions"]:
-            _kind, node_class, func_args, source_ref = extractKindAndArgsFromXML(xml, source_ref)
-
-            if "provider" in func_args:
-                func_args["provider"] = getOwnerFromCodeName(func_args["provider"])
-            else:
-                func_args["provider"] = result
-
-            if "flags" in args:
-                func_args["flags"] = set(func_args["flags"].split(','))
-
-            if "doc" not in args:
-                func_args["doc"] = None
-
-            function = node_class.fromXML(
-                source_ref = source_ref,
-                **func_args
-            )
-
-            # Could do more checks for look up of body here, but so what...
-            function_work.append(
-                (function, iter(iter(xml).next()).next())
-            )
-
-        for function, xml in function_work:
-            function.setChild(
-                "body",
-                fromXML(
-                    provider   = function,
-                    xml        = xml,
-                    source_ref = function.getSourceReference()
-                )
-            )
-
-        result.setChild(
-            "body",
-            fromXML(
-                provider   = result,
-                xml        = args["body"][0],
-                source_ref = source_ref
-            )
+        result.restoreChildrenFromXML(
+            body_xml      = args.pop("body"),
+            functions_xml = args.pop("functions"),
+            args          = args
         )
 
         return result
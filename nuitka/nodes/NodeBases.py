@@ -25,6 +25,7 @@ expression only stuff.
 
 # from abc import abstractmethod
 
+import binascii
 from abc import abstractmethod
 
 from nuitka import Options, Tracing, TreeXML, Variables
@@ -32,12 +33,18 @@ from nuitka.__past__ import (  # pylint: disable=I0021,redefined-builtin
     intern,
     iterItems
 )
+from nuitka.Constants import (
+    compareConstants,
+    pickleConstant,
+    unpickleConstant
+)
+from nuitka.containers.odict import OrderedDict
 from nuitka.Errors import NuitkaNodeError
 from nuitka.PythonVersions import python_version
 from nuitka.SourceCodeReferences import SourceCodeReference
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
-from .FutureSpecs import fromFlags
+from .LocalsScopes import getLocalsDictHandle
 from .NodeMakingHelpers import makeStatementOnlyNodesFromExpressions
 from .NodeMetaClasses import NodeCheckMetaClass, NodeMetaClassBase
 
@@ -300,6 +307,9 @@ class NodeBase(NodeMetaClassBase):
         if compat_line != line:
             result.attrib["compat_line"] = str(compat_line)
 
+        if self.getSourceReference().isInternal():
+            result.attrib["internal"] = "True"
+
         for key, value in iterItems(self.getDetailsForDisplay()):
             result.set(key, str(value))
 
@@ -733,10 +743,11 @@ class ClosureGiverNodeMixin(CodeNodeMixin):
             code_prefix = code_prefix
         )
 
-        self.providing = {}
+        # Ordered, so the XML persistence restores the same order.
+        self.providing = OrderedDict()
         self.variable_order = []
 
-        self.temp_variables = {}
+        self.temp_variables = OrderedDict()
 
         self.temp_scopes = {}
 
@@ -836,6 +847,139 @@ class ClosureGiverNodeMixin(CodeNodeMixin):
 
         return self.preserver_id
 
+    def getProviderDetailsForXML(self):
+        """ Details of provided variables and counters for XML persistence.
+
+            These are not visible in the node tree itself, but code generation
+            depends on their order and values.
+        """
+
+        result = {}
+
+        if self.providing:
+            result["variables"] = ','.join(self.providing)
+
+            outer_names = [
+                variable_name
+                for variable_name, variable in
+                iterItems(self.providing)
+                if variable.getOwner() is not self
+                if not variable.isLocalsDictVariable()
+            ]
+
+            if outer_names:
+                result["variables_outer"] = ','.join(outer_names)
+
+        if self.variable_order != list(self.providing):
+            result["variable_order"] = ','.join(self.variable_order)
+
+        if self.temp_variables:
+            result["temp_variables"] = ','.join(self.temp_variables)
+
+        shared_users = []
+        shared_scopes = []
+
+        for variable in self._getOwnedVariables():
+            variable_shared_users, variable_shared_scopes = \
+              variable.getSharingForXML()
+
+            if variable_shared_users:
+                shared_users.append(variable.getName())
+            if variable_shared_scopes:
+                shared_scopes.append(variable.getName())
+
+        if shared_users:
+            result["shared_users"] = ','.join(shared_users)
+        if shared_scopes:
+            result["shared_scopes"] = ','.join(shared_scopes)
+
+        if self.uids:
+            result["uids"] = _encodeCountersForXML(self.uids)
+
+        if self.temp_scopes:
+            result["temp_scopes"] = _encodeCountersForXML(self.temp_scopes)
+
+        if self.preserver_id:
+            result["preserver_id"] = self.preserver_id
+
+        return result
+
+    def restoreProviderDetailsFromXML(self, args):
+        """ Restore from details of getProviderDetailsForXML, consuming them.
+
+            Closure variables must be restored before this.
+        """
+
+        outer_names = _decodeNamesFromXML(args.pop("variables_outer", ""))
+
+        for variable_name in _decodeNamesFromXML(args.pop("variables", "")):
+            if variable_name in self.providing:
+                continue
+
+            if variable_name not in outer_names:
+                self.getProvidedVariable(variable_name)
+            elif self.hasTakenVariable(variable_name):
+                self.registerProvidedVariable(
+                    self.getTakenVariable(variable_name)
+                )
+            else:
+                # Owned by one of the providers, without being taken.
+                owner = self.getParentVariableProvider()
+
+                while variable_name not in owner.providing and \
+                      not owner.isCompiledPythonModule():
+                    owner = owner.getParentVariableProvider()
+
+                self.registerProvidedVariable(
+                    owner.getProvidedVariable(variable_name)
+                )
+
+        if "variable_order" in args:
+            variable_order = _decodeNamesFromXML(args.pop("variable_order"))
+
+            # Variables removed as unused, may still be referenced, so they
+            # are created for now, and removed once the module is complete.
+            for variable_name in variable_order:
+                if variable_name not in self.providing:
+                    self.getProvidedVariable(variable_name)
+
+                    self.getParentModule().addRemovedVariableFromXML(
+                        provider      = self,
+                        variable_name = variable_name
+                    )
+
+            self.variable_order = variable_order
+        else:
+            self.variable_order = list(self.providing)
+
+        for temp_name in _decodeNamesFromXML(args.pop("temp_variables", "")):
+            self.createTempVariable(temp_name)
+
+        shared_users = _decodeNamesFromXML(args.pop("shared_users", ""))
+        shared_scopes = _decodeNamesFromXML(args.pop("shared_scopes", ""))
+
+        for variable in self._getOwnedVariables():
+            variable.restoreSharingFromXML(
+                shared_users  = variable.getName() in shared_users,
+                shared_scopes = variable.getName() in shared_scopes
+            )
+
+        self.uids = _decodeCountersFromXML(args.pop("uids", ""))
+        self.temp_scopes = _decodeCountersFromXML(args.pop("temp_scopes", ""))
+        self.preserver_id = int(args.pop("preserver_id", 0))
+
+    def hasTakenVariable(self, variable_name):
+        # Virtual method, pylint: disable=no-self-use,unused-argument
+        return False
+
+    def _getOwnedVariables(self):
+        for variable in self.providing.values():
+            if variable.getOwner() is self:
+                yield variable
+
+        for variable in self.temp_variables.values():
+            yield variable
+
 
 class ClosureTakerMixin(object):
     """ Mixin for nodes that accept variables from closure givers. """
@@ -864,6 +1008,56 @@ class ClosureTakerMixin(object):
 
         return variable
 
+    def getClosureDetailsForXML(self):
+        """ Names of taken variables for XML persistence. """
+
+        result = {}
+
+        for variable in self.taken:
+            if variable.isTempVariable():
+                # Unused temporary variables may have been removed from their
+                # owner already, but not from all closures taking them.
+                owner = variable.getOwner()
+
+                if owner.temp_variables.get(variable.getName()) is not variable:
+                    continue
+
+                key = "closure_temps"
+            elif variable.isModuleVariable():
+                key = "closure_module"
+            else:
+                key = "closure"
+
+            result.setdefault(key, []).append(variable.getName())
+
+        for key, value in iterItems(result):
+            result[key] = ','.join(sorted(value))
+
+        return result
+
+    def restoreClosureDetailsFromXML(self, args):
+        """ Take the closure variables from the providers again. """
+
+        for variable_name in _decodeNamesFromXML(args.pop("closure", "")):
+            self.taken.add(self.provider.getVariableForClosure(variable_name))
+
+        # Module variables may be taken without passing through the providers,
+        # e.g. with "global" declarations.
+        module = self.getParentModule()
+
+        for variable_name in _decodeNamesFromXML(args.pop("closure_module", "")):
+            self.taken.add(module.getVariableForClosure(variable_name))
+
+        # Temporary variables are not provided by name, but they are owned
+        # by one of the providers.
+        for temp_name in _decodeNamesFromXML(args.pop("closure_temps", "")):
+            owner = self.provider
+
+            while temp_name not in owner.temp_variables:
+                owner = owner.getParentVariableProvider()
+
+            self.taken.add(owner.temp_variables[temp_name])
+
     def getClosureVariables(self):
         return tuple(
             sorted(
@@ -1192,6 +1386,113 @@ class SideEffectsFromChildrenMixin(object):
             )
 
 
+def _encodeCountersForXML(counters):
+    return ','.join(
+        "%s:%d" % (key, value)
+        for key, value in
+        sorted(counters.items())
+    )
+
+
+def _decodeCountersFromXML(value):
+    result = {}
+
+    for part in _decodeNamesFromXML(value):
+        key, count = part.rsplit(':', 1)
+        result[key] = int(count)
+
+    return result
+
+
+def _decodeNamesFromXML(value):
+    if value == "":
+        return []
+    else:
+        return value.split(',')
+
+
+def makeCodeNodeFromXML(node_class, provider, code_name, source_ref, args):
+    """ Create a code node from XML, giving it the stored code name.
+
+        Code names are allocated from counters of the entry point, which
+        restoring from XML does not reproduce in the same order, so the
+        counter is temporarily set to the stored value.
+    """
+
+    entry_point = provider.getEntryPoint()
+    uids = dict(entry_point.uids)
+
+    uid = int(code_name.rsplit("$$$", 1)[1].split('_')[1])
+    entry_point.uids[node_class.kind] = uid - 1
+
+    result = node_class.fromXML(
+        provider   = provider,
+        source_ref = source_ref,
+        **args
+    )
+
+    assert result.getCodeName() == code_name, (result, code_name)
+
+    entry_point.uids = uids
+
+    return result
+
+
+def getVariableOwnerDetailsForXML(variable):
+    """ Details to identify the owner of a variable in XML.
+
+        Outline functions share the code name of their provider, so for
+        variables they own, the outline name is added to tell them apart.
+    """
+
+    owner = variable.getOwner()
+
+    result = {
+        "owner" : owner.getCodeName()
+    }
+
+    if owner.isExpressionOutlineFunctionBodyBase():
+        result["owner_outline"] = owner.getName()
+
+    return result
+
+
+def extractVariableOwnerFromXML(provider, args):
+    """ Resolve the owner of a variable from XML details, consuming them.
+
+        The owner must be the provider itself, one of its providers, or a
+        function of the same module.
+    """
+
+    owner_code_name = args.pop("owner")
+    outline_name = args.pop("owner_outline", None)
+
+    if outline_name is not None:
+        # Nested outlines can have the same name, e.g. for contractions, but
+        # only the owner provides the variable.
+        variable_name = args.get("variable_name") or args["temp_name"]
+
+        owner = provider
+
+        while not owner.isExpressionOutlineFunctionBodyBase() or \
+              owner.getName() != outline_name or \
+              (variable_name not in owner.providing and \
+               variable_name not in owner.temp_variables):
+            owner = owner.getParentVariableProvider()
+
+        return owner
+
+    module = provider.getParentModule()
+
+    if owner_code_name == module.getCodeName():
+        return module
+
+    owner = module.getFunctionFromCodeName(owner_code_name)
+    assert owner is not None, owner_code_name
+
+    return owner
+
+
 def makeChild(provider, child, source_ref):
     child_type = child.attrib.get("type")
 
@@ -1238,28 +1539,85 @@ def extractKindAndArgsFromXML(xml, source_ref):
         source_ref = source_ref.atLineNumber(int(args["line"]))
         del args["line"]
 
+    # Internal references are inherited by line number changes, so this must
+    # be corrected in both directions.
+    if args.pop("internal", None) is not None:
+        source_ref = source_ref.atInternal()
+    elif source_ref.isInternal():
+        source_ref = SourceCodeReference.fromFilenameAndLine(
+            source_ref.getFilename(),
+            source_ref.getLineNumber()
+        )
+
     node_class = getNodeClassFromKind(kind)
 
     return kind, node_class, args, source_ref
 
 
+# Names that "repr" of constants may use, but that are not built-ins.
+_constant_eval_dict = {
+    "inf" : float("inf"),
+    "nan" : float("nan")
+}
+
+# Marker for constants whose "repr" cannot be evaluated back.
+_constant_pickle_prefix = "pickle:"
+
+
+def getConstantTextForXML(constant):
+    """ Text for a constant, such that constantFromXMLText gives it back.
+
+        Normally this is the "repr" of it, but some constants, e.g. built-in
+        type references, do not have one that evaluates back, these are
+        pickled then.
+    """
+    text = repr(constant)
+
+    try:
+        # pylint: disable=eval-used
+        if compareConstants(eval(text, _constant_eval_dict), constant):
+            return text
+    except Exception: # Catch all the things, pylint: disable=broad-except
+        pass
+
+    try:
+        return _constant_pickle_prefix + binascii.hexlify(
+            pickleConstant(constant)
+        ).decode("ascii")
+    except Exception: # Catch all the things, pylint: disable=broad-except
+        # Restoring it will fail then, but displaying it still works.
+        return text
+
+
+def constantFromXMLText(text):
+    if text.startswith(_constant_pickle_prefix):
+        return unpickleConstant(
+            binascii.unhexlify(text[len(_constant_pickle_prefix):])
+        )
+
+    # pylint: disable=eval-used
+    return eval(text, _constant_eval_dict)
+
+
 def fromXML(provider, xml, source_ref = None):
     assert xml.tag == "node", xml
 
-    kind, node_class, args, source_ref = extractKindAndArgsFromXML(xml, source_ref)
+    _kind, node_class, args, source_ref = extractKindAndArgsFromXML(xml, source_ref)
 
     if "constant" in args:
         # TODO: Try and reduce/avoid this, use marshal and/or pickle from a file
-        # global stream     instead. For now, this will do. pylint: disable=eval-used
-        args["constant"] = eval(args["constant"])
-
-    if kind in ("ExpressionFunctionBody", "PythonMainModule",
-                "PythonCompiledModule", "PythonCompiledPackage",
-                "PythonInternalModule"):
-        delayed = node_class.named_children
-
-        if "code_flags" in args:
-            args["future_spec"] = fromFlags(args["code_flags"])
+        # global stream instead. For now, this will do.
+        args["constant"] = constantFromXMLText(args["constant"])
+
+    for key in ("locals_scope", "target_scope"):
+        if key in args:
+            args[key] = getLocalsDictHandle(args[key])
+
+    # Providers of variables need to exist before their children can be
+    # restored, these get passed the XML and must restore them.
+    if issubclass(node_class, ClosureGiverNodeMixin):
+        delayed = getattr(node_class, "named_children", ()) or \
+                  (node_class.named_child,)
     else:
         delayed = ()
 
@@ -1276,8 +1634,15 @@ def fromXML(provider, xml, source_ref = None):
         else:
             args[child_name] = child
 
+    compat_line = args.pop("compat_line", None)
+
+    # Nodes that have a provider, name it, but it's given by the context.
+    provider_code_name = args.pop("provider", None)
+    assert provider_code_name is None or \
+           provider_code_name == provider.getCodeName(), provider_code_name
+
     try:
-        return node_class.fromXML(
+        result = node_class.fromXML(
             provider   = provider,
             source_ref = source_ref,
             **args
@@ -1285,3 +1650,10 @@ def fromXML(provider, xml, source_ref = None):
     except (TypeError, AttributeError):
         Tracing.printLine(node_class, args, source_ref)
         raise
+
+    if compat_line is not None:
+        result.setCompatibleSourceReference(
+            source_ref.atLineNumber(int(compat_line))
+        )
+
+    return result
@@ -85,6 +85,26 @@ class ExpressionOperationBinaryBase(ExpressionChildrenHavingBase):
     def isInplaceSuspect(self):
         return self.inplace_suspect
 
+    def getDetailsForDisplay(self):
+        result = self.getDetails()
+
+        # Only tree building marks these, so it needs to be preserved.
+        if self.inplace_suspect:
+            result["inplace_suspect"] = True
+
+        return result
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        inplace_suspect = args.pop("inplace_suspect", None) == "True"
+
+        result = cls(source_ref = source_ref, **args)
+
+        if inplace_suspect:
+            result.markAsInplaceSuspect()
+
+        return result
+
     def computeExpression(self, trace_collection):
         operator = self.getOperator()
 
@@ -353,6 +373,9 @@ class ExpressionOperationBinaryDivmod(ExpressionOperationBinaryBase):
 
         self.shape = None
 
+    def getDetails(self):
+        return {}
+
 
     # TODO: Value shape is two elemented tuple of int or float both.
     def getTypeShape(self):
@@ -555,8 +578,15 @@ class ExpressionOperationBinaryInplace(ExpressionOperationBinary):
             assert not left.isMutable(), self
             source_ref = self.getSourceReference()
 
+            # The in-place operator raises different errors, so keep it, unless
+            # the operation can be computed.
+            if right.isCompileTimeConstant():
+                operator = self.getOperator()[1:]
+            else:
+                operator = self.getOperator()
+
             result = makeBinaryOperationNode(
-                operator   = self.getOperator()[1:],
+                operator   = operator,
                 left       = left,
                 right      = right,
                 source_ref = source_ref
@@ -26,6 +26,7 @@ expressions, or multiple returns, without running in a too different context.
 from .ExceptionNodes import ExpressionRaiseException
 from .ExpressionBases import ExpressionChildrenHavingBase
 from .FunctionNodes import ExpressionFunctionBodyBase
+from .NodeBases import ClosureGiverNodeMixin, makeChild
 
 
 class ExpressionOutlineBody(ExpressionChildrenHavingBase):
@@ -75,6 +76,31 @@ class ExpressionOutlineBody(ExpressionChildrenHavingBase):
             "name"     : self.name
         }
 
+    def getDetailsForDisplay(self):
+        result = {
+            "provider" : self.provider.getCodeName(),
+            "name"     : self.name
+        }
+
+        if self.temp_scope is not None:
+            result["temp_scope"] = self.temp_scope
+
+        return result
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        temp_scope = args.pop("temp_scope", None)
+
+        result = cls(
+            provider   = provider,
+            source_ref = source_ref,
+            **args
+        )
+
+        result.temp_scope = temp_scope
+
+        return result
+
     getBody = ExpressionChildrenHavingBase.childGetter("body")
     setBody = ExpressionChildrenHavingBase.childSetter("body")
 
@@ -223,11 +249,86 @@ class ExpressionOutlineFunctionBodyBase(ExpressionFunctionBodyBase):
         }
 
     def getDetailsForDisplay(self):
-        return {
+        result = {
             "name"     : self.name,
             "provider" : self.provider.getCodeName()
         }
 
+        if self.temp_scope is not None:
+            result["temp_scope"] = self.temp_scope
+
+        result.update(self.getProviderDepthDetailsForXML())
+        result.update(self.getClosureDetailsForXML())
+        result.update(self.getProviderDetailsForXML())
+
+        return result
+
+    def getProviderDepthDetailsForXML(self):
+        """ Restoring from XML uses the closest provider in the tree, which
+            need not be the provider, e.g. for nested contractions.
+        """
+
+        provider = self.parent
+
+        while not isinstance(provider, ClosureGiverNodeMixin):
+            provider = provider.parent
+
+        provider_depth = 0
+
+        while provider is not self.provider:
+            provider = provider.getParentVariableProvider()
+            provider_depth += 1
+
+        if provider_depth:
+            return {
+                "provider_depth" : provider_depth
+            }
+        else:
+            return {}
+
+    @staticmethod
+    def extractProviderFromXML(provider, args):
+        for _count in range(int(args.pop("provider_depth", 0))):
+            provider = provider.getParentVariableProvider()
+
+        return provider
+
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        result = cls(
+            provider   = cls.extractProviderFromXML(provider, args),
+            name       = args.pop("name"),
+            source_ref = source_ref
+        )
+
+        result.restoreFromXML(args)
+
+        return result
+
+    def restoreFromXML(self, args):
+        """ Restore details and body from XML, consuming the args.
+
+            The body can only be restored once this node exists, as it is
+            the provider for its variables.
+        """
+
+        self.temp_scope = args.pop("temp_scope", None)
+
+        body = args.pop("body")
+
+        self.restoreClosureDetailsFromXML(args)
+        self.restoreProviderDetailsFromXML(args)
+
+        assert not args, args
+
+        self.setBody(
+            makeChild(
+                provider   = self,
+                child      = body,
+                source_ref = self.source_ref
+            )
+        )
+
     def computeExpressionRaw(self, trace_collection):
         # Keep track of these, so they can provide what variables are to be
         # setup.
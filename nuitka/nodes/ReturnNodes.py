@@ -23,7 +23,11 @@ This one exits functions. The only other exit is the default exit of functions w
 from abc import abstractmethod
 
 from .ExpressionBases import ExpressionBase
-from .NodeBases import StatementBase, StatementChildHavingBase
+from .NodeBases import (
+    StatementBase,
+    StatementChildHavingBase,
+    getConstantTextForXML
+)
 from .NodeMakingHelpers import makeConstantReplacementNode
 
 
@@ -202,6 +206,11 @@ class StatementReturnConstant(StatementReturnConstantBase):
             "constant" : self.constant
         }
 
+    def getDetailsForDisplay(self):
+        return {
+            "constant" : getConstantTextForXML(self.constant)
+        }
+
 
 def makeStatementReturnConstant(constant, source_ref):
     if constant is None:
@@ -266,7 +266,7 @@ class StatementPreserveFrameException(StatementBase):
             source_ref = source_ref
         )
 
-        self.preserver_id = preserver_id
+        self.preserver_id = int(preserver_id)
 
     def finalize(self):
         del self.parent
@@ -310,7 +310,7 @@ class StatementRestoreFrameException(StatementBase):
             source_ref = source_ref
         )
 
-        self.preserver_id = preserver_id
+        self.preserver_id = int(preserver_id)
 
     def finalize(self):
         del self.parent
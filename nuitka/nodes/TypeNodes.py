@@ -137,6 +137,14 @@ class ExpressionBuiltinSuper(ExpressionChildrenHavingBase):
             },
             source_ref = source_ref )
 
+    @classmethod
+    def fromXML(cls, provider, source_ref, **args):
+        return cls(
+            super_type   = args["type"],
+            super_object = args["object"],
+            source_ref   = source_ref
+        )
+
     getType = ExpressionChildrenHavingBase.childGetter("type")
     getObject = ExpressionChildrenHavingBase.childGetter("object")
 
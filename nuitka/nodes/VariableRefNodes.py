@@ -23,7 +23,6 @@ and its expressions, changing the meaning of course dramatically.
 """
 
 from nuitka import Builtins, Variables
-from nuitka.ModuleRegistry import getOwnerFromCodeName
 from nuitka.PythonVersions import python_version
 
 from .DictionaryNodes import (
@@ -40,6 +39,10 @@ from .ModuleAttributeNodes import (
     ExpressionModuleAttributePackageRef,
     ExpressionModuleAttributeSpecRef
 )
+from .NodeBases import (
+    extractVariableOwnerFromXML,
+    getVariableOwnerDetailsForXML
+)
 from .NodeMakingHelpers import makeRaiseExceptionReplacementExpression
 from .shapes.StandardShapes import ShapeUnknown
 
@@ -271,16 +274,19 @@ class ExpressionVariableRef(ExpressionVariableRefBase):
         }
 
     def getDetailsForDisplay(self):
-        return {
-            "variable_name" : self.variable.getName(),
-            "owner"         : self.variable.getOwner().getCodeName()
+        result = {
+            "variable_name" : self.variable.getName()
         }
 
+        result.update(getVariableOwnerDetailsForXML(self.variable))
+
+        return result
+
     @classmethod
     def fromXML(cls, provider, source_ref, **args):
         assert cls is ExpressionVariableRef, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = extractVariableOwnerFromXML(provider, args)
         variable = owner.getProvidedVariable(args["variable_name"])
 
         return cls(
@@ -500,11 +506,14 @@ class ExpressionTempVariableRef(ExpressionVariableRefBase):
         )
 
     def getDetailsForDisplay(self):
-        return {
-            "temp_name" : self.variable.getName(),
-            "owner"     : self.variable.getOwner().getCodeName()
+        result = {
+            "temp_name" : self.variable.getName()
         }
 
+        result.update(getVariableOwnerDetailsForXML(self.variable))
+
+        return result
+
     def getDetails(self):
         return {
             "variable" : self.variable
@@ -514,9 +523,9 @@ class ExpressionTempVariableRef(ExpressionVariableRefBase):
     def fromXML(cls, provider, source_ref, **args):
         assert cls is ExpressionTempVariableRef, cls
 
-        owner = getOwnerFromCodeName(args["owner"])
+        owner = extractVariableOwnerFromXML(provider, args)
 
-        variable = owner.getTempVariable(None, args["temp_name"])
+        variable = owner.createTempVariable(args["temp_name"])
 
         return cls(
             variable   = variable,
@@ -22,6 +22,7 @@
 import marshal
 from logging import debug
 
+from nuitka.BytecodeCaching import compileSourceToBytecode
 from nuitka.importing.ImportCache import replaceImportedModule
 from nuitka.ModuleRegistry import replaceRootModule
 from nuitka.nodes.ModuleNodes import makeUncompiledPythonModule
@@ -52,7 +53,7 @@ def demoteCompiledModuleToBytecode(module):
         source_code = source_code
     )
 
-    bytecode = compile(source_code, filename, "exec", dont_inherit = True)
+    bytecode = compileSourceToBytecode(source_code, filename)
 
     bytecode = Plugins.onFrozenModuleBytecode(
         module_name = full_name,
@@ -0,0 +1,246 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Tracking of function bodies that need to be computed again.
+
+Computing a function body that did not change doing it the last time, gives
+the same result again, unless what it looked at changed since then. That is
+the usage of variables it has traces for, the function bodies it uses, its
+parent function, and the module dictionary becoming escaped.
+
+These are recorded for each computed function body, so later passes compute
+only function bodies that changed, and the ones that depend on them. For the
+others, only what they used, is used again. Their variable traces are also
+the same, so there is no need to look for unused variables in them again.
+"""
+
+from nuitka import ModuleRegistry
+
+# Counter of changes, to tell if something changed after a function body
+# was last computed.
+_change_count = 0
+
+# Change count of variables, when their usage last changed.
+_variable_changes = {}
+
+# Computation state of function bodies.
+_function_states = {}
+
+# Function bodies currently computed, innermost last.
+_computing_states = []
+
+# In a full pass, all function bodies are computed.
+_full_pass = True
+
+# Function bodies computed in this pass.
+_computed_functions = set()
+
+
+class FunctionComputationState(object):
+    __slots__ = (
+        "start_count", "change_count", "changed", "variables",
+        "used_functions", "module_dict_escaped"
+    )
+
+    def __init__(self):
+        # Change count when the computation started.
+        self.start_count = None
+
+        # Change count when the function body last changed.
+        self.change_count = None
+
+        # Newly created function bodies are changed.
+        self.changed = True
+
+        self.variables = ()
+        self.used_functions = ()
+
+        self.module_dict_escaped = None
+
+
+def _isModuleDictEscaped(function_body):
+    return function_body.getParentModule().getModuleDictScope().isEscaped()
+
+
+def _hasChangedSince(function_body, count):
+    state = _function_states.get(function_body)
+
+    # Not computed at all, or not finished yet, counts as changed.
+    if state is None or state.change_count is None:
+        return True
+
+    return state.change_count > count
+
+
+def startPass(full):
+    """ Start an optimization pass, full passes compute all function bodies.
+
+        Full passes are needed, when something changed, that is not tracked
+        for function bodies, e.g. the variables becoming complete.
+    """
+
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global _full_pass
+    _full_pass = full
+
+    _computed_functions.clear()
+
+
+def isFunctionComputationNeeded(function_body):
+    if _full_pass:
+        return True
+
+    state = _function_states.get(function_body)
+
+    if state is None or state.changed:
+        return True
+
+    start_count = state.start_count
+
+    for variable in state.variables:
+        if _variable_changes.get(variable, 0) > start_count:
+            return True
+
+    for used_function in state.used_functions:
+        if _hasChangedSince(used_function, start_count):
+            return True
+
+    parent = function_body.getParentVariableProvider().getEntryPoint()
+
+    if not parent.isCompiledPythonModule() and \
+       _hasChangedSince(parent, start_count):
+        return True
+
+    if _isModuleDictEscaped(function_body) != state.module_dict_escaped:
+        return True
+
+    return False
+
+
+def isVariableOptimizationNeeded(function_body):
+    """ Decide if unused variables are to be looked for in a function body.
+
+        Function bodies not computed in this pass have the same traces, that
+        were already looked at after the previous pass.
+    """
+
+    return _full_pass or function_body in _computed_functions
+
+
+def startFunctionComputation(function_body):
+    state = _function_states.get(function_body)
+
+    if state is None:
+        state = FunctionComputationState()
+        _function_states[function_body] = state
+    else:
+        state.changed = False
+
+    state.start_count = _change_count
+
+    _computing_states.append(state)
+    _computed_functions.add(function_body)
+
+    ModuleRegistry.startUses()
+
+
+def finishFunctionComputation(function_body):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global _change_count
+
+    state = _computing_states.pop()
+
+    _used_modules, state.used_functions = ModuleRegistry.finishUses()
+
+    state.variables = tuple(
+        set(
+            variable
+            for variable, _version in
+            function_body.trace_collection.getVariableTracesAll()
+        )
+    )
+
+    state.module_dict_escaped = _isModuleDictEscaped(function_body)
+
+    if state.changed:
+        _change_count += 1
+        state.change_count = _change_count
+
+
+def replayFunctionUses(function_body, trace_collection):
+    """ Use what a function body used when it was last computed.
+
+        This is for function bodies not computed again, so what they use does
+        not become unused. Used function bodies that are dirty, are computed.
+    """
+
+    ModuleRegistry.startUses()
+
+    for module_name in function_body.trace_collection.getUsedModules():
+        trace_collection.onUsedModule(module_name)
+
+    for used_function in _function_states[function_body].used_functions:
+        if ModuleRegistry.addUsedFunction(used_function):
+            used_function.computeFunctionRaw(trace_collection)
+
+    ModuleRegistry.finishUses()
+
+
+def onChangeSignal():
+    """ A change was signalled, attribute it to the function body computed.
+
+    """
+    if _computing_states:
+        _computing_states[-1].changed = True
+
+
+def onFunctionChanged(function_body):
+    """ A function body was changed outside of its computation.
+
+    """
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global _change_count
+
+    state = _function_states.get(function_body)
+
+    if state is not None:
+        _change_count += 1
+
+        state.changed = True
+        state.change_count = _change_count
+
+
+def onVariablesUsageChanged(variables):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global _change_count
+
+    if variables:
+        _change_count += 1
+
+        for variable in variables:
+            _variable_changes[variable] = _change_count
+
+
+def forgetFunction(function_body):
+    """ Forget about an unused function body, its traces are dropped. """
+
+    _function_states.pop(function_body, None)
+    _computed_functions.discard(function_body)
@@ -24,16 +24,20 @@ make others possible.
 
 
 import inspect
-from logging import debug, info
+from logging import debug, info, warning
 
 from nuitka import ModuleRegistry, Options, Variables
 from nuitka.importing import ImportCache
-from nuitka.nodes.LocalsScopes import LocalsDictHandle, getLocalsDictHandles
+from nuitka.nodes.LocalsScopes import (
+    LocalsDictHandle,
+    getLocalsDictHandles,
+    releaseModuleLocalsDictHandles
+)
 from nuitka.plugins.Plugins import Plugins
 from nuitka.Tracing import printLine
 from nuitka.utils import MemoryUsage
 
-from . import Graphs, TraceCollections
+from . import FunctionTracking, Graphs, TraceCollections
 from .BytecodeDemotion import demoteCompiledModuleToBytecode
 from .Tags import TagSet
 
@@ -73,6 +77,8 @@ def signalChange(tags, source_ref, message):
 
     tag_set.onSignal(tags)
 
+    FunctionTracking.onChangeSignal()
+
 # Use this globally from there, without cyclic dependency.
 TraceCollections.signalChange = signalChange
 
@@ -348,30 +354,48 @@ def optimizeUnusedAssignments(provider):
     return False
 
 
-def optimizeVariables(module):
+def optimizeVariables(module, module_optimized):
+    """ Remove unused variables of a module and its function bodies.
+
+        Only the ones computed in this pass are considered, the others have
+        the same traces as after the last pass, where this was done already.
+        Function bodies are computed for the module using them, so that is
+        not necessarily the module optimized.
+    """
+
     changed = False
 
     try:
         try:
             for function_body in module.getUsedFunctions():
+                if not FunctionTracking.isVariableOptimizationNeeded(function_body):
+                    continue
+
+                function_changed = False
+
                 if Variables.complete:
                     if optimizeUnusedUserVariables(function_body):
-                        changed = True
+                        function_changed = True
 
                     if optimizeUnusedClosureVariables(function_body):
-                        changed = True
+                        function_changed = True
 
                 if optimizeUnusedTempVariables(function_body):
+                    function_changed = True
+
+                if function_changed:
+                    FunctionTracking.onFunctionChanged(function_body)
                     changed = True
         except Exception:
             print("Problem with", function_body)
             raise#
 
-        if optimizeUnusedUserVariables(module):
-            changed = True
+        if module_optimized:
+            if optimizeUnusedUserVariables(module):
+                changed = True
 
-        if optimizeUnusedTempVariables(module):
-            changed = True
+            if optimizeUnusedTempVariables(module):
+                changed = True
 
 #        TODO: Global optimizations could go here maybe, so far we can do all
 #        the things in assign nodes themselves based on last trace.
@@ -413,16 +437,66 @@ def restoreFromXML(text):
     return module
 
 
+# Modules changed in the last pass, "None" means all modules are to be
+# optimized in the next pass.
+changed_modules = None
+
+def _isModuleOptimizationNeeded(module):
+    """ Decide if a module needs to be optimized in this pass.
+
+        Compiled modules are only optimized again, if they or the modules
+        they used changed in the last pass. Otherwise, they would come to the
+        same result.
+    """
+
+    if changed_modules is None or not module.isCompiledPythonModule():
+        return True
+
+    if module in changed_modules:
+        return True
+
+    module_uses = ModuleRegistry.getModuleUses(module)
+
+    if module_uses is None:
+        return True
+
+    used_modules, _used_functions = module_uses
+
+    for used_module in used_modules:
+        if used_module in changed_modules:
+            return True
+
+    return False
+
+
 def makeOptimizationPass(initial_pass):
     """ Make a single pass for optimization, indication potential completion.
 
+        Returns if nothing changed, and if all modules and function bodies
+        were optimized in the pass.
     """
     # Controls complex optimization, pylint: disable=too-many-branches
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global changed_modules
 
     finished = True
+    pass_changed_modules = set()
+    pass_optimized_modules = set()
+
+    # Without change tracking, every pass is a full one, which must give the
+    # same result, only slower.
+    if Options.isExperimental("disable_change_tracking"):
+        changed_modules = None
+
+    full_pass = changed_modules is None
 
     ModuleRegistry.startTraversal()
 
+    FunctionTracking.startPass(
+        full = full_pass
+    )
+
     if _progress:
         if initial_pass:
             info("Initial optimization pass.")
@@ -435,35 +509,60 @@ def makeOptimizationPass(initial_pass):
         if current_module is None:
             break
 
+        if not _isModuleOptimizationNeeded(current_module):
+            if _progress:
+                info(
+                    "Skipping module '{module_name}', nothing it uses changed.".format(
+                        module_name = current_module.getFullName()
+                    )
+                )
+
+            ModuleRegistry.replayModuleUses(current_module)
+
+            continue
+
         if _progress:
             _traceProgress(current_module)
 
         # The tag set is global, so it can react to changes without context.
-        # pylint: disable=global-statement
         global tag_set
         tag_set = TagSet()
 
+        ModuleRegistry.startModuleUses()
+
         changed = optimizeModule(current_module)
+        pass_optimized_modules.add(current_module)
+
+        ModuleRegistry.finishModuleUses(current_module)
 
         if changed:
             finished = False
+            pass_changed_modules.add(current_module)
 
     # Unregister collection traces from now unused code, dropping the trace
     # collections of functions no longer used.
     for current_module in ModuleRegistry.getDoneModules():
         if current_module.isCompiledPythonModule():
             for function in current_module.getUnusedFunctions():
-                Variables.updateVariablesFromCollection(
-                    old_collection = function.trace_collection,
-                    new_collection = None
+                FunctionTracking.onVariablesUsageChanged(
+                    Variables.updateVariablesFromCollection(
+                        old_collection = function.trace_collection,
+                        new_collection = None
+                    )
                 )
 
+                FunctionTracking.forgetFunction(function)
+
                 function.trace_collection = None
 
     for current_module in ModuleRegistry.getDoneModules():
         if current_module.isCompiledPythonModule():
-            if optimizeVariables(current_module):
+            if optimizeVariables(
+                module           = current_module,
+                module_optimized = current_module in pass_optimized_modules
+            ):
                 finished = False
+                pass_changed_modules.add(current_module)
 
             used_functions = current_module.getUsedFunctions()
 
@@ -479,23 +578,40 @@ def makeOptimizationPass(initial_pass):
 
             current_module.setFunctions(used_functions)
 
+    changed_modules = pass_changed_modules
+
     if Variables.complete:
         if optimizeLocalsDictsHandles():
             finished = False
 
-    return finished
+            # Not associated with modules, so all need to be optimized again.
+            changed_modules = None
+
+    return finished, full_pass
 
 
 def _checkXMLPersistence():
     new_roots = ModuleRegistry.root_modules.__class__()  # @UndefinedVariable
 
+    texts = []
+
     for module in tuple(ModuleRegistry.getDoneModules()):
+        # The internal module is shared, and not a root module.
+        if module.isInternalModule():
+            continue
+
         ModuleRegistry.root_modules.remove(module)
 
         if module.isPythonShlibModule():
             continue
 
-        text = module.asXmlText()
+        texts.append((module, module.asXmlText()))
+
+    # The restored modules will create their locals dict handles anew.
+    for module, _text in texts:
+        releaseModuleLocalsDictHandles(module.getCodeName())
+
+    for module, text in texts:
         open("out.xml", 'w').write(text)
         restored = restoreFromXML(text)
         retext = restored.asXmlText()
@@ -524,6 +640,10 @@ def _checkXMLPersistence():
 
 
 def optimize(output_filename):
+    # Using global here, as this is really a singleton, in the form of a module,
+    # pylint: disable=global-statement
+    global changed_modules
+
     Graphs.startGraph()
 
     # First pass.
@@ -533,11 +653,16 @@ def optimize(output_filename):
     makeOptimizationPass(initial_pass = True)
     Variables.complete = True
 
-    finished = makeOptimizationPass(initial_pass = False)
+    # With complete variables, all modules can be optimized further.
+    changed_modules = None
+
+    finished, full_pass = makeOptimizationPass(initial_pass = False)
 
     if Options.isExperimental("check_xml_persistence"):
         _checkXMLPersistence()
 
+        changed_modules = None
+
     # Demote compiled modules to bytecode, now that imports had a chance to be resolved, and
     # dependencies were handled.
     for module in ModuleRegistry.getDoneUserModules():
@@ -545,11 +670,29 @@ def optimize(output_filename):
            module.mode == "bytecode":
             demoteCompiledModuleToBytecode(module)
 
+            changed_modules = None
+
     if _progress:
         info("PASS 2 ... :")
 
     # Second, "endless" pass.
-    while not finished:
-        finished = makeOptimizationPass(initial_pass = False)
+    while True:
+        while not finished:
+            finished, full_pass = makeOptimizationPass(initial_pass = False)
+
+        if full_pass:
+            break
+
+        # Passes that are not full, rely on the change tracking to not miss
+        # anything. Only a full pass without changes is the final result.
+        changed_modules = None
+
+        finished, full_pass = makeOptimizationPass(initial_pass = False)
+
+        if finished:
+            break
+
+        if Options.isDebug():
+            warning("Full optimization pass found changes missed before.")
 
     Graphs.endGraph(output_filename)
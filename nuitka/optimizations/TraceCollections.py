@@ -40,6 +40,7 @@ from nuitka.PythonVersions import python_version
 from nuitka.tree.SourceReading import readSourceLine
 from nuitka.utils.InstanceCounters import counted_del, counted_init
 
+from .FunctionTracking import onVariablesUsageChanged
 from .ValueTraces import (
     ValueTraceAssign,
     ValueTraceInit,
@@ -308,7 +309,9 @@ class CollectionStartpointMixin(object):
         return trace
 
     def updateVariablesFromCollection(self, old_collection):
-        Variables.updateVariablesFromCollection(old_collection, self)
+        onVariablesUsageChanged(
+            Variables.updateVariablesFromCollection(old_collection, self)
+        )
 
     @contextlib.contextmanager
     def makeAbortStackContext(self, catch_breaks, catch_continues,
@@ -821,6 +824,9 @@ class TraceCollectionFunction(CollectionStartpointMixin,
             self.initVariableUnknown(closure_variable)
             self.variable_actives[closure_variable] = 0
 
+        # Modules used by this function, also reported to the parent.
+        self.used_modules = OrderedSet()
+
         # TODO: Have special function type for exec functions stuff.
         locals_scope = function_body.getFunctionLocalsScope()
 
@@ -831,6 +837,14 @@ class TraceCollectionFunction(CollectionStartpointMixin,
             else:
                 function_body.locals_scope = None
 
+    def onUsedModule(self, module_name):
+        self.used_modules.add(module_name)
+
+        return self.parent.onUsedModule(module_name)
+
+    def getUsedModules(self):
+        return self.used_modules
+
 
 class TraceCollectionModule(CollectionStartpointMixin,
                             TraceCollectionBase):
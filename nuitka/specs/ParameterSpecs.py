@@ -89,7 +89,7 @@ class ParameterSpec(object):
         self.list_star_variable = None
         self.dict_star_variable = None
 
-        self.default_count = ps_default_count
+        self.default_count = int(ps_default_count)
 
         self.kw_only_args = tuple(ps_kw_only_args)
         self.kw_only_variables = None
@@ -0,0 +1,608 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Generator for C helpers specialized to the types of their arguments.
+
+This creates "nuitka/build/include/nuitka/helper/operations_binary.h" with one
+"BINARY_OPERATION_<OP>_<TYPE1>_<TYPE2>" helper for all the operators and types
+listed here, and it needs to be run after making changes here.
+
+Where the types are known, the number slot that will do the work is known too,
+and called directly, or even the operation done in C. Combinations that only
+ever can raise an error are made aliases of the generic helper.
+
+For in-place operators on types that cannot be modified, there are variants
+"BINARY_OPERATION_I<OP>_<TYPE1>_<TYPE2>", that use the same code, but the
+generic in-place helper, which gives the errors of the in-place operator.
+"""
+
+from __future__ import print_function
+
+import os
+import sys
+
+# Unchanged, running from checkout, use the parent directory, the nuitka
+# package ought be there.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(__file__),
+            "..",
+            "..",
+            ".."
+        )
+    )
+)
+
+from nuitka.tools.Basics import goHome # isort:skip
+
+
+class TypeDesc(object):
+    """ Description of a built-in type as relevant to binary operations. """
+
+    def __init__(self, type_name, type_object, check_exact, python_requirement,
+                 number_rank, number_slots, is_sequence):
+        self.type_name = type_name
+        self.type_object = type_object
+        self.check_exact = check_exact
+        self.python_requirement = python_requirement
+
+        # Numbers only handle each other, with the highest rank doing it.
+        self.number_rank = number_rank
+        self.number_slots = number_slots
+
+        self.is_sequence = is_sequence
+
+    def getSlot(self, operation):
+        return "%s.tp_as_number->%s" % (
+            self.type_object,
+            operation.slot_name
+        )
+
+    def getSequenceSlot(self, slot_name):
+        return "%s.tp_as_sequence->%s" % (
+            self.type_object,
+            slot_name
+        )
+
+
+class OperationDesc(object):
+    """ Description of a binary operation and its generic helper. """
+
+    def __init__(self, op_name, slot_name, generic_helper,
+                 generic_inplace_helper, python_requirement, is_ternary = False):
+        self.op_name = op_name
+        self.slot_name = slot_name
+        self.generic_helper = generic_helper
+        self.generic_inplace_helper = generic_inplace_helper
+        self.python_requirement = python_requirement
+        self.is_ternary = is_ternary
+
+
+_all_number_ops = (
+    "ADD", "SUB", "MUL", "DIV", "FLOORDIV", "TRUEDIV", "REMAINDER", "POW",
+    "LSHIFT", "RSHIFT", "BITAND", "BITOR", "BITXOR"
+)
+
+types = (
+    TypeDesc(
+        type_name          = "INT",
+        type_object        = "PyInt_Type",
+        check_exact        = "PyInt_CheckExact",
+        python_requirement = "PYTHON_VERSION < 300",
+        number_rank        = 1,
+        number_slots       = _all_number_ops,
+        is_sequence        = False
+    ),
+    TypeDesc(
+        type_name          = "LONG",
+        type_object        = "PyLong_Type",
+        check_exact        = "PyLong_CheckExact",
+        python_requirement = None,
+        number_rank        = 2,
+        number_slots       = _all_number_ops,
+        is_sequence        = False
+    ),
+    TypeDesc(
+        type_name          = "FLOAT",
+        type_object        = "PyFloat_Type",
+        check_exact        = "PyFloat_CheckExact",
+        python_requirement = None,
+        number_rank        = 3,
+        number_slots       = (
+            "ADD", "SUB", "MUL", "DIV", "FLOORDIV", "TRUEDIV", "REMAINDER",
+            "POW"
+        ),
+        is_sequence        = False
+    ),
+    TypeDesc(
+        type_name          = "STR",
+        type_object        = "PyString_Type",
+        check_exact        = "PyString_CheckExact",
+        python_requirement = "PYTHON_VERSION < 300",
+        number_rank        = None,
+        number_slots       = ("REMAINDER",),
+        is_sequence        = True
+    ),
+    TypeDesc(
+        type_name          = "UNICODE",
+        type_object        = "PyUnicode_Type",
+        check_exact        = "PyUnicode_CheckExact",
+        python_requirement = None,
+        number_rank        = None,
+        number_slots       = ("REMAINDER",),
+        is_sequence        = True
+    ),
+    TypeDesc(
+        type_name          = "BYTES",
+        type_object        = "PyBytes_Type",
+        check_exact        = "PyBytes_CheckExact",
+        python_requirement = "PYTHON_VERSION >= 300",
+        number_rank        = None,
+        # Formatting for bytes is only there for some versions.
+        number_slots       = (),
+        is_sequence        = True
+    ),
+    TypeDesc(
+        type_name          = "LIST",
+        type_object        = "PyList_Type",
+        check_exact        = "PyList_CheckExact",
+        python_requirement = None,
+        number_rank        = None,
+        number_slots       = (),
+        is_sequence        = True
+    ),
+    TypeDesc(
+        type_name          = "TUPLE",
+        type_object        = "PyTuple_Type",
+        check_exact        = "PyTuple_CheckExact",
+        python_requirement = None,
+        number_rank        = None,
+        number_slots       = (),
+        is_sequence        = True
+    ),
+)
+
+operations = (
+    OperationDesc("ADD", "nb_add", "BINARY_OPERATION_ADD", "PyNumber_InPlaceAdd", None),
+    OperationDesc("SUB", "nb_subtract", "BINARY_OPERATION_SUB", "PyNumber_InPlaceSubtract", None),
+    OperationDesc("MUL", "nb_multiply", "BINARY_OPERATION_MUL", "PyNumber_InPlaceMultiply", None),
+    OperationDesc("DIV", "nb_divide", "BINARY_OPERATION_DIV", "PyNumber_InPlaceDivide", "PYTHON_VERSION < 300"),
+    OperationDesc("FLOORDIV", "nb_floor_divide", "BINARY_OPERATION_FLOORDIV", "PyNumber_InPlaceFloorDivide", None),
+    OperationDesc("TRUEDIV", "nb_true_divide", "BINARY_OPERATION_TRUEDIV", "PyNumber_InPlaceTrueDivide", None),
+    OperationDesc("REMAINDER", "nb_remainder", "BINARY_OPERATION_REMAINDER", "PyNumber_InPlaceRemainder", None),
+    OperationDesc("POW", "nb_power", "POWER_OPERATION", "POWER_OPERATION2", None, is_ternary = True),
+    OperationDesc("LSHIFT", "nb_lshift", "PyNumber_Lshift", "PyNumber_InPlaceLshift", None),
+    OperationDesc("RSHIFT", "nb_rshift", "PyNumber_Rshift", "PyNumber_InPlaceRshift", None),
+    OperationDesc("BITAND", "nb_and", "PyNumber_And", "PyNumber_InPlaceAnd", None),
+    OperationDesc("BITOR", "nb_or", "PyNumber_Or", "PyNumber_InPlaceOr", None),
+    OperationDesc("BITXOR", "nb_xor", "PyNumber_Xor", "PyNumber_InPlaceXor", None),
+)
+
+# The in-place operators are only specialized for these, as they cannot be
+# modified, the in-place operation is the normal one, except for errors.
+inplace_types = tuple(
+    type_desc
+    for type_desc in types
+    if type_desc.type_name != "LIST"
+)
+
+# Operations that are done in C for the type, if operands are of that type.
+_inline_c_operations = {
+    ("INT", "ADD") : '+',
+    ("INT", "SUB") : '-',
+    ("FLOAT", "ADD") : '+',
+    ("FLOAT", "SUB") : '-',
+    ("FLOAT", "MUL") : '*',
+    ("FLOAT", "TRUEDIV") : '/',
+}
+
+template_header = """\
+//     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+//
+//     Part of "Nuitka", an optimizing Python compiler that is compatible and
+//     integrates with CPython, but also works on its own.
+//
+//     Licensed under the Apache License, Version 2.0 (the "License");
+//     you may not use this file except in compliance with the License.
+//     You may obtain a copy of the License at
+//
+//        http://www.apache.org/licenses/LICENSE-2.0
+//
+//     Unless required by applicable law or agreed to in writing, software
+//     distributed under the License is distributed on an "AS IS" BASIS,
+//     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//     See the License for the specific language governing permissions and
+//     limitations under the License.
+//
+#ifndef __NUITKA_OPERATIONS_BINARY_H__
+#define __NUITKA_OPERATIONS_BINARY_H__
+
+// This file is generated by "python -m nuitka.tools.specialize", do not edit
+// it, but change the generator instead.
+"""
+
+template_footer = """
+#endif
+"""
+
+template_helper = """\
+NUITKA_MAY_BE_UNUSED static PyObject *%(helper_name)s(PyObject *operand1, PyObject *operand2) {
+    CHECK_OBJECT(operand1);
+%(check1)s    CHECK_OBJECT(operand2);
+%(check2)s
+%(body)s
+}
+"""
+
+template_alias = """\
+#define %(helper_name)s %(generic_helper)s
+"""
+
+template_inline_int = """\
+    long a = PyInt_AS_LONG(operand1);
+    long b = PyInt_AS_LONG(operand2);
+
+    long i = a %(c_operator)s b;
+
+    // Detect overflow, in which case, a "long" object would have to be
+    // created, which the slot will do.
+    if (likely(!((i ^ a) < 0 && (i ^ %(overflow_operand)s) < 0))) {
+        return PyInt_FromLong(i);
+    }
+
+"""
+
+template_inline_float = """\
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    return PyFloat_FromDouble(a %(c_operator)s b);
+"""
+
+template_inline_float_checked = """\
+    double a = PyFloat_AS_DOUBLE(operand1);
+    double b = PyFloat_AS_DOUBLE(operand2);
+
+    // The slot raises the exception for this.
+    if (likely(b != 0.0)) {
+        return PyFloat_FromDouble(a %(c_operator)s b);
+    }
+
+"""
+
+template_slot_call = """\
+    PyObject *result = %(slot)s(%(slot_args)s);
+
+    if (likely(result != Py_NotImplemented)) {
+        return result;
+    }
+
+    Py_DECREF(result);
+
+    return %(generic_helper)s(operand1, operand2);
+"""
+
+template_sequence_concat = """\
+    return %(slot)s(operand1, operand2);
+"""
+
+template_sequence_repeat = """\
+    return SEQUENCE_REPEAT(%(slot)s, %(sequence)s, %(count)s);
+"""
+
+template_object_dispatch = """\
+    if (%(check_exact)s(%(operand)s)) {
+        return %(specialized_helper)s(operand1, operand2);
+    }
+
+    return %(generic_helper)s(operand1, operand2);
+"""
+
+
+def _getHelperName(operation, type1, type2, inplace = False):
+    return "BINARY_OPERATION_%s%s_%s_%s" % (
+        'I' if inplace else "",
+        operation.op_name,
+        type1.type_name if type1 is not None else "OBJECT",
+        type2.type_name if type2 is not None else "OBJECT"
+    )
+
+
+def _getNumberSlotOwner(operation, type1, type2):
+    """ The type whose number slot handles the operation, if any.
+
+    For numbers, the one of higher rank does it, the other one will return
+    "NotImplemented" for it. Formatting only works as the left operand.
+    """
+
+    if type1.number_rank is not None and type2.number_rank is not None:
+        owner = type1 if type1.number_rank >= type2.number_rank else type2
+    elif type1.number_rank is None and operation.op_name == "REMAINDER":
+        owner = type1
+    else:
+        return None
+
+    if operation.op_name not in owner.number_slots:
+        return None
+
+    return owner
+
+
+def _getKnownTypesBody(operation, type1, type2):
+    """ C code for both types known, or None if it can only be an error. """
+
+    owner = _getNumberSlotOwner(operation, type1, type2)
+
+    if owner is not None:
+        body = ""
+
+        c_operator = _inline_c_operations.get(
+            (owner.type_name, operation.op_name)
+        )
+
+        if c_operator is not None and type1 is type2:
+            if owner.type_name == "INT":
+                body = template_inline_int % {
+                    "c_operator"       : c_operator,
+                    "overflow_operand" : 'b' if c_operator == '+' else "~b",
+                }
+            elif operation.op_name == "TRUEDIV":
+                body = template_inline_float_checked % {
+                    "c_operator" : c_operator
+                }
+            else:
+                return template_inline_float % {
+                    "c_operator" : c_operator
+                }
+
+        body += template_slot_call % {
+            "slot"           : owner.getSlot(operation),
+            "slot_args"      : "operand1, operand2, Py_None"
+                                 if operation.is_ternary else
+                               "operand1, operand2",
+            "generic_helper" : operation.generic_helper
+        }
+
+        return body
+
+    if operation.op_name == "ADD" and type1.is_sequence:
+        return template_sequence_concat % {
+            "slot" : type1.getSequenceSlot("sq_concat")
+        }
+
+    if operation.op_name == "MUL":
+        if type1.is_sequence and type2.number_rank in (1, 2):
+            return template_sequence_repeat % {
+                "slot"     : type1.getSequenceSlot("sq_repeat"),
+                "sequence" : "operand1",
+                "count"    : "operand2"
+            }
+
+        if type2.is_sequence and type1.number_rank in (1, 2):
+            return template_sequence_repeat % {
+                "slot"     : type2.getSequenceSlot("sq_repeat"),
+                "sequence" : "operand2",
+                "count"    : "operand1"
+            }
+
+    return None
+
+
+def _getRequirements(*descs):
+    requirements = set(
+        desc.python_requirement
+        for desc in descs
+        if desc is not None
+        if desc.python_requirement is not None
+    )
+
+    if len(requirements) > 1:
+        return None
+
+    return requirements
+
+
+def _makeCheck(type_desc, operand):
+    if type_desc is None:
+        return ""
+
+    return "    assert(%s(%s));\n" % (
+        type_desc.check_exact,
+        operand
+    )
+
+
+def _makeHelperCode(operation, type1, type2, specialized, aliased):
+    helper_name = _getHelperName(operation, type1, type2)
+
+    if type1 is not None and type2 is not None:
+        body = _getKnownTypesBody(operation, type1, type2)
+    else:
+        known_type = type1 if type1 is not None else type2
+
+        if (operation, known_type) not in specialized:
+            body = None
+        else:
+            body = template_object_dispatch % {
+                "check_exact"        : known_type.check_exact,
+                "operand"            : "operand1" if type1 is None else "operand2",
+                "specialized_helper" : _getHelperName(
+                    operation,
+                    known_type,
+                    known_type
+                ),
+                "generic_helper"     : operation.generic_helper
+            }
+
+    if body is None:
+        aliased.add(helper_name)
+
+        return template_alias % {
+            "helper_name"    : helper_name,
+            "generic_helper" : operation.generic_helper
+        }
+
+    if type1 is type2:
+        specialized.add((operation, type1))
+
+    return template_helper % {
+        "helper_name" : helper_name,
+        "check1"      : _makeCheck(type1, "operand1"),
+        "check2"      : _makeCheck(type2, "operand2"),
+        "body"        : body.rstrip('\n')
+    }
+
+
+def _makeInplaceHelperCode(operation, type1, type2, specialized, aliased):
+    helper_name = _getHelperName(operation, type1, type2, inplace = True)
+
+    if type2 is not None:
+        # Errors only come from the generic helper, others are the same.
+        normal_helper_name = _getHelperName(operation, type1, type2)
+
+        return template_alias % {
+            "helper_name"    : helper_name,
+            "generic_helper" : operation.generic_inplace_helper
+                                 if normal_helper_name in aliased else
+                               normal_helper_name
+        }
+
+    if (operation, type1) not in specialized:
+        return template_alias % {
+            "helper_name"    : helper_name,
+            "generic_helper" : operation.generic_inplace_helper
+        }
+
+    return template_helper % {
+        "helper_name" : helper_name,
+        "check1"      : _makeCheck(type1, "operand1"),
+        "check2"      : "",
+        "body"        : (template_object_dispatch % {
+            "check_exact"        : type1.check_exact,
+            "operand"            : "operand2",
+            "specialized_helper" : _getHelperName(operation, type1, type1),
+            "generic_helper"     : operation.generic_inplace_helper
+        }).rstrip('\n')
+    }
+
+
+def _makeOperationCode(operation):
+    specialized = set()
+    aliased = set()
+
+    codes = []
+
+    # Same types first, these are used by the ones with one unknown type.
+    type_pairs = [
+        (type_desc, type_desc)
+        for type_desc in types
+    ]
+
+    type_pairs += [
+        (type1, type2)
+        for type1 in types
+        for type2 in types
+        if type1 is not type2
+    ]
+
+    type_pairs += [
+        (None, type_desc)
+        for type_desc in types
+    ]
+
+    type_pairs += [
+        (type_desc, None)
+        for type_desc in types
+    ]
+
+    for type1, type2 in type_pairs:
+        requirements = _getRequirements(operation, type1, type2)
+
+        # Types that do not exist in the same Python version.
+        if requirements is None:
+            continue
+
+        code = _makeHelperCode(operation, type1, type2, specialized, aliased)
+
+        if requirements:
+            code = "#if %s\n%s#endif\n" % (
+                requirements.pop(),
+                code
+            )
+
+        codes.append(code)
+
+    inplace_type_pairs = [
+        (type1, type2)
+        for type1 in inplace_types
+        for type2 in types + (None,)
+    ]
+
+    for type1, type2 in inplace_type_pairs:
+        requirements = _getRequirements(operation, type1, type2)
+
+        if requirements is None:
+            continue
+
+        code = _makeInplaceHelperCode(operation, type1, type2, specialized, aliased)
+
+        if requirements:
+            code = "#if %s\n%s#endif\n" % (
+                requirements.pop(),
+                code
+            )
+
+        codes.append(code)
+
+    return codes
+
+
+def main():
+    goHome()
+
+    filename = os.path.join(
+        "nuitka",
+        "build",
+        "include",
+        "nuitka",
+        "helper",
+        "operations_binary.h"
+    )
+
+    with open(filename, 'w') as output:
+        output.write(template_header)
+
+        for operation in operations:
+            output.write(
+                "\n// Specialized helpers for binary operation %s.\n" % (
+                    operation.op_name
+                )
+            )
+
+            for code in _makeOperationCode(operation):
+                output.write('\n')
+                output.write(code)
+
+        output.write(template_footer)
+
+    print("Generated", filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -95,6 +95,37 @@ The optimization tests, execute these to check if Nuitka does optimize certain
 constructs fully away. Default is %default."""
     )
 
+    parser.add_option(
+        "--skip-incremental-tests",
+        action  = "store_false",
+        dest    = "incremental_tests",
+        default = True,
+        help    = """\
+The incremental tests, execute these to check if Nuitka notices changes, when
+compiling again with files of earlier compilations. Default is %default."""
+    )
+
+    parser.add_option(
+        "--skip-blobs-tests",
+        action  = "store_false",
+        dest    = "blobs_tests",
+        default = True,
+        help    = """\
+The blobs tests, execute these to check if Nuitka shares the values of the
+constants blob fine. Default is %default."""
+    )
+
+    parser.add_option(
+        "--skip-elf-tests",
+        action  = "store_false",
+        dest    = "elf_tests",
+        # Only Linux has ELF files and "ldd" to compare with.
+        default = sys.platform.startswith("linux"),
+        help    = """\
+The ELF tests, execute these to check if Nuitka finds the DLLs used by ELF
+files like "ldd" does. Default is %default."""
+    )
+
     parser.add_option(
         "--skip-standalone-tests",
         action  = "store_false",
@@ -613,6 +644,21 @@ def main():
                 setExtraFlags(where, "optimizations", flags)
                 executeSubTest("./tests/optimizations/run_all.py search")
 
+        if options.incremental_tests and not options.coverage:
+            print("Running the incremental tests with options '%s' with %s:" % (flags, use_python))
+            setExtraFlags(None, "incremental", flags)
+            executeSubTest("./tests/incremental/run_all.py search")
+
+        if options.blobs_tests:
+            print("Running the blobs tests with options '%s' with %s:" % (flags, use_python))
+            setExtraFlags(None, "blobs", flags)
+            executeSubTest("./tests/blobs/run_all.py search")
+
+        if options.elf_tests:
+            print("Running the ELF tests with options '%s' with %s:" % (flags, use_python))
+            setExtraFlags(None, "elf", flags)
+            executeSubTest("./tests/elf/run_all.py search")
+
         if options.standalone_tests and not options.coverage:
             print("Running the standalone tests with options '%s' with %s:" % (flags, use_python))
             setExtraFlags(None, "standalone", flags)
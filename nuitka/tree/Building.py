@@ -113,6 +113,7 @@ from nuitka.utils import MemoryUsage
 from nuitka.utils.FileOperations import splitPath
 
 from . import SyntaxErrors
+from .ModuleTreeCache import restoreModuleTree
 from .ReformulationAssertStatements import buildAssertNode
 from .ReformulationAssignmentStatements import (
     buildAnnAssignNode,
@@ -1052,6 +1053,10 @@ class CodeTooComplexCode(Exception):
 
 
 def createModuleTree(module, source_ref, source_code, is_main):
+    if Options.shallUseModuleTreeCache() and \
+       restoreModuleTree(module, source_code):
+        return
+
     if Options.isShowMemory():
         memory_watch = MemoryUsage.MemoryWatch()
 
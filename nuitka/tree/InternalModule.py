@@ -47,9 +47,14 @@ def once_decorator(func):
 
         return func.cached_value
 
+    once_functions.append(replacement)
+
     return replacement
 
 
+once_functions = []
+
+
 @once_decorator
 def getInternalModule():
     """ Get the singleton internal module.
@@ -69,3 +74,26 @@ def makeInternalHelperFunctionBody(name, parameters):
         flags       = set(),
         source_ref  = internal_source_ref
     )
+
+
+def getInternalHelperFunction(name):
+    """ Get an internal helper function by its name.
+
+    Used when restoring references to them. The helpers are only created on
+    demand, so this may have to create others until the name is found.
+    """
+
+    for function in getInternalModule().getFunctions():
+        if function.getFunctionName() == name:
+            return function
+
+    for once_function in once_functions:
+        if once_function is getInternalModule:
+            continue
+
+        function = once_function()
+
+        if function.getFunctionName() == name:
+            return function
+
+    assert False, name
@@ -0,0 +1,350 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Cache of optimized module trees.
+
+Unchanged modules, compiled with the same Nuitka, Python and relevant options,
+will result in the same optimized tree again. The XML of the tree is stored in
+the cache directory, and restored instead of building the tree from source and
+optimizing it from scratch.
+
+The optimized tree can also depend on the modules used, e.g. directly or by
+the modules it imports. The files of these modules are hashed and stored with
+the tree, and if any of them changed, the cached tree is not used.
+
+A restored tree must give exactly the stored XML again, otherwise it is thrown
+away and the module is built from source as usual.
+"""
+
+import hashlib
+import os
+import sys
+from logging import info
+
+from nuitka import ModuleRegistry, Options, TreeXML
+from nuitka.__past__ import unicode  # pylint: disable=I0021,redefined-builtin
+from nuitka.PythonVersions import python_version
+from nuitka.utils.AppDirs import getCacheDir
+from nuitka.utils.FileOperations import listDir, makePath
+from nuitka.Version import getNuitkaVersion
+
+# Cache keys of modules built from source, these are to be stored.
+_module_cache_keys = {}
+
+# Cached trees read into memory by the compile server, by filename, with the
+# modification time and size of the file, its text, and the parsed XML.
+_memory_trees = {}
+
+# Hashes of module files, by filename, with their modification time and size.
+_file_hashes = {}
+
+
+def _getCacheKey(module, source_code):
+    hash_value = hashlib.md5()
+
+    def _addValue(value):
+        if type(value) is not bytes:
+            value = repr(value).encode("utf8")
+
+        hash_value.update(value)
+        hash_value.update(b"\0")
+
+    _addValue(getNuitkaVersion())
+    _addValue(sys.version)
+    _addValue(sys.executable)
+
+    _addValue(module.__class__.__name__)
+    _addValue(module.getFullName())
+    _addValue(module.getCompileTimeFilename())
+
+    # Options that are used during tree building and optimization.
+    _addValue(sorted(Options.getPythonFlags()))
+    _addValue(Options.isFullCompat())
+    _addValue(Options.isDebug())
+    _addValue(Options.isPythonDebug())
+    _addValue(Options.isStandaloneMode())
+    _addValue(Options.shallMakeModule())
+    _addValue(Options.getFileReferenceMode())
+    _addValue(sorted(Options.getExperimentalIndications()))
+    _addValue(sorted(Options.getPluginsEnabled()))
+    _addValue(sorted(Options.getPluginsDisabled()))
+
+    for plugin_name in sorted(Options.getPluginsEnabled()):
+        _addValue(Options.getPluginOptions(plugin_name))
+
+    # Options and paths that decide which imports are followed and where they
+    # are found, which is visible in the tree, e.g. as import nodes that know
+    # the module they refer to.
+    _addValue(Options.shallFollowStandardLibrary())
+    _addValue(Options.shallFollowNoImports())
+    _addValue(Options.shallFollowAllImports())
+    _addValue(Options.getShallFollowInNoCase())
+    _addValue(Options.getShallFollowModules())
+    _addValue(Options.getShallFollowExtra())
+    _addValue(Options.getShallFollowExtraFilePatterns())
+    _addValue(Options.getMustIncludeModules())
+    _addValue(Options.getMustIncludePackages())
+    _addValue(sys.path)
+
+    if type(source_code) is unicode:
+        source_code = source_code.encode("utf8")
+
+    _addValue(source_code)
+
+    return hash_value.hexdigest()
+
+
+def _getFileHash(filename):
+    """ Hash of the contents of a module file, "None" for no file. """
+
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+
+    # Packages are directories, their "__init__" file is its own module.
+    if not os.path.isfile(filename):
+        return None
+
+    file_info = (stat.st_mtime, stat.st_size)
+
+    if filename in _file_hashes and _file_hashes[filename][0] == file_info:
+        return _file_hashes[filename][1]
+
+    with open(filename, "rb") as module_file:
+        result = hashlib.md5(module_file.read()).hexdigest()
+
+    _file_hashes[filename] = (file_info, result)
+
+    return result
+
+
+def _getModuleDependencies(module):
+    """ Filenames of the modules used by a module, directly or indirectly.
+
+        These were optimized with the module, so what is known about them, can
+        be part of its tree.
+    """
+
+    result = set()
+    pending = [module]
+    seen = set(pending)
+
+    while pending:
+        module_uses = ModuleRegistry.getModuleUses(pending.pop())
+
+        if module_uses is None:
+            continue
+
+        for used_module in module_uses[0]:
+            if used_module in seen:
+                continue
+
+            seen.add(used_module)
+            pending.append(used_module)
+
+            result.add(used_module.getCompileTimeFilename())
+
+    return sorted(result)
+
+
+def _getCacheDir():
+    cache_dir = os.path.join(
+        getCacheDir(),
+        "module_trees"
+    )
+
+    makePath(cache_dir)
+
+    return cache_dir
+
+
+def _getCacheFilename(cache_key):
+    return os.path.join(
+        _getCacheDir(),
+        cache_key + ".xml"
+    )
+
+
+def _getDependenciesFilename(cache_filename):
+    return os.path.splitext(cache_filename)[0] + ".deps"
+
+
+def _areDependenciesUnchanged(cache_filename):
+    dependencies = _readCacheFile(_getDependenciesFilename(cache_filename))
+
+    for line in dependencies.splitlines():
+        hash_value, filename = line.split(' ', 1)
+
+        if hash_value != str(_getFileHash(filename)):
+            return False
+
+    return True
+
+
+def _readCacheFile(cache_filename):
+    with open(cache_filename, "rb") as cache_file:
+        text = cache_file.read()
+
+    if python_version >= 300:
+        text = text.decode("utf8")
+
+    return text
+
+
+def loadModuleTreesIntoMemory():
+    """ Read the cached trees into memory, for the compile server.
+
+        Only new and changed files are read again.
+    """
+
+    filenames = set()
+
+    for cache_filename, filename in listDir(_getCacheDir()):
+        if not filename.endswith(".xml"):
+            continue
+
+        filenames.add(cache_filename)
+
+        try:
+            stat = os.stat(cache_filename)
+
+            if cache_filename in _memory_trees and \
+               _memory_trees[cache_filename][0] == (stat.st_mtime, stat.st_size):
+                continue
+
+            text = _readCacheFile(cache_filename)
+
+            _memory_trees[cache_filename] = (
+                (stat.st_mtime, stat.st_size),
+                text,
+                TreeXML.fromString(text)
+            )
+        except (IOError, OSError, SyntaxError):
+            # Removed or partial files, XML parse errors are syntax errors.
+            _memory_trees.pop(cache_filename, None)
+
+    for cache_filename in set(_memory_trees) - filenames:
+        del _memory_trees[cache_filename]
+
+
+def _getCachedTree(cache_filename):
+    """ Text and XML of a cached tree, from memory if it is unchanged. """
+
+    if cache_filename in _memory_trees:
+        stat = os.stat(cache_filename)
+        file_info, text, xml = _memory_trees[cache_filename]
+
+        if file_info == (stat.st_mtime, stat.st_size):
+            return text, xml
+
+    text = _readCacheFile(cache_filename)
+
+    return text, TreeXML.fromString(text)
+
+
+def restoreModuleTree(module, source_code):
+    """ Restore the optimized tree of a module from the cache.
+
+        Returns "True" if that worked, otherwise the module is untouched, and
+        its tree will be stored when "storeModuleTrees" is called.
+    """
+
+    cache_key = _getCacheKey(module, source_code)
+    cache_filename = _getCacheFilename(cache_key)
+
+    if os.path.exists(cache_filename):
+        try:
+            if _areDependenciesUnchanged(cache_filename):
+                text, xml = _getCachedTree(cache_filename)
+
+                module.restoreFromXML(xml)
+
+                restored = module.asXmlText() == text
+            else:
+                restored = False
+        except (IOError, OSError, SyntaxError):
+            # Removed or partial files, XML parse errors are syntax errors.
+            restored = False
+
+        if restored:
+            if Options.isShowProgress():
+                info(
+                    "Restored optimized tree of '%s' from cache." % module.getFullName()
+                )
+
+            return True
+
+        if Options.isShowProgress():
+            info(
+                "Cached tree of '%s' is not usable, building it." % module.getFullName()
+            )
+
+        module.discardTree()
+
+    _module_cache_keys[module] = cache_key
+
+    return False
+
+
+def _writeCacheFile(cache_filename, contents):
+    if type(contents) is unicode:
+        contents = contents.encode("utf8")
+
+    # Write to a temporary file first, so concurrent compilations do not
+    # see partial files.
+    tmp_filename = "%s.%d.tmp" % (cache_filename, os.getpid())
+
+    with open(tmp_filename, "wb") as cache_file:
+        cache_file.write(contents)
+
+    if os.name == "nt" and os.path.exists(cache_filename):
+        os.unlink(cache_filename)
+
+    os.rename(tmp_filename, cache_filename)
+
+
+def storeModuleTrees():
+    """ Store the optimized trees of modules built from source. """
+
+    for module in ModuleRegistry.getDoneUserModules():
+        cache_key = _module_cache_keys.get(module)
+
+        if cache_key is None:
+            continue
+
+        # Modules demoted to bytecode, are not compiled, their tree is of no
+        # use.
+        if not module.isCompiledPythonModule() or module.mode != "compiled":
+            continue
+
+        text = module.asXmlText()
+
+        cache_filename = _getCacheFilename(cache_key)
+
+        dependencies = "".join(
+            "%s %s\n" % (_getFileHash(filename), filename)
+            for filename in
+            _getModuleDependencies(module)
+        )
+
+        # The dependencies are written first, a tree is not used without
+        # them.
+        _writeCacheFile(_getDependenciesFilename(cache_filename), dependencies)
+        _writeCacheFile(cache_filename, text)
+
+    _module_cache_keys.clear()
@@ -0,0 +1,415 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Part of "Nuitka", an optimizing Python compiler that is compatible and
+#     integrates with CPython, but also works on its own.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reading and changing the dynamic section of ELF files.
+
+This is used for standalone mode on Linux and BSD, to find the DLLs used by
+extension modules and libraries, and to remove their "RPATH" settings. It
+avoids running "ldd", "readelf", and "chrpath" for every file.
+
+Used DLLs are found like the dynamic loader does it, with "DT_RPATH", also the
+one of the loading ELF files, the "LD_LIBRARY_PATH" environment, "DT_RUNPATH",
+the loader cache, and default directories, in that order.
+"""
+
+import mmap
+import os
+import struct
+import subprocess
+
+# Program header and dynamic section values we care about.
+PT_LOAD = 1
+PT_DYNAMIC = 2
+
+DT_NULL = 0
+DT_NEEDED = 1
+DT_STRTAB = 5
+DT_STRSZ = 10
+DT_RPATH = 15
+DT_RUNPATH = 29
+
+
+class ElfError(Exception):
+    pass
+
+
+class ElfDynamicInfo(object):
+    """ The dynamic section of an ELF file.
+
+        Values are "bytes", as they are in the file.
+    """
+
+    __slots__ = ("elf_class", "machine", "needed", "rpath", "runpath")
+
+    def __init__(self, elf_class, machine, needed, rpath, runpath):
+        self.elf_class = elf_class
+        self.machine = machine
+
+        self.needed = needed
+        self.rpath = rpath
+        self.runpath = runpath
+
+    def isCompatible(self, other):
+        return self.elf_class == other.elf_class and \
+               self.machine == other.machine
+
+
+def _getHeaderFormats(data):
+    if data[:4] != b"\x7fELF":
+        raise ElfError("Not an ELF file.")
+
+    elf_class = data[4:5]
+    byte_order = {b"\x01" : '<', b"\x02" : '>'}.get(data[5:6])
+
+    if byte_order is None:
+        raise ElfError("Unknown ELF byte order.")
+
+    if elf_class == b"\x01":
+        return (
+            elf_class,
+            byte_order + "HHIIIIIHHHHHH",
+            byte_order + "IIIIIIII",
+            (1, 2, 3, 4),
+            byte_order + "iI"
+        )
+    elif elf_class == b"\x02":
+        return (
+            elf_class,
+            byte_order + "HHIQQQIHHHHHH",
+            byte_order + "IIQQQQQQ",
+            (2, 3, 4, 5),
+            byte_order + "qQ"
+        )
+    else:
+        raise ElfError("Unknown ELF class.")
+
+
+def _getDynamicEntries(data):
+    """ The machine, the dynamic section location, and its entries. """
+
+    elf_class, header_format, program_header_format, program_header_indexes, \
+      dynamic_format = _getHeaderFormats(data)
+
+    header = struct.unpack_from(header_format, data, 16)
+
+    machine = header[1]
+    program_header_offset = header[4]
+    program_header_size = header[8]
+    program_header_count = header[9]
+
+    offset_index, vaddr_index, _paddr_index, filesz_index = \
+      program_header_indexes
+
+    loads = []
+    dynamic = None
+
+    for count in range(program_header_count):
+        program_header = struct.unpack_from(
+            program_header_format,
+            data,
+            program_header_offset + count * program_header_size
+        )
+
+        if program_header[0] == PT_LOAD:
+            loads.append(
+                (
+                    program_header[vaddr_index],
+                    program_header[filesz_index],
+                    program_header[offset_index]
+                )
+            )
+        elif program_header[0] == PT_DYNAMIC:
+            dynamic = (
+                program_header[offset_index],
+                program_header[filesz_index]
+            )
+
+    entries = []
+
+    if dynamic is not None:
+        entry_size = struct.calcsize(dynamic_format)
+        dynamic_offset, dynamic_size = dynamic
+
+        for count in range(dynamic_size // entry_size):
+            tag, value = struct.unpack_from(
+                dynamic_format,
+                data,
+                dynamic_offset + count * entry_size
+            )
+
+            if tag == DT_NULL:
+                break
+
+            entries.append((tag, value))
+
+    return elf_class, machine, loads, dynamic, dynamic_format, entries
+
+
+def _getFileOffset(loads, address):
+    for vaddr, filesz, offset in loads:
+        if vaddr <= address < vaddr + filesz:
+            return address - vaddr + offset
+
+    raise ElfError("Address not in file.")
+
+
+def _withMappedFile(filename, writable, function):
+    with open(filename, "r+b" if writable else "rb") as elf_file:
+        data = mmap.mmap(
+            elf_file.fileno(),
+            0,
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+        )
+
+        try:
+            return function(data)
+        finally:
+            data.close()
+
+
+def getElfDynamicInfo(filename):
+    """ Read the dynamic section information of an ELF file. """
+
+    def readDynamicInfo(data):
+        elf_class, machine, loads, _dynamic, _dynamic_format, entries = \
+          _getDynamicEntries(data)
+
+        values = dict(entries)
+
+        if DT_STRTAB in values:
+            string_offset = _getFileOffset(loads, values[DT_STRTAB])
+            string_end = string_offset + values.get(DT_STRSZ, len(data))
+        else:
+            string_offset = string_end = 0
+
+        def getString(offset):
+            start = string_offset + offset
+            end = data.find(b"\0", start, string_end)
+
+            if end == -1:
+                raise ElfError("Unterminated string.")
+
+            return data[start:end]
+
+        needed = [
+            getString(value)
+            for tag, value in
+            entries
+            if tag == DT_NEEDED
+        ]
+
+        return ElfDynamicInfo(
+            elf_class = elf_class,
+            machine   = machine,
+            needed    = needed,
+            rpath     = getString(values[DT_RPATH]) if DT_RPATH in values else None,
+            runpath   = getString(values[DT_RUNPATH]) if DT_RUNPATH in values else None,
+        )
+
+    return _withMappedFile(filename, False, readDynamicInfo)
+
+
+def removeElfRPATH(filename):
+    """ Remove "DT_RPATH" and "DT_RUNPATH" entries in place.
+
+        Like "chrpath -d" does, the entries after it are moved up, and the
+        section is filled up with "DT_NULL" entries. Returns True if there
+        was anything removed.
+    """
+
+    def removeRPATH(data):
+        _elf_class, _machine, _loads, dynamic, dynamic_format, entries = \
+          _getDynamicEntries(data)
+
+        kept = [
+            entry
+            for entry in
+            entries
+            if entry[0] not in (DT_RPATH, DT_RUNPATH)
+        ]
+
+        if len(kept) == len(entries):
+            return False
+
+        entry_size = struct.calcsize(dynamic_format)
+        dynamic_offset, dynamic_size = dynamic
+
+        for count in range(dynamic_size // entry_size):
+            struct.pack_into(
+                dynamic_format,
+                data,
+                dynamic_offset + count * entry_size,
+                *(kept[count] if count < len(kept) else (DT_NULL, 0))
+            )
+
+        data.flush()
+
+        return True
+
+    return _withMappedFile(filename, True, removeRPATH)
+
+
+def _expandOrigin(path, origin):
+    for variable in (b"${ORIGIN}", b"$ORIGIN"):
+        path = path.replace(variable, origin)
+
+    return path
+
+
+def _splitSearchPath(value, origin):
+    if not value:
+        return []
+
+    return [
+        _expandOrigin(path, origin)
+        for path in
+        value.split(b':')
+        if path
+    ]
+
+
+_loader_cache = None
+
+def _getLoaderCache():
+    """ The libraries known to the loader cache, by their name. """
+
+    # This is a singleton, pylint: disable=global-statement
+    global _loader_cache
+
+    if _loader_cache is None:
+        _loader_cache = {}
+
+        try:
+            process = subprocess.Popen(
+                args   = ["/sbin/ldconfig", "-p"],
+                stdout = subprocess.PIPE,
+                stderr = subprocess.PIPE,
+            )
+        except OSError:
+            # Not all systems have that, BSD works without it too.
+            return _loader_cache
+
+        stdout, _stderr = process.communicate()
+
+        for line in stdout.splitlines()[1:]:
+            if b" => " not in line:
+                continue
+
+            left, right = line.strip().split(b" => ", 1)
+            left = left[:left.rfind(b" (")]
+
+            _loader_cache.setdefault(left, []).append(right)
+
+    return _loader_cache
+
+
+_default_dirs = (b"/lib", b"/usr/lib")
+_default_dirs_64 = (b"/lib64", b"/usr/lib64", b"/lib", b"/usr/lib")
+
+
+def _isCompatibleFile(filename, dynamic_info):
+    try:
+        return getElfDynamicInfo(filename).isCompatible(dynamic_info)
+    except (ElfError, EnvironmentError, ValueError):
+        return False
+
+
+def _getOrigin(filename):
+    origin = os.path.dirname(os.path.abspath(filename))
+
+    if type(origin) is not bytes:
+        origin = origin.encode("utf-8")
+
+    return origin
+
+
+def getInheritedRpath(filename, dynamic_info, inherited_rpath):
+    """ The "DT_RPATH" directories, the DLLs loaded by an ELF file inherit.
+
+        The loader also searches the "DT_RPATH" of the objects that caused a
+        DLL to be loaded, up to the executable, unless it has "DT_RUNPATH".
+    """
+
+    result = []
+
+    # Searching a directory twice finds nothing new, and for DLLs that load
+    # each other, this keeps it from growing.
+    for search_dir in _splitSearchPath(dynamic_info.rpath, _getOrigin(filename)) + \
+                      list(inherited_rpath):
+        if search_dir not in result:
+            result.append(search_dir)
+
+    return tuple(result)
+
+
+def resolveElfNeeded(filename, dynamic_info, library_path, inherited_rpath = ()):
+    """ Find the files for the used DLLs of an ELF file.
+
+        Returns the names of the used DLLs, and their filenames, or None, if
+        the loader would not find them with the search rules used here.
+        The library path is the value of "LD_LIBRARY_PATH" to use, and the
+        inherited "DT_RPATH" is from "getInheritedRpath" of the ELF files
+        that loaded this one.
+    """
+
+    origin = _getOrigin(filename)
+
+    # The "DT_RPATH" is ignored if "DT_RUNPATH" is present, and so is the one
+    # of the loading ELF files.
+    if dynamic_info.runpath is None:
+        search_dirs = list(
+            getInheritedRpath(filename, dynamic_info, inherited_rpath)
+        )
+    else:
+        search_dirs = []
+
+    search_dirs += _splitSearchPath(library_path, origin)
+    search_dirs += _splitSearchPath(dynamic_info.runpath, origin)
+
+    result = []
+
+    for needed in dynamic_info.needed:
+        if b'/' in needed:
+            candidates = [needed]
+        else:
+            candidates = [
+                os.path.join(search_dir, needed)
+                for search_dir in
+                search_dirs
+            ]
+
+            candidates += _getLoaderCache().get(needed, [])
+
+            candidates += [
+                os.path.join(default_dir, needed)
+                for default_dir in
+                (_default_dirs_64 if dynamic_info.elf_class == b"\x02" else _default_dirs)
+            ]
+
+        for candidate in candidates:
+            # Special values of the loader, like "$LIB", are not supported.
+            if b'$' in candidate:
+                return None
+
+            if os.path.isfile(candidate) and \
+               _isCompatibleFile(candidate, dynamic_info):
+                result.append((needed, os.path.normpath(candidate)))
+                break
+        else:
+            return None
+
+    return result
@@ -0,0 +1,693 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Binary operations, normal and in-place, for all pairs of value types.
+
+The operands are function parameters, so their type is not known, or
+constants of int, long, float, str, unicode, bytes, list and tuple, which
+select specialized helpers for the one type known. In-place operators must
+give their own errors, also where they are done like the normal ones.
+"""
+
+from __future__ import print_function
+
+import sys
+
+try:
+    long
+except NameError:
+    long = int
+
+operands = (
+    0,
+    5,
+    -3,
+    sys.maxsize,
+    -sys.maxsize - 1,
+    2 ** 100,
+    long(3),
+    1.5,
+    0.0,
+    "ab",
+    u"cd",
+    b"ef",
+    [1, 2],
+    (3, 4),
+)
+
+# Powers of these would not finish in reasonable time.
+huge_exponents = (sys.maxsize, 2 ** 100)
+
+# Binary operations with a constant as the left operand.
+def add_left_int(b): return 3 + b
+def add_left_zero(b): return 0 + b
+def add_left_minusone(b): return (-1) + b
+def add_left_long(b): return (2 ** 100) + b
+def add_left_float(b): return 1.5 + b
+def add_left_floatzero(b): return 0.0 + b
+def add_left_str(b): return "ab" + b
+def add_left_unicode(b): return u"cd" + b
+def add_left_bytes(b): return b"ef" + b
+def add_left_list(b): return [1, 2] + b
+def add_left_tuple(b): return (3, 4) + b
+
+def sub_left_int(b): return 3 - b
+def sub_left_zero(b): return 0 - b
+def sub_left_minusone(b): return (-1) - b
+def sub_left_long(b): return (2 ** 100) - b
+def sub_left_float(b): return 1.5 - b
+def sub_left_floatzero(b): return 0.0 - b
+def sub_left_str(b): return "ab" - b
+def sub_left_unicode(b): return u"cd" - b
+def sub_left_bytes(b): return b"ef" - b
+def sub_left_list(b): return [1, 2] - b
+def sub_left_tuple(b): return (3, 4) - b
+
+def mul_left_int(b): return 3 * b
+def mul_left_zero(b): return 0 * b
+def mul_left_minusone(b): return (-1) * b
+def mul_left_long(b): return (2 ** 100) * b
+def mul_left_float(b): return 1.5 * b
+def mul_left_floatzero(b): return 0.0 * b
+def mul_left_str(b): return "ab" * b
+def mul_left_unicode(b): return u"cd" * b
+def mul_left_bytes(b): return b"ef" * b
+def mul_left_list(b): return [1, 2] * b
+def mul_left_tuple(b): return (3, 4) * b
+
+def div_left_int(b): return 3 / b
+def div_left_zero(b): return 0 / b
+def div_left_minusone(b): return (-1) / b
+def div_left_long(b): return (2 ** 100) / b
+def div_left_float(b): return 1.5 / b
+def div_left_floatzero(b): return 0.0 / b
+def div_left_str(b): return "ab" / b
+def div_left_unicode(b): return u"cd" / b
+def div_left_bytes(b): return b"ef" / b
+def div_left_list(b): return [1, 2] / b
+def div_left_tuple(b): return (3, 4) / b
+
+def floordiv_left_int(b): return 3 // b
+def floordiv_left_zero(b): return 0 // b
+def floordiv_left_minusone(b): return (-1) // b
+def floordiv_left_long(b): return (2 ** 100) // b
+def floordiv_left_float(b): return 1.5 // b
+def floordiv_left_floatzero(b): return 0.0 // b
+def floordiv_left_str(b): return "ab" // b
+def floordiv_left_unicode(b): return u"cd" // b
+def floordiv_left_bytes(b): return b"ef" // b
+def floordiv_left_list(b): return [1, 2] // b
+def floordiv_left_tuple(b): return (3, 4) // b
+
+def mod_left_int(b): return 3 % b
+def mod_left_zero(b): return 0 % b
+def mod_left_minusone(b): return (-1) % b
+def mod_left_long(b): return (2 ** 100) % b
+def mod_left_float(b): return 1.5 % b
+def mod_left_floatzero(b): return 0.0 % b
+def mod_left_str(b): return "ab" % b
+def mod_left_unicode(b): return u"cd" % b
+def mod_left_bytes(b): return b"ef" % b
+def mod_left_list(b): return [1, 2] % b
+def mod_left_tuple(b): return (3, 4) % b
+
+def pow_left_int(b): return 3 ** b
+def pow_left_zero(b): return 0 ** b
+def pow_left_minusone(b): return (-1) ** b
+def pow_left_long(b): return (2 ** 100) ** b
+def pow_left_float(b): return 1.5 ** b
+def pow_left_floatzero(b): return 0.0 ** b
+def pow_left_str(b): return "ab" ** b
+def pow_left_unicode(b): return u"cd" ** b
+def pow_left_bytes(b): return b"ef" ** b
+def pow_left_list(b): return [1, 2] ** b
+def pow_left_tuple(b): return (3, 4) ** b
+
+def lshift_left_int(b): return 3 << b
+def lshift_left_zero(b): return 0 << b
+def lshift_left_minusone(b): return (-1) << b
+def lshift_left_long(b): return (2 ** 100) << b
+def lshift_left_float(b): return 1.5 << b
+def lshift_left_floatzero(b): return 0.0 << b
+def lshift_left_str(b): return "ab" << b
+def lshift_left_unicode(b): return u"cd" << b
+def lshift_left_bytes(b): return b"ef" << b
+def lshift_left_list(b): return [1, 2] << b
+def lshift_left_tuple(b): return (3, 4) << b
+
+def rshift_left_int(b): return 3 >> b
+def rshift_left_zero(b): return 0 >> b
+def rshift_left_minusone(b): return (-1) >> b
+def rshift_left_long(b): return (2 ** 100) >> b
+def rshift_left_float(b): return 1.5 >> b
+def rshift_left_floatzero(b): return 0.0 >> b
+def rshift_left_str(b): return "ab" >> b
+def rshift_left_unicode(b): return u"cd" >> b
+def rshift_left_bytes(b): return b"ef" >> b
+def rshift_left_list(b): return [1, 2] >> b
+def rshift_left_tuple(b): return (3, 4) >> b
+
+def bitand_left_int(b): return 3 & b
+def bitand_left_zero(b): return 0 & b
+def bitand_left_minusone(b): return (-1) & b
+def bitand_left_long(b): return (2 ** 100) & b
+def bitand_left_float(b): return 1.5 & b
+def bitand_left_floatzero(b): return 0.0 & b
+def bitand_left_str(b): return "ab" & b
+def bitand_left_unicode(b): return u"cd" & b
+def bitand_left_bytes(b): return b"ef" & b
+def bitand_left_list(b): return [1, 2] & b
+def bitand_left_tuple(b): return (3, 4) & b
+
+def bitor_left_int(b): return 3 | b
+def bitor_left_zero(b): return 0 | b
+def bitor_left_minusone(b): return (-1) | b
+def bitor_left_long(b): return (2 ** 100) | b
+def bitor_left_float(b): return 1.5 | b
+def bitor_left_floatzero(b): return 0.0 | b
+def bitor_left_str(b): return "ab" | b
+def bitor_left_unicode(b): return u"cd" | b
+def bitor_left_bytes(b): return b"ef" | b
+def bitor_left_list(b): return [1, 2] | b
+def bitor_left_tuple(b): return (3, 4) | b
+
+def bitxor_left_int(b): return 3 ^ b
+def bitxor_left_zero(b): return 0 ^ b
+def bitxor_left_minusone(b): return (-1) ^ b
+def bitxor_left_long(b): return (2 ** 100) ^ b
+def bitxor_left_float(b): return 1.5 ^ b
+def bitxor_left_floatzero(b): return 0.0 ^ b
+def bitxor_left_str(b): return "ab" ^ b
+def bitxor_left_unicode(b): return u"cd" ^ b
+def bitxor_left_bytes(b): return b"ef" ^ b
+def bitxor_left_list(b): return [1, 2] ^ b
+def bitxor_left_tuple(b): return (3, 4) ^ b
+
+# Binary operations with a constant as the right operand.
+def add_right_int(b): return b + 3
+def add_right_zero(b): return b + 0
+def add_right_minusone(b): return b + (-1)
+def add_right_long(b): return b + (2 ** 100)
+def add_right_float(b): return b + 1.5
+def add_right_floatzero(b): return b + 0.0
+def add_right_str(b): return b + "ab"
+def add_right_unicode(b): return b + u"cd"
+def add_right_bytes(b): return b + b"ef"
+def add_right_list(b): return b + [1, 2]
+def add_right_tuple(b): return b + (3, 4)
+
+def sub_right_int(b): return b - 3
+def sub_right_zero(b): return b - 0
+def sub_right_minusone(b): return b - (-1)
+def sub_right_long(b): return b - (2 ** 100)
+def sub_right_float(b): return b - 1.5
+def sub_right_floatzero(b): return b - 0.0
+def sub_right_str(b): return b - "ab"
+def sub_right_unicode(b): return b - u"cd"
+def sub_right_bytes(b): return b - b"ef"
+def sub_right_list(b): return b - [1, 2]
+def sub_right_tuple(b): return b - (3, 4)
+
+def mul_right_int(b): return b * 3
+def mul_right_zero(b): return b * 0
+def mul_right_minusone(b): return b * (-1)
+def mul_right_long(b): return b * (2 ** 100)
+def mul_right_float(b): return b * 1.5
+def mul_right_floatzero(b): return b * 0.0
+def mul_right_str(b): return b * "ab"
+def mul_right_unicode(b): return b * u"cd"
+def mul_right_bytes(b): return b * b"ef"
+def mul_right_list(b): return b * [1, 2]
+def mul_right_tuple(b): return b * (3, 4)
+
+def div_right_int(b): return b / 3
+def div_right_zero(b): return b / 0
+def div_right_minusone(b): return b / (-1)
+def div_right_long(b): return b / (2 ** 100)
+def div_right_float(b): return b / 1.5
+def div_right_floatzero(b): return b / 0.0
+def div_right_str(b): return b / "ab"
+def div_right_unicode(b): return b / u"cd"
+def div_right_bytes(b): return b / b"ef"
+def div_right_list(b): return b / [1, 2]
+def div_right_tuple(b): return b / (3, 4)
+
+def floordiv_right_int(b): return b // 3
+def floordiv_right_zero(b): return b // 0
+def floordiv_right_minusone(b): return b // (-1)
+def floordiv_right_long(b): return b // (2 ** 100)
+def floordiv_right_float(b): return b // 1.5
+def floordiv_right_floatzero(b): return b // 0.0
+def floordiv_right_str(b): return b // "ab"
+def floordiv_right_unicode(b): return b // u"cd"
+def floordiv_right_bytes(b): return b // b"ef"
+def floordiv_right_list(b): return b // [1, 2]
+def floordiv_right_tuple(b): return b // (3, 4)
+
+def mod_right_int(b): return b % 3
+def mod_right_zero(b): return b % 0
+def mod_right_minusone(b): return b % (-1)
+def mod_right_long(b): return b % (2 ** 100)
+def mod_right_float(b): return b % 1.5
+def mod_right_floatzero(b): return b % 0.0
+def mod_right_str(b): return b % "ab"
+def mod_right_unicode(b): return b % u"cd"
+def mod_right_bytes(b): return b % b"ef"
+def mod_right_list(b): return b % [1, 2]
+def mod_right_tuple(b): return b % (3, 4)
+
+def pow_right_int(b): return b ** 3
+def pow_right_zero(b): return b ** 0
+def pow_right_minusone(b): return b ** (-1)
+def pow_right_float(b): return b ** 1.5
+def pow_right_floatzero(b): return b ** 0.0
+def pow_right_str(b): return b ** "ab"
+def pow_right_unicode(b): return b ** u"cd"
+def pow_right_bytes(b): return b ** b"ef"
+def pow_right_list(b): return b ** [1, 2]
+def pow_right_tuple(b): return b ** (3, 4)
+
+def lshift_right_int(b): return b << 3
+def lshift_right_zero(b): return b << 0
+def lshift_right_minusone(b): return b << (-1)
+def lshift_right_long(b): return b << (2 ** 100)
+def lshift_right_float(b): return b << 1.5
+def lshift_right_floatzero(b): return b << 0.0
+def lshift_right_str(b): return b << "ab"
+def lshift_right_unicode(b): return b << u"cd"
+def lshift_right_bytes(b): return b << b"ef"
+def lshift_right_list(b): return b << [1, 2]
+def lshift_right_tuple(b): return b << (3, 4)
+
+def rshift_right_int(b): return b >> 3
+def rshift_right_zero(b): return b >> 0
+def rshift_right_minusone(b): return b >> (-1)
+def rshift_right_long(b): return b >> (2 ** 100)
+def rshift_right_float(b): return b >> 1.5
+def rshift_right_floatzero(b): return b >> 0.0
+def rshift_right_str(b): return b >> "ab"
+def rshift_right_unicode(b): return b >> u"cd"
+def rshift_right_bytes(b): return b >> b"ef"
+def rshift_right_list(b): return b >> [1, 2]
+def rshift_right_tuple(b): return b >> (3, 4)
+
+def bitand_right_int(b): return b & 3
+def bitand_right_zero(b): return b & 0
+def bitand_right_minusone(b): return b & (-1)
+def bitand_right_long(b): return b & (2 ** 100)
+def bitand_right_float(b): return b & 1.5
+def bitand_right_floatzero(b): return b & 0.0
+def bitand_right_str(b): return b & "ab"
+def bitand_right_unicode(b): return b & u"cd"
+def bitand_right_bytes(b): return b & b"ef"
+def bitand_right_list(b): return b & [1, 2]
+def bitand_right_tuple(b): return b & (3, 4)
+
+def bitor_right_int(b): return b | 3
+def bitor_right_zero(b): return b | 0
+def bitor_right_minusone(b): return b | (-1)
+def bitor_right_long(b): return b | (2 ** 100)
+def bitor_right_float(b): return b | 1.5
+def bitor_right_floatzero(b): return b | 0.0
+def bitor_right_str(b): return b | "ab"
+def bitor_right_unicode(b): return b | u"cd"
+def bitor_right_bytes(b): return b | b"ef"
+def bitor_right_list(b): return b | [1, 2]
+def bitor_right_tuple(b): return b | (3, 4)
+
+def bitxor_right_int(b): return b ^ 3
+def bitxor_right_zero(b): return b ^ 0
+def bitxor_right_minusone(b): return b ^ (-1)
+def bitxor_right_long(b): return b ^ (2 ** 100)
+def bitxor_right_float(b): return b ^ 1.5
+def bitxor_right_floatzero(b): return b ^ 0.0
+def bitxor_right_str(b): return b ^ "ab"
+def bitxor_right_unicode(b): return b ^ u"cd"
+def bitxor_right_bytes(b): return b ^ b"ef"
+def bitxor_right_list(b): return b ^ [1, 2]
+def bitxor_right_tuple(b): return b ^ (3, 4)
+
+# In-place operations with a constant as the left operand.
+def inplace_add_left_int(b): a = 3; a += b; return a
+def inplace_add_left_zero(b): a = 0; a += b; return a
+def inplace_add_left_minusone(b): a = (-1); a += b; return a
+def inplace_add_left_long(b): a = (2 ** 100); a += b; return a
+def inplace_add_left_float(b): a = 1.5; a += b; return a
+def inplace_add_left_floatzero(b): a = 0.0; a += b; return a
+def inplace_add_left_str(b): a = "ab"; a += b; return a
+def inplace_add_left_unicode(b): a = u"cd"; a += b; return a
+def inplace_add_left_bytes(b): a = b"ef"; a += b; return a
+def inplace_add_left_list(b): a = [1, 2]; a += b; return a
+def inplace_add_left_tuple(b): a = (3, 4); a += b; return a
+
+def inplace_sub_left_int(b): a = 3; a -= b; return a
+def inplace_sub_left_zero(b): a = 0; a -= b; return a
+def inplace_sub_left_minusone(b): a = (-1); a -= b; return a
+def inplace_sub_left_long(b): a = (2 ** 100); a -= b; return a
+def inplace_sub_left_float(b): a = 1.5; a -= b; return a
+def inplace_sub_left_floatzero(b): a = 0.0; a -= b; return a
+def inplace_sub_left_str(b): a = "ab"; a -= b; return a
+def inplace_sub_left_unicode(b): a = u"cd"; a -= b; return a
+def inplace_sub_left_bytes(b): a = b"ef"; a -= b; return a
+def inplace_sub_left_list(b): a = [1, 2]; a -= b; return a
+def inplace_sub_left_tuple(b): a = (3, 4); a -= b; return a
+
+def inplace_mul_left_int(b): a = 3; a *= b; return a
+def inplace_mul_left_zero(b): a = 0; a *= b; return a
+def inplace_mul_left_minusone(b): a = (-1); a *= b; return a
+def inplace_mul_left_long(b): a = (2 ** 100); a *= b; return a
+def inplace_mul_left_float(b): a = 1.5; a *= b; return a
+def inplace_mul_left_floatzero(b): a = 0.0; a *= b; return a
+def inplace_mul_left_str(b): a = "ab"; a *= b; return a
+def inplace_mul_left_unicode(b): a = u"cd"; a *= b; return a
+def inplace_mul_left_bytes(b): a = b"ef"; a *= b; return a
+def inplace_mul_left_list(b): a = [1, 2]; a *= b; return a
+def inplace_mul_left_tuple(b): a = (3, 4); a *= b; return a
+
+def inplace_div_left_int(b): a = 3; a /= b; return a
+def inplace_div_left_zero(b): a = 0; a /= b; return a
+def inplace_div_left_minusone(b): a = (-1); a /= b; return a
+def inplace_div_left_long(b): a = (2 ** 100); a /= b; return a
+def inplace_div_left_float(b): a = 1.5; a /= b; return a
+def inplace_div_left_floatzero(b): a = 0.0; a /= b; return a
+def inplace_div_left_str(b): a = "ab"; a /= b; return a
+def inplace_div_left_unicode(b): a = u"cd"; a /= b; return a
+def inplace_div_left_bytes(b): a = b"ef"; a /= b; return a
+def inplace_div_left_list(b): a = [1, 2]; a /= b; return a
+def inplace_div_left_tuple(b): a = (3, 4); a /= b; return a
+
+def inplace_floordiv_left_int(b): a = 3; a //= b; return a
+def inplace_floordiv_left_zero(b): a = 0; a //= b; return a
+def inplace_floordiv_left_minusone(b): a = (-1); a //= b; return a
+def inplace_floordiv_left_long(b): a = (2 ** 100); a //= b; return a
+def inplace_floordiv_left_float(b): a = 1.5; a //= b; return a
+def inplace_floordiv_left_floatzero(b): a = 0.0; a //= b; return a
+def inplace_floordiv_left_str(b): a = "ab"; a //= b; return a
+def inplace_floordiv_left_unicode(b): a = u"cd"; a //= b; return a
+def inplace_floordiv_left_bytes(b): a = b"ef"; a //= b; return a
+def inplace_floordiv_left_list(b): a = [1, 2]; a //= b; return a
+def inplace_floordiv_left_tuple(b): a = (3, 4); a //= b; return a
+
+def inplace_mod_left_int(b): a = 3; a %= b; return a
+def inplace_mod_left_zero(b): a = 0; a %= b; return a
+def inplace_mod_left_minusone(b): a = (-1); a %= b; return a
+def inplace_mod_left_long(b): a = (2 ** 100); a %= b; return a
+def inplace_mod_left_float(b): a = 1.5; a %= b; return a
+def inplace_mod_left_floatzero(b): a = 0.0; a %= b; return a
+def inplace_mod_left_str(b): a = "ab"; a %= b; return a
+def inplace_mod_left_unicode(b): a = u"cd"; a %= b; return a
+def inplace_mod_left_bytes(b): a = b"ef"; a %= b; return a
+def inplace_mod_left_list(b): a = [1, 2]; a %= b; return a
+def inplace_mod_left_tuple(b): a = (3, 4); a %= b; return a
+
+def inplace_pow_left_int(b): a = 3; a **= b; return a
+def inplace_pow_left_zero(b): a = 0; a **= b; return a
+def inplace_pow_left_minusone(b): a = (-1); a **= b; return a
+def inplace_pow_left_long(b): a = (2 ** 100); a **= b; return a
+def inplace_pow_left_float(b): a = 1.5; a **= b; return a
+def inplace_pow_left_floatzero(b): a = 0.0; a **= b; return a
+def inplace_pow_left_str(b): a = "ab"; a **= b; return a
+def inplace_pow_left_unicode(b): a = u"cd"; a **= b; return a
+def inplace_pow_left_bytes(b): a = b"ef"; a **= b; return a
+def inplace_pow_left_list(b): a = [1, 2]; a **= b; return a
+def inplace_pow_left_tuple(b): a = (3, 4); a **= b; return a
+
+def inplace_lshift_left_int(b): a = 3; a <<= b; return a
+def inplace_lshift_left_zero(b): a = 0; a <<= b; return a
+def inplace_lshift_left_minusone(b): a = (-1); a <<= b; return a
+def inplace_lshift_left_long(b): a = (2 ** 100); a <<= b; return a
+def inplace_lshift_left_float(b): a = 1.5; a <<= b; return a
+def inplace_lshift_left_floatzero(b): a = 0.0; a <<= b; return a
+def inplace_lshift_left_str(b): a = "ab"; a <<= b; return a
+def inplace_lshift_left_unicode(b): a = u"cd"; a <<= b; return a
+def inplace_lshift_left_bytes(b): a = b"ef"; a <<= b; return a
+def inplace_lshift_left_list(b): a = [1, 2]; a <<= b; return a
+def inplace_lshift_left_tuple(b): a = (3, 4); a <<= b; return a
+
+def inplace_rshift_left_int(b): a = 3; a >>= b; return a
+def inplace_rshift_left_zero(b): a = 0; a >>= b; return a
+def inplace_rshift_left_minusone(b): a = (-1); a >>= b; return a
+def inplace_rshift_left_long(b): a = (2 ** 100); a >>= b; return a
+def inplace_rshift_left_float(b): a = 1.5; a >>= b; return a
+def inplace_rshift_left_floatzero(b): a = 0.0; a >>= b; return a
+def inplace_rshift_left_str(b): a = "ab"; a >>= b; return a
+def inplace_rshift_left_unicode(b): a = u"cd"; a >>= b; return a
+def inplace_rshift_left_bytes(b): a = b"ef"; a >>= b; return a
+def inplace_rshift_left_list(b): a = [1, 2]; a >>= b; return a
+def inplace_rshift_left_tuple(b): a = (3, 4); a >>= b; return a
+
+def inplace_bitand_left_int(b): a = 3; a &= b; return a
+def inplace_bitand_left_zero(b): a = 0; a &= b; return a
+def inplace_bitand_left_minusone(b): a = (-1); a &= b; return a
+def inplace_bitand_left_long(b): a = (2 ** 100); a &= b; return a
+def inplace_bitand_left_float(b): a = 1.5; a &= b; return a
+def inplace_bitand_left_floatzero(b): a = 0.0; a &= b; return a
+def inplace_bitand_left_str(b): a = "ab"; a &= b; return a
+def inplace_bitand_left_unicode(b): a = u"cd"; a &= b; return a
+def inplace_bitand_left_bytes(b): a = b"ef"; a &= b; return a
+def inplace_bitand_left_list(b): a = [1, 2]; a &= b; return a
+def inplace_bitand_left_tuple(b): a = (3, 4); a &= b; return a
+
+def inplace_bitor_left_int(b): a = 3; a |= b; return a
+def inplace_bitor_left_zero(b): a = 0; a |= b; return a
+def inplace_bitor_left_minusone(b): a = (-1); a |= b; return a
+def inplace_bitor_left_long(b): a = (2 ** 100); a |= b; return a
+def inplace_bitor_left_float(b): a = 1.5; a |= b; return a
+def inplace_bitor_left_floatzero(b): a = 0.0; a |= b; return a
+def inplace_bitor_left_str(b): a = "ab"; a |= b; return a
+def inplace_bitor_left_unicode(b): a = u"cd"; a |= b; return a
+def inplace_bitor_left_bytes(b): a = b"ef"; a |= b; return a
+def inplace_bitor_left_list(b): a = [1, 2]; a |= b; return a
+def inplace_bitor_left_tuple(b): a = (3, 4); a |= b; return a
+
+def inplace_bitxor_left_int(b): a = 3; a ^= b; return a
+def inplace_bitxor_left_zero(b): a = 0; a ^= b; return a
+def inplace_bitxor_left_minusone(b): a = (-1); a ^= b; return a
+def inplace_bitxor_left_long(b): a = (2 ** 100); a ^= b; return a
+def inplace_bitxor_left_float(b): a = 1.5; a ^= b; return a
+def inplace_bitxor_left_floatzero(b): a = 0.0; a ^= b; return a
+def inplace_bitxor_left_str(b): a = "ab"; a ^= b; return a
+def inplace_bitxor_left_unicode(b): a = u"cd"; a ^= b; return a
+def inplace_bitxor_left_bytes(b): a = b"ef"; a ^= b; return a
+def inplace_bitxor_left_list(b): a = [1, 2]; a ^= b; return a
+def inplace_bitxor_left_tuple(b): a = (3, 4); a ^= b; return a
+
+# In-place operations with a constant as the right operand.
+def inplace_add_right_int(b): b += 3; return b
+def inplace_add_right_zero(b): b += 0; return b
+def inplace_add_right_minusone(b): b += (-1); return b
+def inplace_add_right_long(b): b += (2 ** 100); return b
+def inplace_add_right_float(b): b += 1.5; return b
+def inplace_add_right_floatzero(b): b += 0.0; return b
+def inplace_add_right_str(b): b += "ab"; return b
+def inplace_add_right_unicode(b): b += u"cd"; return b
+def inplace_add_right_bytes(b): b += b"ef"; return b
+def inplace_add_right_list(b): b += [1, 2]; return b
+def inplace_add_right_tuple(b): b += (3, 4); return b
+
+def inplace_sub_right_int(b): b -= 3; return b
+def inplace_sub_right_zero(b): b -= 0; return b
+def inplace_sub_right_minusone(b): b -= (-1); return b
+def inplace_sub_right_long(b): b -= (2 ** 100); return b
+def inplace_sub_right_float(b): b -= 1.5; return b
+def inplace_sub_right_floatzero(b): b -= 0.0; return b
+def inplace_sub_right_str(b): b -= "ab"; return b
+def inplace_sub_right_unicode(b): b -= u"cd"; return b
+def inplace_sub_right_bytes(b): b -= b"ef"; return b
+def inplace_sub_right_list(b): b -= [1, 2]; return b
+def inplace_sub_right_tuple(b): b -= (3, 4); return b
+
+def inplace_mul_right_int(b): b *= 3; return b
+def inplace_mul_right_zero(b): b *= 0; return b
+def inplace_mul_right_minusone(b): b *= (-1); return b
+def inplace_mul_right_long(b): b *= (2 ** 100); return b
+def inplace_mul_right_float(b): b *= 1.5; return b
+def inplace_mul_right_floatzero(b): b *= 0.0; return b
+def inplace_mul_right_str(b): b *= "ab"; return b
+def inplace_mul_right_unicode(b): b *= u"cd"; return b
+def inplace_mul_right_bytes(b): b *= b"ef"; return b
+def inplace_mul_right_list(b): b *= [1, 2]; return b
+def inplace_mul_right_tuple(b): b *= (3, 4); return b
+
+def inplace_div_right_int(b): b /= 3; return b
+def inplace_div_right_zero(b): b /= 0; return b
+def inplace_div_right_minusone(b): b /= (-1); return b
+def inplace_div_right_long(b): b /= (2 ** 100); return b
+def inplace_div_right_float(b): b /= 1.5; return b
+def inplace_div_right_floatzero(b): b /= 0.0; return b
+def inplace_div_right_str(b): b /= "ab"; return b
+def inplace_div_right_unicode(b): b /= u"cd"; return b
+def inplace_div_right_bytes(b): b /= b"ef"; return b
+def inplace_div_right_list(b): b /= [1, 2]; return b
+def inplace_div_right_tuple(b): b /= (3, 4); return b
+
+def inplace_floordiv_right_int(b): b //= 3; return b
+def inplace_floordiv_right_zero(b): b //= 0; return b
+def inplace_floordiv_right_minusone(b): b //= (-1); return b
+def inplace_floordiv_right_long(b): b //= (2 ** 100); return b
+def inplace_floordiv_right_float(b): b //= 1.5; return b
+def inplace_floordiv_right_floatzero(b): b //= 0.0; return b
+def inplace_floordiv_right_str(b): b //= "ab"; return b
+def inplace_floordiv_right_unicode(b): b //= u"cd"; return b
+def inplace_floordiv_right_bytes(b): b //= b"ef"; return b
+def inplace_floordiv_right_list(b): b //= [1, 2]; return b
+def inplace_floordiv_right_tuple(b): b //= (3, 4); return b
+
+def inplace_mod_right_int(b): b %= 3; return b
+def inplace_mod_right_zero(b): b %= 0; return b
+def inplace_mod_right_minusone(b): b %= (-1); return b
+def inplace_mod_right_long(b): b %= (2 ** 100); return b
+def inplace_mod_right_float(b): b %= 1.5; return b
+def inplace_mod_right_floatzero(b): b %= 0.0; return b
+def inplace_mod_right_str(b): b %= "ab"; return b
+def inplace_mod_right_unicode(b): b %= u"cd"; return b
+def inplace_mod_right_bytes(b): b %= b"ef"; return b
+def inplace_mod_right_list(b): b %= [1, 2]; return b
+def inplace_mod_right_tuple(b): b %= (3, 4); return b
+
+def inplace_pow_right_int(b): b **= 3; return b
+def inplace_pow_right_zero(b): b **= 0; return b
+def inplace_pow_right_minusone(b): b **= (-1); return b
+def inplace_pow_right_float(b): b **= 1.5; return b
+def inplace_pow_right_floatzero(b): b **= 0.0; return b
+def inplace_pow_right_str(b): b **= "ab"; return b
+def inplace_pow_right_unicode(b): b **= u"cd"; return b
+def inplace_pow_right_bytes(b): b **= b"ef"; return b
+def inplace_pow_right_list(b): b **= [1, 2]; return b
+def inplace_pow_right_tuple(b): b **= (3, 4); return b
+
+def inplace_lshift_right_int(b): b <<= 3; return b
+def inplace_lshift_right_zero(b): b <<= 0; return b
+def inplace_lshift_right_minusone(b): b <<= (-1); return b
+def inplace_lshift_right_long(b): b <<= (2 ** 100); return b
+def inplace_lshift_right_float(b): b <<= 1.5; return b
+def inplace_lshift_right_floatzero(b): b <<= 0.0; return b
+def inplace_lshift_right_str(b): b <<= "ab"; return b
+def inplace_lshift_right_unicode(b): b <<= u"cd"; return b
+def inplace_lshift_right_bytes(b): b <<= b"ef"; return b
+def inplace_lshift_right_list(b): b <<= [1, 2]; return b
+def inplace_lshift_right_tuple(b): b <<= (3, 4); return b
+
+def inplace_rshift_right_int(b): b >>= 3; return b
+def inplace_rshift_right_zero(b): b >>= 0; return b
+def inplace_rshift_right_minusone(b): b >>= (-1); return b
+def inplace_rshift_right_long(b): b >>= (2 ** 100); return b
+def inplace_rshift_right_float(b): b >>= 1.5; return b
+def inplace_rshift_right_floatzero(b): b >>= 0.0; return b
+def inplace_rshift_right_str(b): b >>= "ab"; return b
+def inplace_rshift_right_unicode(b): b >>= u"cd"; return b
+def inplace_rshift_right_bytes(b): b >>= b"ef"; return b
+def inplace_rshift_right_list(b): b >>= [1, 2]; return b
+def inplace_rshift_right_tuple(b): b >>= (3, 4); return b
+
+def inplace_bitand_right_int(b): b &= 3; return b
+def inplace_bitand_right_zero(b): b &= 0; return b
+def inplace_bitand_right_minusone(b): b &= (-1); return b
+def inplace_bitand_right_long(b): b &= (2 ** 100); return b
+def inplace_bitand_right_float(b): b &= 1.5; return b
+def inplace_bitand_right_floatzero(b): b &= 0.0; return b
+def inplace_bitand_right_str(b): b &= "ab"; return b
+def inplace_bitand_right_unicode(b): b &= u"cd"; return b
+def inplace_bitand_right_bytes(b): b &= b"ef"; return b
+def inplace_bitand_right_list(b): b &= [1, 2]; return b
+def inplace_bitand_right_tuple(b): b &= (3, 4); return b
+
+def inplace_bitor_right_int(b): b |= 3; return b
+def inplace_bitor_right_zero(b): b |= 0; return b
+def inplace_bitor_right_minusone(b): b |= (-1); return b
+def inplace_bitor_right_long(b): b |= (2 ** 100); return b
+def inplace_bitor_right_float(b): b |= 1.5; return b
+def inplace_bitor_right_floatzero(b): b |= 0.0; return b
+def inplace_bitor_right_str(b): b |= "ab"; return b
+def inplace_bitor_right_unicode(b): b |= u"cd"; return b
+def inplace_bitor_right_bytes(b): b |= b"ef"; return b
+def inplace_bitor_right_list(b): b |= [1, 2]; return b
+def inplace_bitor_right_tuple(b): b |= (3, 4); return b
+
+def inplace_bitxor_right_int(b): b ^= 3; return b
+def inplace_bitxor_right_zero(b): b ^= 0; return b
+def inplace_bitxor_right_minusone(b): b ^= (-1); return b
+def inplace_bitxor_right_long(b): b ^= (2 ** 100); return b
+def inplace_bitxor_right_float(b): b ^= 1.5; return b
+def inplace_bitxor_right_floatzero(b): b ^= 0.0; return b
+def inplace_bitxor_right_str(b): b ^= "ab"; return b
+def inplace_bitxor_right_unicode(b): b ^= u"cd"; return b
+def inplace_bitxor_right_bytes(b): b ^= b"ef"; return b
+def inplace_bitxor_right_list(b): b ^= [1, 2]; return b
+def inplace_bitxor_right_tuple(b): b ^= (3, 4); return b
+
+# Operations with both operands unknown.
+def add_unknown(a, b): return a + b
+def sub_unknown(a, b): return a - b
+def mul_unknown(a, b): return a * b
+def div_unknown(a, b): return a / b
+def floordiv_unknown(a, b): return a // b
+def mod_unknown(a, b): return a % b
+def pow_unknown(a, b): return a ** b
+def lshift_unknown(a, b): return a << b
+def rshift_unknown(a, b): return a >> b
+def bitand_unknown(a, b): return a & b
+def bitor_unknown(a, b): return a | b
+def bitxor_unknown(a, b): return a ^ b
+
+def inplace_add_unknown(a, b): a += b; return a
+def inplace_sub_unknown(a, b): a -= b; return a
+def inplace_mul_unknown(a, b): a *= b; return a
+def inplace_div_unknown(a, b): a /= b; return a
+def inplace_floordiv_unknown(a, b): a //= b; return a
+def inplace_mod_unknown(a, b): a %= b; return a
+def inplace_pow_unknown(a, b): a **= b; return a
+def inplace_lshift_unknown(a, b): a <<= b; return a
+def inplace_rshift_unknown(a, b): a >>= b; return a
+def inplace_bitand_unknown(a, b): a &= b; return a
+def inplace_bitor_unknown(a, b): a |= b; return a
+def inplace_bitxor_unknown(a, b): a ^= b; return a
+
+def copyOperand(value):
+    # In-place operations change lists, so each call gets a fresh one.
+    return list(value) if type(value) is list else value
+
+def execute(function, *args):
+    try:
+        return repr(function(*[copyOperand(arg) for arg in args]))
+    except Exception as e:
+        return "%s: %s" % (e.__class__.__name__, e)
+
+def isHugePower(name, *args):
+    # The parameter is the exponent, unless the constant is on the right.
+    return "pow" in name and "_right_" not in name and args[-1] in huge_exponents
+
+for name in sorted(dir()):
+    function = globals()[name]
+
+    if not name.endswith("_unknown") and ("_left_" in name or "_right_" in name):
+        for operand in operands:
+            if isHugePower(name, operand):
+                continue
+
+            print(name, repr(operand), execute(function, operand))
+
+for name in sorted(dir()):
+    function = globals()[name]
+
+    if name.endswith("_unknown"):
+        for left in operands:
+            for right in operands:
+                if isHugePower(name, left, right):
+                    continue
+
+                print(name, repr(left), repr(right), execute(function, left, right))
@@ -65,3 +65,43 @@ defaultValueTest6.func_defaults = ([1,2,3],)
 print(defaultValueTest6.__defaults__)
 
 print(defaultValueTest6(1))
+
+def defaultValueTest7(a, b = 2, c = 3):
+    return a, b, c
+
+def defaultValueTest7Replacement(a, b = 20, c = 30):
+    return "replaced", a, b, c
+
+# These calls to a module level function are made to its C code directly,
+# when at run time it is still the same function.
+def callDefaultValueTest7():
+    return (
+        defaultValueTest7(1),
+        defaultValueTest7(1, 5),
+        defaultValueTest7(1, c = 6),
+        defaultValueTest7(a = 1, b = 5, c = 6)
+    )
+
+print("Direct calls:", callDefaultValueTest7())
+
+defaultValueTest7.__defaults__ = (7, 8)
+print("Changed default values:", callDefaultValueTest7())
+
+globals()["defaultValueTest7"] = defaultValueTest7Replacement
+print("Rebound to other function:", callDefaultValueTest7())
+
+globals()["defaultValueTest7"] = lambda a, b = 0, c = 0: ("lambda", a, b, c)
+print("Rebound to lambda:", callDefaultValueTest7())
+
+class CallableObject:
+    def __call__(self, a, b = -1, c = -2):
+        return "object", a, b, c
+
+globals()["defaultValueTest7"] = CallableObject()
+print("Rebound to callable object:", callDefaultValueTest7())
+
+del globals()["defaultValueTest7"]
+try:
+    callDefaultValueTest7()
+except NameError as e:
+    print("Deleted:", repr(e))
@@ -472,6 +472,27 @@ d = { "other" : 7, 'c' : 3 }
 
 print("Dual star args consuming function", posDoubleStarArgsFunction(1,  *l, **d))
 
+class ClassWithConstantKeywords(object):
+    def __init__(self, x, y):
+        self.values = x, y
+
+class ClassWithStarDict(object):
+    def __init__(self, a, **kw):
+        # Must not change the keyword arguments of the next call.
+        kw["changed"] = True
+        self.values = a, sorted(kw.items())
+
+def constantKeywordCalls():
+    # Keyword arguments that are constant, given to classes, which are not
+    # compiled functions, and take them as a dictionary.
+    for _i in range(2):
+        print("Class called with constant keywords", ClassWithConstantKeywords(x = 1, y = 2).values)
+        print("Class called with positional and constant keywords", ClassWithConstantKeywords(1, y = 2).values)
+        print("Class with star dict called with constant keywords", ClassWithStarDict(1, b = 2, c = 3).values)
+        print("Builtin called with constant keywords", sorted(dict(a = 1, b = 2).items()))
+
+constantKeywordCalls()
+
 import inspect, sys
 
 for value in sorted(dir()):
@@ -119,6 +119,32 @@ def kwonlystarfunc(*, a, b, **d):
 
 print("kwonlystarfunc", kwonlystarfunc(a = 8, b = 12, k = 9, j = 7))
 
+def callWithKeywords(called):
+    # The function is not known here, keyword arguments are passed as values
+    # with a tuple of their names.
+    return called(1, b = 2, a = 3, k = 4)
+
+def kwonlymixedfunc(x, *, a, b, k = 9):
+    return x, a, b, k
+
+def kwonlymixeddefaultedfunc(x, y = 5, *, a, b = 7, k):
+    return x, y, a, b, k
+
+def kwonlymixedstarfunc(x, *, a, **d):
+    return x, a, sorted(d.items())
+
+def starfunc(x, **d):
+    return x, sorted(d.items())
+
+for called in (kwonlymixedfunc, kwonlymixeddefaultedfunc, kwonlymixedstarfunc, starfunc):
+    print(called.__name__, callWithKeywords(called))
+
+class ClassWithKeywordOnly:
+    def method(self, x, *, a, b, k):
+        return x, a, b, k
+
+print("Method called with keyword arguments", callWithKeywords(ClassWithKeywordOnly().method))
+
 def deeplyNestedNonLocalWrite():
     x = 0
     y = 0
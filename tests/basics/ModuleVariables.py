@@ -0,0 +1,104 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Reading module variables after changes not done by assignments.
+
+Reads of module variables may be cached, these changes must be noticed.
+"""
+
+from __future__ import print_function
+
+import sys
+
+try:
+    import __builtin__ as builtins
+except ImportError:
+    import builtins
+
+x = 1
+
+def readX():
+    try:
+        return x
+    except NameError as e:
+        return "NameError: " + str(e)
+
+def readLen():
+    return len("abc")
+
+def incrementX():
+    global x
+
+    x += 1
+
+this_module = sys.modules[__name__]
+
+print("Initial:", readX(), readX())
+
+globals()["x"] = 2
+print("After globals() write:", readX())
+
+incrementX()
+print("After in-place global write:", readX())
+
+for count in range(3):
+    globals()["x"] = count * 10
+    print("Loop globals() write:", readX())
+
+setattr(this_module, 'x', 3)
+print("After setattr on module:", readX())
+
+this_module.x = 4
+print("After module attribute assignment:", readX())
+
+del globals()['x']
+print("After del globals() item:", readX())
+
+globals()['x'] = 5
+print("After globals() write again:", readX())
+
+delattr(this_module, 'x')
+print("After delattr on module:", readX())
+
+x = 6
+print("After module level assignment:", readX())
+
+globals().update(x = 7)
+print("After globals() update:", readX())
+
+print("Built-in len:", readLen())
+
+def len(value):
+    return "shadowed"
+
+print("Shadowed by module variable:", readLen())
+
+del len
+print("Un-shadowed by deleting it:", readLen())
+
+globals()["len"] = lambda value: "shadowed again"
+print("Shadowed through globals():", readLen())
+
+globals().pop("len")
+print("Un-shadowed through globals():", readLen())
+
+original_len = builtins.len
+builtins.len = lambda value: "replaced built-in"
+print("Built-in replaced:", readLen())
+
+builtins.len = original_len
+print("Built-in restored:", readLen())
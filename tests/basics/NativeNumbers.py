@@ -0,0 +1,193 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Local variables only holding "int" and "float" values.
+
+These may be kept as C values, which must behave the same as objects, also
+when the values overflow or the operation fails.
+"""
+
+from __future__ import print_function
+
+import sys
+
+def describe(value):
+    return "%s %r" % (type(value).__name__, value)
+
+def intOverflow():
+    x = 1
+
+    for count in range(70):
+        x = x * 2
+
+        if count > 60:
+            print("Doubled:", count, describe(x))
+
+    y = -1
+    for count in range(70):
+        y = y * 3 - 1
+
+    print("Negative:", describe(y))
+
+    z = 2147483647
+    for count in range(3):
+        z = z * z + 1
+
+    print("Squared:", describe(z))
+
+def intBoundaries():
+    half = 1
+
+    while half < sys.maxsize // 2:
+        half = half * 2
+
+    top = half - 1 + half
+    print("Largest is maxsize:", top == sys.maxsize, describe(top - sys.maxsize))
+
+    above = top + 1
+    below = top - 1
+    print("Above:", describe(above - sys.maxsize), above > top)
+    print("Below:", describe(below - sys.maxsize), below < top)
+
+    bottom = 0 - top - 1
+    print("Smallest:", bottom == -sys.maxsize - 1)
+
+    under = bottom - 1
+    print("Under:", describe(under + sys.maxsize), under < bottom)
+
+    product = bottom * -1
+    print("Negated smallest:", describe(product - sys.maxsize))
+
+    product = top * 2
+    print("Doubled largest:", describe(product - sys.maxsize))
+
+    product = half * half
+    print("Squared half:", describe(product // sys.maxsize))
+
+def divisions():
+    a = 7.5
+    b = 0.0
+    c = 3
+
+    for count in range(3):
+        try:
+            r = a / b
+        except ZeroDivisionError as e:
+            print("Float division by zero:", count, e)
+        else:
+            print("Float division:", count, describe(r))
+
+        b = b + 2.5
+
+    i = 7
+    j = 0
+
+    for count in range(3):
+        try:
+            r = i / j
+        except ZeroDivisionError as e:
+            print("Int division by zero:", count, e)
+        else:
+            print("Int division:", count, describe(r))
+
+        try:
+            r = a / j
+        except ZeroDivisionError as e:
+            print("Float by int division by zero:", count, e)
+        else:
+            print("Float by int division:", count, describe(r))
+
+        try:
+            r = c / b
+        except ZeroDivisionError as e:
+            print("Int by float division by zero:", count, e)
+        else:
+            print("Int by float division:", count, describe(r))
+
+        j = j + 1
+
+def mixedOperands():
+    f = 0.5
+    i = 3
+
+    for count in range(3):
+        r = i * f + i
+        s = f - i
+        t = i + f * i
+        print("Mixed:", describe(r), describe(s), describe(t))
+
+        i = i + 1
+        f = f * 3
+
+    big = 1e300
+    for count in range(3):
+        big = big * 1e5
+
+    print("Float overflow:", describe(big), describe(big - big))
+
+    n = 9007199254740993
+    g = 0.0
+    g = g + n
+    print("Large int to float:", describe(g))
+
+def localsAfterAssignments():
+    a = 1
+    b = 2.0
+
+    for count in range(2):
+        a = a * 5 + 1
+        b = b / 4
+
+    print("Locals:", sorted(locals().items()))
+
+    del a
+    print("Locals after del:", sorted(locals().items()))
+
+    try:
+        a = a + 1
+    except NameError as e:
+        print("Use after del:", e)
+
+    a = 10
+    print("Assigned again:", describe(a + 1))
+
+    del b
+    try:
+        print(b)
+    except NameError as e:
+        print("Use after del:", e)
+
+def inplaceOperations():
+    x = 1
+    y = 1.0
+
+    for count in range(70):
+        x += x
+        y *= 2
+
+    x -= 1
+    print("In-place:", describe(x), describe(y))
+
+    x *= 0
+    print("In-place to zero:", describe(x))
+
+intOverflow()
+intBoundaries()
+divisions()
+mixedOperands()
+localsAfterAssignments()
+inplaceOperations()
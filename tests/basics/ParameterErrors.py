@@ -277,3 +277,58 @@ try:
     functionwithTwoArgsOneDefaulted(b = 12)
 except TypeError as e:
     print(repr(e))
+
+# Calls with keyword arguments to functions not known at compile time, these
+# pass their values with a tuple of the names.
+def callWithKeywords(called):
+    print("Calling", called.__name__, "with keyword arguments:")
+
+    try:
+        called(1, b = 2)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(a = 1, b = 2)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, 2, 3, c = 4)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, a = 2)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(b = 2)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, z = 3)
+    except TypeError as e:
+        print(repr(e))
+
+def functionTwoParametersDefaulted(a, b, c = 3):
+    print(a, b, c)
+
+def functionStarDictParameters(a, **kw):
+    print(a, sorted(kw.items()))
+
+def functionStarListParameters(a, *args):
+    print(a, args)
+
+for called in (functionNoParameters, functionOneParameter,
+               functionTwoParameters, functionTwoParametersDefaulted,
+               functionStarDictParameters, functionStarListParameters):
+    callWithKeywords(called)
+
+class ClassWithMethod:
+    def method(self, a, b):
+        print(a, b)
+
+callWithKeywords(ClassWithMethod().method)
@@ -72,3 +72,49 @@ try:
     kwfunc2( 1 )
 except TypeError as e:
     print( repr(e) )
+
+# Calls with keyword arguments to functions not known at compile time, these
+# pass their values with a tuple of the names.
+def callWithKeywordOnly(called):
+    print("Calling", called.__name__, "with keyword only arguments:")
+
+    try:
+        called(1, k = 2)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, l = 2, m = 3)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, k = 2, l = 3, m = 4)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(k = 2, l = 3, m = 4)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, 2, k = 2, l = 3, m = 4)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, a = 1, k = 2)
+    except TypeError as e:
+        print(repr(e))
+
+    try:
+        called(1, k = 2, z = 3)
+    except TypeError as e:
+        print(repr(e))
+
+def kwfuncdefaulted2(a, *, k, l = 5, m = 6):
+    print(a, k, l, m)
+
+for called in (kwfunc, kwfunc2, kwfuncdefaulted, kwfuncdefaulted2):
+    callWithKeywordOnly(called)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+""" Check the constants blob builder against an exhaustive search.
+
+The blob is built from values of standard library modules, the marshalled
+code objects and the strings in them. Values must be found at the offsets
+given, and the blob must not be larger than it is with searching the whole
+data for every value large enough to be found with the index of parts, and
+sharing smaller values only with equal ones.
+"""
+
+import marshal
+import os
+import sys
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..",
+            ".."
+        )
+    )
+)
+
+from nuitka.tools.testing.Common import ( # isort:skip
+    createSearchMode,
+    my_print,
+    setup
+)
+from nuitka.codegen.BlobCodes import BlobBuilder, _min_found_size # isort:skip
+
+
+def getModuleValues(module_name):
+    module_filename = __import__(module_name).__file__
+
+    if module_filename.endswith((".pyc", ".pyo")):
+        module_filename = module_filename[:-1]
+
+    with open(module_filename) as source_file:
+        code_object = compile(source_file.read(), module_filename, "exec")
+
+    result = []
+
+    def considerCode(code_object):
+        for name in code_object.co_names + code_object.co_varnames:
+            result.append(name.encode("utf8"))
+
+        for constant in code_object.co_consts:
+            if type(constant) is bytes:
+                result.append(constant)
+            elif type(constant) is type(u""):
+                result.append(constant.encode("utf8"))
+            elif hasattr(constant, "co_code"):
+                considerCode(constant)
+
+        result.append(marshal.dumps(code_object))
+
+    considerCode(code_object)
+
+    return result
+
+
+def getSearchedSize(values):
+    data = b""
+    small_values = set()
+
+    for value in values:
+        if len(value) < _min_found_size:
+            if value not in small_values:
+                small_values.add(value)
+                data += value
+        elif data.find(value) == -1:
+            data += value
+
+    return len(data)
+
+
+def checkBlobSize(module_names):
+    values = []
+
+    for module_name in module_names:
+        values += getModuleValues(module_name)
+
+    blob = BlobBuilder()
+
+    for value in values:
+        offset = blob.getValueOffset(value)
+
+        if bytes(blob.data[offset:offset+len(value)]) != value:
+            sys.exit("Error, value not found at its offset %d." % offset)
+
+    blob_size = len(blob.getBytes())
+    searched_size = getSearchedSize(values)
+
+    my_print(
+        "Blob has %d bytes for %d values, searching gives %d bytes." % (
+            blob_size,
+            len(values),
+            searched_size
+        )
+    )
+
+    if blob_size > searched_size:
+        sys.exit("Error, blob is larger than with searching.")
+
+
+def main():
+    setup()
+
+    search_mode = createSearchMode()
+
+    for name, module_names in (
+        ("small_modules", ("keyword", "stat", "string")),
+        ("large_modules", ("inspect", "difflib", "argparse")),
+    ):
+        if search_mode.consider(dirname = None, filename = name):
+            my_print("Consider blob size:", name)
+
+            checkBlobSize(module_names)
+        else:
+            my_print("Skipping", name)
+
+    search_mode.finish()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+""" Check the ELF reader against "ldd" for system libraries.
+
+The used DLLs of ELF files are found with the dynamic sections only, like
+standalone mode does it, and must be the same "ldd" reports. DLLs found only
+with the "DT_RPATH" of the DLL loading them, are checked with libraries made
+for that.
+"""
+
+import os
+import subprocess
+import sys
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..",
+            ".."
+        )
+    )
+)
+
+from nuitka.tools.testing.Common import ( # isort:skip
+    createSearchMode,
+    getTempDir,
+    my_print,
+    setup
+)
+from nuitka.utils.ElfFiles import ( # isort:skip
+    getElfDynamicInfo,
+    getInheritedRpath,
+    resolveElfNeeded
+)
+
+
+def getLddFilenames(filename):
+    output = subprocess.check_output(["ldd", filename])
+
+    result = set()
+
+    for line in output.splitlines():
+        if b" => " not in line:
+            continue
+
+        part = line.split(b" => ", 1)[1]
+        part = part[:part.rfind(b" (")].strip()
+
+        if part and part != b"not found":
+            result.add(os.path.realpath(part))
+
+    return result
+
+
+def getElfFilenames(filename):
+    """ All DLLs used by an ELF file, found with the ELF reader. """
+
+    library_path = os.environ.get("LD_LIBRARY_PATH", "")
+
+    if str is not bytes:
+        library_path = library_path.encode("utf-8")
+
+    result = set()
+    pending = [(filename, ())]
+    visited = set(pending)
+
+    while pending:
+        current, inherited_rpath = pending.pop()
+
+        dynamic_info = getElfDynamicInfo(current)
+
+        needed = resolveElfNeeded(
+            filename        = current,
+            dynamic_info    = dynamic_info,
+            library_path    = library_path,
+            inherited_rpath = inherited_rpath
+        )
+
+        if needed is None:
+            sys.exit(
+                "Error, not all DLLs of '%s' were found." % current.decode("utf-8")
+            )
+
+        sub_inherited_rpath = getInheritedRpath(
+            filename        = current,
+            dynamic_info    = dynamic_info,
+            inherited_rpath = inherited_rpath
+        )
+
+        for _needed_name, needed_filename in needed:
+            result.add(os.path.realpath(needed_filename))
+
+            if (needed_filename, sub_inherited_rpath) not in visited:
+                visited.add((needed_filename, sub_inherited_rpath))
+                pending.append((needed_filename, sub_inherited_rpath))
+
+    return result
+
+
+def compareWithLdd(filename):
+    if type(filename) is not bytes:
+        filename = filename.encode("utf-8")
+
+    ldd_filenames = getLddFilenames(filename)
+    elf_filenames = getElfFilenames(filename)
+
+    # The loader itself is not reported by "ldd" with an arrow.
+    elf_filenames = set(
+        elf_filename
+        for elf_filename in
+        elf_filenames
+        if not os.path.basename(elf_filename).startswith((b"ld-linux", b"ld64.so."))
+    )
+
+    if ldd_filenames != elf_filenames:
+        sys.exit(
+            "Error, DLLs of '%s' differ from 'ldd':\n%s\n%s" % (
+                filename.decode("utf-8"),
+                sorted(ldd_filenames),
+                sorted(elf_filenames)
+            )
+        )
+
+    my_print("Used DLLs of '%s' are the same: %d" % (
+        os.path.basename(filename).decode("utf-8"),
+        len(elf_filenames)
+    ))
+
+
+def checkSystemLibraries():
+    import zlib
+
+    filenames = [
+        os.path.realpath(sys.executable)
+    ]
+
+    # Extension modules, if they are not built into the executable.
+    for module in (zlib,):
+        if hasattr(module, "__file__"):
+            filenames.append(module.__file__)
+
+    for module_name in ("_ssl", "_ctypes", "_sqlite3"):
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            continue
+
+        if hasattr(module, "__file__"):
+            filenames.append(module.__file__)
+
+    for filename in filenames:
+        compareWithLdd(filename)
+
+
+def checkInheritedRpath():
+    # The outer library has the "DT_RPATH" to find the inner one, which the
+    # middle library uses, and only finds with the inherited "DT_RPATH".
+    test_dir = os.path.join(getTempDir(), "inherited_rpath")
+    sub_dir = os.path.join(test_dir, "sub")
+
+    if not os.path.isdir(sub_dir):
+        os.makedirs(sub_dir)
+
+    def makeLibrary(name, code, extra_args):
+        source_filename = os.path.join(test_dir, name + ".c")
+
+        with open(source_filename, 'w') as source_file:
+            source_file.write(code)
+
+        subprocess.check_call(
+            [
+                "gcc",
+                "-shared",
+                "-fPIC",
+                "-o",
+                os.path.join(
+                    sub_dir if name == "inner" else test_dir,
+                    "lib%s.so" % name
+                ),
+                source_filename
+            ] + extra_args
+        )
+
+    makeLibrary("inner", "int inner(void) { return 1; }\n", [])
+    makeLibrary(
+        "middle",
+        "int inner(void);\nint middle(void) { return inner(); }\n",
+        ["-L" + sub_dir, "-linner"]
+    )
+    makeLibrary(
+        "outer",
+        "int middle(void);\nint outer(void) { return middle(); }\n",
+        [
+            "-L" + test_dir,
+            "-lmiddle",
+            "-Wl,-rpath-link," + sub_dir,
+            "-Wl,--disable-new-dtags",
+            "-Wl,-rpath,$ORIGIN:$ORIGIN/sub"
+        ]
+    )
+
+    outer_filename = os.path.join(test_dir, "libouter.so")
+
+    if getElfDynamicInfo(outer_filename).rpath is None:
+        sys.exit("Error, library made has no 'DT_RPATH'.")
+
+    compareWithLdd(outer_filename)
+
+
+def main():
+    setup()
+
+    if not sys.platform.startswith("linux"):
+        my_print("Skipped, ELF files are only checked on Linux.")
+        return
+
+    search_mode = createSearchMode()
+
+    for name, checker in (
+        ("system_libraries", checkSystemLibraries),
+        ("inherited_rpath", checkInheritedRpath),
+    ):
+        if search_mode.consider(dirname = None, filename = name):
+            my_print("Consider ELF files:", name)
+
+            checker()
+        else:
+            my_print("Skipping", name)
+
+    search_mode.finish()
+
+
+if __name__ == "__main__":
+    main()
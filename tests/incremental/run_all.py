@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python test originally created or extracted from other peoples work. The
+#     parts from me are licensed as below. It is at least Free Software where
+#     it's copied from other people. In these cases, that will normally be
+#     indicated.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+
+""" Compile programs again after changes, and check the results.
+
+Each step writes the program source into the same directory, compiles it
+with the options given, and compares the output with CPython. This covers
+builds that keep files of previous builds, i.e. the things that must be
+noticed when they changed.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+# Find nuitka package relative to us.
+sys.path.insert(
+    0,
+    os.path.normpath(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "..",
+            ".."
+        )
+    )
+)
+
+from nuitka.tools.testing.Common import ( # isort:skip
+    createSearchMode,
+    getTempDir,
+    my_print,
+    setup
+)
+from nuitka.CompileServer import stopServer # isort:skip
+from nuitka.utils.AppDirs import getCacheDir # isort:skip
+from nuitka.utils.Execution import check_output # isort:skip
+
+nuitka_main_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "..",
+    "..",
+    "bin",
+    "nuitka"
+)
+
+
+def getTestDir(name):
+    test_dir = os.path.join(getTempDir(), name)
+
+    if not os.path.isdir(test_dir):
+        os.makedirs(test_dir)
+
+    return test_dir
+
+
+def compileAndCompare(name, source_code, extra_options, modules = None):
+    tmp_dir = getTestDir(name)
+
+    with open(os.path.join(tmp_dir, "main.py"), 'w') as output:
+        output.write(source_code)
+
+    for module_name, module_code in (modules or {}).items():
+        with open(os.path.join(tmp_dir, module_name + ".py"), 'w') as output:
+            output.write(module_code)
+
+    cpython_output = check_output(
+        [os.environ["PYTHON"], "main.py"],
+        cwd = tmp_dir
+    )
+
+    subprocess.check_call(
+        [
+            os.environ["PYTHON"],
+            nuitka_main_path,
+            "--output-dir=%s" % tmp_dir,
+        ] + extra_options + [
+            "main.py"
+        ],
+        cwd = tmp_dir
+    )
+
+    nuitka_output = check_output(
+        [os.path.join(tmp_dir, "main.bin")],
+        cwd = tmp_dir
+    )
+
+    if cpython_output != nuitka_output:
+        sys.exit(
+            "Error, output differs from CPython:\n%s\n%s" % (
+                cpython_output,
+                nuitka_output
+            )
+        )
+
+
+def getBuildFileTime(name, filename):
+    return os.path.getmtime(
+        os.path.join(getTestDir(name), "main.build", filename)
+    )
+
+
+def checkIncrementalHelpers():
+    compileAndCompare(
+        name          = "incremental_helpers",
+        source_code   = """\
+def f(a):
+    return a * 2
+
+print(f(2))
+""",
+        extra_options = ["--incremental"]
+    )
+
+    # Calls through a variable with many arguments need a new helper, that
+    # is declared in the generated "__helpers.h", which the precompiled
+    # header includes.
+    program_code = """\
+def f(a, b, c, d, e, g, h):
+    return a + b + c + d + e + g + h
+
+k = f
+print(k(1, 2, 3, 4, 5, 6, 7))
+"""
+    compileAndCompare(
+        name          = "incremental_helpers",
+        source_code   = program_code,
+        extra_options = ["--incremental"]
+    )
+
+    helpers_time = getBuildFileTime("incremental_helpers", "__helpers.h")
+
+    # A change in the main program that needs no new helpers, must not touch
+    # them.
+    compileAndCompare(
+        name          = "incremental_helpers",
+        source_code   = program_code.replace("k(1,", "k(0,"),
+        extra_options = ["--incremental"]
+    )
+
+    if getBuildFileTime("incremental_helpers", "__helpers.h") != helpers_time:
+        sys.exit("Error, unchanged '__helpers.h' was written again.")
+
+
+def checkModuleTreeCacheImports():
+    program_code = """\
+from helper import value, describe
+
+print(value * 2, describe())
+"""
+
+    helper_code = """\
+value = 21
+
+def describe():
+    return "value is %d" % value
+"""
+
+    for _count in range(2):
+        compileAndCompare(
+            name          = "module_tree_cache_imports",
+            source_code   = program_code,
+            extra_options = ["--module-tree-cache", "--recurse-all"],
+            modules       = {"helper" : helper_code}
+        )
+
+    # The main program is unchanged, but what it knows about the imported
+    # module is not, so its cached tree must not be used.
+    compileAndCompare(
+        name          = "module_tree_cache_imports",
+        source_code   = program_code,
+        extra_options = ["--module-tree-cache", "--recurse-all"],
+        modules       = {
+            "helper" : helper_code.replace("21", "'changed'").replace(
+                "%d",
+                "%s"
+            )
+        }
+    )
+
+
+def getServerSockets():
+    server_dir = os.path.join(getCacheDir(), "compile_server")
+
+    if not os.path.isdir(server_dir):
+        return set()
+
+    # The log file is created by the client, the socket only once the server
+    # is ready.
+    return set(
+        os.path.join(server_dir, filename[:-4])
+        for filename in
+        os.listdir(server_dir)
+        if filename.endswith(".sock.log")
+    )
+
+
+def waitForPath(path, exists):
+    for _count in range(600):
+        if os.path.exists(path) == exists:
+            return True
+
+        time.sleep(0.1)
+
+    return False
+
+
+def checkCompileServer():
+    if os.name == "nt":
+        my_print("Skipped, the compile server is not supported on Windows.")
+        return
+
+    program_code = """\
+def f(a):
+    return a * 2
+
+print(f(21))
+"""
+
+    old_sockets = getServerSockets()
+
+    # Without a server, the compilation is done as usual, and a server is
+    # started for the next one.
+    compileAndCompare(
+        name          = "compile_server",
+        source_code   = program_code,
+        extra_options = ["--compile-server"]
+    )
+
+    new_sockets = getServerSockets() - old_sockets
+
+    if len(new_sockets) != 1:
+        sys.exit("Error, compile server was not started.")
+
+    socket_path, = new_sockets
+
+    if not waitForPath(socket_path, True):
+        sys.exit("Error, compile server did not start.")
+
+    try:
+        compileAndCompare(
+            name          = "compile_server",
+            source_code   = program_code.replace("21", "42"),
+            extra_options = ["--compile-server"]
+        )
+
+        # The server must have done the compilation, and still be running.
+        if not os.path.exists(socket_path):
+            sys.exit("Error, compile server stopped after a compilation.")
+    finally:
+        stopServer(socket_path)
+
+    if not waitForPath(socket_path, False):
+        sys.exit("Error, compile server did not stop.")
+
+
+def main():
+    setup(needs_io_encoding = True)
+
+    search_mode = createSearchMode()
+
+    for name, checker in (
+        ("incremental_helpers", checkIncrementalHelpers),
+        ("module_tree_cache_imports", checkModuleTreeCacheImports),
+        ("compile_server", checkCompileServer),
+    ):
+        if search_mode.consider(dirname = None, filename = name):
+            my_print("Consider incremental compilation:", name)
+
+            checker()
+        else:
+            my_print("Skipping", name)
+
+    search_mode.finish()
+
+
+if __name__ == "__main__":
+    main()
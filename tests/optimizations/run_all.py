@@ -243,6 +243,21 @@ for filename in sorted(os.listdir('.')):
             command
         )
 
+        # Optimizing again only what changed, must give the same result as
+        # optimizing everything in every pass.
+        untracked_result = check_output(
+            command[:-1] + [
+                "--experimental=disable_change_tracking",
+                filename
+            ]
+        )
+
+        if result != untracked_result:
+            my_print("FAIL.")
+            sys.exit(
+                "Error, XML output differs without change tracking."
+            )
+
         # Parse the result into XML and check it.
         try:
             root = lxml.etree.fromstring(result)
@@ -0,0 +1,35 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Modules with their C code generated in parallel processes.
+
+The modules use each other, so what one process decided about a module must
+be the same, as the other processes assumed.
+"""
+
+from __future__ import print_function
+
+from some_package import Child1, Child2, Child3
+
+print("Child1:", Child1.describe())
+print("Child2:", Child2.describe())
+print("Child3:", Child3.describe())
+
+print("Shared constant is the same:", Child1.shared is Child2.shared)
+print("Function from other module:", Child3.compute(Child1.compute, 3))
+
+print("Done.")
@@ -0,0 +1,36 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Modules with constants created when the function using them is called.
+
+Some functions have constants of their own, others only use ones shared with
+the module or other functions, or none at all.
+"""
+
+from __future__ import print_function
+
+from some_package import Helpers
+
+print("Module constant:", Helpers.shared)
+print("Own constants:", Helpers.withOwnConstants())
+print("Own constants again:", Helpers.withOwnConstants())
+print("Shared constants:", Helpers.withSharedConstants())
+print("No constants:", Helpers.withoutConstants(3))
+print("Generator:", list(Helpers.generatorWithOwnConstants()))
+print("Closure:", Helpers.makeClosure()())
+
+print("Done.")
@@ -0,0 +1,39 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+shared = ("shared", "tuple", 1.5)
+
+def withOwnConstants():
+    return ("only", "used", "here", 17), {"key" : [1, 2, 3]}
+
+def withSharedConstants():
+    return shared, ("shared", "tuple", 1.5)
+
+def withoutConstants(value):
+    return value
+
+def generatorWithOwnConstants():
+    yield ("generator", "only", 2.5)
+    yield sorted(frozenset(["also", "generator", "only"]))
+
+def makeClosure():
+    value = ["closure", "list"]
+
+    def closure():
+        return value, ("closure", "only", 33)
+
+    return closure
@@ -0,0 +1,50 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Program compiled with profile guided optimization.
+
+The training run executes it once, and the result must behave the same, for
+both branches taken and not taken during training.
+"""
+
+from __future__ import print_function
+
+import sys
+
+
+def classify(value):
+    if value % 3 == 0:
+        return "fizz"
+    elif value % 5 == 0:
+        return "buzz"
+    else:
+        return value
+
+def accumulate(count):
+    result = {}
+
+    for value in range(count):
+        key = classify(value)
+
+        if type(key) is str:
+            result[key] = result.get(key, 0) + 1
+
+    return sorted(result.items())
+
+print("Accumulated:", accumulate(1000))
+print("Classified:", [classify(value) for value in range(16)])
+print("Arguments:", sys.argv[1:])
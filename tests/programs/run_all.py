@@ -113,6 +113,27 @@ for filename in sorted(os.listdir('.')):
               )
 
         extra_flags.append("ignore_warnings")
+    elif filename == "codegen_jobs":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --codegen-jobs=2"
+    elif filename == "lazy_constants":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --lazy-constants"
+    elif filename == "unity_build":
+        os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+          " --unity-build --unity-files=2"
+    elif filename == "pgo_build":
+        # Profile guided optimization is only supported with gcc, not with
+        # the clang used on MacOS X and FreeBSD, or MSVC.
+        if os.name != "nt" and \
+           sys.platform != "darwin" and \
+           "freebsd" not in sys.platform and \
+           "clang" not in os.path.basename(os.environ.get("CC", "")) and \
+           "--clang" not in extra_options:
+            os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options + \
+              " --pgo"
+        else:
+            os.environ["NUITKA_EXTRA_OPTIONS"] = extra_options
     elif filename == "multiprocessing_using":
         if os.name == "nt":
             extra_flags += [
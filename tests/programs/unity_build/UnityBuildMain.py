@@ -0,0 +1,36 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+""" Modules with their C code compiled together in unity files.
+
+The modules define functions, classes and constants of the same names, which
+must not get mixed up, when their C code ends up in the same file.
+"""
+
+from __future__ import print_function
+
+from some_package import Child1, Child2, Child3
+
+print("Child1:", Child1.describe())
+print("Child2:", Child2.describe())
+print("Child3:", Child3.describe())
+
+print("Same named functions differ:", Child1.compute(3), Child2.compute(3))
+print("Same named classes differ:", Child1.Value(1), Child3.Value(1))
+print("Shared constant is the same:", Child1.shared is Child3.shared)
+
+print("Done.")
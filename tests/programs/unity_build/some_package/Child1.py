@@ -0,0 +1,31 @@
+#     Copyright 2018, Kay Hayen, mailto:kay.hayen@gmail.com
+#
+#     Python tests originally created or extracted from other peoples work. The
+#     parts were too small to be protected.
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+#
+shared = ("shared", "constant", 1)
+
+def compute(value):
+    return value * 2
+
+class Value(object):
+    def __init__(self, value):
+        self.value = value
+
+    def __repr__(self):
+        return "<%s.Value %r>" % (__name__, self.value)
+
+def describe():
+    return __name__, shared, compute(21)